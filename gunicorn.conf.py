@@ -18,10 +18,25 @@ backlog = 2048
 # Each worker loads the full Dash app (Pandas, DuckDB, Plotly) into memory
 # Rule of thumb: 2 * num_cpus for memory-intensive Dash apps
 workers = int(os.getenv("WEB_CONCURRENCY", "4"))  # Default to 4, can override via env var
-worker_class = "sync"
+# Threaded mode (GUNICORN_THREADS > 1): gthread workers serve that many
+# requests at once, so a slow analytics callback no longer blocks the parallel
+# callbacks of a page. Threads share the worker's memory and caches; each query
+# borrows its own DuckDB cursor (DB_READ_POOL_SIZE, defaults to the thread
+# count here). Use fewer workers with more threads to save memory.
+threads = int(os.getenv("GUNICORN_THREADS", "1"))
+worker_class = "gthread" if threads > 1 else "sync"
+os.environ.setdefault("DB_READ_POOL_SIZE", str(max(threads, 1)))
 timeout = 120  # 2 minutes - important for slow analytics queries
 keepalive = 5
 
+# Preload mode (GUNICORN_PRELOAD=1): the arbiter imports the app and warms the
+# shared lookups once, then forks workers that share that memory copy-on-write.
+# Recycled workers (max_requests) start warm instead of re-importing the app.
+# GUNICORN_PRELOAD_WARM=1 also pins the default overview results before fork.
+# Code changes need a full restart rather than a HUP while preloading.
+preload_app = os.getenv("GUNICORN_PRELOAD", "0") == "1"
+_preload_warm_overview = os.getenv("GUNICORN_PRELOAD_WARM", "0") == "1"
+
 # Logging
 # Access logs go to rotating file on persistent volume for analytics,
 # and also to stdout for fly logs. Error logs stay on stdout only.
@@ -49,6 +64,32 @@ def on_starting(server: "arbiter.Arbiter") -> None:
     handler.setFormatter(logging.Formatter("%(message)s"))
     access_logger.addHandler(handler)
 
+
+def when_ready(server: "arbiter.Arbiter") -> None:
+    """Warm shared state in the arbiter once the preloaded app is imported."""
+    if not preload_app:
+        return
+    from tournament_visualizer.preload import warm_shared_state
+
+    stats = warm_shared_state(warm_overview=_preload_warm_overview)
+    server.log.info(f"Preloaded shared state: {stats}")
+
+
+def pre_fork(server: "arbiter.Arbiter", worker: "workers.base.Worker") -> None:
+    """Make sure no database connection is inherited by the new worker."""
+    if preload_app:
+        from tournament_visualizer.preload import release_before_fork
+
+        release_before_fork()
+
+
+def post_fork(server: "arbiter.Arbiter", worker: "workers.base.Worker") -> None:
+    """Give the new worker its own database connection state."""
+    if preload_app:
+        from tournament_visualizer.preload import reset_after_fork
+
+        reset_after_fork()
+
 # Process naming
 proc_name = "tournament_visualizer"
 
@@ -2,7 +2,9 @@
 """Management script for the tournament visualizer server.
 
 This script provides commands to start, stop, restart, and check the status
-of the development server.
+of the development server, and to profile how long the app takes to import.
+`start --gunicorn` runs the production server locally instead, for load tests
+with scripts/replay_traffic.py.
 """
 
 import argparse
@@ -17,6 +19,17 @@ from pathlib import Path
 PORT = 8050
 PID_FILE = Path(".server.pid")
 
+# Dependencies that only some requests need (chat, narratives, statistics,
+# imports). They should be imported on first use, not while a worker boots.
+LAZY_DEPENDENCIES = (
+    "anthropic",
+    "chyllonge",
+    "googleapiclient",
+    "groq",
+    "lxml",
+    "scipy",
+)
+
 
 def get_pid_from_port() -> int | None:
     """Get the process ID using the configured port.
@@ -116,12 +129,46 @@ def stop_server(quiet: bool = False) -> bool:
         return False
 
 
-def start_server(debug: bool = True, background: bool = True) -> bool:
-    """Start the development server.
+def server_command(workers: int = 0, threads: int = 1) -> tuple[list[str], dict]:
+    """Command line and environment for the server.
+
+    Args:
+        workers: Number of gunicorn workers; 0 runs the Dash development server
+        threads: Threads per gunicorn worker (gthread when above 1)
+
+    Returns:
+        Tuple of (command, environment)
+    """
+    env = os.environ.copy()
+    if not workers:
+        return ["uv", "run", "python", "tournament_visualizer/app.py"], env
+
+    # Same server and config as production, on the local port. Access logs
+    # go to logs/gunicorn/ instead of the Fly volume.
+    env["PORT"] = str(PORT)
+    env["WEB_CONCURRENCY"] = str(workers)
+    env["GUNICORN_THREADS"] = str(threads)
+    env.setdefault("LOG_DIR", str(Path("logs") / "gunicorn"))
+    command = [
+        "uv", "run", "gunicorn", "tournament_visualizer.app:server",
+        "--config", "gunicorn.conf.py",
+    ]
+    return command, env
+
+
+def start_server(
+    debug: bool = True,
+    background: bool = True,
+    workers: int = 0,
+    threads: int = 1,
+) -> bool:
+    """Start the development server, or gunicorn for load testing.
     
     Args:
         debug: If True, enable debug mode with auto-reload
         background: If True, run in background; if False, run in foreground
+        workers: Number of gunicorn workers; 0 runs the development server
+        threads: Threads per gunicorn worker
         
     Returns:
         True if server started successfully, False on error
@@ -134,15 +181,19 @@ def start_server(debug: bool = True, background: bool = True) -> bool:
     
     print(f"Starting server on http://localhost:{PORT}...")
     
-    if debug:
+    if workers:
+        print(f"Running gunicorn with {workers} workers x {threads} threads")
+    elif debug:
         print("Debug mode enabled - server will auto-reload on code changes")
         os.environ["FLASK_DEBUG"] = "1"
+    command, env = server_command(workers, threads)
     
     try:
         if background:
             # Start in background
             process = subprocess.Popen(
-                ["uv", "run", "python", "tournament_visualizer/app.py"],
+                command,
+                env=env,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
                 start_new_session=True
@@ -165,10 +216,7 @@ def start_server(debug: bool = True, background: bool = True) -> bool:
         else:
             # Run in foreground
             print("Running in foreground mode (press Ctrl+C to stop)...")
-            result = subprocess.run(
-                ["uv", "run", "python", "tournament_visualizer/app.py"],
-                check=False
-            )
+            result = subprocess.run(command, env=env, check=False)
             return result.returncode == 0
             
     except Exception as e:
@@ -239,6 +287,115 @@ def show_logs(follow: bool = False) -> None:
         print(latest_log.read_text())
 
 
+def parse_import_times(output: str) -> list[tuple[str, int, int]]:
+    """Parse the report written by ``python -X importtime``.
+
+    Args:
+        output: stderr of the profiled interpreter
+
+    Returns:
+        List of (module, self_us, cumulative_us) in import order
+    """
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # Header line
+        rows.append((parts[2].strip(), int(parts[0]), int(parts[1])))
+    return rows
+
+
+def summarize_import_times(
+    rows: list[tuple[str, int, int]], top: int = 15
+) -> dict:
+    """Aggregate import times for the profile report.
+
+    Args:
+        rows: Output of parse_import_times()
+        top: Number of entries per ranking
+
+    Returns:
+        Dict with total_us, packages (top-level package -> self time, slowest
+        first), project (slowest tournament_visualizer modules by cumulative
+        time) and lazy (LAZY_DEPENDENCIES that were imported)
+    """
+    packages: dict[str, int] = {}
+    for module, self_us, _ in rows:
+        package = module.split(".")[0]
+        packages[package] = packages.get(package, 0) + self_us
+
+    project = sorted(
+        (row for row in rows if row[0].startswith("tournament_visualizer")),
+        key=lambda row: row[2],
+        reverse=True,
+    )
+    return {
+        "total_us": sum(packages.values()),
+        "packages": sorted(packages.items(), key=lambda item: item[1], reverse=True)[
+            :top
+        ],
+        "project": [(module, cumulative) for module, _, cumulative in project[:top]],
+        "lazy": sorted(package for package in LAZY_DEPENDENCIES if package in packages),
+    }
+
+
+def profile_imports(module: str = "tournament_visualizer.app", top: int = 15) -> bool:
+    """Import a module in a fresh interpreter and report where the time goes.
+
+    This is the cost every gunicorn worker pays when it starts and again each
+    time it is recycled after max_requests.
+
+    Args:
+        module: Module to import (the WSGI app by default)
+        top: Number of entries per ranking
+
+    Returns:
+        True if the module imported successfully, False otherwise
+    """
+    # Peak RSS is reported in KiB on Linux and in bytes on macOS
+    code = (
+        "import resource, sys\n"
+        f"import {module}\n"
+        "rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss\n"
+        "print(rss // 1024 if sys.platform == 'darwin' else rss)\n"
+    )
+    print(f"Profiling import of {module}...")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=False
+    )
+    if result.returncode != 0:
+        print(f"Import failed:\n{result.stderr[-2000:]}")
+        return False
+
+    summary = summarize_import_times(parse_import_times(result.stderr), top=top)
+    peak_rss_mb = int(result.stdout.strip().splitlines()[-1]) / 1024
+
+    print(f"\nTotal import time: {summary['total_us'] / 1e6:.2f} s")
+    print(f"Peak RSS: {peak_rss_mb:.0f} MB")
+
+    print("\nTop-level packages by import time:")
+    for package, self_us in summary["packages"]:
+        print(f"  {package:<40} {self_us / 1000:>8.1f} ms")
+
+    print("\nSlowest project modules (including their imports):")
+    for name, cumulative_us in summary["project"]:
+        print(f"  {name:<60} {cumulative_us / 1000:>8.1f} ms")
+
+    if summary["lazy"]:
+        print(
+            "\nWarning: imported at boot but only needed on first use: "
+            + ", ".join(summary["lazy"])
+        )
+    else:
+        print("\nNo lazily used dependencies were imported at boot")
+    return True
+
+
 def main() -> int:
     """Main entry point for the management script.
 
@@ -264,6 +421,23 @@ def main() -> int:
         action="store_true",
         help="Run in foreground (don't daemonize)"
     )
+    start_parser.add_argument(
+        "--gunicorn",
+        action="store_true",
+        help="Run gunicorn with the production config instead of the dev server"
+    )
+    start_parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="gunicorn workers (default: 4, as on Fly.io)"
+    )
+    start_parser.add_argument(
+        "--threads",
+        type=int,
+        default=1,
+        help="Threads per gunicorn worker (default: 1)"
+    )
 
     # Stop command
     subparsers.add_parser("stop", help="Stop the server")
@@ -286,6 +460,23 @@ def main() -> int:
         action="store_true",
         help="Follow log output (like tail -f)"
     )
+
+    # Import profile command
+    profile_parser = subparsers.add_parser(
+        "profile-imports",
+        help="Report import time and memory of the app (worker boot cost)"
+    )
+    profile_parser.add_argument(
+        "--module",
+        default="tournament_visualizer.app",
+        help="Module to import (default: tournament_visualizer.app)"
+    )
+    profile_parser.add_argument(
+        "--top",
+        type=int,
+        default=15,
+        help="Number of entries per ranking (default: 15)"
+    )
     
     args = parser.parse_args()
     
@@ -297,7 +488,9 @@ def main() -> int:
         if args.command == "start":
             success = start_server(
                 debug=not args.no_debug,
-                background=not args.foreground
+                background=not args.foreground,
+                workers=args.workers if args.gunicorn else 0,
+                threads=args.threads,
             )
             return 0 if success else 1
 
@@ -316,6 +509,10 @@ def main() -> int:
         elif args.command == "logs":
             show_logs(follow=args.follow)
             return 0
+
+        elif args.command == "profile-imports":
+            success = profile_imports(module=args.module, top=args.top)
+            return 0 if success else 1
             
     except KeyboardInterrupt:
         print("\nInterrupted")
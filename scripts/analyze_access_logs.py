@@ -1,7 +1,13 @@
 """Analyze access logs from the Fly.io persistent volume.
 
 Pulls access.log from the deployed app via `fly ssh console` and reports
-visitor and page analytics.
+visitor and page analytics. With --log-dir it reads a local copy of the log
+directory instead, including the rotated access.log.1 .. access.log.5.
+
+The latency subcommands need a local copy. Each run loads only the lines
+added since the last run into a DuckDB file (--db), remembering how far it
+got in each log file, then reports request duration percentiles (gunicorn's
+%(D)s field) by page, by status code, or over time.
 
 Usage:
     uv run python scripts/analyze_access_logs.py visitors              # Unique visitor summary
@@ -13,20 +19,38 @@ Usage:
     uv run python scripts/analyze_access_logs.py pages --daily         # Daily breakdown
     uv run python scripts/analyze_access_logs.py pages --monthly       # Monthly breakdown
     uv run python scripts/analyze_access_logs.py pages --all           # Everything
+
+    uv run python scripts/analyze_access_logs.py --log-dir logs pages  # Local log copy
+
+    # Copy the logs down first, e.g.
+    #   fly ssh sftp get /data/logs/access.log logs/access.log  (and .1 .. .5)
+    uv run python scripts/analyze_access_logs.py --log-dir logs latency pages
+    uv run python scripts/analyze_access_logs.py --log-dir logs latency status
+    uv run python scripts/analyze_access_logs.py --log-dir logs latency trend --hourly
+    uv run python scripts/analyze_access_logs.py --log-dir logs latency trend --page Matches
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import re
 import subprocess
 import sys
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
 from datetime import datetime
+from pathlib import Path
 from urllib.parse import urlparse
 
+import duckdb
+import pandas as pd
+
 APP_NAME = "prospector"
 LOG_PATH = "/data/logs/access.log"
+LOG_NAME = "access.log"
+LOG_BACKUPS = 5  # RotatingFileHandler backupCount in gunicorn.conf.py
+DEFAULT_DB_PATH = "data/access_logs.duckdb"
 
 # Matches the X-Forwarded-For IP(s) at the start, then the date in brackets
 # Example: 74.108.139.73, 66.241.125.158 - - [19/Feb/2026:19:24:26 +0000] "GET / HTTP/1.1" ...
@@ -34,6 +58,14 @@ LOG_PATTERN = re.compile(
     r'^([\d., ]+)\s+-\s+-\s+\[(\d{2}/\w{3}/\d{4}):\d{2}:\d{2}:\d{2}\s+[+\-]\d{4}\]\s+"(\w+)\s+(\S+)'
 )
 
+# Full line for the latency table, including status, size and duration
+# (microseconds). Format: access_log_format in gunicorn.conf.py
+ACCESS_PATTERN = re.compile(
+    r'^(?P<ips>.*?)\s+-\s+-\s+\[(?P<ts>[^\]]+)\]\s+"(?P<method>[A-Z]+)\s+(?P<path>\S+)[^"]*"'
+    r'\s+(?P<status>\d{3})\s+(?P<bytes>\d+|-)\s+"(?:[^"\\]|\\.)*"\s+"(?P<agent>(?:[^"\\]|\\.)*)"'
+    r"\s+(?P<duration>\d+)\s*$"
+)
+
 # Map URL paths to friendly page names
 PAGE_NAMES: dict[str, str] = {
     "/": "Overview",
@@ -63,10 +95,23 @@ def fetch_logs() -> str:
     return result.stdout
 
 
-def parse_logs(raw: str) -> list[dict[str, str]]:
+def local_log_files(log_dir: Path) -> list[Path]:
+    """Access log files in a directory, oldest first (access.log.5 .. access.log)."""
+    names = [f"{LOG_NAME}.{i}" for i in range(LOG_BACKUPS, 0, -1)] + [LOG_NAME]
+    return [log_dir / name for name in names if (log_dir / name).is_file()]
+
+
+def read_local_logs(log_dir: Path) -> Iterator[str]:
+    """Stream the lines of all local access logs, oldest first."""
+    for path in local_log_files(log_dir):
+        with path.open(encoding="utf-8", errors="replace") as f:
+            yield from f
+
+
+def parse_logs(lines: Iterable[str]) -> list[dict[str, str]]:
     """Parse log lines into structured records, filtering out health checks and static assets."""
     records: list[dict[str, str]] = []
-    for line in raw.strip().splitlines():
+    for line in lines:
         if "Consul Health Check" in line:
             continue
 
@@ -273,6 +318,245 @@ def pages_monthly(records: list[dict[str, str]]) -> None:
         print(row)
 
 
+# ---------------------------------------------------------------------------
+# Latency subcommand
+# ---------------------------------------------------------------------------
+
+LATENCY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS requests (
+    ts TIMESTAMP,          -- As logged (UTC on Fly.io)
+    ip VARCHAR,
+    method VARCHAR,
+    path VARCHAR,
+    page VARCHAR,
+    status SMALLINT,
+    bytes BIGINT,
+    duration_ms DOUBLE
+);
+CREATE TABLE IF NOT EXISTS log_files (
+    fingerprint VARCHAR PRIMARY KEY,  -- Hash of the first line
+    name VARCHAR,
+    offset_bytes BIGINT,
+    loaded_at TIMESTAMP
+);
+"""
+
+_BATCH_ROWS = 50_000
+
+
+def latency_group(path: str) -> str:
+    """Group a request path for latency reports: pages, callbacks, APIs, static."""
+    base_path = urlparse(path).path.rstrip("/") or "/"
+    if base_path in PAGE_NAMES:
+        return PAGE_NAMES[base_path]
+    if base_path == "/_dash-update-component":
+        return "Dash callbacks"
+    if base_path.startswith("/_dash-"):
+        return "Dash internals"
+    if base_path.startswith("/api/map/"):
+        return "API " + base_path.split("/")[3]
+    if base_path.startswith("/map/viewer/"):
+        return "Map viewer"
+    if base_path.startswith(("/assets/", "/static-assets/", "/_favicon")):
+        return "Static"
+    return base_path
+
+
+def parse_access_line(line: str) -> tuple | None:
+    """Parse one full access log line into a requests row, or None to skip it."""
+    match = ACCESS_PATTERN.match(line)
+    if not match or "Consul Health Check" in match["agent"]:
+        return None
+    path = match["path"]
+    if urlparse(path).path in SKIP_PATHS:
+        return None
+    return (
+        match["ts"][:20],  # Drops the UTC offset; parsed by DuckDB on insert
+        match["ips"].split(",")[0].strip(),
+        match["method"],
+        path,
+        latency_group(path),
+        int(match["status"]),
+        0 if match["bytes"] == "-" else int(match["bytes"]),
+        int(match["duration"]) / 1000,
+    )
+
+
+def _file_fingerprint(path: Path) -> str | None:
+    """Identify a log file by its first line, which survives rotation renames."""
+    with path.open("rb") as f:
+        first_line = f.readline()
+    if not first_line.endswith(b"\n"):
+        return None  # Empty, or first line still being written
+    return hashlib.sha256(first_line).hexdigest()[:16]
+
+
+def _insert_rows(con: duckdb.DuckDBPyConnection, rows: list[tuple]) -> None:
+    batch = pd.DataFrame(
+        rows,
+        columns=["ts", "ip", "method", "path", "page", "status", "bytes", "duration_ms"],
+    )
+    con.register("batch", batch)
+    con.execute(
+        """
+        INSERT INTO requests
+        SELECT strptime(ts, '%d/%b/%Y:%H:%M:%S'), ip, method, path, page,
+               status, bytes, duration_ms
+        FROM batch
+        """
+    )
+    con.unregister("batch")
+
+
+def load_new_lines(con: duckdb.DuckDBPyConnection, log_dir: Path) -> int:
+    """Load log lines added since the last run into the requests table.
+
+    Files are matched to their stored offsets by fingerprint, so a file that
+    was rotated from access.log to access.log.1 resumes where it left off. A
+    trailing line without a newline is left for the next run.
+
+    Returns:
+        Number of rows loaded
+    """
+    con.execute(LATENCY_SCHEMA)
+    loaded = 0
+    for path in local_log_files(log_dir):
+        fingerprint = _file_fingerprint(path)
+        if fingerprint is None:
+            continue
+        stored = con.execute(
+            "SELECT offset_bytes FROM log_files WHERE fingerprint = ?", [fingerprint]
+        ).fetchone()
+        offset = stored[0] if stored else 0
+        if offset >= path.stat().st_size:
+            continue
+
+        # Rows and the new offset commit together, so an interrupted run
+        # never loads a line twice
+        con.execute("BEGIN TRANSACTION")
+        try:
+            rows: list[tuple] = []
+            with path.open("rb") as f:
+                f.seek(offset)
+                for raw_line in f:
+                    if not raw_line.endswith(b"\n"):
+                        break
+                    offset += len(raw_line)
+                    row = parse_access_line(raw_line.decode("utf-8", errors="replace"))
+                    if row is not None:
+                        rows.append(row)
+                    if len(rows) >= _BATCH_ROWS:
+                        _insert_rows(con, rows)
+                        loaded += len(rows)
+                        rows = []
+            if rows:
+                _insert_rows(con, rows)
+                loaded += len(rows)
+            con.execute(
+                """
+                INSERT OR REPLACE INTO log_files VALUES (?, ?, ?, current_timestamp)
+                """,
+                [fingerprint, path.name, offset],
+            )
+            con.execute("COMMIT")
+        except Exception:
+            con.execute("ROLLBACK")
+            raise
+    return loaded
+
+
+def _latency_filter(args: argparse.Namespace) -> tuple[str, list]:
+    clauses, params = [], []
+    if args.since:
+        clauses.append("ts >= CAST(? AS TIMESTAMP)")
+        params.append(args.since)
+    if getattr(args, "page", None):
+        clauses.append("page = ?")
+        params.append(args.page)
+    if not args.include_static:
+        clauses.append("page NOT IN ('Static', 'Dash internals')")
+    return ("WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+
+_PERCENTILES = """
+    count(*) AS requests,
+    quantile_cont(duration_ms, 0.5) AS p50,
+    quantile_cont(duration_ms, 0.95) AS p95,
+    quantile_cont(duration_ms, 0.99) AS p99,
+    max(duration_ms) AS max
+"""
+
+
+def _print_latency_table(title: str, label: str, rows: list[tuple]) -> None:
+    label_w = max([len(label)] + [len(str(r[0])) for r in rows])
+    header = (
+        f" {label:<{label_w}s} {'Requests':>9s} {'p50 ms':>9s} {'p95 ms':>9s}"
+        f" {'p99 ms':>9s} {'max ms':>9s}"
+    )
+    print(f"\n{'=' * len(header)}")
+    print(f" {title}")
+    print(f"{'=' * len(header)}")
+    print(header)
+    print(f" {'-' * label_w}" + f" {'-' * 9}" * 5)
+    for name, count, p50, p95, p99, slowest in rows:
+        print(
+            f" {str(name):<{label_w}s} {count:>9d} {p50:>9.1f} {p95:>9.1f}"
+            f" {p99:>9.1f} {slowest:>9.1f}"
+        )
+
+
+def latency_pages(con: duckdb.DuckDBPyConnection, args: argparse.Namespace) -> None:
+    """Print duration percentiles per page group, slowest p95 first."""
+    where, params = _latency_filter(args)
+    rows = con.execute(
+        f"SELECT page, {_PERCENTILES} FROM requests {where} GROUP BY page ORDER BY p95 DESC",
+        params,
+    ).fetchall()
+    _print_latency_table("Latency by page", "Page", rows)
+
+
+def latency_status(con: duckdb.DuckDBPyConnection, args: argparse.Namespace) -> None:
+    """Print duration percentiles per status code."""
+    where, params = _latency_filter(args)
+    rows = con.execute(
+        f"SELECT status, {_PERCENTILES} FROM requests {where} GROUP BY status ORDER BY status",
+        params,
+    ).fetchall()
+    _print_latency_table("Latency by status", "Status", rows)
+
+
+def latency_trend(con: duckdb.DuckDBPyConnection, args: argparse.Namespace) -> None:
+    """Print duration percentiles per day (or hour), to spot regressions after deploys."""
+    where, params = _latency_filter(args)
+    unit, fmt = ("hour", "%Y-%m-%d %H:00") if args.hourly else ("day", "%Y-%m-%d")
+    rows = con.execute(
+        f"""
+        SELECT strftime(date_trunc('{unit}', ts), '{fmt}') AS period, {_PERCENTILES}
+        FROM requests {where}
+        GROUP BY period ORDER BY period
+        """,
+        params,
+    ).fetchall()
+    scope = f" ({args.page})" if args.page else ""
+    _print_latency_table(f"Latency per {unit}{scope}", "Period", rows)
+
+
+def run_latency(args: argparse.Namespace) -> None:
+    """Load new log lines, then print the requested latency report."""
+    Path(args.db).parent.mkdir(parents=True, exist_ok=True)
+    con = duckdb.connect(args.db)
+    try:
+        loaded = load_new_lines(con, Path(args.log_dir))
+        total = con.execute("SELECT count(*) FROM requests").fetchone()[0]
+        print(f"Loaded {loaded} new requests ({total} total) into {args.db}")
+        if not total:
+            return
+        report = {"pages": latency_pages, "status": latency_status, "trend": latency_trend}
+        report[args.report](con, args)
+    finally:
+        con.close()
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -289,6 +573,10 @@ def main() -> None:
         description="Analyze Fly.io access logs",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
+    parser.add_argument(
+        "--log-dir",
+        help="Read a local copy of the log directory instead of fetching from Fly.io",
+    )
     subparsers = parser.add_subparsers(dest="command")
 
     visitors_parser = subparsers.add_parser("visitors", help="Unique visitor analytics")
@@ -297,15 +585,38 @@ def main() -> None:
     pages_parser = subparsers.add_parser("pages", help="Page visit analytics")
     _add_time_args(pages_parser)
 
+    latency_parser = subparsers.add_parser(
+        "latency", help="Request duration percentiles (needs --log-dir)"
+    )
+    latency_parser.add_argument("report", choices=["pages", "status", "trend"])
+    latency_parser.add_argument(
+        "--db", default=DEFAULT_DB_PATH, help=f"DuckDB file (default: {DEFAULT_DB_PATH})"
+    )
+    latency_parser.add_argument("--since", help="Only requests on/after this date (YYYY-MM-DD)")
+    latency_parser.add_argument("--page", help="trend: only this page group, e.g. Matches")
+    latency_parser.add_argument("--hourly", action="store_true", help="trend: per hour instead of per day")
+    latency_parser.add_argument(
+        "--include-static", action="store_true", help="Include static files and Dash internals"
+    )
+
     args = parser.parse_args()
 
     if not args.command:
         parser.print_help()
         sys.exit(1)
 
-    print("Fetching logs from Fly.io...")
-    raw = fetch_logs()
-    records = parse_logs(raw)
+    if args.command == "latency":
+        if not args.log_dir:
+            parser.error("latency needs --log-dir (copy the logs down with fly ssh sftp)")
+        run_latency(args)
+        return
+
+    if args.log_dir:
+        records = parse_logs(read_local_logs(Path(args.log_dir)))
+    else:
+        print("Fetching logs from Fly.io...")
+        raw = fetch_logs()
+        records = parse_logs(raw.strip().splitlines())
 
     if not records:
         print("No visitor requests found in logs (only health checks/static assets).")
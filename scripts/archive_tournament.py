@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Archive a finished tournament's database as its own partition.
+
+Copies a closed database into TOURNAMENTS_DIRECTORY/{tournament}/, where the
+app opens it read-only on demand (get_queries(tournament)). After
+archiving, point TOURNAMENT at the next season and rebuild the live database
+with import_attachments.py --force. See tournament_visualizer/data/tournaments.py.
+
+Usage:
+    uv run python scripts/archive_tournament.py --tournament owduels2025
+    uv run python scripts/archive_tournament.py --tournament owduels2025 \\
+        --source backups/tournament_data.duckdb --name "OW Duels 2025"
+    uv run python scripts/archive_tournament.py --list
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tournament_visualizer.config import Config
+from tournament_visualizer.data.tournaments import (
+    archive_tournament,
+    list_tournaments,
+    partition_path,
+)
+
+
+def main() -> None:
+    """Archive a tournament or list the archived ones."""
+    parser = argparse.ArgumentParser(
+        description="Archive a tournament database as its own partition"
+    )
+    parser.add_argument(
+        "--source",
+        default=Config.DATABASE_PATH,
+        help="Closed database to archive (default: $TOURNAMENT_DB_PATH)",
+    )
+    parser.add_argument(
+        "--tournament",
+        default=Config.TOURNAMENT,
+        help="Tournament the database holds (default: $TOURNAMENT)",
+    )
+    parser.add_argument("--name", help="Display name (default: the identifier)")
+    parser.add_argument(
+        "--tournaments-dir",
+        default=Config.TOURNAMENTS_DIRECTORY,
+        help="Partitions directory (default: $TOURNAMENTS_DIRECTORY)",
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="List tournaments and exit"
+    )
+    args = parser.parse_args()
+
+    if args.list:
+        for tournament in list_tournaments(args.tournaments_dir):
+            path = partition_path(tournament, args.tournaments_dir)
+            if path is None:
+                print(f"* {tournament}  (live: {Config.DATABASE_PATH})")
+            else:
+                print(f"  {tournament}  {path.stat().st_size / 1e6:.1f} MB")
+        return
+
+    try:
+        path = archive_tournament(
+            args.source, args.tournament, args.name, args.tournaments_dir
+        )
+    except (OSError, ValueError) as e:
+        print(f"❌ Archive failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"✅ Archived {args.tournament} to {path}")
+
+
+if __name__ == "__main__":
+    main()
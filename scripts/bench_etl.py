@@ -0,0 +1,270 @@
+"""Benchmark save parsing and import on synthetic saves.
+
+Generates saves with scripts/generate_saves.py for every combination of the
+size knobs, then runs each one through the import pipeline stage by stage,
+the way TournamentETL.process_tournament_file does:
+
+    read       unzip and parse the XML into a tree
+    extract    run every section extractor (each one is also listed)
+    load       insert the records into a fresh database in one transaction
+    optimize   cluster and checkpoint the database (once per case)
+
+Each stage reports wall time and memory. Python allocations are traced with
+tracemalloc (--trace-memory, which slows the run down); peak RSS is the
+process high-water mark after the stage, so the stage that raises it is the
+one that set it. lxml trees live outside the Python heap and only show up in
+RSS.
+
+Usage:
+    uv run python scripts/bench_etl.py                                # 100 turns, smallest map
+    uv run python scripts/bench_etl.py --turns 50 100 200 --map-size smallest medium
+    uv run python scripts/bench_etl.py --players 4 --event-density 3 --saves 5
+    uv run python scripts/bench_etl.py --trace-memory --json bench_etl.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import logging
+import resource
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.generate_saves import (  # noqa: E402
+    MAP_SIZES,
+    SaveSpec,
+    save_file_name,
+    write_save,
+)
+from tournament_visualizer.data.database import TournamentDatabase  # noqa: E402
+from tournament_visualizer.data.etl import TournamentETL  # noqa: E402
+from tournament_visualizer.data.parser import (  # noqa: E402
+    PARSED_SECTION_VERSIONS,
+    OldWorldSaveParser,
+    parse_tournament_file,
+)
+
+STAGES = ["read", "extract", "load", "optimize"]
+
+
+def _peak_rss_mb() -> float:
+    # Reported in KiB on Linux and in bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+
+class StageMeter:
+    """Collects time and memory of named stages.
+
+    Attributes:
+        samples: Stage name -> list of {"ms", "rss_mb", "py_peak_mb"}
+    """
+
+    def __init__(self, trace_memory: bool = False) -> None:
+        self.trace_memory = trace_memory
+        self.samples: dict[str, list[dict[str, float]]] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        started = time.perf_counter()
+        yield
+        sample = {
+            "ms": (time.perf_counter() - started) * 1000,
+            "rss_mb": _peak_rss_mb(),
+        }
+        if self.trace_memory:
+            sample["py_peak_mb"] = tracemalloc.get_traced_memory()[1] / 1e6
+        self.samples.setdefault(name, []).append(sample)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Stage -> median ms and largest memory figures over all samples."""
+        result = {}
+        for name, samples in self.samples.items():
+            result[name] = {
+                "ms": round(statistics.median(s["ms"] for s in samples), 1),
+                "rss_mb": round(max(s["rss_mb"] for s in samples), 1),
+            }
+            if self.trace_memory:
+                result[name]["py_peak_mb"] = round(
+                    max(s["py_peak_mb"] for s in samples), 1
+                )
+        return result
+
+
+def import_save(etl: TournamentETL, path: Path, meter: StageMeter) -> dict[str, int]:
+    """Import one save, timing each stage.
+
+    Returns:
+        Section -> number of records extracted
+    """
+    with meter.stage("read"):
+        parser = OldWorldSaveParser(str(path))
+        parser.extract_and_parse()
+
+    # Territories are extracted here too, as the parse cache does, so the load
+    # stage does not parse the file a second time
+    parsed: dict[str, Any] = {}
+    with meter.stage("extract"):
+        for section in PARSED_SECTION_VERSIONS:
+            with meter.stage(f"extract {section}"):
+                parsed.update(
+                    parse_tournament_file(str(path), [section], parser=parser)
+                )
+    parsed["match_metadata"]["file_hash"] = etl.calculate_file_hash(str(path))
+    counts = {
+        section: len(records) if isinstance(records, list) else 1
+        for section, records in parsed.items()
+    }
+
+    with meter.stage("load"):
+        with etl.db.transaction():
+            etl._load_tournament_data(parsed, str(path))
+    return counts
+
+
+def run_case(
+    spec: SaveSpec, saves: int, work_dir: Path, trace_memory: bool = False
+) -> dict[str, Any]:
+    """Generate `saves` saves for a spec and import them into a new database.
+
+    Returns:
+        {"spec", "save_mb", "xml_mb", "records", "stages": stage -> figures}
+    """
+    meter = StageMeter(trace_memory)
+    paths = []
+    for i in range(saves):
+        save_spec = SaveSpec(**{**spec.__dict__, "seed": spec.seed + i})
+        names = [f"p{save_spec.seed}_{slot}" for slot in range(spec.players)]
+        paths.append(
+            write_save(
+                work_dir / save_file_name(900000000 + save_spec.seed, names),
+                save_spec,
+                names,
+            )
+        )
+
+    db_path = work_dir / "bench_etl.duckdb"
+    db = TournamentDatabase(str(db_path), read_only=False)
+    try:
+        db.create_schema()
+        etl = TournamentETL(database=db)
+        records: dict[str, int] = {}
+        for path in paths:
+            records = import_save(etl, path, meter)
+        with meter.stage("optimize"):
+            db.optimize_storage()
+    finally:
+        db.close()
+
+    with zipfile.ZipFile(paths[-1]) as archive:
+        xml_bytes = archive.infolist()[0].file_size
+    return {
+        "spec": spec.__dict__,
+        "save_mb": round(paths[-1].stat().st_size / 1e6, 2),
+        "xml_mb": round(xml_bytes / 1e6, 2),
+        "records": records,
+        "stages": meter.summary(),
+    }
+
+
+def print_case(result: dict[str, Any], top: int) -> None:
+    spec = result["spec"]
+    print(f"\n{'=' * 72}")
+    print(
+        f" {spec['turns']} turns, {spec['map_width']}x{spec['map_width']} map,"
+        f" {spec['players']} players, event density {spec['event_density']}"
+        f" ({result['xml_mb']} MB XML, {result['save_mb']} MB zipped)"
+    )
+    print(f"{'=' * 72}")
+    stages = result["stages"]
+    tracing = any("py_peak_mb" in figures for figures in stages.values())
+    header = f" {'Stage':<34s} {'ms':>10s} {'peak RSS MB':>12s}"
+    print(header + (f" {'py peak MB':>11s}" if tracing else ""))
+
+    def row(name: str, label: str) -> None:
+        figures = stages[name]
+        line = f" {label:<34s} {figures['ms']:>10.1f} {figures['rss_mb']:>12.0f}"
+        if tracing:
+            line += f" {figures['py_peak_mb']:>11.1f}"
+        print(line)
+
+    for stage in STAGES:
+        row(stage, stage)
+        if stage == "extract":
+            sections = sorted(
+                (name for name in stages if name.startswith("extract ")),
+                key=lambda name: stages[name]["ms"],
+                reverse=True,
+            )
+            for name in sections[:top]:
+                section = name.split(" ", 1)[1]
+                row(name, f"  {section} ({result['records'].get(section, 0):,})")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark parsing and import on synthetic saves",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--turns", type=int, nargs="+", default=[SaveSpec.turns])
+    parser.add_argument(
+        "--map-size", choices=list(MAP_SIZES), nargs="+", default=["smallest"]
+    )
+    parser.add_argument("--players", type=int, nargs="+", default=[SaveSpec.players])
+    parser.add_argument(
+        "--event-density", type=float, nargs="+", default=[SaveSpec.event_density]
+    )
+    parser.add_argument(
+        "--saves", type=int, default=1, help="Saves per case (default: 1)"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Trace Python allocations per stage (slower)",
+    )
+    parser.add_argument("--top", type=int, default=8, help="Slowest sections to list")
+    parser.add_argument("--json", type=Path, help="Also write the results here")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    if args.trace_memory:
+        tracemalloc.start()
+
+    results = []
+    for turns, map_size, players, density in itertools.product(
+        args.turns, args.map_size, args.players, args.event_density
+    ):
+        spec = SaveSpec(
+            turns=turns,
+            map_width=MAP_SIZES[map_size],
+            players=players,
+            event_density=density,
+            seed=args.seed,
+        )
+        with tempfile.TemporaryDirectory(prefix="bench_etl_") as work_dir:
+            result = run_case(spec, args.saves, Path(work_dir), args.trace_memory)
+        results.append(result)
+        print_case(result, args.top)
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+        print(f"\nWrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
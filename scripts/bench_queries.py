@@ -0,0 +1,1323 @@
+"""Benchmark the query layer against synthetic tournament databases.
+
+Generates DuckDB databases with the production schema at several scales
+(number of matches), then times every public TournamentQueries method and the
+callbacks the overview and match pages send when they load. Results are
+written to a JSON file and compared with a saved baseline, so a query or
+schema change shows how it scales before it is deployed.
+
+The synthetic data follows the shape of real imports: two players per match,
+per-turn points, military, legitimacy, yield and opinion histories for every
+turn, events at the density seen in tournament saves, rulers, cities and
+pick order data. Full per-turn territory snapshots are large (map tiles x
+turns) and only queried one match at a time, so they are generated for the
+first --territory-matches matches only.
+
+Each scale runs in a separate process with cold caches: the query caches are
+invalidated before every timed call, and each timing is the median of
+--repeat runs.
+
+Usage:
+    uv run python scripts/bench_queries.py                         # 50, 500 and 5000 matches
+    uv run python scripts/bench_queries.py --scales 50 500 --repeat 5
+    uv run python scripts/bench_queries.py --only territory --no-callbacks
+    uv run python scripts/bench_queries.py --save-baseline         # Accept these results
+
+Databases are cached in data/bench/ and rebuilt when GENERATOR_VERSION changes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import inspect
+import json
+import logging
+import math
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable
+
+import duckdb
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tournament_visualizer.data.database import TournamentDatabase  # noqa: E402
+from tournament_visualizer.data.game_constants import (  # noqa: E402
+    ARCHETYPE_ICONS,
+    LAW_CLASSES,
+    NATION_FAMILIES,
+    TECH_TYPES,
+)
+
+GENERATOR_VERSION = 1  # Bump when generated data changes; cached databases rebuild
+DEFAULT_SCALES = [50, 500, 5000]
+DEFAULT_BENCH_DIR = PROJECT_ROOT / "data" / "bench"
+DEFAULT_TERRITORY_MATCHES = 20
+REGRESSION_RATIO = 1.25  # Slower than baseline by this factor ...
+REGRESSION_MIN_MS = 2.0  # ... and by at least this much counts as a regression
+
+# Methods that change state rather than read it
+SKIPPED_METHODS = {"invalidate_caches", "invalidate_match_summary_cache"}
+
+# (name, share of matches, map width and height)
+MAP_SIZES = [("Duel", 0.6, 40), ("Tiny", 0.3, 46), ("Small", 0.1, 52)]
+MAP_CLASSES = [
+    "Coastal Rain Basin",
+    "Continent",
+    "Inland Sea",
+    "Lakes and Gulfs",
+    "Mediterranean",
+    "Highlands",
+]
+MAP_ASPECTS = ["Square", "Wide", "Ultrawide"]
+RELIGIONS = [
+    "RELIGION_ATENISM",
+    "RELIGION_CHRISTIANITY",
+    "RELIGION_JUDAISM",
+    "RELIGION_MANICHAEISM",
+    "RELIGION_ZOROASTRIANISM",
+] + [f"RELIGION_PAGAN_{n}" for n in ["AKSUM", "ASSYRIA", "BABYLONIA", "CARTHAGE"]] + [
+    f"RELIGION_PAGAN_{n}" for n in ["EGYPT", "GREECE", "HITTITE", "KUSH", "PERSIA", "ROME"]
+]
+STARTING_TRAITS = [
+    "Affable",
+    "Ambitious",
+    "Bold",
+    "Educated",
+    "Eloquent",
+    "Gracious",
+    "Intelligent",
+    "Just",
+    "Shrewd",
+    "Strong",
+]
+AMBITIONS = [
+    "Promote Units Five Times",
+    "Control Four Shrines",
+    "Enact Slavery",
+    "Have Six Cities",
+    "Build a Wonder",
+    "Research Ten Technologies",
+    "Train Twelve Units",
+]
+WONDERS = ["The Pyramids", "The Hanging Gardens", "The Colossus", "The Great Library"]
+MEMORY_EVENTS = [
+    "MEMORYPLAYER_ATTACKED_UNIT",
+    "MEMORYPLAYER_ATTACKED_CITY",
+    "MEMORYTRIBE_ATTACKED_UNIT",
+    "TRIBE_DIPLOMACY",
+    "TRIBE_CONTACT",
+    "MEMORYFAMILY_FOUNDED_CITY",
+    "MEMORYCHARACTER_UPGRADED_RECENTLY",
+    "COURTIER",
+    "MEMORYRELIGION_SPREAD_RELIGION",
+    "MEMORYFAMILY_OUR_LEGACY",
+]
+# Yield rate per turn (tenths, as stored) at turn 0 and its growth per turn
+YIELD_RATES = {
+    "YIELD_CIVICS": (30, 8.0),
+    "YIELD_CULTURE": (10, 3.0),
+    "YIELD_DISCONTENT": (20, 8.0),
+    "YIELD_FOOD": (40, 3.0),
+    "YIELD_GROWTH": (50, 8.0),
+    "YIELD_HAPPINESS": (-20, -6.0),
+    "YIELD_IRON": (20, 3.5),
+    "YIELD_MAINTENANCE": (50, 25.0),
+    "YIELD_MONEY": (20, -5.0),
+    "YIELD_ORDERS": (30, 3.0),
+    "YIELD_SCIENCE": (40, 6.0),
+    "YIELD_STONE": (20, 3.5),
+    "YIELD_TRAINING": (60, 15.0),
+    "YIELD_WOOD": (20, -0.5),
+}
+IMPROVEMENTS = [
+    "IMPROVEMENT_FARM",
+    "IMPROVEMENT_MINE",
+    "IMPROVEMENT_QUARRY",
+    "IMPROVEMENT_LUMBERMILL",
+    "IMPROVEMENT_PASTURE",
+    "IMPROVEMENT_WINDMILL",
+    "IMPROVEMENT_WATERMILL",
+    "IMPROVEMENT_LIBRARY_1",
+    "IMPROVEMENT_LIBRARY_2",
+    "IMPROVEMENT_SHRINE_ATHENA",
+    "IMPROVEMENT_MONASTERY_CHRISTIANITY",
+    "IMPROVEMENT_MUSAEUM",
+]
+SPECIALISTS = [
+    "SPECIALIST_FARMER",
+    "SPECIALIST_MINER",
+    "SPECIALIST_STONECUTTER",
+    "SPECIALIST_WOODCUTTER",
+    "SPECIALIST_RANCHER",
+    "SPECIALIST_PHILOSOPHER_1",
+    "SPECIALIST_PHILOSOPHER_2",
+    "SPECIALIST_DOCTOR_2",
+]
+TILE_RESOURCES = [
+    "RESOURCE_HORSE",
+    "RESOURCE_CATTLE",
+    "RESOURCE_WHEAT",
+    "RESOURCE_ORE",
+    "RESOURCE_FISH",
+    "RESOURCE_WINE",
+]
+PROJECTS = [
+    "PROJECT_ARCHIVE_1",
+    "PROJECT_ARCHIVE_2",
+    "PROJECT_FESTIVAL",
+    "PROJECT_FORUM_1",
+    "PROJECT_GOVERNOR",
+    "PROJECT_CONVOY",
+    "PROJECT_MIDWIFERY",
+]
+BONUSES = [
+    "BONUS_ACHIEVEMENT_FAMILY_FURIOUS",
+    "BONUS_CONVERT_LEGITIMACY",
+    "BONUS_FOUND_CITY",
+    "BONUS_TRAIN_UNIT",
+    "BONUS_ADOPT_LAW",
+]
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Database generation
+# ---------------------------------------------------------------------------
+
+
+def _pick_weighted(rng: random.Random, options: list[tuple]) -> tuple:
+    return rng.choices(options, weights=[option[1] for option in options])[0]
+
+
+def _family_names(nation: str) -> list[str]:
+    return [f"FAMILY_{family.upper()}" for family in NATION_FAMILIES[nation]]
+
+
+def _plan_tournament(
+    matches: int, seed: int, territory_matches: int, event_density: float
+) -> dict[str, list[dict]]:
+    """Rows of every non per-turn table, as lists of record dictionaries."""
+    rng = random.Random(seed)
+    participant_count = max(16, matches // 3)
+    participants = [
+        {
+            "participant_id": 1000 + i,
+            "display_name": f"player_{i:04d}",
+            "display_name_normalized": f"player_{i:04d}",
+            "challonge_username": f"player_{i:04d}",
+            "challonge_user_id": 50000 + i,
+            "seed": i + 1,
+            "final_rank": None,
+        }
+        for i in range(participant_count)
+    ]
+    skills = [rng.gauss(0, 1) for _ in participants]
+    nations = list(NATION_FAMILIES)
+    techs = list(TECH_TYPES)
+    start = datetime(2025, 1, 1)
+
+    # In insert order, for the foreign keys
+    rows: dict[str, list[dict]] = {"tournament_participants": participants}
+    rows.update(
+        (name, [])
+        for name in [
+            "matches",
+            "players",
+            "match_winners",
+            "match_metadata",
+            "rulers",
+            "events",
+            "cities",
+            "city_unit_production",
+            "city_projects",
+            "technology_progress",
+            "player_statistics",
+            "units_produced",
+            "pick_order_games",
+            "bench_players",
+            "bench_maps",
+        ]
+    )
+    ids = {"ruler": 0, "event": 0, "production": 0, "project": 0, "stat": 0}
+    ids.update(tech=0, unit=0)
+
+    def next_id(kind: str) -> int:
+        ids[kind] += 1
+        return ids[kind]
+
+    for m in range(matches):
+        match_id = m + 1
+        total_turns = int(min(180, max(35, rng.gauss(85, 25))))
+        map_size, _, width = _pick_weighted(rng, MAP_SIZES)
+        tournament_round = rng.choice([1, 2, 3, 4, 5, 6, -1, -2, -3, -4])
+        seats = rng.sample(range(participant_count), 2)
+        match_nations = rng.sample(nations, 2)
+        # Stronger players win more often
+        p_first = 1 / (1 + math.exp(skills[seats[1]] - skills[seats[0]]))
+        winner_slot = 0 if rng.random() < p_first else 1
+        player_ids = [2 * m + 1, 2 * m + 2]
+        names = [participants[s]["display_name"] for s in seats]
+        first_picker = rng.randrange(2)
+
+        rows["matches"].append(
+            {
+                "match_id": match_id,
+                "challonge_match_id": 400000 + match_id,
+                "file_name": f"match_{match_id}_{names[0]}-{names[1]}.zip",
+                "file_hash": f"{match_id:064x}",
+                "game_name": f"{names[0]} vs {names[1]}",
+                "save_date": start + timedelta(hours=37 * m % 8760),
+                "game_mode": "NETWORK",
+                "map_size": map_size,
+                "map_class": rng.choice(MAP_CLASSES),
+                "map_aspect_ratio": rng.choice(MAP_ASPECTS),
+                "turn_style": "Tight",
+                "turn_timer": rng.choice(["Slow", "Medium"]),
+                "victory_conditions": "Points, Time, Conquest",
+                "total_turns": total_turns,
+                "tournament_round": tournament_round,
+                "winner_player_id": player_ids[winner_slot],
+                "player1_participant_id": participants[seats[0]]["participant_id"],
+                "player2_participant_id": participants[seats[1]]["participant_id"],
+                "winner_participant_id": participants[seats[winner_slot]][
+                    "participant_id"
+                ],
+                "first_picker_participant_id": participants[seats[first_picker]][
+                    "participant_id"
+                ],
+                "second_picker_participant_id": participants[
+                    seats[1 - first_picker]
+                ]["participant_id"],
+            }
+        )
+        rows["match_winners"].append(
+            {
+                "match_id": match_id,
+                "winner_player_id": player_ids[winner_slot],
+                "winner_determination_method": "parser_determined",
+            }
+        )
+        rows["match_metadata"].append(
+            {
+                "match_id": match_id,
+                "difficulty": "Moderate",
+                "event_level": "Moderate",
+                "victory_type": rng.choice(["Points", "Conquest", "Time"]),
+                "victory_turn": total_turns,
+                "opponent_level": "Peaceful",
+                "tribe_level": "Normal",
+                "development": "Fledgling",
+                "advantage": "None",
+                "succession_gender": "Absolute Cognatic",
+                "succession_order": "Primogeniture",
+                "mortality": "Standard",
+                "victory_point_modifier": "Medium High",
+                "game_options": '{"GAMEOPTION_COMPETITIVE_MODE": true}',
+                "dlc_content": '{"DLC_BEHIND_THE_THRONE": true}',
+                "map_settings": '{"MapAspectRatio": "MAPASPECTRATIO_SQUARE"}',
+            }
+        )
+        if rng.random() < 0.6:
+            rows["pick_order_games"].append(
+                {
+                    "game_number": match_id,
+                    "round_number": abs(tournament_round),
+                    "round_label": f"Round {abs(tournament_round)}",
+                    "player1_sheet_name": names[0],
+                    "player2_sheet_name": names[1],
+                    "first_pick_nation": match_nations[first_picker],
+                    "second_pick_nation": match_nations[1 - first_picker],
+                    "first_picker_sheet_name": names[first_picker],
+                    "second_picker_sheet_name": names[1 - first_picker],
+                    "matched_match_id": match_id,
+                    "first_picker_participant_id": participants[seats[first_picker]][
+                        "participant_id"
+                    ],
+                    "second_picker_participant_id": participants[
+                        seats[1 - first_picker]
+                    ]["participant_id"],
+                    "match_confidence": "high",
+                    "match_reason": "synthetic",
+                }
+            )
+
+        # Capitals on opposite halves of the map; cities spread around them
+        capitals = [
+            (width // 4 + rng.randrange(-3, 4), width // 2 + rng.randrange(-5, 6)),
+            (3 * width // 4 + rng.randrange(-3, 4), width // 2 + rng.randrange(-5, 6)),
+        ]
+        city_ids = []
+        next_city = 0
+        for slot in range(2):
+            player_id = player_ids[slot]
+            nation = match_nations[slot]
+            families = _family_names(nation)
+            skill = skills[seats[slot]]
+            won = slot == winner_slot
+            rows["players"].append(
+                {
+                    "player_id": player_id,
+                    "match_id": match_id,
+                    "player_name": names[slot],
+                    "player_name_normalized": names[slot],
+                    "civilization": nation,
+                    "team_id": None,
+                    "difficulty_level": None,
+                    "final_score": int(total_turns * (0.12 + 0.03 * skill)),
+                    "is_human": True,
+                    "final_turn_active": total_turns,
+                    "participant_id": participants[seats[slot]]["participant_id"],
+                }
+            )
+            rows["bench_players"].append(
+                {
+                    "match_id": match_id,
+                    "player_id": player_id,
+                    "slot": slot,
+                    "total_turns": total_turns,
+                    "skill": 1.0 + 0.15 * skill + (0.1 if won else 0.0),
+                    "nation": nation,
+                    "has_totals": rng.random() < 0.7,
+                }
+            )
+
+            def event(turn: int, event_type: str, description: str, data=None):
+                rows["events"].append(
+                    {
+                        "event_id": next_id("event"),
+                        "match_id": match_id,
+                        "turn_number": turn,
+                        "event_type": event_type,
+                        "player_id": player_id,
+                        "description": description,
+                        "x_coordinate": None,
+                        "y_coordinate": None,
+                        "event_data": json.dumps(data) if data else None,
+                    }
+                )
+
+            # Cities: the capital on turn 1, then steady expansion
+            city_count = max(2, int(total_turns / 9 + rng.gauss(0, 2)))
+            cx, cy = capitals[slot]
+            player_cities = []
+            for c in range(city_count):
+                founded = 1 if c == 0 else rng.randint(5, max(6, total_turns - 5))
+                x = min(width - 1, max(0, cx + rng.randrange(-8, 9)))
+                y = min(width - 1, max(0, cy + rng.randrange(-8, 9)))
+                if c == 0:
+                    x, y = cx, cy
+                family = families[c % len(families)]
+                city = {
+                    "city_id": next_city,
+                    "match_id": match_id,
+                    "player_id": player_id,
+                    "city_name": f"{nation[:4]}-{c}",
+                    "tile_id": y * width + x,
+                    "founded_turn": founded,
+                    "family_name": family,
+                    "is_capital": c == 0,
+                    "population": rng.randint(1, 14),
+                    "first_player_id": player_ids[1 - slot]
+                    if rng.random() < 0.05
+                    else player_id,
+                    "governor_id": None,
+                    "culture_level": rng.randint(1, 4),
+                    "religion_count": rng.randint(0, 3),
+                }
+                next_city += 1
+                player_cities.append(city)
+                rows["cities"].append(city)
+                archetype = NATION_FAMILIES[nation][family[7:].title()].upper()
+                event(
+                    founded,
+                    "CITY_FOUNDED",
+                    f"Founded  {city['city_name']}",
+                    {"family_archetype": archetype},
+                )
+                for unit in rng.sample(["UNIT_WORKER", "UNIT_SETTLER", "UNIT_WARRIOR",
+                                        "UNIT_SPEARMAN", "UNIT_ARCHER"], 3):
+                    rows["city_unit_production"].append(
+                        {
+                            "production_id": next_id("production"),
+                            "match_id": match_id,
+                            "city_id": city["city_id"],
+                            "unit_type": unit,
+                            "count": rng.randint(1, 6),
+                        }
+                    )
+                for project in rng.sample(PROJECTS, 2):
+                    rows["city_projects"].append(
+                        {
+                            "project_id": next_id("project"),
+                            "match_id": match_id,
+                            "city_id": city["city_id"],
+                            "project_type": project,
+                            "count": rng.randint(1, 4),
+                        }
+                    )
+            city_ids.append(player_cities[0]["city_id"])
+
+            # Technologies, roughly one every 3.5 turns
+            researched = rng.sample(techs, min(len(techs), int(total_turns / 3.5)))
+            for turn, tech in zip(
+                sorted(rng.randint(1, total_turns) for _ in researched), researched
+            ):
+                name = tech[5:].replace("_", " ").title()
+                event(turn, "TECH_DISCOVERED", f"Discovered {name}", {"tech": tech})
+                rows["technology_progress"].append(
+                    {
+                        "tech_progress_id": next_id("tech"),
+                        "match_id": match_id,
+                        "player_id": player_id,
+                        "tech_name": tech,
+                        "count": 1,
+                    }
+                )
+
+            # Laws: one per law class, some switched later
+            classes = rng.sample(
+                list(LAW_CLASSES), min(len(LAW_CLASSES), max(2, total_turns // 9))
+            )
+            for turn, law_class in zip(
+                sorted(rng.randint(8, total_turns) for _ in classes), classes
+            ):
+                law = rng.choice(LAW_CLASSES[law_class])
+                name = law[4:].replace("_", " ").title()
+                event(turn, "LAW_ADOPTED", f"Adopted {name}", {"law": law})
+            for law_class in classes:
+                rows["player_statistics"].append(
+                    {
+                        "stat_id": next_id("stat"),
+                        "match_id": match_id,
+                        "player_id": player_id,
+                        "stat_category": "law_changes",
+                        "stat_name": f"LAWCLASS_{law_class.upper()}",
+                        "value": rng.randint(1, 2),
+                    }
+                )
+
+            # Rulers: a succession every ~30 turns
+            succession_turns = [1] + sorted(
+                rng.sample(range(10, total_turns), min(total_turns - 10, total_turns // 30))
+            )
+            for order, turn in enumerate(succession_turns):
+                death = (
+                    succession_turns[order + 1]
+                    if order + 1 < len(succession_turns)
+                    else None
+                )
+                rows["rulers"].append(
+                    {
+                        "ruler_id": next_id("ruler"),
+                        "match_id": match_id,
+                        "player_id": player_id,
+                        "character_id": 100 * slot + order,
+                        "ruler_name": f"Ruler {order + 1}",
+                        "archetype": rng.choice(list(ARCHETYPE_ICONS)),
+                        "starting_trait": rng.choice(STARTING_TRAITS)
+                        if order == 0
+                        else None,
+                        "cognomen": rng.choice([None, "the Great", "the Wise"]),
+                        "birth_turn": turn - rng.randint(18, 40),
+                        "death_turn": death,
+                        "succession_order": order,
+                        "succession_turn": turn,
+                    }
+                )
+                if order:
+                    event(
+                        turn,
+                        "CHARACTER_SUCCESSION",
+                        f"A new ruler, King Ruler {order + 1} , has taken the throne.",
+                    )
+                    event(turn, "CHARACTER_DEATH", f"King Ruler {order} has died!")
+
+            # Ambitions
+            for _ in range(rng.randint(5, 10)):
+                turn = rng.randint(2, total_turns)
+                ambition = rng.choice(AMBITIONS)
+                event(
+                    turn,
+                    "GOAL_STARTED",
+                    f"Ruler has started a new link(CONCEPT_AMBITION): {ambition}",
+                )
+                outcome = rng.random()
+                if outcome < 0.6 and turn + 5 <= total_turns:
+                    event(
+                        rng.randint(turn + 5, total_turns),
+                        "GOAL_FINISHED",
+                        f"You have completed an link(CONCEPT_AMBITION): {ambition}",
+                    )
+                elif outcome < 0.7:
+                    event(total_turns, "GOAL_FAILED", f"Failed: {ambition}")
+
+            if rng.random() < 0.5:
+                event(
+                    rng.randint(10, total_turns),
+                    "RELIGION_FOUNDED",
+                    f"{nation} Paganism founded in  {player_cities[0]['city_name']}.",
+                )
+            if rng.random() < 0.3:
+                wonder = rng.choice(WONDERS)
+                turn = rng.randint(20, total_turns)
+                event(
+                    turn,
+                    "WONDER_ACTIVITY",
+                    f"{wonder} has begun construction ({names[slot]})",
+                )
+                event(
+                    min(total_turns, turn + 8),
+                    "WONDER_ACTIVITY",
+                    f"{wonder} completed by {nation} ({names[slot]})",
+                )
+
+            # Background memories and diplomacy at the configured density
+            for _ in range(int(total_turns * 0.8 * event_density)):
+                event_type = rng.choice(MEMORY_EVENTS)
+                event(
+                    rng.randint(1, total_turns),
+                    event_type,
+                    event_type.replace("_", " ").title(),
+                )
+
+            for stat_name in rng.sample(BONUSES, 3):
+                rows["player_statistics"].append(
+                    {
+                        "stat_id": next_id("stat"),
+                        "match_id": match_id,
+                        "player_id": player_id,
+                        "stat_category": "bonus_count",
+                        "stat_name": stat_name,
+                        "value": rng.randint(1, 10),
+                    }
+                )
+            for yield_type in YIELD_RATES:
+                rows["player_statistics"].append(
+                    {
+                        "stat_id": next_id("stat"),
+                        "match_id": match_id,
+                        "player_id": player_id,
+                        "stat_category": "yield_stockpile",
+                        "stat_name": yield_type,
+                        "value": rng.randint(0, 5000),
+                    }
+                )
+            for unit in ["UNIT_SETTLER", "UNIT_WORKER", "UNIT_MILITIA", "UNIT_WARRIOR",
+                         "UNIT_SPEARMAN", "UNIT_ARCHER", "UNIT_SCOUT"]:
+                rows["units_produced"].append(
+                    {
+                        "unit_produced_id": next_id("unit"),
+                        "match_id": match_id,
+                        "player_id": player_id,
+                        "unit_type": unit,
+                        "count": rng.randint(1, 8),
+                    }
+                )
+
+        if m < territory_matches:
+            rows["bench_maps"].append(
+                {
+                    "match_id": match_id,
+                    "width": width,
+                    "total_turns": total_turns,
+                    "p1": player_ids[0],
+                    "p2": player_ids[1],
+                    "c1x": capitals[0][0],
+                    "c1y": capitals[0][1],
+                    "c2x": capitals[1][0],
+                    "c2y": capitals[1][1],
+                    "city1": city_ids[0],
+                    "city2": city_ids[1],
+                }
+            )
+
+    return rows
+
+
+def _sql_list(values: list[str]) -> str:
+    return "[" + ", ".join(f"'{v}'" for v in values) + "]"
+
+
+# Per-turn tables, generated in SQL from the bench_players and bench_maps plans.
+# hash() of the row's keys stands in for random noise, so output is
+# deterministic for a seed.
+PER_TURN_SQL = {
+    "player_points_history": """
+        INSERT INTO player_points_history
+        SELECT row_number() OVER (), match_id, player_id, turn,
+               greatest(0, floor(turn * 0.14 * skill + (hash(player_id, turn) % 3)::INT))::INT
+        FROM (SELECT *, unnest(range(2, total_turns + 1)) AS turn FROM bench_players)
+    """,
+    "player_military_history": """
+        INSERT INTO player_military_history
+        SELECT row_number() OVER (), match_id, player_id, turn,
+               floor(turn * 3.8 * skill + (hash(player_id, turn, 'm') % 40)::INT)::INT
+        FROM (SELECT *, unnest(range(2, total_turns + 1)) AS turn FROM bench_players)
+    """,
+    "player_legitimacy_history": """
+        INSERT INTO player_legitimacy_history
+        SELECT row_number() OVER (), match_id, player_id, turn,
+               greatest(0, least(200, floor(20 + turn * 0.9 * skill
+                                + (hash(player_id, turn, 'l') % 30)::INT - 15)))::INT
+        FROM (SELECT *, unnest(range(2, total_turns + 1)) AS turn FROM bench_players)
+    """,
+    "player_yield_history": """
+        INSERT INTO player_yield_history
+        SELECT row_number() OVER (), p.match_id, p.player_id, p.turn, y.resource_type,
+               floor((y.base + y.growth * p.turn) * p.skill
+                     + (hash(p.player_id, p.turn, y.resource_type) % 21)::INT - 10)::INT
+        FROM (SELECT *, unnest(range(2, total_turns + 1)) AS turn FROM bench_players) p
+        CROSS JOIN bench_yields y
+    """,
+    "player_yield_total_history": """
+        INSERT INTO player_yield_total_history
+        SELECT row_number() OVER (), match_id, player_id, turn, resource_type,
+               sum(greatest(rate, 0)) OVER (
+                   PARTITION BY player_id, resource_type ORDER BY turn
+               )::INT
+        FROM (
+            SELECT p.match_id, p.player_id, p.turn, y.resource_type,
+                   floor((y.base + y.growth * p.turn) * p.skill)::INT AS rate
+            FROM (SELECT *, unnest(range(2, total_turns + 1)) AS turn
+                  FROM bench_players WHERE has_totals) p
+            CROSS JOIN bench_yields y
+        )
+    """,
+    "family_opinion_history": """
+        INSERT INTO family_opinion_history
+        SELECT row_number() OVER (), p.match_id, p.player_id, p.turn, f.family_name,
+               CASE WHEN f.nation = p.nation
+                    THEN floor(((hash(p.player_id, f.family_name) % 300)::INT - 120)
+                               * p.turn / p.total_turns
+                               + (hash(p.player_id, p.turn, f.family_name) % 41)::INT - 20)
+                    ELSE 0 END::INT
+        FROM (SELECT *, unnest(range(2, total_turns + 1)) AS turn FROM bench_players) p
+        CROSS JOIN bench_families f
+    """,
+    "religion_opinion_history": """
+        INSERT INTO religion_opinion_history
+        SELECT row_number() OVER (), p.match_id, p.player_id, p.turn, r.religion_name,
+               ((hash(p.player_id, r.religion_name) % 3)::INT - 1) * 20
+               + CASE WHEN (hash(p.player_id, r.religion_name) % 5)::INT = 0
+                      THEN floor(p.turn * 0.8)::INT ELSE 0 END
+        FROM (SELECT *, unnest(range(2, total_turns + 1)) AS turn FROM bench_players) p
+        CROSS JOIN bench_religions r
+    """,
+}
+
+# Full map snapshot per turn. Each player's land grows outward from its
+# capital; improvements, specialists and roads appear on owned tiles over time.
+TERRITORY_SQL = f"""
+    INSERT INTO territories
+    SELECT row_number() OVER (), match_id, x, y, turn,
+           terrain, height,
+           CASE WHEN owner IS NOT NULL AND turn >= improved_turn
+                THEN {_sql_list(IMPROVEMENTS)}[1 + h % {len(IMPROVEMENTS)}] END,
+           CASE WHEN owner IS NOT NULL AND turn >= improved_turn + 10 AND h % 5 = 0
+                THEN {_sql_list(SPECIALISTS)}[1 + h % {len(SPECIALISTS)}] END,
+           CASE WHEN h % 13 = 0
+                THEN {_sql_list(TILE_RESOURCES)}[1 + h % {len(TILE_RESOURCES)}] END,
+           owner IS NOT NULL AND h % 6 = 0,
+           owner,
+           CASE WHEN owner = p1 THEN city1 WHEN owner = p2 THEN city2 END
+    FROM (
+        SELECT *,
+               CASE
+                   WHEN terrain = 'TERRAIN_WATER' THEN NULL
+                   WHEN d1 <= radius AND d1 <= d2 THEN p1
+                   WHEN d2 <= radius THEN p2
+               END AS owner,
+               CASE
+                   WHEN terrain = 'TERRAIN_WATER' AND h % 3 = 0 THEN 'HEIGHT_COAST'
+                   WHEN terrain = 'TERRAIN_WATER' THEN 'HEIGHT_OCEAN'
+                   WHEN height_roll < 15 THEN 'HEIGHT_HILL'
+                   WHEN height_roll < 20 THEN 'HEIGHT_MOUNTAIN'
+                   ELSE 'HEIGHT_FLAT'
+               END AS height
+        FROM (
+            SELECT *,
+                   CASE
+                       WHEN terrain_roll < 15 THEN 'TERRAIN_WATER'
+                       WHEN terrain_roll < 40 THEN 'TERRAIN_TEMPERATE'
+                       WHEN terrain_roll < 60 THEN 'TERRAIN_LUSH'
+                       WHEN terrain_roll < 75 THEN 'TERRAIN_ARID'
+                       WHEN terrain_roll < 82 THEN 'TERRAIN_TUNDRA'
+                       WHEN terrain_roll < 88 THEN 'TERRAIN_MARSH'
+                       WHEN terrain_roll < 94 THEN 'TERRAIN_SAND'
+                       ELSE 'TERRAIN_FROST'
+                   END AS terrain
+            FROM (
+                SELECT m.match_id, m.p1, m.p2, m.city1, m.city2, x, y, turn,
+                       (hash(m.match_id, x, y) % 1000003)::INT AS h,
+                       (hash(m.match_id, x, y, 't') % 100)::INT AS terrain_roll,
+                       (hash(m.match_id, x, y, 'h') % 100)::INT AS height_roll,
+                       10 + (hash(m.match_id, x, y, 'i') % m.total_turns)::INT
+                           AS improved_turn,
+                       sqrt((x - m.c1x) ^ 2 + (y - m.c1y) ^ 2) AS d1,
+                       sqrt((x - m.c2x) ^ 2 + (y - m.c2y) ^ 2) AS d2,
+                       least(2 + turn * 0.12, m.width / 2.2) AS radius
+                FROM bench_maps m, range(m.width) xs(x), range(m.width) ys(y),
+                     range(1, m.total_turns + 1) ts(turn)
+            )
+        )
+    )
+"""
+
+
+def generate_database(
+    path: Path,
+    matches: int,
+    seed: int = 0,
+    territory_matches: int = DEFAULT_TERRITORY_MATCHES,
+    event_density: float = 1.0,
+) -> dict[str, int]:
+    """Create a synthetic tournament database with the production schema.
+
+    Args:
+        path: DuckDB file to create (replaced if it exists)
+        matches: Number of matches
+        seed: Random seed; the same seed gives the same database
+        territory_matches: Matches that get full per-turn territory snapshots
+        event_density: Multiplier for background (memory/diplomacy) events
+
+    Returns:
+        Table name -> row count
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for stale in (path, path.with_name(path.name + ".wal")):
+        stale.unlink(missing_ok=True)
+
+    rows = _plan_tournament(matches, seed, territory_matches, event_density)
+
+    db = TournamentDatabase(str(path), read_only=False)
+    try:
+        db.create_schema()
+        # Enum columns accept only known values; extend them up front, while
+        # the tables are still empty
+        families = [f for nation in NATION_FAMILIES for f in _family_names(nation)]
+        categorical = {
+            "territories": {
+                "improvement_type": IMPROVEMENTS,
+                "specialist_type": SPECIALISTS,
+                "resource_type": TILE_RESOURCES,
+            },
+            "events": {"event_type": sorted({r["event_type"] for r in rows["events"]})},
+            "family_opinion_history": {"family_name": families},
+            "religion_opinion_history": {"religion_name": RELIGIONS},
+        }
+        for table, columns in categorical.items():
+            records = [
+                {column: value}
+                for column, values in columns.items()
+                for value in values
+            ]
+            db._ensure_categorical_values(table, records)
+
+        with db.bulk_load() as conn:
+            conn.execute("SET enable_progress_bar = false")
+            for table, records in rows.items():
+                frame = pd.DataFrame(records)
+                if table.startswith("bench_"):
+                    conn.execute(f"CREATE TEMP TABLE {table} AS SELECT * FROM frame")
+                elif records:
+                    columns = ", ".join(frame.columns)
+                    conn.execute(
+                        f"INSERT INTO {table} ({columns}) SELECT {columns} FROM frame"
+                    )
+            yields = pd.DataFrame(
+                [(name, base, growth) for name, (base, growth) in YIELD_RATES.items()],
+                columns=["resource_type", "base", "growth"],
+            )
+            conn.execute("CREATE TEMP TABLE bench_yields AS SELECT * FROM yields")
+            family_frame = pd.DataFrame(
+                [
+                    (name, nation)
+                    for nation in NATION_FAMILIES
+                    for name in _family_names(nation)
+                ],
+                columns=["family_name", "nation"],
+            )
+            conn.execute(
+                "CREATE TEMP TABLE bench_families AS SELECT * FROM family_frame"
+            )
+            conn.execute(
+                "CREATE TEMP TABLE bench_religions AS "
+                f"SELECT unnest({_sql_list(RELIGIONS)}) AS religion_name"
+            )
+            for sql in PER_TURN_SQL.values():
+                conn.execute(sql)
+            if rows["bench_maps"]:
+                conn.execute(TERRITORY_SQL)
+            for table in ["bench_players", "bench_maps", "bench_yields"]:
+                conn.execute(f"DROP TABLE {table}")
+            conn.execute("DROP TABLE bench_families")
+            conn.execute("DROP TABLE bench_religions")
+
+        # Same physical layout as a production import
+        db.optimize_storage()
+
+        with db.get_connection() as conn:
+            counts = {
+                table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for (table,) in conn.execute(
+                    "SELECT table_name FROM duckdb_tables() "
+                    "WHERE schema_name = 'main' ORDER BY table_name"
+                ).fetchall()
+            }
+    finally:
+        db.close()
+    return counts
+
+
+def _database_path(bench_dir: Path, matches: int, seed: int, territory: int) -> Path:
+    return bench_dir / (
+        f"bench_v{GENERATOR_VERSION}_{matches}m_s{seed}_t{territory}.duckdb"
+    )
+
+
+def ensure_database(
+    bench_dir: Path, matches: int, seed: int, territory_matches: int, force: bool
+) -> Path:
+    """Return the cached database for a scale, generating it if needed."""
+    path = _database_path(bench_dir, matches, seed, territory_matches)
+    if path.exists() and not force:
+        return path
+    print(f"Generating {matches} matches -> {path} ...", flush=True)
+    started = time.perf_counter()
+    counts = generate_database(
+        path, matches, seed=seed, territory_matches=min(territory_matches, matches)
+    )
+    print(
+        f"  {sum(counts.values()):,} rows in {time.perf_counter() - started:.1f} s,"
+        f" {path.stat().st_size / 1e6:.0f} MB"
+    )
+    return path
+
+
+# ---------------------------------------------------------------------------
+# Benchmark (runs in a child process per scale)
+# ---------------------------------------------------------------------------
+
+
+def benchmark_context(db: TournamentDatabase) -> dict[str, Any]:
+    """Arguments for the query methods: a typical match that has territories."""
+    with db.get_connection() as conn:
+        match_id, total_turns = conn.execute(
+            """
+            SELECT match_id, total_turns
+            FROM matches
+            WHERE match_id IN (SELECT DISTINCT match_id FROM territories)
+            ORDER BY abs(total_turns - (SELECT median(total_turns) FROM matches)),
+                     match_id
+            LIMIT 1
+        """
+        ).fetchone()
+        players = conn.execute(
+            "SELECT player_id, player_name FROM players WHERE match_id = ? "
+            "ORDER BY player_id",
+            [match_id],
+        ).fetchall()
+    return {
+        "match_id": match_id,
+        "turn_number": total_turns // 2,
+        "player_name": players[0][1],
+        "player1": players[0][1],
+        "player2": players[1][1],
+        "player1_id": players[0][0],
+        "player2_id": players[1][0],
+        "yield_type": "YIELD_SCIENCE",
+        "page_current": 0,
+        "page_size": 25,
+    }
+
+
+def public_query_methods(queries: Any) -> dict[str, Callable[..., Any]]:
+    """Every public read method of a TournamentQueries instance."""
+    return {
+        name: method
+        for name, method in inspect.getmembers(queries, inspect.ismethod)
+        if not name.startswith("_") and name not in SKIPPED_METHODS
+    }
+
+
+def _result_size(result: Any) -> int | None:
+    if isinstance(result, tuple) and result and isinstance(result[0], pd.DataFrame):
+        result = result[0]
+    try:
+        return len(result)
+    except TypeError:
+        return None
+
+
+def _timings(samples: list[float]) -> dict[str, float]:
+    return {
+        "ms": round(statistics.median(samples), 2),
+        "min_ms": round(min(samples), 2),
+    }
+
+
+def bench_query_methods(
+    queries: Any, context: dict[str, Any], repeat: int, only: str | None = None
+) -> dict[str, dict]:
+    """Time each public query method with cold caches.
+
+    Returns:
+        Method name -> {"ms", "min_ms", "rows"} or {"error"}
+    """
+    results: dict[str, dict] = {}
+    for name, method in sorted(public_query_methods(queries).items()):
+        if only and only not in name:
+            continue
+        parameters = inspect.signature(method).parameters.values()
+        required = [p.name for p in parameters if p.default is inspect.Parameter.empty]
+        missing = [p for p in required if p not in context]
+        if missing:
+            results[name] = {"error": f"no benchmark value for {', '.join(missing)}"}
+            continue
+        kwargs = {p: context[p] for p in required}
+        samples = []
+        try:
+            for _ in range(repeat):
+                queries.invalidate_caches()
+                started = time.perf_counter()
+                result = method(**kwargs)
+                samples.append((time.perf_counter() - started) * 1000)
+        except Exception as e:  # Recorded per method; one failure must not stop the run
+            results[name] = {"error": f"{type(e).__name__}: {e}"}
+            continue
+        results[name] = {**_timings(samples), "rows": _result_size(result)}
+    return results
+
+
+def bench_page_callbacks(
+    server: Any, queries: Any, context: dict[str, Any], repeat: int
+) -> dict[str, dict]:
+    """Time the callbacks the overview and match pages send on load.
+
+    Callbacks are sent one after another, including the ones triggered by
+    earlier results, with cold caches like the first visit after a deploy.
+
+    Returns:
+        Page -> {"ms", "min_ms", "calls", "callbacks": output -> timings,
+        "errors": output -> HTTP status}
+    """
+    from scripts.replay_traffic import (
+        collect_props,
+        fire_page_callbacks,
+        pages_router_body,
+    )
+
+    client = server.test_client()
+    dependencies = client.get("/_dash-dependencies").get_json()
+    shell = client.get("/_dash-layout").get_json()
+    pages = {
+        "overview": "/",
+        "match": f"/matches?match_id={context['match_id']}",
+    }
+
+    results: dict[str, dict] = {}
+    for page, path in pages.items():
+        url = f"http://localhost{path}"
+        totals: list[float] = []
+        per_callback: dict[str, list[float]] = {}
+        errors: dict[str, int] = {}
+        for _ in range(repeat):
+            queries.invalidate_caches()
+            routed = client.post(
+                "/_dash-update-component", json=pages_router_body(path)
+            )
+            props = collect_props(shell, url)
+            collect_props(
+                routed.get_json()["response"]["_pages_content"]["children"],
+                url,
+                props,
+            )
+            load: dict[str, float] = {}
+
+            def send(body: dict) -> dict | None:
+                started = time.perf_counter()
+                response = client.post("/_dash-update-component", json=body)
+                elapsed = (time.perf_counter() - started) * 1000
+                load[body["output"]] = load.get(body["output"], 0.0) + elapsed
+                if response.status_code >= 400:
+                    errors[body["output"]] = response.status_code
+                    return None
+                return response.get_json(silent=True)
+
+            calls = fire_page_callbacks(send, dependencies, props, url)
+            totals.append(sum(load.values()))
+            for output, elapsed in load.items():
+                per_callback.setdefault(output, []).append(elapsed)
+        results[page] = {
+            **_timings(totals),
+            "calls": calls,
+            "callbacks": {
+                output: _timings(samples) for output, samples in per_callback.items()
+            },
+            "errors": errors,
+        }
+    return results
+
+
+def run_scale(db_path: str, repeat: int, only: str | None, callbacks: bool) -> dict:
+    """Benchmark one database; the app must see it as TOURNAMENT_DB_PATH."""
+    from tournament_visualizer.data.queries import get_queries
+
+    queries = get_queries()
+    context = benchmark_context(queries.db)
+    result: dict[str, Any] = {
+        "context": context,
+        "queries": bench_query_methods(queries, context, repeat, only),
+    }
+    if callbacks:
+        from tournament_visualizer.app import server
+
+        result["callbacks"] = bench_page_callbacks(server, queries, context, repeat)
+    return result
+
+
+def _run_child(db_path: Path, args: argparse.Namespace) -> dict:
+    """Run run_scale() in a fresh interpreter, so caches and memory start clean."""
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as handle:
+        output = Path(handle.name)
+    command = [
+        sys.executable,
+        str(Path(__file__).resolve()),
+        "--child",
+        str(db_path),
+        "--child-output",
+        str(output),
+        "--repeat",
+        str(args.repeat),
+    ]
+    if args.only:
+        command += ["--only", args.only]
+    if args.no_callbacks:
+        command.append("--no-callbacks")
+    env = dict(
+        os.environ,
+        TOURNAMENT_DB_PATH=str(db_path),
+        # The app only checks that this exists; nothing is imported
+        SAVES_DIRECTORY=str(db_path.parent),
+        PERF_TELEMETRY="false",
+    )
+    try:
+        subprocess.run(command, env=env, cwd=PROJECT_ROOT, check=True)
+        return json.loads(output.read_text())
+    finally:
+        output.unlink(missing_ok=True)
+
+
+# ---------------------------------------------------------------------------
+# Baseline comparison and report
+# ---------------------------------------------------------------------------
+
+
+def _flatten(results: dict) -> dict[tuple[str, str], float]:
+    """(scale, "query name" / "page page") -> median ms, for comparison."""
+    flat = {}
+    for scale, data in results.get("scales", {}).items():
+        for name, timing in data.get("queries", {}).items():
+            if "ms" in timing:
+                flat[(scale, f"query {name}")] = timing["ms"]
+        for page, timing in data.get("callbacks", {}).items():
+            flat[(scale, f"page {page}")] = timing["ms"]
+            for output, callback in timing["callbacks"].items():
+                flat[(scale, f"callback {output}")] = callback["ms"]
+    return flat
+
+
+def compare(
+    results: dict,
+    baseline: dict,
+    ratio: float = REGRESSION_RATIO,
+    min_ms: float = REGRESSION_MIN_MS,
+) -> list[dict]:
+    """Timings that changed by more than `ratio` and `min_ms` from the baseline.
+
+    Returns:
+        Rows with scale, name, baseline_ms, ms and ratio, regressions first
+    """
+    current = _flatten(results)
+    previous = _flatten(baseline)
+    changes = []
+    for key, ms in current.items():
+        before = previous.get(key)
+        if before is None or abs(ms - before) < min_ms:
+            continue
+        change = ms / before if before else float("inf")
+        if change >= ratio or change <= 1 / ratio:
+            changes.append(
+                {
+                    "scale": key[0],
+                    "name": key[1],
+                    "baseline_ms": before,
+                    "ms": ms,
+                    "ratio": round(change, 2),
+                }
+            )
+    changes.sort(key=lambda row: row["ratio"], reverse=True)
+    return changes
+
+
+def print_scale_report(scale: str, data: dict, top: int) -> None:
+    queries = data["queries"]
+    timed = {name: t for name, t in queries.items() if "ms" in t}
+    failed = {name: t["error"] for name, t in queries.items() if "error" in t}
+    print(f"\n{'=' * 78}")
+    print(
+        f" {scale} matches: {len(timed)} query methods,"
+        f" {sum(t['ms'] for t in timed.values()):.0f} ms in total"
+    )
+    print(f"{'=' * 78}")
+    print(f" {'Method':<56s} {'ms':>9s} {'rows':>9s}")
+    for name, timing in sorted(timed.items(), key=lambda i: i[1]["ms"], reverse=True)[
+        :top
+    ]:
+        rows = "" if timing["rows"] is None else str(timing["rows"])
+        print(f" {name[:56]:<56s} {timing['ms']:>9.1f} {rows:>9s}")
+    for name, error in failed.items():
+        print(f" FAILED {name}: {error[:100]}")
+
+    for page, timing in data.get("callbacks", {}).items():
+        print(
+            f"\n {page} page: {timing['calls']} callback requests,"
+            f" {timing['ms']:.0f} ms sequential"
+        )
+        slowest = sorted(
+            timing["callbacks"].items(), key=lambda i: i[1]["ms"], reverse=True
+        )[:5]
+        for output, callback in slowest:
+            print(f"   {output[:62]:<62s} {callback['ms']:>9.1f}")
+        for output, status in timing["errors"].items():
+            print(f"   FAILED {output}: HTTP {status}")
+
+
+def print_changes(changes: list[dict]) -> None:
+    if not changes:
+        print("\nNo timing changed by more than the thresholds vs the baseline")
+        return
+    print(f"\n{'=' * 78}")
+    print(" Changes vs baseline")
+    print(f"{'=' * 78}")
+    print(f" {'Scale':>6s} {'Name':<45s} {'Before':>8s} {'Now':>8s} {'Ratio':>6s}")
+    for row in changes:
+        print(
+            f" {row['scale']:>6s} {row['name'][:45]:<45s} {row['baseline_ms']:>8.1f}"
+            f" {row['ms']:>8.1f} {row['ratio']:>6.2f}"
+        )
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark queries and page callbacks on synthetic databases",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--scales",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SCALES,
+        help="Match counts to benchmark (default: 50 500 5000)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per timing")
+    parser.add_argument("--only", help="Only query methods containing this text")
+    parser.add_argument(
+        "--no-callbacks", action="store_true", help="Skip the page callback sets"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Data generation seed")
+    parser.add_argument(
+        "--territory-matches",
+        type=int,
+        default=DEFAULT_TERRITORY_MATCHES,
+        help="Matches with per-turn territory snapshots",
+    )
+    parser.add_argument(
+        "--bench-dir",
+        type=Path,
+        default=DEFAULT_BENCH_DIR,
+        help="Where databases and results are kept (default: data/bench)",
+    )
+    parser.add_argument(
+        "--regenerate", action="store_true", help="Rebuild cached databases"
+    )
+    parser.add_argument("--baseline", type=Path, help="Default: BENCH_DIR/baseline.json")
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="Store these results as baseline"
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit with status 1 if anything got slower than the baseline",
+    )
+    parser.add_argument("--top", type=int, default=15, help="Slowest methods to list")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--child-output", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        logging.disable(logging.INFO)
+        result = run_scale(args.child, args.repeat, args.only, not args.no_callbacks)
+        Path(args.child_output).write_text(json.dumps(result))
+        return
+
+    results: dict[str, Any] = {
+        "generator_version": GENERATOR_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "machine": platform.platform(),
+        "python": platform.python_version(),
+        "duckdb": duckdb.__version__,
+        "repeat": args.repeat,
+        "scales": {},
+    }
+    for scale in args.scales:
+        db_path = ensure_database(
+            args.bench_dir, scale, args.seed, args.territory_matches, args.regenerate
+        )
+        print(f"Benchmarking {scale} matches ...", flush=True)
+        data = _run_child(db_path, args)
+        data["database_mb"] = round(db_path.stat().st_size / 1e6, 1)
+        results["scales"][str(scale)] = data
+        print_scale_report(str(scale), data, args.top)
+
+    args.bench_dir.mkdir(parents=True, exist_ok=True)
+    output = args.bench_dir / f"results_{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.write_text(json.dumps(results, indent=2))
+    print(f"\nWrote {output}")
+
+    baseline_path = args.baseline or args.bench_dir / "baseline.json"
+    changes = []
+    if baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text())
+        if baseline.get("generator_version") != GENERATOR_VERSION:
+            print(f"\n{baseline_path} was made with other data; not comparing")
+        else:
+            changes = compare(results, baseline)
+            print_changes(changes)
+    if args.save_baseline or not baseline_path.exists():
+        baseline_path.write_text(json.dumps(results, indent=2))
+        print(f"Saved baseline {baseline_path}")
+
+    if args.fail_on_regression and any(row["ratio"] > 1 for row in changes):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
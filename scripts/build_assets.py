@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Build fingerprinted icons, sprites and atlases for the web app.
+
+Writes tournament_visualizer/static_build/ (see
+tournament_visualizer/static_assets.py). The Docker image runs this at build
+time; locally the app serves plain /assets/ files until it has been run.
+
+Usage:
+    python scripts/build_assets.py
+    python scripts/build_assets.py --output /tmp/static_build
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tournament_visualizer.config import Config  # noqa: E402
+from tournament_visualizer.static_assets import build_assets  # noqa: E402
+
+PACKAGE_DIR = PROJECT_ROOT / "tournament_visualizer"
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--source",
+        type=Path,
+        default=PACKAGE_DIR / Config.ASSETS_DIRECTORY,
+        help="Assets directory to build from",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=PACKAGE_DIR / Config.STATIC_BUILD_DIRECTORY,
+        help="Build directory (replaced)",
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    stats = build_assets(args.source, args.output)
+    elapsed = time.perf_counter() - start
+
+    mb = 1024 * 1024
+    print(f"Built static assets in {elapsed:.1f}s -> {args.output}")
+    print(f"  {stats['files']} files: {stats['file_bytes'] / mb:.1f} MB")
+    print(
+        f"  {stats['sprite_atlases']} sprite atlases, {stats['icon_atlases']} icon "
+        f"atlases: {stats['atlas_bytes'] / mb:.1f} MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Export the tournament database as a partitioned Parquet dataset.
+
+Writes only the match partitions that are new or changed since the last
+export, then publishes a new manifest generation. Servers with
+PARQUET_DATASET pointing at the dataset switch to it between requests. See
+tournament_visualizer/data/parquet_dataset.py.
+
+Usage:
+    uv run python scripts/export_parquet.py --dataset data/parquet
+    uv run python scripts/export_parquet.py --dataset data/parquet --full
+    uv run python scripts/export_parquet.py --dataset data/parquet --list
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tournament_visualizer.config import Config
+from tournament_visualizer.data.database import TournamentDatabase
+from tournament_visualizer.data.parquet_dataset import load_manifest
+
+
+def print_manifest(dataset_dir: str, tournament: str) -> None:
+    """Print a tournament's current generation and its files per table."""
+    manifest = load_manifest(dataset_dir, tournament)
+    if manifest is None:
+        print(f"{tournament}: not exported to {dataset_dir}")
+        return
+    print(
+        f"{tournament}: generation {manifest['generation']}, "
+        f"published {manifest['published_at']}"
+    )
+    root = Path(dataset_dir)
+    for table, spec in sorted(manifest["tables"].items()):
+        files = spec["files"].values()
+        size_mb = sum((root / rel).stat().st_size for rel in files) / 1e6
+        print(f"  {table:<30} {len(files):>5} files  {size_mb:>8.1f} MB")
+
+
+def main() -> None:
+    """Export the database or show the dataset's manifest."""
+    parser = argparse.ArgumentParser(
+        description="Export the tournament database as a Parquet dataset"
+    )
+    parser.add_argument(
+        "--source",
+        default=Config.DATABASE_PATH,
+        help="Database file to export (default: $TOURNAMENT_DB_PATH)",
+    )
+    parser.add_argument(
+        "--dataset",
+        default=Config.PARQUET_DATASET or "data/parquet",
+        help="Dataset directory (default: $PARQUET_DATASET or data/parquet)",
+    )
+    parser.add_argument(
+        "--tournament",
+        help="Tournament to export as (default: the one the database records)",
+    )
+    parser.add_argument(
+        "--full", action="store_true", help="Rewrite every file, not just changes"
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="Show the current manifest and exit"
+    )
+    args = parser.parse_args()
+
+    if args.list:
+        print_manifest(args.dataset, args.tournament or Config.TOURNAMENT)
+        return
+
+    if not Path(args.source).exists():
+        print(f"❌ Database not found: {args.source}", file=sys.stderr)
+        sys.exit(1)
+    db = TournamentDatabase(args.source, read_only=True)
+    start = time.perf_counter()
+    try:
+        written = db.export_parquet(args.dataset, args.tournament, full=args.full)
+    except (OSError, ValueError) as e:
+        print(f"❌ Export failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        db.close()
+    elapsed = time.perf_counter() - start
+
+    for table, count in sorted(written.items()):
+        if count:
+            print(f"  {table:<30} {count:>5} files written")
+    print(
+        f"✅ Exported {args.source} to {args.dataset}: "
+        f"{sum(written.values())} files in {elapsed:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,790 @@
+"""Generate synthetic Old World save files for parser and ETL scale testing.
+
+The saves contain every structure the parser reads, at realistic densities:
+players with PermanentLogList/LogData, MemoryList, points, military,
+legitimacy, yield and opinion histories (T<n> elements), tiles with terrain,
+improvements and OwnerHistory, cities with production and project counts, and
+characters with TraitTurn for the ruler successions. Everything else a real
+save holds (units, AI state, occurrences) is left out.
+
+Output is deterministic for a seed, and files are named like real tournament
+saves (match_<id>_<player>-<player>.zip), so a generated directory can be
+imported with `import_attachments.py --directory`.
+
+Usage:
+    uv run python scripts/generate_saves.py --out-dir data/synthetic_saves
+    uv run python scripts/generate_saves.py --count 20 --turns 150 --map-size medium
+    uv run python scripts/generate_saves.py --players 4 --event-density 3 --seed 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import sys
+import xml.etree.ElementTree as ET
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tournament_visualizer.data.game_constants import (  # noqa: E402
+    ARCHETYPE_ICONS,
+    LAW_CLASSES,
+    NATION_FAMILIES,
+    TECH_TYPES,
+    YIELD_TYPES,
+)
+
+# Approximate map widths (tiles) per map size setting
+MAP_SIZES = {
+    "smallest": 46,
+    "tiny": 56,
+    "small": 66,
+    "medium": 76,
+    "large": 88,
+    "huge": 100,
+}
+MAP_CLASSES = [
+    "MAPCLASS_CoastalRainBasin",
+    "MAPCLASS_Continent",
+    "MAPCLASS_MapScriptInlandSea",
+    "MAPCLASS_MapScriptLakesAndGulfs",
+]
+# (terrain, weight); water tiles are never owned
+TERRAINS = [
+    ("TERRAIN_WATER", 15),
+    ("TERRAIN_TEMPERATE", 25),
+    ("TERRAIN_LUSH", 20),
+    ("TERRAIN_ARID", 15),
+    ("TERRAIN_TUNDRA", 7),
+    ("TERRAIN_MARSH", 6),
+    ("TERRAIN_SAND", 6),
+    ("TERRAIN_FROST", 6),
+]
+IMPROVEMENTS = [
+    "IMPROVEMENT_FARM",
+    "IMPROVEMENT_MINE",
+    "IMPROVEMENT_QUARRY",
+    "IMPROVEMENT_LUMBERMILL",
+    "IMPROVEMENT_PASTURE",
+    "IMPROVEMENT_WINDMILL",
+    "IMPROVEMENT_LIBRARY_1",
+    "IMPROVEMENT_SHRINE_ATHENA",
+]
+SPECIALISTS = [
+    "SPECIALIST_FARMER",
+    "SPECIALIST_MINER",
+    "SPECIALIST_STONECUTTER",
+    "SPECIALIST_WOODCUTTER",
+    "SPECIALIST_PHILOSOPHER_1",
+]
+RESOURCES = [
+    "RESOURCE_HORSE",
+    "RESOURCE_CATTLE",
+    "RESOURCE_WHEAT",
+    "RESOURCE_ORE",
+    "RESOURCE_FISH",
+    "RESOURCE_WINE",
+]
+RELIGIONS = [
+    "RELIGION_ZOROASTRIANISM",
+    "RELIGION_JUDAISM",
+    "RELIGION_CHRISTIANITY",
+    "RELIGION_MANICHAEISM",
+    "RELIGION_ATENISM",
+]
+TRIBES = ["TRIBE_DANES", "TRIBE_THRACIANS", "TRIBE_GAULS", "TRIBE_SCYTHIANS"]
+TRAITS = [
+    "TRAIT_AFFABLE",
+    "TRAIT_BOLD",
+    "TRAIT_EDUCATED",
+    "TRAIT_ELOQUENT",
+    "TRAIT_INTELLIGENT",
+    "TRAIT_JUST",
+    "TRAIT_SHREWD",
+    "TRAIT_STRONG",
+]
+COGNOMENS = ["COGNOMEN_GREAT", "COGNOMEN_WISE", "COGNOMEN_LION", "COGNOMEN_BOLD"]
+FIRST_NAMES = ["NAME_CYRUS", "NAME_DARIUS", "NAME_CATO", "NAME_HANNO", "NAME_NABU"]
+GOALS = [
+    ("GOAL_FIVE_PROMOTIONS", "Promote Units Five Times"),
+    ("GOAL_SIX_CITIES", "Have Six Cities"),
+    ("GOAL_WONDER", "Build a Wonder"),
+    ("GOAL_TEN_TECHS", "Research Ten Technologies"),
+]
+MEMORY_TYPES = {
+    "Player": ["MEMORYPLAYER_ATTACKED_UNIT", "MEMORYPLAYER_ATTACKED_CITY"],
+    "Tribe": ["MEMORYTRIBE_ATTACKED_UNIT", "MEMORYTRIBE_GIFTED"],
+    "Family": ["MEMORYFAMILY_FOUNDED_CITY", "MEMORYFAMILY_OUR_LEGACY"],
+    "Religion": ["MEMORYRELIGION_SPREAD_RELIGION", "MEMORYRELIGION_OUR_AMBITION"],
+    "CharacterID": ["MEMORYCHARACTER_UPGRADED_RECENTLY"],
+}
+UNITS = ["UNIT_SETTLER", "UNIT_WORKER", "UNIT_WARRIOR", "UNIT_SPEARMAN", "UNIT_ARCHER"]
+PROJECTS = ["PROJECT_FESTIVAL", "PROJECT_FORUM_1", "PROJECT_ARCHIVE_1"]
+BONUSES = ["BONUS_XP_CHARACTER_SMALL", "BONUS_FOUND_CITY", "BONUS_ADOPT_LAW"]
+CULTURE_LEVELS = ["CULTURE_WEAK", "CULTURE_DEVELOPING", "CULTURE_STRONG"]
+CITY_RADIUS = 4.5  # Tiles a city's borders reach
+
+
+@dataclass
+class SaveSpec:
+    """Size knobs of a generated save.
+
+    Attributes:
+        turns: Final turn of the game
+        map_width: Map width in tiles; the map is square
+        players: Number of human players
+        event_density: Multiplier for background log entries and memories
+        seed: Random seed; the same spec gives the same save
+    """
+
+    turns: int = 100
+    map_width: int = MAP_SIZES["smallest"]
+    players: int = 2
+    event_density: float = 1.0
+    seed: int = 0
+
+    def map_size_setting(self) -> str:
+        """MapSize root attribute for the closest map size."""
+        size = min(MAP_SIZES, key=lambda name: abs(MAP_SIZES[name] - self.map_width))
+        return f"MAPSIZE_{size.upper()}"
+
+
+def _family_tags(nation: str) -> list[str]:
+    prefix = "FAMILY_AKSUM_" if nation == "Aksum" else "FAMILY_"
+    return [f"{prefix}{family.upper()}" for family in NATION_FAMILIES[nation]]
+
+
+def _sub(
+    parent: ET.Element, tag: str, text: object = None, **attrib: str
+) -> ET.Element:
+    elem = ET.SubElement(parent, tag, attrib)
+    if text is not None:
+        elem.text = str(text)
+    return elem
+
+
+def _history(parent: ET.Element, tag: str, values: list[int]) -> ET.Element:
+    """<tag><T2>..</T2>...</tag>, one value per turn starting at turn 2."""
+    history = _sub(parent, tag)
+    for turn, value in enumerate(values, start=2):
+        _sub(history, f"T{turn}", value)
+    return history
+
+
+def _random_walk(
+    rng: random.Random,
+    turns: int,
+    start: float,
+    drift: float,
+    noise: float,
+    low: float | None = None,
+    high: float | None = None,
+) -> list[int]:
+    values = []
+    value = start
+    for _ in range(2, turns + 1):
+        value += drift + rng.gauss(0, noise)
+        if low is not None:
+            value = max(low, value)
+        if high is not None:
+            value = min(high, value)
+        values.append(int(value))
+    return values
+
+
+class _SaveBuilder:
+    """Builds the XML tree of one save."""
+
+    def __init__(self, spec: SaveSpec, names: list[str]) -> None:
+        self.spec = spec
+        self.rng = random.Random(spec.seed)
+        self.names = names
+        # Distinct nations while they last, as in a real game
+        shuffled = self.rng.sample(list(NATION_FAMILIES), len(NATION_FAMILIES))
+        self.nations = [shuffled[i % len(shuffled)] for i in range(spec.players)]
+        self.next_character = 0
+        self.next_city = 0
+        self.characters: list[ET.Element] = []
+        self.cities: list[ET.Element] = []
+        # (player, city id, tile id) for city territories
+        self.city_sites: list[tuple[int, int, int]] = []
+
+    def build(self) -> ET.Element:
+        spec, rng = self.spec, self.rng
+        winner = rng.randrange(spec.players)
+        root = ET.Element(
+            "Root",
+            {
+                "SaveDate": "20 September 2025",
+                "MapWidth": str(spec.map_width),
+                "MapClass": rng.choice(MAP_CLASSES),
+                "MapAspectRatio": "MAPASPECTRATIO_SQUARE",
+                "MapSize": spec.map_size_setting(),
+                "GameName": " vs ".join(self.names),
+                "GameMode": "NETWORK",
+                "TurnStyle": "TURNSTYLE_TIGHT",
+                "TurnTimer": "TURNTIMER_SLOW",
+                "OpponentLevel": "OPPONENTLEVEL_PEACEFUL",
+                "TribeLevel": "TRIBELEVEL_NORMAL",
+                "Development": "DEVELOPMENT_FLEDGLING",
+                "Advantage": "ADVANTAGE_NONE",
+                "SuccessionGender": "SUCCESSIONGENDER_ABSOLUTE_COGNATIC",
+                "SuccessionOrder": "SUCCESSIONORDER_PRIMOGENITURE",
+                "Mortality": "MORTALITY_STANDARD",
+                "EventLevel": "EVENTLEVEL_MODERATE",
+                "VictoryPointModifier": "VICTORYPOINT_MEDIUM_HIGH",
+            },
+        )
+        team = _sub(root, "Team")
+        for slot in range(spec.players):
+            _sub(team, "PlayerTeam", slot)
+        options = _sub(root, "GameOptions")
+        for option in ["GAMEOPTION_COMPETITIVE_MODE", "GAMEOPTION_NO_UNDO"]:
+            _sub(options, option)
+        victories = _sub(root, "VictoryEnabled")
+        for victory in ["VICTORY_POINTS", "VICTORY_TIME", "VICTORY_CONQUEST"]:
+            _sub(victories, victory)
+        content = _sub(root, "GameContent")
+        for dlc in ["DLC_BEHIND_THE_THRONE", "DLC_WONDERS_AND_DYNASTIES"]:
+            _sub(content, dlc)
+
+        game = _sub(root, "Game")
+        _sub(game, "Turn", spec.turns)
+        completed = _sub(game, "TeamVictoriesCompleted")
+        _sub(completed, "Team", winner, Victory="VICTORY_POINTS")
+
+        capitals = self._capital_tiles()
+        for slot in range(spec.players):
+            root.append(self._player(slot, slot == winner, capitals[slot]))
+        root.extend(self.characters)
+        root.extend(self.cities)
+        for tile in self._tiles():
+            root.append(tile)
+        return root
+
+    def _capital_tiles(self) -> list[int]:
+        """Capitals spaced evenly on a circle around the map center."""
+        width = self.spec.map_width
+        center = (width - 1) / 2
+        radius = width * 0.3
+        offset = self.rng.uniform(0, 2 * math.pi)
+        tiles = []
+        for slot in range(self.spec.players):
+            angle = offset + 2 * math.pi * slot / self.spec.players
+            x = int(center + radius * math.cos(angle))
+            y = int(center + radius * math.sin(angle))
+            tiles.append(y * width + x)
+        return tiles
+
+    def _character(
+        self,
+        family: str,
+        birth_turn: int,
+        death_turn: int | None,
+        archetype: str,
+        trait: str | None,
+    ) -> int:
+        character_id = self.next_character
+        self.next_character += 1
+        elem = ET.Element(
+            "Character",
+            {
+                "ID": str(character_id),
+                "FirstName": self.rng.choice(FIRST_NAMES),
+                "BirthTurn": str(birth_turn),
+            },
+        )
+        _sub(elem, "Family", family)
+        if self.rng.random() < 0.5:
+            _sub(elem, "Cognomen", self.rng.choice(COGNOMENS))
+        if death_turn is not None:
+            _sub(elem, "DeathTurn", death_turn)
+        traits = _sub(elem, "TraitTurn")
+        _sub(traits, f"TRAIT_{archetype.upper()}_ARCHETYPE", max(1, birth_turn + 18))
+        if trait:
+            _sub(traits, trait, 1)
+        self.characters.append(elem)
+        return character_id
+
+    def _player(self, slot: int, won: bool, capital_tile: int) -> ET.Element:
+        spec, rng = self.spec, self.rng
+        turns = spec.turns
+        nation = self.nations[slot]
+        families = _family_tags(nation)
+        archetypes = list(NATION_FAMILIES[nation].values())
+        skill = 1.0 + rng.gauss(0, 0.1) + (0.1 if won else 0.0)
+        logs: list[tuple[int, str, str, str]] = []  # (turn, type, data1, text)
+
+        player = ET.Element(
+            "Player",
+            {
+                "ID": str(slot),
+                "Name": self.names[slot],
+                "OnlineID": str(76561198000000000 + spec.seed * 16 + slot),
+                "Nation": f"NATION_{nation.upper()}",
+                "Dynasty": "DYNASTY_DEFAULT",
+            },
+        )
+
+        # Rulers: the founder, then a succession every ~30 turns
+        succession_turns = [1] + sorted(
+            rng.sample(range(10, turns), max(0, min(turns - 10, turns // 30)))
+        )
+        leaders = _sub(player, "Leaders")
+        for order, turn in enumerate(succession_turns):
+            death = (
+                succession_turns[order + 1]
+                if order + 1 < len(succession_turns)
+                else None
+            )
+            character_id = self._character(
+                families[0],
+                turn - rng.randint(18, 40),
+                death,
+                rng.choice(list(ARCHETYPE_ICONS)),
+                rng.choice(TRAITS) if order == 0 else None,
+            )
+            _sub(leaders, "ID", character_id)
+            if order:
+                logs.append(
+                    (
+                        turn,
+                        "CHARACTER_SUCCESSION",
+                        str(character_id),
+                        f"A new ruler, King {character_id}, has taken the throne.",
+                    )
+                )
+                logs.append(
+                    (
+                        turn,
+                        "CHARACTER_DEATH",
+                        str(character_id - 1),
+                        f"King {character_id - 1} has died!",
+                    )
+                )
+        # Courtiers and family members, referenced by memories
+        courtiers = [
+            self._character(
+                rng.choice(families),
+                rng.randint(-30, turns),
+                None,
+                rng.choice(list(ARCHETYPE_ICONS)),
+                None,
+            )
+            for _ in range(max(4, turns // 8))
+        ]
+        for character_id in courtiers[: turns // 15]:
+            logs.append(
+                (
+                    rng.randint(2, turns),
+                    "CHARACTER_BIRTH",
+                    str(character_id),
+                    f"Prince {character_id} was born.",
+                )
+            )
+
+        # Cities: the capital on turn 1, then steady expansion
+        city_count = max(2, int(turns / 9 * (spec.map_width / 46) ** 0.5))
+        width = spec.map_width
+        cx, cy = capital_tile % width, capital_tile // width
+        for c in range(city_count):
+            founded = 1 if c == 0 else rng.randint(5, max(6, turns - 5))
+            if c == 0:
+                tile = capital_tile
+            else:
+                x = min(width - 1, max(0, cx + rng.randint(-9, 9)))
+                y = min(width - 1, max(0, cy + rng.randint(-9, 9)))
+                tile = y * width + x
+            family = families[c % len(families)]
+            city_id = self._city(slot, tile, founded, family, capital=c == 0)
+            archetype = archetypes[c % len(archetypes)].upper()
+            logs.append(
+                (
+                    founded,
+                    "CITY_FOUNDED",
+                    str(tile),
+                    f'Founded <sprite="Sprites/Crests" name="CREST_ARCHETYPE_{archetype}"'
+                    f" tint> City {city_id}",
+                )
+            )
+
+        # Technologies, roughly one every 3.5 turns
+        techs = rng.sample(list(TECH_TYPES), min(len(TECH_TYPES), int(turns / 3.5)))
+        tech_turns = sorted(rng.randint(1, turns) for _ in techs)
+        for turn, tech in zip(tech_turns, techs):
+            name = tech[5:].replace("_", " ").title()
+            logs.append(
+                (
+                    turn,
+                    "TECH_DISCOVERED",
+                    tech,
+                    f'Discovered <link="HELP_LINK,HELP_TECH,{tech}">{name}</link>',
+                )
+            )
+
+        # Laws, one per law class, some switched back and forth
+        law_classes = rng.sample(
+            list(LAW_CLASSES), min(len(LAW_CLASSES), max(2, turns // 9))
+        )
+        law_changes = {}
+        for law_class in law_classes:
+            changes = rng.choice([1, 1, 2, 3])
+            law_changes[law_class] = changes
+            for turn in sorted(
+                rng.randint(min(8, turns), turns) for _ in range(changes)
+            ):
+                law = rng.choice(LAW_CLASSES[law_class])
+                name = law[4:].replace("_", " ").title()
+                logs.append(
+                    (
+                        turn,
+                        "LAW_ADOPTED",
+                        law,
+                        f'Adopted <link="HELP_LINK,HELP_LAW,{law},0">{name}</link>',
+                    )
+                )
+
+        # Ambitions
+        for _ in range(rng.randint(5, 10)):
+            goal, text = rng.choice(GOALS)
+            turn = rng.randint(2, turns)
+            logs.append(
+                (
+                    turn,
+                    "GOAL_STARTED",
+                    "0",
+                    f"King has started a new link(CONCEPT_AMBITION): {text}",
+                )
+            )
+            outcome = rng.random()
+            if outcome < 0.6 and turn + 5 <= turns:
+                logs.append(
+                    (
+                        rng.randint(turn + 5, turns),
+                        "GOAL_FINISHED",
+                        "0",
+                        f"You have completed an link(CONCEPT_AMBITION): {text}",
+                    )
+                )
+            elif outcome < 0.7:
+                logs.append(
+                    (
+                        turns,
+                        "GOAL_FAILED",
+                        "-1",
+                        f"You have failed a link(CONCEPT_AMBITION): {text}",
+                    )
+                )
+
+        # Background diplomacy at the configured density
+        for _ in range(int(turns * 0.15 * spec.event_density)):
+            tribe = rng.choice(TRIBES)
+            event_type = rng.choice(["TRIBE_CONTACT", "TRIBE_DIPLOMACY"])
+            logs.append(
+                (
+                    rng.randint(1, turns),
+                    event_type,
+                    "6",
+                    f'<link="HELP_LINK,HELP_SELECT_TRIBE,{tribe}">{tribe[6:].title()}'
+                    "</link>: War",
+                )
+            )
+
+        perm_logs = _sub(player, "PermanentLogList")
+        for turn, event_type, data1, text in sorted(logs, key=lambda log: log[0]):
+            log = _sub(perm_logs, "LogData")
+            _sub(log, "Text", text)
+            _sub(log, "Type", event_type)
+            _sub(log, "Data1", data1)
+            _sub(log, "Data2")
+            _sub(log, "Data3")
+            _sub(log, "Turn", turn)
+            _sub(log, "TeamTurn", 0)
+
+        # Memories at the configured density
+        memories = _sub(player, "MemoryList")
+        # Memories of other players need another player
+        memory_fields = [f for f in MEMORY_TYPES if f != "Player" or spec.players > 1]
+        for _ in range(int(turns * 0.8 * spec.event_density)):
+            field = rng.choice(memory_fields)
+            memory = _sub(memories, "MemoryData")
+            _sub(memory, "Type", rng.choice(MEMORY_TYPES[field]))
+            if field == "Player":
+                value: object = rng.choice(
+                    [p for p in range(spec.players) if p != slot]
+                )
+            elif field == "Tribe":
+                value = rng.choice(TRIBES)
+            elif field == "Family":
+                value = rng.choice(families)
+            elif field == "Religion":
+                value = rng.choice(RELIGIONS)
+            else:
+                value = rng.choice(courtiers)
+            _sub(memory, field, value)
+            _sub(memory, "Turn", rng.randint(1, turns))
+
+        if rng.random() < 0.5:
+            story = _sub(player, "ReligionEventStoryTurn")
+            _sub(
+                story,
+                f"{rng.choice(RELIGIONS)}.EVENTSTORY_ADOPT_RELIGION",
+                rng.randint(min(20, turns), turns),
+            )
+
+        # Turn-by-turn histories
+        _history(
+            player,
+            "MilitaryPowerHistory",
+            _random_walk(rng, turns, 20, 4 * skill, 15, low=0),
+        )
+        _history(
+            player,
+            "PointsHistory",
+            _random_walk(rng, turns, 1, 0.14 * skill, 0.3, low=0),
+        )
+        _history(
+            player,
+            "LegitimacyHistory",
+            _random_walk(rng, turns, 20, 0.6 * skill, 4, low=0, high=200),
+        )
+        rates = _sub(player, "YieldRateHistory")
+        totals = _sub(player, "YieldTotalHistory")
+        for yield_type in YIELD_TYPES:
+            values = _random_walk(
+                rng, turns, rng.randint(10, 60), rng.uniform(-2, 8) * skill, 5
+            )
+            _history(rates, yield_type, values)
+            running = 0
+            cumulative = []
+            for value in values:
+                running += max(0, value)
+                cumulative.append(running)
+            _history(totals, yield_type, cumulative)
+        family_opinions = _sub(player, "FamilyOpinionHistory")
+        for nation_name in NATION_FAMILIES:
+            for family in _family_tags(nation_name):
+                if nation_name == nation:
+                    values = _random_walk(rng, turns, 100, rng.uniform(-1, 1), 6)
+                else:
+                    values = [0] * (turns - 1)
+                _history(family_opinions, family, values)
+        religion_opinions = _sub(player, "ReligionOpinionHistory")
+        for religion in RELIGIONS + [
+            f"RELIGION_PAGAN_{n.upper()}" for n in NATION_FAMILIES
+        ]:
+            values = _random_walk(rng, turns, 0, rng.choice([0, 0, 0.8]), 1)
+            _history(religion_opinions, religion, values)
+
+        # End-of-game statistics
+        tech_count = _sub(player, "TechCount")
+        for tech in techs:
+            _sub(tech_count, tech, 1)
+        stockpile = _sub(player, "YieldStockpile")
+        for yield_type in YIELD_TYPES:
+            _sub(stockpile, yield_type, rng.randint(0, 5000))
+        bonus_count = _sub(player, "BonusCount")
+        for bonus in BONUSES:
+            _sub(bonus_count, bonus, rng.randint(0, 10))
+        law_count = _sub(player, "LawClassChangeCount")
+        for law_class, changes in law_changes.items():
+            _sub(law_count, f"LAWCLASS_{law_class.upper()}", changes)
+        units = _sub(player, "UnitsProduced")
+        for unit in UNITS:
+            _sub(units, unit, rng.randint(1, 8))
+        return player
+
+    def _city(
+        self, slot: int, tile: int, founded: int, family: str, capital: bool
+    ) -> int:
+        rng = self.rng
+        city_id = self.next_city
+        self.next_city += 1
+        city = ET.Element(
+            "City",
+            {
+                "ID": str(city_id),
+                "TileID": str(tile),
+                "Player": str(slot),
+                "Family": family,
+                "Founded": str(founded),
+            },
+        )
+        _sub(city, "NameType", f"CITYNAME_SYNTHETIC_{city_id}")
+        _sub(city, "Citizens", rng.randint(1, 14))
+        if capital:
+            _sub(city, "Capital")
+        _sub(city, "FirstPlayer", slot)
+        _sub(city, "LastPlayer", slot)
+        culture = _sub(city, "TeamCulture")
+        _sub(culture, f"T.{slot}", rng.choice(CULTURE_LEVELS))
+        religions = _sub(city, "Religion")
+        for religion in rng.sample(RELIGIONS, rng.randint(0, 2)):
+            _sub(religions, religion)
+        production = _sub(city, "UnitProductionCounts")
+        for unit in rng.sample(UNITS, 3):
+            _sub(production, unit, rng.randint(1, 6))
+        projects = _sub(city, "ProjectCount")
+        for project in rng.sample(PROJECTS, 2):
+            _sub(projects, project, rng.randint(1, 4))
+        self.cities.append(city)
+        self.city_sites.append((slot, city_id, tile))
+        return city_id
+
+    def _tiles(self) -> list[ET.Element]:
+        """Every map tile; land grows outward from each city after it is founded."""
+        rng = self.rng
+        width = self.spec.map_width
+        turns = self.spec.turns
+        terrains = [terrain for terrain, _ in TERRAINS]
+        weights = [weight for _, weight in TERRAINS]
+        founded = {
+            int(city.get("ID")): int(city.get("Founded")) for city in self.cities
+        }
+        sites = [
+            (slot, city_id, tile % width, tile // width)
+            for slot, city_id, tile in self.city_sites
+        ]
+
+        tiles = []
+        for tile_id in range(width * width):
+            x, y = tile_id % width, tile_id // width
+            terrain = rng.choices(terrains, weights)[0]
+            tile = ET.Element("Tile", {"ID": str(tile_id)})
+            _sub(tile, "Terrain", terrain)
+            if terrain == "TERRAIN_WATER":
+                _sub(tile, "Height", "HEIGHT_OCEAN")
+                tiles.append(tile)
+                continue
+            roll = rng.random()
+            _sub(
+                tile,
+                "Height",
+                (
+                    "HEIGHT_HILL"
+                    if roll < 0.15
+                    else "HEIGHT_MOUNTAIN" if roll < 0.2 else "HEIGHT_FLAT"
+                ),
+            )
+            if rng.random() < 0.08:
+                _sub(tile, "Resource", rng.choice(RESOURCES))
+
+            # Claimed by the city whose borders reach it first; borders grow
+            # 0.12 tiles per turn up to CITY_RADIUS
+            claims = []
+            for slot, city_id, cx, cy in sites:
+                distance = math.hypot(x - cx, y - cy)
+                if distance <= CITY_RADIUS:
+                    grow = max(0, math.ceil((distance - 1.5) / 0.12))
+                    claims.append((founded[city_id] + grow, slot, city_id))
+            if claims and min(claims)[0] <= turns:
+                claim_turn, owner, city_id = min(claims)
+                if rng.random() < 0.4:
+                    _sub(tile, "Improvement", rng.choice(IMPROVEMENTS))
+                    if rng.random() < 0.2:
+                        _sub(tile, "Specialist", rng.choice(SPECIALISTS))
+                if rng.random() < 0.15:
+                    _sub(tile, "Road")
+                _sub(tile, "CityTerritory", city_id)
+                history = _sub(tile, "OwnerHistory")
+                _sub(history, f"T{claim_turn}", owner)
+                # A few border tiles change hands later
+                if self.spec.players > 1 and rng.random() < 0.03:
+                    lost = rng.randint(claim_turn, turns)
+                    if lost > claim_turn:
+                        taker = rng.choice(
+                            [p for p in range(self.spec.players) if p != owner]
+                        )
+                        _sub(history, f"T{lost}", taker)
+            tiles.append(tile)
+        return tiles
+
+
+def generate_save_xml(spec: SaveSpec, names: list[str] | None = None) -> bytes:
+    """Build the XML of a synthetic save.
+
+    Args:
+        spec: Size knobs
+        names: Player names (default: player_<seed>_<slot>)
+
+    Returns:
+        UTF-8 encoded XML document
+    """
+    names = names or [f"player_{spec.seed}_{slot}" for slot in range(spec.players)]
+    root = _SaveBuilder(spec, names).build()
+    return ET.tostring(root, encoding="utf-8", xml_declaration=True)
+
+
+def write_save(path: Path, spec: SaveSpec, names: list[str] | None = None) -> Path:
+    """Write a synthetic save as a zip holding one XML file, like the game does.
+
+    Returns:
+        path
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(
+            f"OW-Save-Synthetic-Year{spec.turns}.xml", generate_save_xml(spec, names)
+        )
+    return path
+
+
+def save_file_name(match_id: int, names: list[str]) -> str:
+    """Tournament save name, so the Challonge match ID can be read back."""
+    return f"match_{match_id}_{'-'.join(names)}.zip"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Generate synthetic Old World save files",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--out-dir", type=Path, default=PROJECT_ROOT / "data" / "synthetic_saves"
+    )
+    parser.add_argument("--count", type=int, default=1, help="Number of saves")
+    parser.add_argument("--turns", type=int, default=SaveSpec.turns)
+    parser.add_argument(
+        "--map-size",
+        choices=list(MAP_SIZES),
+        default="smallest",
+        help="Map size setting (ignored when --map-width is given)",
+    )
+    parser.add_argument("--map-width", type=int, help="Map width in tiles")
+    parser.add_argument("--players", type=int, default=SaveSpec.players)
+    parser.add_argument(
+        "--event-density",
+        type=float,
+        default=SaveSpec.event_density,
+        help="Multiplier for background log entries and memories",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the first save")
+    args = parser.parse_args()
+
+    if args.players < 1:
+        parser.error("--players must be at least 1")
+    if args.turns < 10:
+        parser.error("--turns must be at least 10")
+
+    for i in range(args.count):
+        spec = SaveSpec(
+            turns=args.turns,
+            map_width=args.map_width or MAP_SIZES[args.map_size],
+            players=args.players,
+            event_density=args.event_density,
+            seed=args.seed + i,
+        )
+        names = [f"player_{spec.seed}_{slot}" for slot in range(spec.players)]
+        path = write_save(
+            args.out_dir / save_file_name(900000000 + spec.seed, names), spec, names
+        )
+        print(f"{path} ({path.stat().st_size / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,8 @@ and imports them into the DuckDB database for visualization.
 Usage:
     python import_tournaments.py [--directory DIRECTORY] [--verbose] [--force]
     python import_tournaments.py --match-id 426504724  # Reimport single match
+    python import_tournaments.py --optimize-only  # Re-cluster an existing database
+    python import_tournaments.py --precompute-only  # Rebuild the landing page cache
 """
 
 import argparse
@@ -25,8 +27,10 @@ from tournament_visualizer.data.etl import (
     TournamentETL,
     fetch_tournament_rounds,
     initialize_database,
+    optimize_database,
     process_tournament_directory,
 )
+from tournament_visualizer.data.parse_cache import ParsedRecordCache
 
 
 def setup_logging(verbose: bool = False) -> None:
@@ -142,6 +146,61 @@ def print_summary(results: dict) -> None:
     print("=" * 60)
 
 
+def _format_bytes(num_bytes: int) -> str:
+    """Format a byte count as megabytes."""
+    return f"{num_bytes / (1024 * 1024):.1f} MB"
+
+
+def print_optimization_summary(results: dict) -> None:
+    """Print a summary of the storage optimization results.
+
+    Args:
+        results: Results dictionary from optimize_database
+    """
+    print("\n" + "=" * 60)
+    print("STORAGE OPTIMIZATION")
+    print("=" * 60)
+    print(f"Tables rewritten: {len(results['tables'])}")
+    for table, row_count in results["tables"].items():
+        print(f"  {table}: {row_count:,} rows")
+    print(f"Duration: {results['duration_seconds']:.1f}s")
+
+    before = results["storage"]["before"]
+    after = results["storage"]["after"]
+    print("\nStorage (before -> after):")
+    print(
+        f"  File size: {_format_bytes(before['file_bytes'])} -> "
+        f"{_format_bytes(after['file_bytes'])}"
+    )
+    print(
+        f"  Used blocks: {_format_bytes(before['used_bytes'])} -> "
+        f"{_format_bytes(after['used_bytes'])}"
+    )
+
+    latency_before = results["latency_ms"]["before"]
+    latency_after = results["latency_ms"]["after"]
+    if latency_before:
+        print("\nQuery latency (before -> after):")
+        for name, before_ms in latency_before.items():
+            after_ms = latency_after.get(name, 0.0)
+            print(f"  {name}: {before_ms:.1f} ms -> {after_ms:.1f} ms")
+
+    print("=" * 60)
+
+
+def precompute_overview() -> None:
+    """Precompute the default overview page, warning instead of failing."""
+    from tournament_visualizer.precompute import build_overview_artifact
+
+    print("\nPrecomputing default overview page...")
+    try:
+        stored = build_overview_artifact()
+        print(f"Stored {stored} precomputed overview results")
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Overview precompute failed: {e}")
+        print(f"⚠️  Overview precompute failed: {e}")
+
+
 def find_match_file(challonge_match_id: int, directory: str) -> Path | None:
     """Find the save file for a given Challonge match ID.
 
@@ -170,7 +229,10 @@ def find_match_file(challonge_match_id: int, directory: str) -> Path | None:
 
 
 def reimport_single_match(
-    challonge_match_id: int, directory: str, verbose: bool = False
+    challonge_match_id: int,
+    directory: str,
+    verbose: bool = False,
+    parse_cache: ParsedRecordCache | None = None,
 ) -> None:
     """Reimport a single match by its Challonge match ID.
 
@@ -181,6 +243,7 @@ def reimport_single_match(
         challonge_match_id: The Challonge match ID to reimport
         directory: Directory containing save files
         verbose: Enable verbose logging
+        parse_cache: Optional cache of parsed records to reuse
     """
     setup_logging(verbose)
     logger = logging.getLogger(__name__)
@@ -234,7 +297,7 @@ def reimport_single_match(
     print(f"\nImporting: {save_file.name}")
     print("-" * 60)
 
-    etl = TournamentETL(database=db, round_cache=round_cache)
+    etl = TournamentETL(database=db, round_cache=round_cache, parse_cache=parse_cache)
     success = etl.process_tournament_file(str(save_file), challonge_match_id)
 
     if success:
@@ -296,16 +359,68 @@ def main() -> None:
         help="Reimport a single match by its Challonge match ID (e.g., 426504724)",
     )
 
+    parser.add_argument(
+        "--skip-optimize",
+        action="store_true",
+        help="Skip the storage optimization step that follows an import of new files",
+    )
+
+    parser.add_argument(
+        "--optimize-only",
+        action="store_true",
+        help="Only run the storage optimization step on the existing database",
+    )
+
+    parser.add_argument(
+        "--skip-precompute",
+        action="store_true",
+        help="Skip precomputing the default overview page after import",
+    )
+
+    parser.add_argument(
+        "--precompute-only",
+        action="store_true",
+        help="Only precompute the default overview page for the existing database",
+    )
+
+    parser.add_argument(
+        "--no-parse-cache",
+        action="store_true",
+        help="Parse every save file instead of reusing cached parsed records",
+    )
+
     args = parser.parse_args()
 
     # Set up logging
     setup_logging(args.verbose)
     logger = logging.getLogger(__name__)
 
+    # Parsed records are keyed by file hash and parser version, so they stay
+    # valid across --force rebuilds
+    parse_cache = None
+    if not args.no_parse_cache:
+        parse_cache = ParsedRecordCache(Config.PARSED_CACHE_DIRECTORY)
+
     try:
         # Handle single-match reimport
         if args.match_id:
-            reimport_single_match(args.match_id, args.directory, args.verbose)
+            reimport_single_match(
+                args.match_id, args.directory, args.verbose, parse_cache
+            )
+            if not args.skip_precompute:
+                precompute_overview()
+            return
+
+        # Handle optimize-only
+        if args.optimize_only:
+            db = initialize_database()
+            print_optimization_summary(optimize_database(db))
+            db.close()
+            return
+
+        # Handle precompute-only
+        if args.precompute_only:
+            precompute_overview()
             return
 
         # Validate directory
@@ -350,13 +465,24 @@ def main() -> None:
             print("Deduplication: DISABLED (all files will be processed)")
 
         # Process all files
+        # A forced rebuild starts from an empty database, so index maintenance
+        # can be deferred until every file is loaded
         results = process_tournament_directory(
-            str(directory), deduplicate=not args.keep_duplicates
+            str(directory),
+            deduplicate=not args.keep_duplicates,
+            bulk_load=args.force,
+            parse_cache=parse_cache,
         )
 
         # Print summary
         print_summary(results)
 
+        # Cluster tables and drop redundant indexes now that appends are done.
+        # The rewrite covers every clustered table, so a sync that imported
+        # nothing leaves the database as it is.
+        if not args.skip_optimize and results["processing"]["successful_files"] > 0:
+            print_optimization_summary(optimize_database(db))
+
         # Success
         if results["processing"]["success_rate"] == 1.0:
             print("\n✅ All files imported successfully!")
@@ -369,6 +495,10 @@ def main() -> None:
         # Close database connection
         db.close()
 
+        # Needs the write connection closed; see precompute.py
+        if not args.skip_precompute:
+            precompute_overview()
+
     except Exception as e:
         logger.error(f"Import failed: {e}")
         print(f"\n❌ Import failed: {e}", file=sys.stderr)
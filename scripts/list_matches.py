@@ -15,8 +15,12 @@ from pathlib import Path
 
 import duckdb
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-def get_matches(db_path: str) -> list[dict]:
+from tournament_visualizer.config import Config
+
+
+def get_matches(db_path: str, tournament: str = Config.TOURNAMENT) -> list[dict]:
     """Query all matches with player and civilization information."""
     query = """
     WITH numbered_players AS (
@@ -30,7 +34,7 @@ def get_matches(db_path: str) -> list[dict]:
     )
     SELECT
         'https://prospector.fly.dev/matches?match_id=' || m.match_id as prospector_url,
-        'https://challonge.com/owduels2025/matches/' || m.challonge_match_id || '/share' as challonge_url,
+        'https://challonge.com/' || $tournament || '/matches/' || m.challonge_match_id || '/share' as challonge_url,
         COALESCE(tp1.display_name, p1.player_name) as player1_name,
         p1.civilization as player1_nation,
         COALESCE(tp2.display_name, p2.player_name) as player2_name,
@@ -44,7 +48,7 @@ def get_matches(db_path: str) -> list[dict]:
     """
 
     conn = duckdb.connect(db_path, read_only=True)
-    results = conn.execute(query).fetchall()
+    results = conn.execute(query, {"tournament": tournament}).fetchall()
     conn.close()
 
     # Convert to list of dicts
@@ -118,6 +122,11 @@ def main() -> None:
         default="data/tournament_data.duckdb",
         help="Path to DuckDB database (default: data/tournament_data.duckdb)",
     )
+    parser.add_argument(
+        "--tournament",
+        default=Config.TOURNAMENT,
+        help="Challonge tournament identifier for URLs (default: $TOURNAMENT)",
+    )
 
     args = parser.parse_args()
 
@@ -128,7 +137,7 @@ def main() -> None:
         sys.exit(1)
 
     # Get matches
-    matches = get_matches(str(db_path))
+    matches = get_matches(str(db_path), args.tournament)
 
     # Determine output mode
     if args.output:
@@ -11,6 +11,10 @@ from pathlib import Path
 from chyllonge.api import ChallongeApi
 from dotenv import load_dotenv
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tournament_visualizer.config import Config
+
 # Load environment variables
 load_dotenv()
 
@@ -34,7 +38,7 @@ def main() -> None:
     api = ChallongeApi()
 
     # Tournament URL
-    tournament_url = "owduels2025"
+    tournament_url = Config.TOURNAMENT
 
     # Get tournament info
     tournament = api.tournaments.get(tournament_url)
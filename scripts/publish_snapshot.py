@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Publish the tournament database as the live read-only snapshot.
+
+Copies (or moves) a closed database file into the snapshot directory under a
+new generation name and flips the CURRENT pointer to it. Running servers
+switch to it within SNAPSHOT_POLL_INTERVAL seconds, without a restart. See
+tournament_visualizer/data/snapshots.py.
+
+Usage:
+    uv run python scripts/publish_snapshot.py                 # publish DATABASE_PATH
+    uv run python scripts/publish_snapshot.py --source /data/upload.duckdb --move
+    uv run python scripts/publish_snapshot.py --list
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tournament_visualizer.config import Config
+from tournament_visualizer.data.snapshots import (
+    current_snapshot,
+    list_snapshots,
+    publish_snapshot,
+)
+
+
+def main() -> None:
+    """Publish a snapshot or list the published ones."""
+    parser = argparse.ArgumentParser(
+        description="Publish the tournament database as the live snapshot"
+    )
+    parser.add_argument(
+        "--source",
+        default=Config.DATABASE_PATH,
+        help="Database file to publish (default: $TOURNAMENT_DB_PATH)",
+    )
+    parser.add_argument(
+        "--snapshot-dir",
+        default=Config.SNAPSHOT_DIRECTORY,
+        help="Snapshot directory (default: $SNAPSHOT_DIRECTORY)",
+    )
+    parser.add_argument(
+        "--keep",
+        type=int,
+        default=2,
+        help="Snapshots to keep, including the new one (default: 2)",
+    )
+    parser.add_argument(
+        "--move",
+        action="store_true",
+        help="Move the source file instead of copying it (same filesystem)",
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="List published snapshots and exit"
+    )
+    args = parser.parse_args()
+    if not args.snapshot_dir:
+        parser.error("--snapshot-dir is required when SNAPSHOT_DIRECTORY is not set")
+
+    if args.list:
+        live = current_snapshot(args.snapshot_dir)
+        for path in list_snapshots(args.snapshot_dir):
+            marker = "*" if path == live else " "
+            size_mb = path.stat().st_size / 1e6
+            print(f"{marker} {path.name}  {size_mb:.1f} MB")
+        return
+
+    try:
+        snapshot = publish_snapshot(
+            args.source, args.snapshot_dir, keep=max(args.keep, 1), move=args.move
+        )
+    except (OSError, ValueError) as e:
+        print(f"❌ Publish failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"✅ Published {snapshot}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,854 @@
+"""Replay production traffic from access logs against a local server.
+
+Turns a local copy of the gunicorn access logs (see analyze_access_logs.py)
+into a workload and replays it against a locally started app, then reports
+throughput, latency percentiles, error rates and the memory of each server
+process. Use it to compare worker counts, cache settings and query changes
+before deploying to the 1 GB Fly machine.
+
+The workload is made of sessions: the requests of one client IP, split after
+30 minutes of inactivity. Only page loads (/, /matches, ...), the map API
+(/api/map/*) and the map viewer are replayed. A page load is replayed the way
+a browser performs it: GET the page, render its layout through the Dash pages
+router, then send every callback that fires on load, including the ones
+triggered by earlier results. Those callbacks are sent one after another per
+session, where a browser would run some in parallel, so raise --concurrency to
+match the real request rate.
+
+Sessions start at their original offsets, divided by --speedup, and each
+session keeps its own request gaps the same way. --speedup 0 drops all waits.
+
+Usage:
+    uv run python manage.py start --gunicorn --workers 4
+    uv run python scripts/replay_traffic.py --log-dir logs
+    uv run python scripts/replay_traffic.py --log-dir logs --speedup 60 --concurrency 8
+    uv run python scripts/replay_traffic.py --log-dir logs --sessions 50 --json a.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import http.client
+import json
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable
+from urllib.parse import urlparse
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.analyze_access_logs import (  # noqa: E402
+    PAGE_NAMES,
+    latency_group,
+    parse_access_line,
+    read_local_logs,
+)
+from tournament_visualizer.telemetry import percentile  # noqa: E402
+
+DEFAULT_URL = "http://localhost:8050"
+SESSION_GAP = timedelta(minutes=30)
+CALLBACK_PATH = "/_dash-update-component"
+PAGES_ROUTER_OUTPUT = ".._pages_content.children..._pages_store.data.."
+PID_FILE = PROJECT_ROOT / ".server.pid"  # Written by manage.py start
+FLY_MEMORY_MB = 1024
+LABEL_WIDTH = 60  # Long multi-output callback names are cut in tables
+LATE_THRESHOLD = 0.5  # Seconds behind schedule before a request counts as late
+
+
+@dataclass
+class Step:
+    """One logged request of a session."""
+
+    offset: float  # Seconds since the session started
+    kind: str  # "page", "api" or "viewer"
+    path: str
+
+
+@dataclass
+class Session:
+    """Requests of one client, in order."""
+
+    client: str
+    start: datetime
+    steps: list[Step] = field(default_factory=list)
+
+
+@dataclass
+class Result:
+    """Outcome of one replayed HTTP request."""
+
+    group: str
+    label: str
+    status: int  # 0 when the request failed without a response
+    ms: float
+    bytes: int = 0
+
+
+def replay_kind(method: str, path: str) -> str | None:
+    """Workload kind of a logged request, or None if it is not replayed."""
+    if method != "GET":
+        return None
+    base_path = urlparse(path).path.rstrip("/") or "/"
+    if base_path in PAGE_NAMES:
+        return "page"
+    if base_path.startswith("/api/map/"):
+        return "api"
+    if base_path.startswith("/map/viewer/"):
+        return "viewer"
+    return None
+
+
+def build_sessions(lines: Iterable[str], gap: timedelta = SESSION_GAP) -> list[Session]:
+    """Group replayable access log lines into sessions, ordered by start."""
+    by_client: dict[str, list[tuple[datetime, str, str]]] = defaultdict(list)
+    for line in lines:
+        row = parse_access_line(line)
+        if row is None:
+            continue
+        ts, client, method, path, _, status, _, _ = row
+        kind = replay_kind(method, path)
+        if kind is None or status >= 400:
+            continue
+        by_client[client].append(
+            (datetime.strptime(ts, "%d/%b/%Y:%H:%M:%S"), kind, path)
+        )
+
+    sessions: list[Session] = []
+    for client, requests in by_client.items():
+        requests.sort(key=lambda request: request[0])
+        session = None
+        previous = None
+        for when, kind, path in requests:
+            if session is None or when - previous > gap:
+                session = Session(client=client, start=when)
+                sessions.append(session)
+            session.steps.append(
+                Step((when - session.start).total_seconds(), kind, path)
+            )
+            previous = when
+    sessions.sort(key=lambda session: (session.start, session.client))
+    return sessions
+
+
+def schedule(sessions: list[Session], speedup: float) -> list[float]:
+    """Start offset of each session in seconds from the beginning of the replay."""
+    if not sessions or speedup <= 0:
+        return [0.0] * len(sessions)
+    first = sessions[0].start
+    return [(s.start - first).total_seconds() / speedup for s in sessions]
+
+
+# ---------------------------------------------------------------------------
+# Dash page loads
+# ---------------------------------------------------------------------------
+
+
+def _split_output(output: str) -> tuple[list[tuple[str, str]], bool]:
+    """Split a dependency output string into (id, property) pairs and multi flag."""
+    multi = output.startswith("..")
+    parts = output[2:-2].split("...") if multi else [output]
+    pairs = []
+    for part in parts:
+        component_id, prop = part.rsplit(".", 1)
+        pairs.append((component_id, prop.split("@")[0]))  # Drop allow_duplicate hash
+    return pairs, multi
+
+
+def collect_props(layout: Any, url: str, props: dict[str, dict] | None = None) -> dict:
+    """Map component id -> props for every component with a string id.
+
+    Location components get the URL a browser would fill in.
+    """
+    props = {} if props is None else props
+    if isinstance(layout, list):
+        for child in layout:
+            collect_props(child, url, props)
+        return props
+    if not isinstance(layout, dict) or "props" not in layout:
+        return props
+
+    component_props = layout["props"]
+    component_id = component_props.get("id")
+    if isinstance(component_id, str):
+        values = dict(component_props)
+        if layout.get("type") == "Location":
+            parsed = urlparse(url)
+            values.update(
+                pathname=parsed.path,
+                search=f"?{parsed.query}" if parsed.query else "",
+                hash="",
+                href=url,
+            )
+        props[component_id] = values
+    for value in component_props.values():
+        if isinstance(value, (dict, list)):
+            collect_props(value, url, props)
+    return props
+
+
+def _argument(spec: dict, props: dict[str, dict]) -> dict:
+    arg = {"id": spec["id"], "property": spec["property"]}
+    component = props.get(spec["id"], {})
+    if spec["property"] in component:
+        arg["value"] = component[spec["property"]]
+    return arg
+
+
+def _callback_body(dep: dict, props: dict[str, dict], changed: list[str]) -> dict:
+    outputs, multi = _split_output(dep["output"])
+    output_specs = [{"id": i, "property": p} for i, p in outputs]
+    return {
+        "output": dep["output"],
+        "outputs": output_specs if multi else output_specs[0],
+        "inputs": [_argument(spec, props) for spec in dep["inputs"]],
+        "state": [
+            _argument(spec, props)
+            for spec in dep.get("state", [])
+            if isinstance(spec["id"], str)
+        ],
+        "changedPropIds": changed,
+    }
+
+
+def _in_layout(dep: dict, props: dict[str, dict]) -> bool:
+    """Server-side callback whose outputs and inputs are all rendered."""
+    if dep.get("clientside_function") or dep.get("no_output"):
+        return False
+    ids = [component_id for component_id, _ in _split_output(dep["output"])[0]]
+    ids += [spec["id"] for spec in dep["inputs"]]
+    return all(isinstance(i, str) and i in props for i in ids)
+
+
+def initial_callbacks(dependencies: list[dict], props: dict[str, dict]) -> list[dict]:
+    """Request bodies of the callbacks a browser sends when a page loads.
+
+    Skips clientside and prevent_initial_call callbacks, pattern-matching ids
+    and callbacks whose inputs or outputs are not in the rendered layout.
+    """
+    return [
+        _callback_body(dep, props, [])
+        for dep in dependencies
+        if not dep.get("prevent_initial_call") and _in_layout(dep, props)
+    ]
+
+
+def apply_response(
+    props: dict[str, dict], response: dict, url: str
+) -> set[tuple[str, str]]:
+    """Store callback results in props the way the renderer does.
+
+    Components inside returned children are added to props.
+
+    Returns:
+        The (id, property) pairs whose value changed
+    """
+    changed = set()
+    for component_id, values in response.items():
+        component = props.setdefault(component_id, {})
+        for prop, value in values.items():
+            if component.get(prop) != value:
+                changed.add((component_id, prop))
+            component[prop] = value
+            if isinstance(value, (dict, list)):
+                collect_props(value, url, props)
+    return changed
+
+
+def fire_page_callbacks(
+    send: Callable[[dict], dict | None],
+    dependencies: list[dict],
+    props: dict[str, dict],
+    url: str,
+    max_calls: int = 3,
+) -> int:
+    """Send a page's callbacks in the order the browser sends them.
+
+    Starts with the initial callbacks. A callback waits while another pending
+    callback still produces one of its inputs, then runs once with the latest
+    values and the trigger it was queued with. Results are applied to props,
+    then callbacks whose inputs another callback changed and those of newly
+    rendered components are queued, until nothing is left. Each callback runs
+    at most max_calls times, which stops update loops.
+
+    Args:
+        send: Posts a request body; returns the decoded response, or None if
+            the callback failed or did not update anything
+        dependencies: /_dash-dependencies
+        props: Rendered component props, updated in place
+        url: Page URL, for Location components in returned children
+
+    Returns:
+        Number of callbacks sent
+    """
+    by_output = {dep["output"]: dep for dep in dependencies}
+    pending = {body["output"]: [] for body in initial_callbacks(dependencies, props)}
+    calls: dict[str, int] = defaultdict(int)
+    sent = 0
+    while pending:
+        produced = {
+            output: set(_split_output(output)[0])
+            for output in pending
+            if _in_layout(by_output[output], props)
+        }
+        ready = [
+            output
+            for output in produced
+            if not any(
+                (spec["id"], spec["property"]) in pairs
+                for spec in by_output[output]["inputs"]
+                for other, pairs in produced.items()
+                if other != output
+            )
+        ] or list(produced)
+
+        rendered = set(props)
+        changed: dict[tuple[str, str], str] = {}  # (id, property) -> set by
+        for output in ready:
+            body = _callback_body(by_output[output], props, pending[output])
+            calls[output] += 1
+            sent += 1
+            data = send(body)
+            if data and "response" in data:
+                for pair in apply_response(props, data["response"], url):
+                    changed[pair] = output
+            del pending[output]
+        for output in set(pending) - set(produced):
+            del pending[output]  # No longer rendered
+
+        for dep in dependencies:
+            if dep["output"] in pending or calls[dep["output"]] >= max_calls:
+                continue
+            if not _in_layout(dep, props):
+                continue
+            # A callback is not triggered by its own outputs
+            triggers = [
+                f"{spec['id']}.{spec['property']}"
+                for spec in dep["inputs"]
+                if changed.get((spec["id"], spec["property"]), dep["output"])
+                != dep["output"]
+            ]
+            new_component = not dep.get("prevent_initial_call") and any(
+                spec["id"] not in rendered for spec in dep["inputs"]
+            )
+            if triggers or new_component:
+                pending[dep["output"]] = triggers
+    return sent
+
+
+def pages_router_body(url: str) -> dict:
+    """Request body of the Dash pages router callback for a URL."""
+    parsed = urlparse(url)
+    return {
+        "output": PAGES_ROUTER_OUTPUT,
+        "outputs": [
+            {"id": "_pages_content", "property": "children"},
+            {"id": "_pages_store", "property": "data"},
+        ],
+        "inputs": [
+            {"id": "_pages_location", "property": "pathname", "value": parsed.path},
+            {
+                "id": "_pages_location",
+                "property": "search",
+                "value": f"?{parsed.query}" if parsed.query else "",
+            },
+        ],
+        "state": [],
+        "changedPropIds": ["_pages_location.pathname"],
+    }
+
+
+# ---------------------------------------------------------------------------
+# HTTP
+# ---------------------------------------------------------------------------
+
+
+class Client:
+    """Keep-alive HTTP connection of one virtual user."""
+
+    def __init__(self, base_url: str, timeout: float) -> None:
+        parsed = urlparse(base_url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 80
+        self.timeout = timeout
+        self._conn: http.client.HTTPConnection | None = None
+
+    def request(
+        self, method: str, path: str, body: dict | None = None
+    ) -> tuple[int, bytes, float]:
+        """Send one request; returns (status, body, milliseconds)."""
+        payload = None if body is None else json.dumps(body).encode()
+        headers = {"Accept-Encoding": "gzip", "Connection": "keep-alive"}
+        if payload is not None:
+            headers["Content-Type"] = "application/json"
+        attempt = 0
+        while True:
+            if self._conn is None:
+                self._conn = http.client.HTTPConnection(
+                    self.host, self.port, timeout=self.timeout
+                )
+            started = time.perf_counter()
+            try:
+                self._conn.request(method, path, body=payload, headers=headers)
+                response = self._conn.getresponse()
+                data = response.read()
+            except (ConnectionError, http.client.HTTPException):
+                # The server closed an idle keep-alive connection; retry once
+                self.close()
+                attempt += 1
+                if attempt > 1:
+                    raise
+                continue
+            ms = (time.perf_counter() - started) * 1000
+            if response.getheader("Connection", "").lower() == "close":
+                self.close()
+            return response.status, data, ms
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def _decode(data: bytes) -> Any:
+    if data[:2] == b"\x1f\x8b":
+        data = gzip.decompress(data)
+    return json.loads(data)
+
+
+class Replayer:
+    """Sends the requests of sessions and collects the results."""
+
+    def __init__(self, base_url: str, timeout: float = 120.0) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.results: list[Result] = []
+        self.lag: list[float] = []
+        self._lock = threading.Lock()
+        self._shell: tuple[list[dict], Any] | None = None
+
+    def _record(self, result: Result) -> None:
+        with self._lock:
+            self.results.append(result)
+
+    def _send(
+        self,
+        client: Client,
+        group: str,
+        label: str,
+        method: str,
+        path: str,
+        body: dict | None = None,
+    ) -> bytes | None:
+        try:
+            status, data, ms = client.request(method, path, body)
+        except (OSError, http.client.HTTPException):
+            self._record(Result(group, label, 0, 0.0))
+            return None
+        self._record(Result(group, label, status, ms, len(data)))
+        return data if status < 400 else None
+
+    def load_shell(self) -> None:
+        """Fetch the callback list and app layout once per replay."""
+        client = Client(self.base_url, self.timeout)
+        try:
+            _, deps, _ = client.request("GET", "/_dash-dependencies")
+            _, layout, _ = client.request("GET", "/_dash-layout")
+        finally:
+            client.close()
+        self._shell = (_decode(deps), _decode(layout))
+
+    def page_load(self, client: Client, path: str) -> None:
+        """GET a page, render it through the pages router, fire its callbacks."""
+        if self._shell is None:
+            self.load_shell()
+        dependencies, shell_layout = self._shell
+        page = latency_group(path)
+
+        if self._send(client, "Page HTML", page, "GET", path) is None:
+            return
+        data = self._send(
+            client, "Page layout", page, "POST", CALLBACK_PATH, pages_router_body(path)
+        )
+        if data is None:
+            return
+
+        url = self.base_url + path
+        props = collect_props(shell_layout, url)
+        content = _decode(data)["response"]["_pages_content"]["children"]
+        collect_props(content, url, props)
+
+        def send(body: dict) -> dict | None:
+            data = self._send(
+                client, "Callbacks", body["output"], "POST", CALLBACK_PATH, body
+            )
+            return _decode(data) if data else None
+
+        fire_page_callbacks(send, dependencies, props, url)
+
+    def run_session(self, session: Session, start_at: float, speedup: float) -> None:
+        """Replay one session, starting start_at on the perf_counter clock."""
+        client = Client(self.base_url, self.timeout)
+        try:
+            for step in session.steps:
+                due = start_at + (step.offset / speedup if speedup > 0 else 0.0)
+                wait = due - time.perf_counter()
+                if wait > 0:
+                    time.sleep(wait)
+                elif speedup > 0 and wait < -LATE_THRESHOLD:
+                    with self._lock:
+                        self.lag.append(-wait)
+                if step.kind == "page":
+                    self.page_load(client, step.path)
+                else:
+                    group = "Map viewer" if step.kind == "viewer" else "Map API"
+                    self._send(
+                        client, group, latency_group(step.path), "GET", step.path
+                    )
+        finally:
+            client.close()
+
+    def run(self, sessions: list[Session], concurrency: int, speedup: float) -> float:
+        """Replay sessions on `concurrency` virtual users; returns wall seconds."""
+        if self._shell is None:
+            self.load_shell()
+        offsets = schedule(sessions, speedup)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            futures = [
+                pool.submit(self.run_session, session, started + offset, speedup)
+                for session, offset in zip(sessions, offsets)
+            ]
+            for future in futures:
+                future.result()
+        return time.perf_counter() - started
+
+
+# ---------------------------------------------------------------------------
+# Server memory
+# ---------------------------------------------------------------------------
+
+
+def server_root_pid(url: str, explicit: int | None) -> int | None:
+    """PID of the server process tree: --server-pid, manage.py's PID file, lsof."""
+    if explicit:
+        return explicit
+    try:
+        return int(PID_FILE.read_text().strip())
+    except (OSError, ValueError):
+        pass
+    port = urlparse(url).port or 80
+    try:
+        result = subprocess.run(
+            ["lsof", "-ti", f"tcp:{port}", "-sTCP:LISTEN"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        return int(result.stdout.split()[0]) if result.stdout.strip() else None
+    except (OSError, ValueError):
+        return None
+
+
+def process_tree(root: int, table: list[tuple[int, int, int, str]]) -> dict[int, tuple]:
+    """(rss_kb, command) of root and all its descendants, from `ps` rows."""
+    children: dict[int, list[int]] = defaultdict(list)
+    info = {}
+    for pid, ppid, rss_kb, command in table:
+        children[ppid].append(pid)
+        info[pid] = (rss_kb, command)
+    tree = {}
+    pending = [root]
+    while pending:
+        pid = pending.pop()
+        if pid in info:
+            tree[pid] = info[pid]
+        pending.extend(children.get(pid, []))
+    return tree
+
+
+def _ps_table() -> list[tuple[int, int, int, str]]:
+    output = subprocess.run(
+        ["ps", "-A", "-o", "pid=,ppid=,rss=,comm="],
+        capture_output=True,
+        text=True,
+        check=False,
+    ).stdout
+    rows = []
+    for line in output.splitlines():
+        parts = line.split(None, 3)
+        if len(parts) == 4 and parts[0].isdigit():
+            rows.append((int(parts[0]), int(parts[1]), int(parts[2]), parts[3]))
+    return rows
+
+
+class RssSampler(threading.Thread):
+    """Samples the RSS of the server processes in the background."""
+
+    def __init__(self, root_pid: int, interval: float) -> None:
+        super().__init__(daemon=True)
+        self.root_pid = root_pid
+        self.interval = interval
+        self.peak: dict[int, int] = {}
+        self.last: dict[int, int] = {}
+        self.commands: dict[int, str] = {}
+        self.peak_total = 0
+        self._stop_event = threading.Event()
+
+    def sample(self) -> None:
+        tree = process_tree(self.root_pid, _ps_table())
+        self.last = {pid: rss for pid, (rss, _) in tree.items()}
+        for pid, (rss_kb, command) in tree.items():
+            self.peak[pid] = max(self.peak.get(pid, 0), rss_kb)
+            self.commands[pid] = command
+        self.peak_total = max(self.peak_total, sum(self.last.values()))
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            self.sample()
+            self._stop_event.wait(self.interval)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+        self.sample()
+
+
+# ---------------------------------------------------------------------------
+# Report
+# ---------------------------------------------------------------------------
+
+
+def summarize(results: list[Result], wall_seconds: float) -> dict:
+    """Throughput, error rates and latency percentiles, overall and per group."""
+
+    def stats(rows: list[Result]) -> dict:
+        latencies = sorted(r.ms for r in rows if r.status)
+        return {
+            "requests": len(rows),
+            "errors": sum(1 for r in rows if r.status == 0 or r.status >= 500),
+            "client_errors": sum(1 for r in rows if 400 <= r.status < 500),
+            "p50_ms": round(percentile(latencies, 50), 1),
+            "p95_ms": round(percentile(latencies, 95), 1),
+            "p99_ms": round(percentile(latencies, 99), 1),
+            "max_ms": round(latencies[-1], 1) if latencies else 0.0,
+            "bytes": sum(r.bytes for r in rows),
+        }
+
+    groups: dict[str, list[Result]] = defaultdict(list)
+    labels: dict[str, list[Result]] = defaultdict(list)
+    for result in results:
+        groups[result.group].append(result)
+        labels[f"{result.group}: {result.label}"].append(result)
+
+    total = stats(results)
+    total["wall_seconds"] = round(wall_seconds, 2)
+    total["throughput_rps"] = (
+        round(len(results) / wall_seconds, 2) if wall_seconds else 0.0
+    )
+    total["error_rate"] = round(total["errors"] / len(results), 4) if results else 0.0
+    return {
+        "total": total,
+        "groups": {name: stats(rows) for name, rows in sorted(groups.items())},
+        "labels": dict(
+            sorted(
+                ((name, stats(rows)) for name, rows in labels.items()),
+                key=lambda item: item[1]["p95_ms"],
+                reverse=True,
+            )
+        ),
+    }
+
+
+def _print_table(title: str, label: str, rows: dict[str, dict]) -> None:
+    rows = {name[:LABEL_WIDTH]: s for name, s in rows.items()}
+    label_w = max([len(label)] + [len(name) for name in rows])
+    header = (
+        f" {label:<{label_w}s} {'Requests':>9s} {'Errors':>7s} {'p50 ms':>9s}"
+        f" {'p95 ms':>9s} {'p99 ms':>9s} {'max ms':>9s}"
+    )
+    print(f"\n{'=' * len(header)}")
+    print(f" {title}")
+    print(f"{'=' * len(header)}")
+    print(header)
+    print(f" {'-' * label_w} {'-' * 9} {'-' * 7}" + f" {'-' * 9}" * 4)
+    for name, s in rows.items():
+        print(
+            f" {name:<{label_w}s} {s['requests']:>9d} {s['errors']:>7d}"
+            f" {s['p50_ms']:>9.1f} {s['p95_ms']:>9.1f} {s['p99_ms']:>9.1f}"
+            f" {s['max_ms']:>9.1f}"
+        )
+
+
+def print_report(summary: dict, lag: list[float], top: int) -> None:
+    total = summary["total"]
+    print(f"\nReplayed {total['requests']} requests in {total['wall_seconds']:.1f} s")
+    print(f"  Throughput:    {total['throughput_rps']:.1f} requests/s")
+    print(
+        f"  Errors:        {total['errors']} ({total['error_rate']:.2%}) 5xx or failed,"
+        f" {total['client_errors']} 4xx"
+    )
+    print(
+        f"  Latency:       p50 {total['p50_ms']:.1f} ms, p95 {total['p95_ms']:.1f} ms,"
+        f" p99 {total['p99_ms']:.1f} ms"
+    )
+    if lag:
+        # Requests that started late: the virtual users could not keep up
+        print(
+            f"  Schedule lag:  {len(lag)} requests late, max {max(lag):.1f} s"
+            " (raise --concurrency or lower --speedup)"
+        )
+    _print_table("Latency by group", "Group", summary["groups"])
+    labels = dict(list(summary["labels"].items())[:top])
+    _print_table(f"Slowest {len(labels)} requests by p95", "Request", labels)
+
+
+def print_memory(sampler: RssSampler) -> None:
+    print(f"\n{'=' * 60}")
+    print(" Server memory (RSS)")
+    print(f"{'=' * 60}")
+    print(f" {'PID':>8s} {'Process':<24s} {'Peak MB':>10s} {'Final MB':>10s}")
+    for pid in sorted(sampler.peak):
+        final = sampler.last.get(pid)
+        final_text = (
+            f"{final / 1024:>10.0f}" if final is not None else f"{'exited':>10s}"
+        )
+        print(
+            f" {pid:>8d} {sampler.commands[pid][:24]:<24s}"
+            f" {sampler.peak[pid] / 1024:>10.0f} {final_text}"
+        )
+    peak_mb = sampler.peak_total / 1024
+    print(f"\n Peak total: {peak_mb:.0f} MB of the {FLY_MEMORY_MB} MB Fly machine")
+    if peak_mb > FLY_MEMORY_MB * 0.9:
+        print(" Warning: within 10% of the machine's memory")
+
+
+def memory_summary(sampler: RssSampler) -> dict:
+    return {
+        "peak_total_mb": round(sampler.peak_total / 1024, 1),
+        "processes": {
+            str(pid): {
+                "command": sampler.commands[pid],
+                "peak_mb": round(sampler.peak[pid] / 1024, 1),
+                "final_mb": round(sampler.last[pid] / 1024, 1)
+                if pid in sampler.last
+                else None,
+            }
+            for pid in sorted(sampler.peak)
+        },
+    }
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Replay access log sessions against a local server",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--log-dir", required=True, help="Local copy of the access log directory"
+    )
+    parser.add_argument(
+        "--url",
+        default=DEFAULT_URL,
+        help=f"Server to replay against (default: {DEFAULT_URL})",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Sessions replayed at once (default: 4)",
+    )
+    parser.add_argument(
+        "--speedup",
+        type=float,
+        default=0.0,
+        help="Time compression: 60 replays an hour in a minute; 0 (default): no waits",
+    )
+    parser.add_argument("--sessions", type=int, help="Only replay the first N sessions")
+    parser.add_argument(
+        "--since", help="Only sessions starting on/after this date (YYYY-MM-DD)"
+    )
+    parser.add_argument(
+        "--server-pid",
+        type=int,
+        help="Server PID for memory sampling (default: manage.py's)",
+    )
+    parser.add_argument(
+        "--rss-interval", type=float, default=1.0, help="Seconds between memory samples"
+    )
+    parser.add_argument("--top", type=int, default=15, help="Slowest requests to list")
+    parser.add_argument("--json", help="Also write the report to this JSON file")
+    args = parser.parse_args()
+
+    sessions = build_sessions(read_local_logs(Path(args.log_dir)))
+    if args.since:
+        since = datetime.strptime(args.since, "%Y-%m-%d")
+        sessions = [s for s in sessions if s.start >= since]
+    if args.sessions:
+        sessions = sessions[: args.sessions]
+    if not sessions:
+        print("No replayable requests found in the logs.")
+        sys.exit(1)
+
+    steps = sum(len(s.steps) for s in sessions)
+    span = (sessions[-1].start - sessions[0].start).total_seconds()
+    print(
+        f"Replaying {len(sessions)} sessions ({steps} logged requests,"
+        f" {span / 3600:.1f} h of traffic) against {args.url}"
+        f" with {args.concurrency} virtual users, speedup {args.speedup or 'none'}"
+    )
+
+    replayer = Replayer(args.url)
+    try:
+        replayer.load_shell()
+    except (OSError, http.client.HTTPException, ValueError) as e:
+        print(f"Could not reach the app at {args.url}: {e}")
+        print("Start it first, e.g. uv run python manage.py start --gunicorn")
+        sys.exit(1)
+
+    root_pid = server_root_pid(args.url, args.server_pid)
+    sampler = RssSampler(root_pid, args.rss_interval) if root_pid else None
+    if sampler is not None:
+        sampler.start()
+    else:
+        print("Server PID not found; skipping memory sampling (use --server-pid)")
+
+    try:
+        wall_seconds = replayer.run(sessions, args.concurrency, args.speedup)
+    finally:
+        if sampler is not None:
+            sampler.stop()
+
+    summary = summarize(replayer.results, wall_seconds)
+    print_report(summary, replayer.lag, args.top)
+    if sampler is not None:
+        print_memory(sampler)
+        summary["memory"] = memory_summary(sampler)
+
+    if args.json:
+        summary["options"] = {
+            "url": args.url,
+            "concurrency": args.concurrency,
+            "speedup": args.speedup,
+            "sessions": len(sessions),
+        }
+        Path(args.json).write_text(json.dumps(summary, indent=2))
+        print(f"\nWrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -131,7 +131,8 @@ fi
 
 # Step 2: Import attachments into DuckDB (locally - FAST!)
 echo -e "${YELLOW}[2/8] Importing save files into DuckDB (local - fast!)...${NC}"
-IMPORT_CMD="uv run python scripts/import_attachments.py --directory saves --verbose ${FORCE_FLAG}"
+# Overview precompute runs once after all enrichment steps (step 2.8)
+IMPORT_CMD="uv run python scripts/import_attachments.py --directory saves --verbose --skip-precompute ${FORCE_FLAG}"
 if ${IMPORT_CMD}; then
     echo -e "${GREEN}✓ Import complete${NC}"
 else
@@ -212,6 +213,15 @@ else
     echo ""
 fi
 
+# Step 2.8: Precompute the default overview page (stored in the database)
+echo -e "${YELLOW}[2.8/8] Precomputing default overview page...${NC}"
+if uv run python scripts/import_attachments.py --precompute-only; then
+    echo -e "${GREEN}✓ Overview precomputed${NC}"
+else
+    echo -e "${YELLOW}⚠ Overview precompute failed (non-critical, pages compute live)${NC}"
+fi
+echo ""
+
 # Exit here if not deploying to Fly.io
 if [ "$DEPLOY_TO_FLY" = false ]; then
     echo ""
@@ -228,11 +238,11 @@ if [ "$DEPLOY_TO_FLY" = false ]; then
     exit 0
 fi
 
-# Step 3: Upload new database via atomic replacement
+# Step 3: Upload new database
 echo -e "${YELLOW}[3/8] Uploading new database to Fly.io...${NC}"
 DB_PATH="data/tournament_data.duckdb"
-REMOTE_PATH="/data/tournament_data.duckdb"
 REMOTE_TEMP_PATH="/data/tournament_data.duckdb.new"
+REMOTE_SNAPSHOT_DIR="/data/snapshots"
 
 if [ ! -f "${DB_PATH}" ]; then
     echo -e "${RED}Error: Database file not found at ${DB_PATH}${NC}"
@@ -287,64 +297,33 @@ else
 fi
 echo ""
 
-# Step 5: Atomically replace database and restart
-echo -e "${YELLOW}[5/8] Replacing database and restarting app...${NC}"
+# Step 5: Publish as the live snapshot
+echo -e "${YELLOW}[5/8] Publishing new database snapshot...${NC}"
 
-# Atomic move (replaces locked file while app is running)
-if fly ssh console -a "${APP_NAME}" -C "mv ${REMOTE_TEMP_PATH} ${REMOTE_PATH}"; then
-    echo -e "${GREEN}✓ Database replaced atomically${NC}"
+# Moves the upload into the snapshot directory and flips its CURRENT pointer.
+# Workers switch to it between requests, so no restart is needed.
+if fly ssh console -a "${APP_NAME}" -C "/app/.venv/bin/python /app/scripts/publish_snapshot.py --source ${REMOTE_TEMP_PATH} --snapshot-dir ${REMOTE_SNAPSHOT_DIR} --move"; then
+    echo -e "${GREEN}✓ Snapshot published${NC}"
 else
-    echo -e "${RED}Error: Failed to replace database${NC}"
+    echo -e "${RED}Error: Failed to publish snapshot${NC}"
     exit 1
 fi
 
-# Sync filesystem to ensure writes are committed
-fly ssh console -a "${APP_NAME}" -C "sync" 2>/dev/null
-echo -e "${GREEN}✓ Filesystem synced${NC}"
-
 # Fix ownership
-if fly ssh console -a "${APP_NAME}" -C "chown appuser:appuser ${REMOTE_PATH}"; then
+if fly ssh console -a "${APP_NAME}" -C "chown -R appuser:appuser ${REMOTE_SNAPSHOT_DIR}"; then
     echo -e "${GREEN}✓ Ownership fixed${NC}"
 else
     echo -e "${YELLOW}Warning: Could not fix ownership${NC}"
 fi
 
-# Fix permissions
-if fly ssh console -a "${APP_NAME}" -C "chmod 664 ${REMOTE_PATH}"; then
-    echo -e "${GREEN}✓ Permissions fixed${NC}"
-else
-    echo -e "${YELLOW}Warning: Could not fix permissions${NC}"
-fi
-
-# Sync filesystem to ensure writes are committed
-fly ssh console -a "${APP_NAME}" -C "sync" 2>/dev/null
-
-# Get machine ID for restart
-MACHINE_ID=$(fly machine list -a "${APP_NAME}" 2>&1 | grep -E '^[a-z0-9]{14}' | awk '{print $1}')
+# Workers poll the pointer every SNAPSHOT_POLL_INTERVAL seconds (default 5)
+echo -e "${BLUE}Waiting for workers to switch...${NC}"
+sleep 10
 
-if [ -z "$MACHINE_ID" ]; then
-    echo -e "${YELLOW}Could not determine machine ID, using generic restart...${NC}"
-    fly apps restart "${APP_NAME}"
+if fly status -a "${APP_NAME}" | grep -q "passing"; then
+    echo -e "${GREEN}✓ Health checks passing${NC}"
 else
-    # Restart app to pick up new database
-    echo -e "${BLUE}Restarting app to load new database...${NC}"
-    if fly machine restart "${MACHINE_ID}" -a "${APP_NAME}"; then
-        echo -e "${GREEN}✓ App restarted${NC}"
-
-        # Wait for health checks
-        echo -e "${BLUE}Waiting for health checks...${NC}"
-        sleep 15
-
-        # Check final status
-        if fly status -a "${APP_NAME}" | grep -q "passing"; then
-            echo -e "${GREEN}✓ Health checks passing${NC}"
-        else
-            echo -e "${YELLOW}Warning: Check health status manually with: fly status -a ${APP_NAME}${NC}"
-        fi
-    else
-        echo -e "${RED}Error: Failed to restart machine${NC}"
-        exit 1
-    fi
+    echo -e "${YELLOW}Warning: Check health status manually with: fly status -a ${APP_NAME}${NC}"
 fi
 
 echo ""
@@ -353,7 +332,7 @@ echo -e "${GREEN}Deployment Complete!${NC}"
 echo "======================================"
 echo ""
 echo "The production database has been updated with the latest tournament data."
-echo "The app has been restarted to load the new data."
+echo "Workers switch to the new snapshot between requests; no restart needed."
 echo ""
 echo -e "${BLUE}Performance benefit:${NC} Processing locally is ~10x faster than on Fly.io!"
 echo ""
@@ -0,0 +1,149 @@
+"""Tests for the local log latency mode of scripts/analyze_access_logs.py.
+
+Test Strategy:
+- Full gunicorn access lines parse into rows with the duration in ms;
+  health checks are dropped
+- Request paths group into pages, callbacks, APIs and static files
+- Loading is incremental: a second run loads only new lines, a rotated file
+  resumes from its stored offset and a partly written line waits for the
+  next run
+"""
+
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from scripts.analyze_access_logs import (
+    latency_group,
+    load_new_lines,
+    local_log_files,
+    parse_access_line,
+)
+
+
+def _line(path: str = "/", duration_us: int = 250000, day: int = 19, **kw) -> str:
+    agent = kw.get("agent", "Mozilla/5.0")
+    status = kw.get("status", 200)
+    return (
+        f"74.108.139.73, 66.241.125.158 - - [{day:02d}/Feb/2026:19:24:26 +0000] "
+        f'"GET {path} HTTP/1.1" {status} 1234 "-" "{agent}" {duration_us}\n'
+    )
+
+
+@pytest.fixture
+def con():
+    connection = duckdb.connect(":memory:")
+    yield connection
+    connection.close()
+
+
+def _durations(con) -> list:
+    return [
+        row[0]
+        for row in con.execute(
+            "SELECT duration_ms FROM requests ORDER BY ts, duration_ms"
+        ).fetchall()
+    ]
+
+
+class TestParseAccessLine:
+    """parse_access_line()"""
+
+    def test_full_line(self) -> None:
+        row = parse_access_line(_line("/matches?match_id=3", 412345, status=500))
+
+        assert row == (
+            "19/Feb/2026:19:24:26",
+            "74.108.139.73",
+            "GET",
+            "/matches?match_id=3",
+            "Matches",
+            500,
+            1234,
+            412.345,
+        )
+
+    def test_escaped_quotes_in_agent(self) -> None:
+        row = parse_access_line(_line(agent='Mozilla/5.0 (\\"X11\\")'))
+
+        assert row is not None
+        assert row[-1] == 250.0
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            _line(agent="Consul Health Check"),
+            _line("/health"),
+            "not an access log line\n",
+        ],
+    )
+    def test_skipped(self, line: str) -> None:
+        assert parse_access_line(line) is None
+
+    @pytest.mark.parametrize(
+        "path, group",
+        [
+            ("/", "Overview"),
+            ("/players?player=x", "Players"),
+            ("/_dash-update-component", "Dash callbacks"),
+            ("/_dash-layout", "Dash internals"),
+            ("/api/map/territories/3/10", "API territories"),
+            ("/static-assets/atlases/icons-techs.1a2b3c4d.png", "Static"),
+            ("/map/viewer/3", "Map viewer"),
+        ],
+    )
+    def test_latency_group(self, path: str, group: str) -> None:
+        assert latency_group(path) == group
+
+
+class TestLoadNewLines:
+    """Incremental loading with stored offsets."""
+
+    def test_second_run_loads_only_new_lines(self, tmp_path: Path, con) -> None:
+        log = tmp_path / "access.log"
+        log.write_text(_line(duration_us=1000) + _line(duration_us=2000))
+
+        assert load_new_lines(con, tmp_path) == 2
+        assert load_new_lines(con, tmp_path) == 0
+
+        with log.open("a") as f:
+            f.write(_line(duration_us=3000))
+        assert load_new_lines(con, tmp_path) == 1
+        assert _durations(con) == [1.0, 2.0, 3.0]
+
+    def test_rotated_file_resumes(self, tmp_path: Path, con) -> None:
+        log = tmp_path / "access.log"
+        log.write_text(_line(duration_us=1000, day=1))
+        load_new_lines(con, tmp_path)
+
+        # RotatingFileHandler: the current file gets a suffix, after a last write
+        with log.open("a") as f:
+            f.write(_line(duration_us=2000, day=2))
+        log.rename(tmp_path / "access.log.1")
+        log.write_text(_line(duration_us=3000, day=3))
+
+        assert load_new_lines(con, tmp_path) == 2
+        assert _durations(con) == [1.0, 2.0, 3.0]
+
+    def test_partial_line_waits(self, tmp_path: Path, con) -> None:
+        log = tmp_path / "access.log"
+        complete = _line(duration_us=1000)
+        partial = _line(duration_us=2000)
+        log.write_text(complete + partial[:40])
+
+        assert load_new_lines(con, tmp_path) == 1
+
+        log.write_text(complete + partial)
+        assert load_new_lines(con, tmp_path) == 1
+        assert _durations(con) == [1.0, 2.0]
+
+    def test_files_read_oldest_first(self, tmp_path: Path) -> None:
+        for name in ["access.log", "access.log.2", "access.log.1", "other.log"]:
+            (tmp_path / name).write_text(_line())
+
+        assert [p.name for p in local_log_files(tmp_path)] == [
+            "access.log.2",
+            "access.log.1",
+            "access.log",
+        ]
@@ -0,0 +1,130 @@
+"""Tests for the query benchmark suite (scripts/bench_queries.py).
+
+Test Strategy:
+- Synthetic databases use the production schema, fill every table the
+  pages read and are the same for the same seed
+- Territory snapshots are generated only for the first territory_matches
+- The benchmark context supplies every required query method argument, and
+  each public method is timed or reports its error
+- Baseline comparison lists changes over both thresholds, slowest first
+"""
+
+from pathlib import Path
+
+import pytest
+
+from scripts.bench_queries import (
+    benchmark_context,
+    bench_query_methods,
+    compare,
+    generate_database,
+    public_query_methods,
+)
+from tournament_visualizer.data.database import TournamentDatabase
+from tournament_visualizer.data.queries import TournamentQueries
+
+
+@pytest.fixture(scope="module")
+def bench_db(tmp_path_factory: pytest.TempPathFactory) -> tuple[Path, dict]:
+    path = tmp_path_factory.mktemp("bench") / "bench.duckdb"
+    counts = generate_database(path, matches=4, seed=1, territory_matches=1)
+    return path, counts
+
+
+@pytest.fixture
+def queries(bench_db: tuple[Path, dict]) -> TournamentQueries:
+    db = TournamentDatabase(str(bench_db[0]), read_only=True)
+    yield TournamentQueries(database=db)
+    db.close()
+
+
+class TestGenerateDatabase:
+    """generate_database()"""
+
+    def test_tables_filled(self, bench_db: tuple[Path, dict]) -> None:
+        _, counts = bench_db
+
+        assert counts["matches"] == 4
+        assert counts["players"] == 8
+        for table in [
+            "events",
+            "rulers",
+            "cities",
+            "territories",
+            "player_points_history",
+            "player_yield_history",
+            "family_opinion_history",
+            "religion_opinion_history",
+            "pick_order_games",
+        ]:
+            assert counts[table] > 0, table
+
+    def test_same_seed_same_data(
+        self, bench_db: tuple[Path, dict], tmp_path: Path
+    ) -> None:
+        counts = generate_database(
+            tmp_path / "again.duckdb", matches=4, seed=1, territory_matches=1
+        )
+
+        assert counts == bench_db[1]
+
+    def test_territories_for_first_matches_only(
+        self, queries: TournamentQueries
+    ) -> None:
+        with queries.db.get_connection() as conn:
+            matches = conn.execute(
+                "SELECT DISTINCT match_id FROM territories"
+            ).fetchall()
+
+        assert matches == [(1,)]
+
+
+class TestBenchmark:
+    """Timing the query methods."""
+
+    def test_context_covers_required_arguments(
+        self, queries: TournamentQueries
+    ) -> None:
+        context = benchmark_context(queries.db)
+
+        assert context["match_id"] == 1
+        assert context["player1_id"] != context["player2_id"]
+        results = bench_query_methods(queries, context, repeat=1)
+        assert set(results) == set(public_query_methods(queries))
+        assert not [
+            name
+            for name, result in results.items()
+            if "no benchmark value" in result.get("error", "")
+        ]
+
+    def test_only_filter(self, queries: TournamentQueries) -> None:
+        context = benchmark_context(queries.db)
+
+        results = bench_query_methods(queries, context, repeat=2, only="territory")
+
+        assert results
+        assert all("territory" in name for name in results)
+        assert all(result["ms"] >= result["min_ms"] for result in results.values())
+
+
+class TestCompare:
+    """compare() against a baseline."""
+
+    @staticmethod
+    def _results(**timings: float) -> dict:
+        return {
+            "scales": {
+                "50": {"queries": {name: {"ms": ms} for name, ms in timings.items()}}
+            }
+        }
+
+    def test_changes_over_thresholds(self) -> None:
+        baseline = self._results(a=10.0, b=10.0, c=1.0, d=10.0)
+        results = self._results(a=20.0, b=11.0, c=2.5, d=4.0, e=50.0)
+
+        changes = compare(results, baseline, ratio=1.25, min_ms=2.0)
+
+        assert [(row["name"], row["ratio"]) for row in changes] == [
+            ("query a", 2.0),
+            ("query d", 0.4),
+        ]
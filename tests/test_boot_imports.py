@@ -0,0 +1,81 @@
+"""Tests for worker boot imports and the manage.py import profile.
+
+Test Strategy:
+- Importing the app (what every gunicorn worker does on start) must not
+  import dependencies that are only needed on first use
+- The -X importtime report is parsed and aggregated per package
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import manage
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     numpy._utils
+import time:      2000 |       2120 |   numpy
+import time:       300 |        300 |     tournament_visualizer.config
+import time:       500 |       2920 |   tournament_visualizer.data.queries
+import time:      4000 |       4000 |   scipy.stats
+import time:       800 |       7720 | tournament_visualizer.app
+"""
+
+
+class TestBootImports:
+    """Modules imported while the app boots."""
+
+    def test_lazy_dependencies_not_imported(self, tmp_path: Path) -> None:
+        (tmp_path / "saves").mkdir()
+        code = (
+            "import sys\n"
+            "import tournament_visualizer.app\n"
+            f"lazy = {manage.LAZY_DEPENDENCIES!r}\n"
+            "print(','.join(m for m in lazy if m in sys.modules))\n"
+        )
+        env = {
+            **os.environ,
+            "PYTHONPATH": str(REPO_ROOT),
+            "SAVES_DIRECTORY": str(tmp_path / "saves"),
+            "TOURNAMENT_DB_PATH": str(tmp_path / "missing.duckdb"),
+        }
+
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=tmp_path,
+            env=env,
+            check=False,
+        )
+
+        assert result.returncode == 0, result.stderr[-2000:]
+        assert result.stdout.strip().splitlines()[-1:] in ([], [""])
+
+
+class TestImportProfile:
+    """Parsing and summarizing python -X importtime output."""
+
+    def test_parse_skips_header(self) -> None:
+        rows = manage.parse_import_times(IMPORTTIME_OUTPUT + "unrelated log line\n")
+
+        assert rows[0] == ("numpy._utils", 120, 120)
+        assert rows[-1] == ("tournament_visualizer.app", 800, 7720)
+        assert len(rows) == 6
+
+    def test_summary(self) -> None:
+        summary = manage.summarize_import_times(
+            manage.parse_import_times(IMPORTTIME_OUTPUT), top=2
+        )
+
+        assert summary["total_us"] == 7720
+        assert summary["packages"] == [("scipy", 4000), ("numpy", 2120)]
+        assert summary["project"] == [
+            ("tournament_visualizer.app", 7720),
+            ("tournament_visualizer.data.queries", 2920),
+        ]
+        assert summary["lazy"] == ["scipy"]
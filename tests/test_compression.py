@@ -0,0 +1,142 @@
+"""Tests for Flask response compression.
+
+Test Strategy:
+- Large JSON responses are gzipped for clients that accept it and decode to
+  the original body
+- Small bodies, other mimetypes, streamed files and clients without gzip
+  support are left alone
+- Accept-Encoding quality values are honored; br is only chosen when the
+  brotli package is available
+- Dash component bundles are compressed once per process
+"""
+
+import gzip
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask, Response, jsonify, send_file
+
+from tournament_visualizer import compression
+from tournament_visualizer.compression import choose_encoding, init_compression
+
+PAYLOAD = {"data": [{"x": list(range(500)), "y": [1.5] * 500, "type": "bar"}]}
+
+
+@pytest.fixture
+def app(tmp_path: Path) -> Flask:
+    app = Flask(__name__)
+    (tmp_path / "icon.svg").write_text("<svg>" + " " * 5000 + "</svg>")
+
+    @app.route("/json")
+    def large_json():
+        return jsonify(PAYLOAD)
+
+    @app.route("/small")
+    def small_json():
+        return jsonify({"ok": True})
+
+    @app.route("/png")
+    def png():
+        return Response(b"\x89PNG" + b"\x00" * 5000, mimetype="image/png")
+
+    @app.route("/file")
+    def file():
+        return send_file(tmp_path / "icon.svg")
+
+    @app.route("/_dash-component-suites/dash/bundle.js")
+    def bundle():
+        return Response("var a = 1;\n" * 1000, mimetype="text/javascript")
+
+    init_compression(app, level=6, min_size=1024)
+    return app
+
+
+class TestCompressResponse:
+    """The after_request hook."""
+
+    def test_large_json_gzipped(self, app: Flask) -> None:
+        response = app.test_client().get(
+            "/json", headers={"Accept-Encoding": "gzip, deflate"}
+        )
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert json.loads(gzip.decompress(response.data)) == PAYLOAD
+        assert int(response.headers["Content-Length"]) == len(response.data)
+
+    def test_client_without_gzip(self, app: Flask) -> None:
+        response = app.test_client().get("/json")
+
+        assert "Content-Encoding" not in response.headers
+        assert response.get_json() == PAYLOAD
+
+    @pytest.mark.parametrize("path", ["/small", "/png", "/file"])
+    def test_not_compressed(self, app: Flask, path: str) -> None:
+        response = app.test_client().get(path, headers={"Accept-Encoding": "gzip"})
+
+        assert "Content-Encoding" not in response.headers
+
+    def test_level_zero_disables(self) -> None:
+        app = Flask(__name__)
+        app.route("/json")(lambda: jsonify(PAYLOAD))
+        init_compression(app, level=0)
+
+        response = app.test_client().get("/json", headers={"Accept-Encoding": "gzip"})
+
+        assert "Content-Encoding" not in response.headers
+
+    def test_component_bundle_compressed_once(
+        self, app: Flask, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls = []
+        original = compression.compress_body
+
+        def counting(data: bytes, encoding: str, level: int) -> bytes:
+            calls.append(encoding)
+            return original(data, encoding, level)
+
+        monkeypatch.setattr(compression, "compress_body", counting)
+        client = app.test_client()
+        path = "/_dash-component-suites/dash/bundle.js"
+
+        first = client.get(path, headers={"Accept-Encoding": "gzip"})
+        second = client.get(path, headers={"Accept-Encoding": "gzip"})
+
+        assert calls == ["gzip"]
+        assert second.data == first.data
+        assert gzip.decompress(second.data).startswith(b"var a = 1;")
+
+
+class TestChooseEncoding:
+    """Accept-Encoding negotiation."""
+
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            ("gzip, deflate, br", "gzip"),
+            ("GZIP", "gzip"),
+            ("*", "gzip"),
+            ("deflate", None),
+            ("", None),
+            ("gzip;q=0", None),
+            ("gzip; q=0.5, identity", "gzip"),
+        ],
+    )
+    def test_without_brotli(
+        self, monkeypatch: pytest.MonkeyPatch, header: str, expected: str
+    ) -> None:
+        monkeypatch.setattr(compression, "brotli", None)
+
+        assert choose_encoding(header) == expected
+
+    def test_brotli_preferred_when_available(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(
+            compression, "brotli", SimpleNamespace(compress=lambda data, quality: data)
+        )
+
+        assert choose_encoding("gzip, deflate, br") == "br"
+        assert choose_encoding("gzip, br;q=0") == "gzip"
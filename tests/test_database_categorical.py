@@ -0,0 +1,243 @@
+"""Tests for ENUM-encoded categorical columns.
+
+Test Strategy:
+- Fresh schemas create the seeded categorical columns as ENUM types and
+  keep open-ended ones (events, improvements, families, ...) as VARCHAR
+- Inserting unseen values extends the enum without losing rows
+- Legacy VARCHAR databases are migrated in place, preserving data and indexes
+"""
+
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from tournament_visualizer.data.database import TournamentDatabase
+
+
+def _column_type(db: TournamentDatabase, table: str, column: str) -> str:
+    with db.get_connection() as conn:
+        return conn.execute(
+            """
+            SELECT data_type FROM information_schema.columns
+            WHERE table_name = ? AND column_name = ?
+            """,
+            [table, column],
+        ).fetchone()[0]
+
+
+def _enum_values(db: TournamentDatabase, type_name: str) -> list:
+    with db.get_connection() as conn:
+        return conn.execute(f"SELECT enum_range(NULL::{type_name})").fetchone()[0]
+
+
+@pytest.fixture
+def fresh_db(tmp_path: Path) -> TournamentDatabase:
+    """Create a new database with schema, one match and two players."""
+    db = TournamentDatabase(db_path=str(tmp_path / "fresh.duckdb"), read_only=False)
+    db.create_schema()
+
+    with db.get_connection() as conn:
+        conn.execute(
+            "INSERT INTO matches (match_id, file_name, file_hash) "
+            "VALUES (1, 'test.zip', 'hash123')"
+        )
+        conn.execute(
+            "INSERT INTO players (player_id, match_id, player_name, "
+            "player_name_normalized) VALUES (1, 1, 'Player1', 'player1')"
+        )
+        conn.execute(
+            "INSERT INTO players (player_id, match_id, player_name, "
+            "player_name_normalized) VALUES (2, 1, 'Player2', 'player2')"
+        )
+
+    yield db
+
+    db.close()
+
+
+class TestFreshSchema:
+    """Categorical columns on a newly created schema."""
+
+    def test_seeded_columns_are_enums(self, fresh_db: TournamentDatabase) -> None:
+        assert _column_type(fresh_db, "territories", "terrain_type").startswith("ENUM")
+        assert _column_type(
+            fresh_db, "player_yield_history", "resource_type"
+        ).startswith("ENUM")
+
+    def test_open_ended_columns_are_varchar(
+        self, fresh_db: TournamentDatabase
+    ) -> None:
+        fresh_db.bulk_insert_events(
+            [{"match_id": 1, "turn_number": 1, "event_type": "LAW_ADOPTED"}]
+        )
+        assert _column_type(fresh_db, "events", "event_type") == "VARCHAR"
+        assert _column_type(fresh_db, "territories", "improvement_type") == "VARCHAR"
+
+    def test_seeded_from_game_constants(self, fresh_db: TournamentDatabase) -> None:
+        values = _enum_values(fresh_db, "yield_type_enum")
+        assert "YIELD_FOOD" in values
+        assert values == sorted(values)
+
+    def test_migration_marked_applied(self, fresh_db: TournamentDatabase) -> None:
+        result = fresh_db.fetch_one(
+            "SELECT COUNT(*) FROM schema_migrations WHERE version = '7'"
+        )
+        assert result[0] == 1
+
+    def test_insert_extends_enum(self, fresh_db: TournamentDatabase) -> None:
+        fresh_db.bulk_insert_yield_history(
+            [
+                {
+                    "match_id": 1,
+                    "player_id": 1,
+                    "turn_number": 1,
+                    "resource_type": "YIELD_FOOD",
+                    "amount": 10,
+                }
+            ]
+        )
+        fresh_db.bulk_insert_yield_history(
+            [
+                {
+                    "match_id": 1,
+                    "player_id": 1,
+                    "turn_number": 2,
+                    "resource_type": "YIELD_NEW_IN_PATCH",
+                    "amount": 3,
+                }
+            ]
+        )
+
+        rows = fresh_db.fetch_all(
+            "SELECT resource_type FROM player_yield_history ORDER BY turn_number"
+        )
+        assert [r[0] for r in rows] == ["YIELD_FOOD", "YIELD_NEW_IN_PATCH"]
+        assert "YIELD_NEW_IN_PATCH" in _enum_values(fresh_db, "yield_type_enum")
+        assert _column_type(
+            fresh_db, "player_yield_history", "resource_type"
+        ).startswith("ENUM")
+
+    def test_rebuild_preserves_indexes(self, fresh_db: TournamentDatabase) -> None:
+        fresh_db.bulk_insert_territories(
+            [
+                {
+                    "match_id": 1,
+                    "x_coordinate": 0,
+                    "y_coordinate": 0,
+                    "turn_number": 1,
+                    "terrain_type": "TERRAIN_NEW_IN_PATCH",
+                }
+            ]
+        )
+        indexes = {
+            row[0]
+            for row in fresh_db.fetch_all(
+                "SELECT index_name FROM duckdb_indexes() "
+                "WHERE table_name = 'territories'"
+            )
+        }
+        assert "idx_territories_temporal" in indexes
+
+    def test_string_predicates_still_work(self, fresh_db: TournamentDatabase) -> None:
+        fresh_db.bulk_insert_territories(
+            [
+                {
+                    "match_id": 1,
+                    "x_coordinate": 0,
+                    "y_coordinate": 0,
+                    "turn_number": 1,
+                    "terrain_type": "TERRAIN_LUSH",
+                    "improvement_type": "IMPROVEMENT_FARM",
+                }
+            ]
+        )
+        result = fresh_db.fetch_one(
+            """
+            SELECT COUNT(*) FROM territories
+            WHERE improvement_type LIKE 'IMPROVEMENT_%'
+            AND terrain_type = 'TERRAIN_LUSH'
+            AND COALESCE(specialist_type, 'none') = 'none'
+            """
+        )
+        assert result[0] == 1
+
+
+class TestLegacyMigration:
+    """Migration of a database created before categorical columns existed."""
+
+    @pytest.fixture
+    def legacy_db_path(self, tmp_path: Path) -> Path:
+        db_path = tmp_path / "legacy.duckdb"
+        conn = duckdb.connect(str(db_path))
+        conn.execute("CREATE TABLE matches (match_id BIGINT PRIMARY KEY)")
+        conn.execute(
+            "CREATE TABLE players (player_id BIGINT PRIMARY KEY, "
+            "match_id BIGINT REFERENCES matches(match_id))"
+        )
+        conn.execute(
+            """
+            CREATE TABLE territories (
+                territory_id BIGINT PRIMARY KEY,
+                match_id BIGINT NOT NULL REFERENCES matches(match_id),
+                x_coordinate INTEGER NOT NULL,
+                y_coordinate INTEGER NOT NULL,
+                turn_number INTEGER NOT NULL,
+                terrain_type VARCHAR(50),
+                height_type VARCHAR(50),
+                improvement_type VARCHAR(50),
+                specialist_type VARCHAR(50),
+                resource_type VARCHAR(50),
+                has_road BOOLEAN DEFAULT FALSE,
+                owner_player_id BIGINT REFERENCES players(player_id),
+                city_id INTEGER
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX idx_territories_temporal ON territories(match_id, turn_number)"
+        )
+        conn.execute("INSERT INTO matches VALUES (1)")
+        conn.execute("INSERT INTO players VALUES (1, 1)")
+        conn.execute(
+            """
+            INSERT INTO territories VALUES
+            (1, 1, 0, 0, 1, 'TERRAIN_LUSH', 'HEIGHT_FLAT', 'IMPROVEMENT_MINE',
+             NULL, 'RESOURCE_ORE', TRUE, 1, 3),
+            (2, 1, 1, 0, 1, 'TERRAIN_ODD', NULL, NULL, NULL, NULL, FALSE, NULL, NULL)
+            """
+        )
+        conn.close()
+        return db_path
+
+    def test_migration_converts_and_preserves(self, legacy_db_path: Path) -> None:
+        db = TournamentDatabase(db_path=str(legacy_db_path), read_only=False)
+        try:
+            assert _column_type(db, "territories", "terrain_type").startswith("ENUM")
+            assert "TERRAIN_ODD" in _enum_values(db, "terrain_type_enum")
+            assert _column_type(db, "territories", "improvement_type") == "VARCHAR"
+
+            rows = db.fetch_all(
+                "SELECT territory_id, terrain_type, improvement_type, "
+                "owner_player_id, city_id FROM territories ORDER BY territory_id"
+            )
+            assert rows == [
+                (1, "TERRAIN_LUSH", "IMPROVEMENT_MINE", 1, 3),
+                (2, "TERRAIN_ODD", None, None, None),
+            ]
+        finally:
+            db.close()
+
+    def test_migration_is_idempotent(self, legacy_db_path: Path) -> None:
+        TournamentDatabase(db_path=str(legacy_db_path), read_only=False).close()
+        db = TournamentDatabase(db_path=str(legacy_db_path), read_only=False)
+        try:
+            count = db.fetch_one("SELECT COUNT(*) FROM territories")[0]
+            assert count == 2
+            applied = db.fetch_one(
+                "SELECT COUNT(*) FROM schema_migrations WHERE version = '7'"
+            )
+            assert applied[0] == 1
+        finally:
+            db.close()
+
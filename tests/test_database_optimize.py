@@ -0,0 +1,124 @@
+"""Tests for the post-import storage optimization step.
+
+Test Strategy:
+- Rewritten tables keep every row and come back in (match_id, turn_number) order
+- Redundant indexes from older schemas are dropped, constraints are kept
+- optimize_database reports storage stats and benchmark latencies
+"""
+
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from tournament_visualizer.data.database import REDUNDANT_INDEXES, TournamentDatabase
+from tournament_visualizer.data.etl import OPTIMIZE_BENCHMARK_QUERIES, optimize_database
+
+
+@pytest.fixture
+def loaded_db(tmp_path: Path) -> TournamentDatabase:
+    """Create a database with two matches whose rows are inserted out of order."""
+    db = TournamentDatabase(db_path=str(tmp_path / "optimize.duckdb"), read_only=False)
+    db.create_schema()
+
+    with db.get_connection() as conn:
+        for match_id in (1, 2):
+            conn.execute(
+                "INSERT INTO matches (match_id, file_name, file_hash) VALUES (?, ?, ?)",
+                [match_id, f"match{match_id}.zip", f"hash{match_id}"],
+            )
+            conn.execute(
+                "INSERT INTO players (player_id, match_id, player_name, "
+                "player_name_normalized) VALUES (?, ?, ?, ?)",
+                [match_id, match_id, f"Player{match_id}", f"player{match_id}"],
+            )
+
+    # Interleave matches and reverse turns so insertion order is unsorted
+    db.bulk_insert_events(
+        [
+            {"match_id": match_id, "turn_number": turn, "event_type": "TECH"}
+            for turn in (3, 2, 1)
+            for match_id in (2, 1)
+        ]
+    )
+    db.bulk_insert_yield_history(
+        [
+            {
+                "match_id": match_id,
+                "player_id": match_id,
+                "turn_number": turn,
+                "resource_type": "YIELD_SCIENCE",
+                "amount": turn * 10,
+            }
+            for turn in (2, 1)
+            for match_id in (2, 1)
+        ]
+    )
+
+    yield db
+
+    db.close()
+
+
+def _index_names(db: TournamentDatabase) -> set:
+    return {row[0] for row in db.fetch_all("SELECT index_name FROM duckdb_indexes()")}
+
+
+class TestOptimizeStorage:
+    """TournamentDatabase.optimize_storage()."""
+
+    def test_rows_are_clustered(self, loaded_db: TournamentDatabase) -> None:
+        loaded_db.optimize_storage()
+
+        rows = loaded_db.fetch_all("SELECT match_id, turn_number FROM events")
+        assert rows == sorted(rows)
+        assert len(rows) == 6
+
+    def test_returns_rewritten_row_counts(self, loaded_db: TournamentDatabase) -> None:
+        tables = loaded_db.optimize_storage()
+
+        assert tables["events"] == 6
+        assert tables["player_yield_history"] == 4
+        assert tables["territories"] == 0
+
+    def test_drops_legacy_indexes(self, loaded_db: TournamentDatabase) -> None:
+        with loaded_db.get_connection() as conn:
+            conn.execute(
+                "CREATE INDEX idx_events_type_player "
+                "ON events(event_type, player_id, turn_number)"
+            )
+
+        loaded_db.optimize_storage()
+
+        indexes = _index_names(loaded_db)
+        assert not indexes & set(REDUNDANT_INDEXES)
+        assert "idx_events_match_turn" in indexes
+
+    def test_constraints_survive(self, loaded_db: TournamentDatabase) -> None:
+        loaded_db.optimize_storage()
+
+        with pytest.raises(duckdb.ConstraintException):
+            loaded_db.bulk_insert_yield_history(
+                [
+                    {
+                        "match_id": 1,
+                        "player_id": 1,
+                        "turn_number": 1,
+                        "resource_type": "YIELD_SCIENCE",
+                        "amount": 5,
+                    }
+                ]
+            )
+
+
+class TestOptimizeDatabase:
+    """etl.optimize_database() reporting."""
+
+    def test_reports_storage_and_latency(self, loaded_db: TournamentDatabase) -> None:
+        results = optimize_database(loaded_db)
+
+        assert results["storage"]["before"]["file_bytes"] > 0
+        assert results["storage"]["after"]["used_bytes"] > 0
+        assert set(results["latency_ms"]["before"]) == set(OPTIMIZE_BENCHMARK_QUERIES)
+        assert set(results["latency_ms"]["after"]) == set(OPTIMIZE_BENCHMARK_QUERIES)
+        assert results["tables"]["events"] == 6
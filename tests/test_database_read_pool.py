@@ -0,0 +1,172 @@
+"""Tests for the read cursor pool used by threaded workers.
+
+Test Strategy:
+- Read-only databases hand each concurrent reader its own cursor, up to the
+  pool size, and reuse idle cursors
+- Nested reads on one thread share its cursor, so they cannot deadlock on a
+  full pool (pool size 1)
+- Readers in different threads do not serialize on the connection lock
+- Closing or forking drops pooled cursors; writers keep the shared connection
+"""
+
+import threading
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from tournament_visualizer.data.database import TournamentDatabase
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> str:
+    path = str(tmp_path / "pool.duckdb")
+    writer = TournamentDatabase(db_path=path, read_only=False)
+    writer.create_schema()
+    writer.close()
+    return path
+
+
+@pytest.fixture
+def db(db_path: str) -> TournamentDatabase:
+    database = TournamentDatabase(db_path=db_path, read_pool_size=2)
+    yield database
+    database.close()
+
+
+def _count(conn) -> int:
+    return conn.execute("SELECT COUNT(*) FROM matches").fetchone()[0]
+
+
+class TestReadPool:
+    """Cursor checkout and reuse."""
+
+    def test_nested_readers_share_cursor(self, db: TournamentDatabase) -> None:
+        with db.get_connection() as first, db.get_connection() as second:
+            assert first is second
+            assert first is not db.connection
+            assert _count(first) == _count(second) == 0
+
+    def test_nested_reads_with_pool_size_one(self, db_path: str) -> None:
+        database = TournamentDatabase(db_path=db_path, read_pool_size=1)
+        counts = []
+
+        def reader() -> None:
+            with database.get_connection() as outer:
+                with database.get_connection() as inner:
+                    counts.append(_count(inner))
+                counts.append(_count(outer))
+
+        try:
+            thread = threading.Thread(target=reader)
+            thread.start()
+            thread.join(timeout=5)
+            assert not thread.is_alive()
+            assert counts == [0, 0]
+            # Released once the outer block ends
+            with database.get_connection() as conn:
+                assert _count(conn) == 0
+        finally:
+            database.close()
+
+    def test_idle_cursor_reused(self, db: TournamentDatabase) -> None:
+        with db.get_connection() as first:
+            pass
+        with db.get_connection() as second:
+            assert second is first
+
+    def test_cursor_returned_after_error(self, db: TournamentDatabase) -> None:
+        with pytest.raises(duckdb.CatalogException):
+            with db.get_connection() as conn:
+                conn.execute("SELECT * FROM missing_table")
+
+        with db.get_connection() as conn:
+            assert _count(conn) == 0
+
+    def test_full_pool_waits_for_release(self, db: TournamentDatabase) -> None:
+        holding = threading.Event()
+        release = threading.Event()
+        acquired = threading.Event()
+
+        def second_reader() -> None:
+            with db.get_connection():
+                holding.set()
+                release.wait(timeout=5)
+
+        def third_reader() -> None:
+            with db.get_connection():
+                acquired.set()
+
+        holder = threading.Thread(target=second_reader)
+        with db.get_connection():
+            holder.start()
+            assert holding.wait(timeout=5)
+            thread = threading.Thread(target=third_reader)
+            thread.start()
+            assert not acquired.wait(timeout=0.2)
+
+        assert acquired.wait(timeout=5)
+        release.set()
+        holder.join()
+        thread.join()
+
+    def test_threads_read_concurrently(self, db: TournamentDatabase) -> None:
+        # Both readers must be inside get_connection() at the same time
+        barrier = threading.Barrier(2, timeout=5)
+        counts = []
+
+        def reader() -> None:
+            with db.get_connection() as conn:
+                barrier.wait()
+                counts.append(_count(conn))
+
+        threads = [threading.Thread(target=reader) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert counts == [0, 0]
+
+
+class TestPoolLifecycle:
+    """Closing, forking and write mode."""
+
+    def test_close_discards_cursors(self, db: TournamentDatabase) -> None:
+        with db.get_connection() as before:
+            pass
+        db.close()
+
+        with db.get_connection() as after:
+            assert after is not before
+            assert _count(after) == 0
+
+    def test_cursor_in_use_during_close_not_reused(
+        self, db: TournamentDatabase
+    ) -> None:
+        with db.get_connection() as stale:
+            db.close()
+
+        with db.get_connection() as conn:
+            assert conn is not stale
+            assert _count(conn) == 0
+
+    def test_reset_after_fork_drops_pool(self, db: TournamentDatabase) -> None:
+        with db.get_connection() as inherited:
+            pass
+        parent = db.connection
+
+        db.reset_after_fork()
+
+        with db.get_connection() as conn:
+            assert conn is not inherited
+            assert db.connection is not parent
+        parent.close()
+
+    def test_writer_uses_shared_connection(self, db_path: str) -> None:
+        writer = TournamentDatabase(db_path=db_path, read_only=False)
+        try:
+            with writer.get_connection() as first, writer.get_connection() as second:
+                assert first is second is writer.connection
+        finally:
+            writer.close()
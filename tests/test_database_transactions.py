@@ -0,0 +1,146 @@
+"""Tests for transactional loading and deferred index maintenance.
+
+Test Strategy:
+- transaction() commits on success, rolls back on error and supports nesting
+- A failure while loading a save file leaves no partial match behind
+- bulk_load() drops secondary indexes and restores them afterwards
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import duckdb
+import pytest
+
+from tournament_visualizer.data.database import TournamentDatabase
+from tournament_visualizer.data.etl import TournamentETL
+
+
+@pytest.fixture
+def test_db(tmp_path: Path) -> TournamentDatabase:
+    """Create a database with schema and no data."""
+    db = TournamentDatabase(db_path=str(tmp_path / "tx.duckdb"), read_only=False)
+    db.create_schema()
+
+    yield db
+
+    db.close()
+
+
+def _insert_match(db: TournamentDatabase, match_id: int) -> None:
+    db.execute_query(
+        "INSERT INTO matches (match_id, file_name, file_hash) VALUES ($id, $f, $h)",
+        {"id": match_id, "f": f"m{match_id}.zip", "h": f"h{match_id}"},
+    )
+
+
+def _match_count(db: TournamentDatabase) -> int:
+    return db.fetch_one("SELECT COUNT(*) FROM matches")[0]
+
+
+def _index_names(db: TournamentDatabase) -> set:
+    return {row[0] for row in db.fetch_all("SELECT index_name FROM duckdb_indexes()")}
+
+
+class TestTransaction:
+    """TournamentDatabase.transaction()."""
+
+    def test_commits_on_success(self, test_db: TournamentDatabase) -> None:
+        with test_db.transaction():
+            _insert_match(test_db, 1)
+            _insert_match(test_db, 2)
+
+        assert _match_count(test_db) == 2
+
+    def test_rolls_back_on_error(self, test_db: TournamentDatabase) -> None:
+        with pytest.raises(RuntimeError):
+            with test_db.transaction():
+                _insert_match(test_db, 1)
+                raise RuntimeError("load failed")
+
+        assert _match_count(test_db) == 0
+
+    def test_nested_joins_outer(self, test_db: TournamentDatabase) -> None:
+        with pytest.raises(RuntimeError):
+            with test_db.transaction():
+                with test_db.transaction():
+                    _insert_match(test_db, 1)
+                raise RuntimeError("outer failed")
+
+        assert _match_count(test_db) == 0
+
+    def test_usable_after_rollback(self, test_db: TournamentDatabase) -> None:
+        with pytest.raises(duckdb.ConstraintException):
+            with test_db.transaction():
+                _insert_match(test_db, 1)
+                _insert_match(test_db, 1)  # duplicate primary key
+
+        with test_db.transaction():
+            _insert_match(test_db, 2)
+
+        assert _match_count(test_db) == 1
+
+
+class TestFailedLoad:
+    """A failing ETL load does not leave a partial match."""
+
+    def test_partial_match_rolled_back(self, test_db: TournamentDatabase) -> None:
+        etl = TournamentETL(database=test_db)
+        parsed_data = {
+            "match_metadata": {"file_name": "m1.zip", "file_hash": "h1"},
+            "players": [{"player_name": "Alice", "civilization": "ROME"}],
+            "events": [{"turn_number": 1, "event_type": "TECH"}],
+        }
+
+        with (
+            patch.object(etl, "calculate_file_hash", return_value="h1"),
+            patch.object(etl, "is_file_processed", return_value=False),
+            patch(
+                "tournament_visualizer.data.etl.parse_tournament_file",
+                return_value=parsed_data,
+            ),
+            patch.object(
+                test_db, "bulk_insert_events", side_effect=RuntimeError("boom")
+            ),
+        ):
+            assert etl.process_tournament_file("m1.zip") is False
+
+        assert _match_count(test_db) == 0
+        assert test_db.fetch_one("SELECT COUNT(*) FROM players")[0] == 0
+
+
+class TestBulkLoad:
+    """TournamentDatabase.bulk_load()."""
+
+    def test_defers_and_restores_indexes(self, test_db: TournamentDatabase) -> None:
+        before = _index_names(test_db)
+        assert "idx_events_match_turn" in before
+
+        with test_db.bulk_load():
+            assert _index_names(test_db) == set()
+            _insert_match(test_db, 1)
+
+        assert _index_names(test_db) == before
+        assert _match_count(test_db) == 1
+
+    def test_restores_indexes_after_error(self, test_db: TournamentDatabase) -> None:
+        before = _index_names(test_db)
+
+        with pytest.raises(RuntimeError):
+            with test_db.bulk_load():
+                raise RuntimeError("import failed")
+
+        assert _index_names(test_db) == before
+
+    def test_enum_rebuild_inside_bulk_load(self, test_db: TournamentDatabase) -> None:
+        before = _index_names(test_db)
+        _insert_match(test_db, 1)
+
+        with test_db.bulk_load():
+            with test_db.transaction():
+                test_db.bulk_insert_events(
+                    [{"match_id": 1, "turn_number": 1, "event_type": "TECH"}]
+                )
+
+        assert _index_names(test_db) == before
+        assert test_db.fetch_one("SELECT COUNT(*) FROM events")[0] == 1
@@ -0,0 +1,240 @@
+"""Tests for the serialized figure cache.
+
+Test Strategy:
+- Repeat calls with the same inputs skip the chart builder
+- Changed inputs or a new query cache generation miss the cache
+- Error placeholders and non-figure outputs are never cached
+- The LRU bound and TTL are respected
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import dash
+import pytest
+from plotly import graph_objects as go
+
+from tournament_visualizer.components import figure_cache as figure_cache_module
+from tournament_visualizer.components.charts import create_empty_chart_placeholder
+from tournament_visualizer.components.figure_cache import FigureCache, cached_figures
+from tournament_visualizer.data.queries import TournamentQueries
+
+
+@pytest.fixture
+def state(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Fresh cache and a controllable data generation."""
+    state = SimpleNamespace(
+        cache=FigureCache(max_entries=8, ttl=60.0), generation=0, calls=0
+    )
+    monkeypatch.setattr(figure_cache_module, "figure_cache", state.cache)
+    monkeypatch.setattr(
+        figure_cache_module,
+        "get_queries",
+        lambda: SimpleNamespace(generation=state.generation),
+    )
+    return state
+
+
+def _bar(value: int) -> go.Figure:
+    return go.Figure(go.Bar(x=["a"], y=[value]))
+
+
+class TestCachedFigures:
+    """The cached_figures decorator."""
+
+    def test_repeat_call_skips_builder(self, state: SimpleNamespace) -> None:
+        @cached_figures("test.single")
+        def build(value: int) -> go.Figure:
+            state.calls += 1
+            return _bar(value)
+
+        first = build(3)
+        second = build(3)
+
+        assert state.calls == 1
+        assert isinstance(first, go.Figure)
+        assert isinstance(second, dict)
+        assert second["data"][0]["y"] == [3]
+        assert go.Figure(second) == first
+
+    def test_tuple_outputs_round_trip(self, state: SimpleNamespace) -> None:
+        @cached_figures("test.tuple")
+        def build(value: int) -> tuple:
+            state.calls += 1
+            return _bar(value), _bar(value + 1)
+
+        build(1)
+        cached = build(1)
+
+        assert state.calls == 1
+        assert isinstance(cached, tuple) and len(cached) == 2
+        assert cached[1]["data"][0]["y"] == [2]
+
+    def test_single_element_tuple_stays_tuple(self, state: SimpleNamespace) -> None:
+        @cached_figures("test.one_tuple")
+        def build() -> tuple:
+            return (_bar(1),)
+
+        build()
+        assert isinstance(build(), tuple)
+
+    def test_positional_and_keyword_calls_share_key(
+        self, state: SimpleNamespace
+    ) -> None:
+        @cached_figures("test.bind")
+        def build(active_tab: str, turn_length: int = 200) -> go.Figure:
+            state.calls += 1
+            return _bar(turn_length)
+
+        build("nations-tab", 200)
+        build(active_tab="nations-tab")
+
+        assert state.calls == 1
+
+    def test_inputs_are_part_of_key(self, state: SimpleNamespace) -> None:
+        @cached_figures("test.inputs")
+        def build(nations: list, result: str = "all") -> go.Figure:
+            state.calls += 1
+            return _bar(len(nations))
+
+        build(["Rome"])
+        build(["Rome", "Egypt"])
+        build(["Rome"], result="winners")
+        build(["Rome"])
+
+        assert state.calls == 3
+
+    def test_new_generation_misses(self, state: SimpleNamespace) -> None:
+        @cached_figures("test.generation")
+        def build() -> go.Figure:
+            state.calls += 1
+            return _bar(state.calls)
+
+        build()
+        state.generation += 1
+        refreshed = build()
+
+        assert state.calls == 2
+        assert isinstance(refreshed, go.Figure)
+
+    def test_error_placeholder_not_cached(self, state: SimpleNamespace) -> None:
+        @cached_figures("test.error")
+        def build() -> tuple:
+            state.calls += 1
+            return _bar(1), create_empty_chart_placeholder("Error: boom")
+
+        build()
+        build()
+
+        assert state.calls == 2
+        assert len(state.cache) == 0
+
+    def test_no_data_placeholder_cached(self, state: SimpleNamespace) -> None:
+        @cached_figures("test.empty")
+        def build() -> go.Figure:
+            state.calls += 1
+            return create_empty_chart_placeholder("No data for selected filters")
+
+        build()
+        build()
+
+        assert state.calls == 1
+
+    def test_no_update_not_cached(self, state: SimpleNamespace) -> None:
+        @cached_figures("test.no_update")
+        def build() -> tuple:
+            state.calls += 1
+            return _bar(1), dash.no_update
+
+        build()
+        build()
+
+        assert state.calls == 2
+
+    def test_prevent_update_propagates(self, state: SimpleNamespace) -> None:
+        @cached_figures("test.prevent")
+        def build(active_tab: str) -> go.Figure:
+            if active_tab != "nations-tab":
+                raise dash.exceptions.PreventUpdate
+            return _bar(1)
+
+        with pytest.raises(dash.exceptions.PreventUpdate):
+            build("family-tab")
+        assert len(state.cache) == 0
+
+
+class TestFigureCache:
+    """The underlying LRU store."""
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = FigureCache(max_entries=2, ttl=60.0)
+        cache.set("a", False, ["{}"])
+        cache.set("b", False, ["{}"])
+        cache.get("a")
+        cache.set("c", False, ["{}"])
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_zero_ttl_disables(self) -> None:
+        cache = FigureCache(max_entries=2, ttl=0)
+        cache.set("a", False, ["{}"])
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_pinned_entries_survive_eviction_and_ttl(self) -> None:
+        cache = FigureCache(max_entries=1, ttl=0)
+        cache.pin({"default": (True, ["{}"])})
+        cache.set("a", False, ["{}"])
+
+        assert cache.get("default") == (True, ["{}"])
+
+
+class TestTableData:
+    """DataTable row lists returned by cached callbacks."""
+
+    def test_rows_cached(self, state: SimpleNamespace) -> None:
+        @cached_figures("test.table")
+        def build() -> list:
+            state.calls += 1
+            return [{"match_link": "[A](/matches?match_id=1)", "total_turns": 80}]
+
+        build()
+        assert build() == [
+            {"match_link": "[A](/matches?match_id=1)", "total_turns": 80}
+        ]
+        assert state.calls == 1
+
+    def test_rows_with_page_count_cached(self, state: SimpleNamespace) -> None:
+        @cached_figures("test.paged_table")
+        def build(page_current: int) -> tuple:
+            state.calls += 1
+            return [{"match_link": "[A](/matches?match_id=1)"}], 4
+
+        build(0)
+        assert build(0) == ([{"match_link": "[A](/matches?match_id=1)"}], 4)
+        assert state.calls == 1
+
+    def test_empty_rows_not_cached(self, state: SimpleNamespace) -> None:
+        @cached_figures("test.empty_table")
+        def build() -> list:
+            state.calls += 1
+            return []
+
+        build()
+        build()
+        assert state.calls == 2
+
+
+class TestQueryGeneration:
+    """Generation stamp provided by TournamentQueries."""
+
+    def test_invalidate_caches_bumps_generation(self) -> None:
+        queries = TournamentQueries(database=MagicMock())
+        before = queries.generation
+
+        queries.invalidate_caches()
+
+        assert queries.generation == before + 1
@@ -0,0 +1,201 @@
+"""Tests for the windowed game state (Timeline tab) table.
+
+Test Strategy:
+- A turn window renders only the first turns plus a load-more button
+- Rendering the table window by window gives the same rows as a full render
+- Running city counts are taken over the whole match, not just the window
+- The two-column timeline builds the same rows from event records
+"""
+
+import json
+
+import pandas as pd
+import plotly
+import pytest
+
+from tournament_visualizer.components.game_state import (
+    GAME_STATE_MORE_ID,
+    GAME_STATE_ROWS_ID,
+    GAME_STATE_WINDOW_ID,
+    create_game_state_component,
+    create_game_state_rows,
+)
+from tournament_visualizer.components.timeline import create_timeline_component
+
+
+def _to_json(component) -> object:
+    return json.loads(json.dumps(component, cls=plotly.utils.PlotlyJSONEncoder))
+
+
+def _find(component, component_id: str):
+    for child in component.children:
+        if getattr(child, "id", None) == component_id:
+            return child
+    return None
+
+
+@pytest.fixture
+def comparison_df() -> pd.DataFrame:
+    turns = list(range(1, 11))
+    return pd.DataFrame(
+        {
+            "turn_number": turns,
+            "p1_orders": [t * 1.0 for t in turns],
+            "p2_orders": [5.0] * 10,
+            "p1_military": [10.0] * 10,
+            "p2_military": [t * 2.0 for t in turns],
+            "p1_science": [t * 3.0 for t in turns],
+            "p2_science": [12.0] * 10,
+            "p1_vp": [0] * 10,
+            "p2_vp": [1] * 10,
+        }
+    )
+
+
+@pytest.fixture
+def events_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "turn": [2, 2, 4, 6, 6, 9, 9],
+            "player_id": [1, 2, 1, 1, 2, 1, 2],
+            "event_type": ["city", "tech", "city", "city", "law", "ruler", "city"],
+            "title": [
+                "Founded: Roma",
+                "Discovered: TECH_IRONWORKING",
+                "Founded: Ostia",
+                "Founded: Antium",
+                "Adopted: LAW_SLAVERY",
+                "Crowned Brutus",
+                "Founded: Memphis",
+            ],
+            "details": [
+                "FAMILY_SARGONID",
+                None,
+                "FAMILY_TUDIYA",
+                "FAMILY_SARGONID",
+                None,
+                "Commander",
+                "FAMILY_ADASI",
+            ],
+            "icon": ["🏙️", "🔬", "🏙️", "🏙️", "📜", "👑", "🏙️"],
+            "subtype": [None] * 7,
+            "player_name": ["A", "B", "A", "A", "B", "A", "B"],
+        }
+    )
+
+
+ROW_ARGS = {
+    "player1_name": "A",
+    "player2_name": "B",
+    "player1_id": 1,
+    "player2_id": 2,
+    "player1_civilization": "NATION_ASSYRIA",
+    "player2_civilization": "NATION_EGYPT",
+}
+
+
+class TestTurnWindow:
+    """Initial window and load-more state."""
+
+    def test_first_window_only(
+        self, comparison_df: pd.DataFrame, events_df: pd.DataFrame
+    ) -> None:
+        table = create_game_state_component(
+            comparison_df, events_df, turn_window=4, **ROW_ARGS
+        )
+
+        assert len(_find(table, GAME_STATE_ROWS_ID).children) == 4
+        window = _find(table, GAME_STATE_WINDOW_ID).data
+        assert window["rendered"] == 4
+        assert window["row_args"]["player2_id"] == 2
+        assert _find(table, GAME_STATE_MORE_ID).children == "Show more turns (4 of 10)"
+
+    def test_no_button_when_window_covers_all_turns(
+        self, comparison_df: pd.DataFrame, events_df: pd.DataFrame
+    ) -> None:
+        table = create_game_state_component(
+            comparison_df, events_df, turn_window=50, **ROW_ARGS
+        )
+
+        assert len(_find(table, GAME_STATE_ROWS_ID).children) == 10
+        assert _find(table, GAME_STATE_MORE_ID) is None
+
+    def test_window_state_is_json_serializable(
+        self, comparison_df: pd.DataFrame, events_df: pd.DataFrame
+    ) -> None:
+        table = create_game_state_component(
+            comparison_df, events_df, turn_window=4, **ROW_ARGS
+        )
+
+        json.dumps(_find(table, GAME_STATE_WINDOW_ID).data)
+
+
+class TestCreateGameStateRows:
+    """Rendering the table window by window."""
+
+    @pytest.mark.parametrize("categories", [None, ["Cities", "Techs"]])
+    def test_windows_match_full_render(
+        self,
+        comparison_df: pd.DataFrame,
+        events_df: pd.DataFrame,
+        categories: list,
+    ) -> None:
+        args = {**ROW_ARGS, "enabled_categories": categories, "show_text": True}
+        full, total = create_game_state_rows(comparison_df, events_df, **args)
+
+        windowed = []
+        while len(windowed) < total:
+            rows, _ = create_game_state_rows(
+                comparison_df, events_df, start=len(windowed), count=3, **args
+            )
+            windowed.extend(rows)
+
+        assert total == 10
+        assert _to_json(windowed) == _to_json(full)
+
+    def test_city_counts_span_earlier_windows(
+        self, comparison_df: pd.DataFrame, events_df: pd.DataFrame
+    ) -> None:
+        # Turn 6 is the Sargonids' second city and the player's third
+        (row,), _ = create_game_state_rows(
+            comparison_df, events_df, start=5, count=1, **ROW_ARGS
+        )
+
+        badges = {
+            node["props"]["style"]["backgroundColor"]: node["props"]["children"]
+            for node in _walk(_to_json(row.children[1]))
+            if node.get("type") == "Span"
+            and isinstance(node["props"].get("children"), str)
+            and "backgroundColor" in node["props"].get("style", {})
+        }
+        assert badges == {"#40c057": "3", "#339af0": "2"}
+
+
+def _walk(node):
+    """Yield every serialized component in a component tree."""
+    if isinstance(node, dict):
+        yield node
+        yield from _walk(node.get("props", {}).get("children"))
+    elif isinstance(node, list):
+        for child in node:
+            yield from _walk(child)
+
+
+class TestTimelineComponent:
+    """Two-column timeline built from event records."""
+
+    def test_rows_for_turns_with_events(self, events_df: pd.DataFrame) -> None:
+        timeline = create_timeline_component(events_df, "A", "B", 1, 2)
+
+        turns = [row.children[1].children for row in timeline.children[1:]]
+        assert turns == ["2", "4", "6", "9"]
+
+    def test_consolidates_same_type_events(self, events_df: pd.DataFrame) -> None:
+        events = pd.concat(
+            [events_df, events_df.iloc[[0]].assign(title="Founded: Antium")]
+        )
+
+        timeline = create_timeline_component(events, "A", "B", 1, 2)
+
+        (city_line,) = timeline.children[1].children[0].children
+        assert "Founded: Roma, Antium" in city_line.children
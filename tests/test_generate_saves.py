@@ -0,0 +1,111 @@
+"""Tests for the synthetic save generator (scripts/generate_saves.py).
+
+Test Strategy:
+- Generated saves parse through every section extractor with both XML
+  backends, and the two backends agree
+- The same spec and seed produce the same bytes
+- Record counts follow the size knobs (turns, map width, players, events)
+- A generated save imports into a fresh database, and bench_etl times every
+  pipeline stage
+"""
+
+from pathlib import Path
+
+import pytest
+
+from scripts.bench_etl import STAGES, run_case
+from scripts.generate_saves import (
+    SaveSpec,
+    generate_save_xml,
+    save_file_name,
+    write_save,
+)
+from tournament_visualizer.data.parser import (
+    PARSED_SECTION_VERSIONS,
+    OldWorldSaveParser,
+    parse_tournament_file,
+)
+
+SMALL = SaveSpec(turns=12, map_width=16, players=2, seed=3)
+
+
+def _parse(tmp_path: Path, spec: SaveSpec, backend: str = "lxml") -> dict:
+    path = write_save(tmp_path / f"{backend}_{spec.seed}.zip", spec)
+    parser = OldWorldSaveParser(str(path), backend=backend)
+    parser.extract_and_parse()
+    return parse_tournament_file(str(path), PARSED_SECTION_VERSIONS, parser=parser)
+
+
+class TestGeneratedSave:
+    """Saves the parser can read."""
+
+    @pytest.mark.parametrize("backend", ["lxml", "etree"])
+    def test_every_section_extracts(self, tmp_path: Path, backend: str) -> None:
+        parsed = _parse(tmp_path, SMALL, backend)
+
+        assert set(PARSED_SECTION_VERSIONS) <= set(parsed)
+        assert parsed["match_metadata"]["total_turns"] == SMALL.turns
+        assert parsed["match_metadata"]["winner_player_id"] is not None
+        for section in [
+            "players",
+            "events",
+            "rulers",
+            "cities",
+            "territories",
+            "points_history",
+            "yield_history",
+            "technology_progress",
+            "family_opinion_history",
+        ]:
+            assert parsed[section], section
+
+    def test_backends_agree(self, tmp_path: Path) -> None:
+        from_lxml = _parse(tmp_path, SMALL, "lxml")
+        from_etree = _parse(tmp_path, SMALL, "etree")
+
+        for parsed in (from_lxml, from_etree):
+            del parsed["match_metadata"]["file_name"]
+        assert from_lxml == from_etree
+
+    def test_same_seed_same_bytes(self) -> None:
+        assert generate_save_xml(SMALL) == generate_save_xml(SMALL)
+        assert generate_save_xml(SMALL) != generate_save_xml(
+            SaveSpec(**{**SMALL.__dict__, "seed": 4})
+        )
+
+    def test_file_name_matches_import_pattern(self) -> None:
+        assert save_file_name(7, ["Ann", "Bob"]) == "match_7_Ann-Bob.zip"
+
+
+class TestSizeKnobs:
+    """Record counts follow the spec."""
+
+    def test_territories_scale_with_map_and_turns(self, tmp_path: Path) -> None:
+        parsed = _parse(tmp_path, SMALL)
+
+        assert len(parsed["territories"]) == 16 * 16 * 12
+
+    def test_players(self, tmp_path: Path) -> None:
+        parsed = _parse(tmp_path, SaveSpec(**{**SMALL.__dict__, "players": 4}))
+
+        assert len(parsed["players"]) == 4
+
+    def test_event_density(self, tmp_path: Path) -> None:
+        sparse = _parse(tmp_path, SaveSpec(**{**SMALL.__dict__, "event_density": 1}))
+        dense = _parse(tmp_path, SaveSpec(**{**SMALL.__dict__, "event_density": 4}))
+
+        assert len(dense["events"]) > 2 * len(sparse["events"])
+
+
+class TestBenchEtl:
+    """scripts/bench_etl.py"""
+
+    def test_run_case_times_every_stage(self, tmp_path: Path) -> None:
+        spec = SaveSpec(turns=6, map_width=12, players=2)
+
+        result = run_case(spec, saves=2, work_dir=tmp_path, trace_memory=False)
+
+        assert set(STAGES) <= set(result["stages"])
+        assert "extract territories" in result["stages"]
+        assert result["records"]["territories"] == 12 * 12 * 6
+        assert all(stage["ms"] >= 0 for stage in result["stages"].values())
@@ -0,0 +1,215 @@
+"""Tests for the shared per-match datasets behind match-data-store.
+
+Test Strategy:
+- Each dataset is queried on first use, once per match and query generation
+- Concurrent callbacks wait for one query instead of each running it
+- The store only holds a small JSON-serializable key
+- A failing query only affects the charts using that dataset
+"""
+
+import json
+import threading
+import time
+from typing import Dict
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from tournament_visualizer.components import match_data as match_data_module
+from tournament_visualizer.components.match_data import (
+    MATCH_DATASETS,
+    MatchData,
+    clear_match_data_cache,
+    get_match_data,
+    make_match_data_key,
+)
+
+EVENTS = pd.DataFrame(
+    {
+        "turn_number": [1, 2],
+        "event_type": ["TECH_DISCOVERED", "CITY_FOUNDED"],
+        "player_name": ["alice", "bob"],
+        "x_coordinate": [None, 12],
+    }
+)
+
+
+@pytest.fixture
+def queries(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Queries stub returning the same frame for every dataset."""
+    queries = MagicMock()
+    queries.get_match_summary.return_value = pd.DataFrame(
+        {
+            "match_id": [7, 8],
+            "game_name": ["Game 7", "Game 8"],
+            "players_with_nations": ["alice (Rome) vs bob (Egypt)", ""],
+            "total_turns": [88, 40],
+        }
+    )
+    for method in (
+        "get_event_timeline",
+        "get_match_timeline_events",
+        "get_tech_timeline",
+        "get_tech_count_by_turn",
+        "get_cumulative_law_count_by_turn",
+        "get_yield_history_by_match",
+        "get_yield_total_history_by_match",
+        "get_science_infrastructure_timeline",
+        "get_science_projects_summary",
+        "get_science_bonuses_summary",
+        "get_territory_control_summary",
+        "get_city_founding_timeline",
+        "get_family_city_counts",
+        "get_match_units_produced",
+    ):
+        getattr(queries, method).return_value = EVENTS
+    queries.has_yield_total_history.return_value = True
+    queries.generation = 0
+    monkeypatch.setattr(match_data_module, "get_queries", lambda: queries)
+    clear_match_data_cache()
+    yield queries
+    clear_match_data_cache()
+
+
+def _colors(match_data: MatchData) -> Dict[str, str]:
+    return {"alice": "#C04E4A"}
+
+
+class TestMatchData:
+    """Loading the datasets of one match."""
+
+    def test_nothing_is_queried_up_front(self, queries: MagicMock) -> None:
+        MatchData(7, _colors)
+
+        queries.get_match_summary.assert_not_called()
+        queries.get_event_timeline.assert_not_called()
+
+    def test_queries_each_dataset_on_first_use(self, queries: MagicMock) -> None:
+        data = MatchData(7, _colors)
+
+        data.frame("events")
+        data.frame("events")
+
+        queries.get_event_timeline.assert_called_once_with(7, None)
+        queries.get_tech_timeline.assert_not_called()
+
+    def test_summary_and_colors(self, queries: MagicMock) -> None:
+        data = MatchData(7, _colors)
+
+        assert data.summary == {
+            "match_id": 7,
+            "game_name": "Game 7",
+            "players_with_nations": "alice (Rome) vs bob (Egypt)",
+            "total_turns": 88,
+        }
+        assert data.total_turns == 88
+        assert data.player_colors == {"alice": "#C04E4A"}
+        queries.get_match_summary.assert_called_once()
+
+    def test_frames_are_copies(self, queries: MagicMock) -> None:
+        data = MatchData(7, _colors)
+
+        for name in MATCH_DATASETS:
+            frame = data.frame(name)
+            assert list(frame.columns) == list(EVENTS.columns)
+            frame["event_type"] = "changed"
+        assert data.frame("events")["event_type"].tolist() == [
+            "TECH_DISCOVERED",
+            "CITY_FOUNDED",
+        ]
+
+    def test_missing_yield_totals_are_empty(self, queries: MagicMock) -> None:
+        queries.has_yield_total_history.return_value = False
+
+        assert MatchData(7, _colors).frame("yield_total_history").empty
+        queries.get_yield_total_history_by_match.assert_not_called()
+
+    def test_turn_comparisons_cached_per_player_pair(self, queries: MagicMock) -> None:
+        queries.get_match_turn_comparisons.return_value = EVENTS
+        data = MatchData(7, _colors)
+
+        data.turn_comparisons(1, 2)
+        data.turn_comparisons(1, 2)
+        data.turn_comparisons(2, 1)
+
+        assert queries.get_match_turn_comparisons.call_count == 2
+
+    def test_failed_dataset_only_affects_its_charts(self, queries: MagicMock) -> None:
+        queries.get_tech_timeline.side_effect = RuntimeError("query failed")
+        data = MatchData(7, _colors)
+
+        with pytest.raises(RuntimeError, match="query failed"):
+            data.frame("tech_timeline")
+        assert not data.frame("events").empty
+
+    def test_failed_dataset_is_retried(self, queries: MagicMock) -> None:
+        queries.get_tech_timeline.side_effect = [RuntimeError("query failed"), EVENTS]
+        data = MatchData(7, _colors)
+
+        with pytest.raises(RuntimeError):
+            data.frame("tech_timeline")
+        assert not data.frame("tech_timeline").empty
+
+    def test_concurrent_callers_share_one_query(self, queries: MagicMock) -> None:
+        def slow_timeline(match_id: int, event_types: None) -> pd.DataFrame:
+            time.sleep(0.05)
+            return EVENTS
+
+        queries.get_event_timeline.side_effect = slow_timeline
+        data = MatchData(7, _colors)
+        threads = [
+            threading.Thread(target=data.frame, args=("events",)) for _ in range(8)
+        ]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        queries.get_event_timeline.assert_called_once_with(7, None)
+
+    def test_unknown_match_has_no_summary(self, queries: MagicMock) -> None:
+        data = MatchData(99, _colors)
+
+        assert data.summary is None
+        assert data.total_turns is None
+
+    def test_failed_colors_fall_back_to_empty(self, queries: MagicMock) -> None:
+        def failing_colors(match_data: MatchData) -> Dict[str, str]:
+            raise RuntimeError("query failed")
+
+        assert MatchData(7, failing_colors).player_colors == {}
+
+
+class TestGetMatchData:
+    """Serving the datasets for a match-data-store key."""
+
+    def test_key_is_small_and_serializable(self, queries: MagicMock) -> None:
+        key = make_match_data_key(7)
+
+        assert json.loads(json.dumps(key)) == {"match_id": 7, "generation": 0}
+
+    def test_shared_per_generation(self, queries: MagicMock) -> None:
+        key = make_match_data_key(7)
+
+        first = get_match_data(key, _colors)
+        first.frame("tech_timeline")
+        assert get_match_data(key, _colors) is first
+        get_match_data(key, _colors).frame("tech_timeline")
+        queries.get_tech_timeline.assert_called_once_with(7)
+
+        queries.generation = 1
+        second = get_match_data(key, _colors)
+        assert second is not first
+        second.frame("tech_timeline")
+        assert queries.get_tech_timeline.call_count == 2
+
+    def test_evicts_least_recently_used(
+        self, queries: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(match_data_module, "MATCH_DATA_CACHE_SIZE", 1)
+        first = get_match_data(make_match_data_key(7), _colors)
+        get_match_data(make_match_data_key(8), _colors)
+
+        assert get_match_data(make_match_data_key(7), _colors) is not first
@@ -0,0 +1,115 @@
+"""Tests for the matches page tab key stores.
+
+Selecting a match should only run the callbacks of the default tab and the
+breadcrumb; every other tab's callbacks run when the tab is first shown.
+
+Test Strategy:
+- The app is booted in a fresh interpreter and the registered callbacks are
+  read from Dash's global callback list
+- Every details tab has a key store, filled by one clientside callback
+- Only the default tab's callbacks run when the details are rendered
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+MATCHES_PAGE = REPO_ROOT / "tournament_visualizer" / "pages" / "matches.py"
+
+DUMP_CALLBACKS = """\
+import json
+import sys
+
+import dash
+from dash._callback import GLOBAL_CALLBACK_LIST
+
+from tournament_visualizer.app import app
+
+matches = sys.modules[dash.page_registry["pages.matches"]["module"]]
+print(json.dumps({
+    "tabs": matches.MATCH_DETAIL_TABS,
+    "default_tab": matches.DEFAULT_MATCH_TAB,
+    "callbacks": [
+        {
+            "output": cb["output"],
+            "inputs": [f"{i['id']}.{i['property']}" for i in cb["inputs"]],
+            "clientside": bool(cb.get("clientside_function")),
+            "prevent_initial_call": bool(cb.get("prevent_initial_call")),
+        }
+        for cb in GLOBAL_CALLBACK_LIST
+    ],
+}))
+"""
+
+
+@pytest.fixture(scope="module")
+def registry(tmp_path_factory: pytest.TempPathFactory) -> dict:
+    """Tab constants and callbacks of a freshly booted app."""
+    tmp_path = tmp_path_factory.mktemp("boot")
+    (tmp_path / "saves").mkdir()
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(REPO_ROOT),
+        "SAVES_DIRECTORY": str(tmp_path / "saves"),
+        "TOURNAMENT_DB_PATH": str(tmp_path / "missing.duckdb"),
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", DUMP_CALLBACKS],
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+        env=env,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _readers(registry: dict, prop: str) -> list[dict]:
+    return [cb for cb in registry["callbacks"] if prop in cb["inputs"]]
+
+
+class TestMatchTabStores:
+    """Callbacks of the match details tabs."""
+
+    def test_every_tab_has_a_store(self, registry: dict) -> None:
+        tab_ids = re.findall(r'"tab_id": "([^"]+)"', MATCHES_PAGE.read_text())
+
+        assert registry["tabs"] == tab_ids
+
+    def test_one_clientside_gate_fills_the_stores(self, registry: dict) -> None:
+        stores = [f"match-{tab}-tab-store.data" for tab in registry["tabs"]]
+        writers = [
+            cb
+            for cb in registry["callbacks"]
+            if any(store in cb["output"] for store in stores)
+        ]
+
+        assert len(writers) == 1
+        assert writers[0]["clientside"]
+        assert writers[0]["inputs"] == ["match-details-tabs.active_tab"]
+
+    def test_no_server_callback_waits_on_the_active_tab(self, registry: dict) -> None:
+        readers = _readers(registry, "match-details-tabs.active_tab")
+
+        assert all(cb["clientside"] for cb in readers)
+
+    def test_only_the_breadcrumb_runs_on_the_match_key(self, registry: dict) -> None:
+        readers = _readers(registry, "match-data-store.data")
+
+        assert [cb["output"] for cb in readers] == ["match-breadcrumb.children"]
+
+    def test_only_default_tab_runs_with_the_details(self, registry: dict) -> None:
+        for tab in registry["tabs"]:
+            readers = _readers(registry, f"match-{tab}-tab-store.data")
+
+            assert readers, f"No callbacks read the {tab} tab store"
+            for cb in readers:
+                expected = tab != registry["default_tab"]
+                assert cb["prevent_initial_call"] is expected, cb["output"]
@@ -0,0 +1,235 @@
+"""Tests for the partitioned Parquet export and serving from it.
+
+Test Strategy:
+- Tables with a match_id are written one file per match under hive-style
+  tournament=/match_id= directories; other tables are written whole
+- A view catalog over the dataset gives the same data fingerprint and query
+  results as the source database, with the source column types and views
+- Re-exporting writes only new or changed partitions and publishes nothing
+  when nothing changed; files dropped from the manifest are deleted one
+  publish later, so readers of the previous generation keep working
+- The server follows new dataset generations like new snapshots
+"""
+
+from pathlib import Path
+
+import duckdb
+import pandas as pd
+import pytest
+
+from scripts.bench_queries import generate_database
+from tournament_visualizer import data_refresh
+from tournament_visualizer.config import Config
+from tournament_visualizer.data.database import TournamentDatabase
+from tournament_visualizer.data.parquet_dataset import (
+    load_manifest,
+    open_dataset_catalog,
+)
+from tournament_visualizer.data.queries import TournamentQueries
+
+
+@pytest.fixture(scope="module")
+def source_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("parquet") / "source.duckdb"
+    generate_database(path, matches=3, seed=1, territory_matches=1)
+    return path
+
+
+@pytest.fixture
+def source(source_path: Path, tmp_path: Path) -> TournamentDatabase:
+    """Writable copy of the synthetic database."""
+    path = tmp_path / "source.duckdb"
+    path.write_bytes(source_path.read_bytes())
+    db = TournamentDatabase(str(path), read_only=False)
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def dataset(tmp_path: Path) -> str:
+    return str(tmp_path / "dataset")
+
+
+def _catalog(dataset: str, tmp_path: Path) -> TournamentDatabase:
+    path = open_dataset_catalog(dataset, "season1", str(tmp_path / "catalogs"))
+    return TournamentDatabase(str(path))
+
+
+class TestExport:
+    """Dataset layout and incremental publishing."""
+
+    def test_layout(self, source: TournamentDatabase, dataset: str) -> None:
+        written = source.export_parquet(dataset, "season1")
+
+        root = Path(dataset)
+        territory_files = list(root.glob("territories/tournament=season1/*/*"))
+        assert [f.parent.name for f in territory_files] == ["match_id=1"]
+        assert len(list(root.glob("players/tournament=season1/match_id=*"))) == 3
+        assert len(list(root.glob("tournament_participants/*/*.parquet"))) == 1
+        assert written["players"] == 3
+        assert load_manifest(dataset, "season1")["generation"] == 1
+
+    def test_partitions_sorted_in_row_groups(
+        self, source: TournamentDatabase, dataset: str
+    ) -> None:
+        source.export_parquet(dataset, "season1")
+
+        path = next(Path(dataset).glob("territories/*/match_id=1/*.parquet"))
+        conn = duckdb.connect()
+        turns = [
+            row[0]
+            for row in conn.execute(
+                f"SELECT turn_number FROM read_parquet('{path}')"
+            ).fetchall()
+        ]
+        row_groups = conn.execute(
+            f"SELECT COUNT(DISTINCT row_group_id) FROM parquet_metadata('{path}')"
+        ).fetchone()[0]
+        assert turns == sorted(turns)
+        assert row_groups > 1
+        assert "match_id" not in [
+            row[0]
+            for row in conn.execute(
+                f"DESCRIBE SELECT * FROM read_parquet('{path}', "
+                "hive_partitioning = false)"
+            ).fetchall()
+        ]
+
+    def test_unchanged_export_publishes_nothing(
+        self, source: TournamentDatabase, dataset: str
+    ) -> None:
+        source.export_parquet(dataset, "season1")
+
+        written = source.export_parquet(dataset, "season1")
+
+        assert sum(written.values()) == 0
+        assert load_manifest(dataset, "season1")["generation"] == 1
+
+    def test_writes_only_changed_partitions(
+        self, source: TournamentDatabase, dataset: str
+    ) -> None:
+        source.export_parquet(dataset, "season1")
+        old_file = load_manifest(dataset, "season1")["tables"]["players"]["files"]["2"]
+        with source.get_connection() as conn:
+            conn.execute("UPDATE players SET final_score = 1 WHERE match_id = 2")
+
+        written = source.export_parquet(dataset, "season1")
+
+        assert written["players"] == 1
+        assert sum(written.values()) == 1
+        manifest = load_manifest(dataset, "season1")
+        assert manifest["generation"] == 2
+        assert manifest["retired"] == [old_file]
+        # Kept for readers of generation 1 until the next publish
+        assert (Path(dataset) / old_file).exists()
+
+        with source.get_connection() as conn:
+            conn.execute("UPDATE players SET final_score = 2 WHERE match_id = 2")
+        source.export_parquet(dataset, "season1")
+        assert not (Path(dataset) / old_file).exists()
+
+    def test_full_rewrites_everything(
+        self, source: TournamentDatabase, dataset: str
+    ) -> None:
+        first = source.export_parquet(dataset, "season1")
+
+        again = source.export_parquet(dataset, "season1", full=True)
+
+        assert again == first
+        assert load_manifest(dataset, "season1")["generation"] == 2
+
+    def test_defaults_to_recorded_tournament(
+        self, source: TournamentDatabase, dataset: str
+    ) -> None:
+        source.set_tournament("season7")
+
+        source.export_parquet(dataset)
+
+        assert load_manifest(dataset, "season7") is not None
+
+
+class TestCatalog:
+    """Querying the dataset through a view catalog."""
+
+    def test_same_data_as_source(
+        self, source: TournamentDatabase, dataset: str, tmp_path: Path
+    ) -> None:
+        source.export_parquet(dataset, "season1")
+        served = _catalog(dataset, tmp_path)
+
+        assert served.get_data_fingerprint() == source.get_data_fingerprint()
+        pd.testing.assert_frame_equal(
+            TournamentQueries(database=served).get_match_summary(),
+            TournamentQueries(database=source).get_match_summary(),
+        )
+        with served.get_connection() as conn:
+            column_type = conn.execute(
+                "SELECT data_type FROM duckdb_columns() "
+                "WHERE table_name = 'territories' AND column_name = 'terrain_type'"
+            ).fetchone()[0]
+            assert column_type.startswith("ENUM")
+            # Views of the source database are replayed over the dataset
+            assert conn.execute("SELECT COUNT(*) FROM match_summary").fetchone() == (3,)
+        served.close()
+
+    def test_empty_partitioned_table(
+        self, source: TournamentDatabase, dataset: str, tmp_path: Path
+    ) -> None:
+        source.export_parquet(dataset, "season1")
+        served = _catalog(dataset, tmp_path)
+
+        with served.get_connection() as conn:
+            assert conn.execute(
+                "SELECT COUNT(*) FROM participant_name_overrides"
+            ).fetchone() == (0,)
+        served.close()
+
+    def test_catalog_per_generation(
+        self, source: TournamentDatabase, dataset: str, tmp_path: Path
+    ) -> None:
+        catalogs = str(tmp_path / "catalogs")
+        assert open_dataset_catalog(dataset, "season1", catalogs) is None
+        source.export_parquet(dataset, "season1")
+        first = open_dataset_catalog(dataset, "season1", catalogs)
+
+        assert open_dataset_catalog(dataset, "season1", catalogs) == first
+        source.export_parquet(dataset, "season1", full=True)
+        assert open_dataset_catalog(dataset, "season1", catalogs) != first
+
+
+class TestServing:
+    """refresh_database() with PARQUET_DATASET set."""
+
+    def test_follows_new_generations(
+        self,
+        source_path: Path,
+        source: TournamentDatabase,
+        dataset: str,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        served = TournamentDatabase(str(source_path), read_pool_size=2)
+        queries = TournamentQueries(database=served)
+        monkeypatch.setattr(Config, "TOURNAMENT", "season1")
+        monkeypatch.setattr(Config, "PARQUET_DATASET", dataset)
+        monkeypatch.setattr(
+            Config, "PARQUET_CATALOG_DIRECTORY", str(tmp_path / "catalogs")
+        )
+        monkeypatch.setattr(data_refresh, "get_database", lambda: served)
+        monkeypatch.setattr(data_refresh, "get_queries", lambda: queries)
+        monkeypatch.setattr(data_refresh, "pin_overview_artifact", lambda: 0)
+
+        assert not data_refresh.refresh_database(force=True)
+        source.export_parquet(dataset, "season1")
+        assert data_refresh.refresh_database(force=True)
+        assert not data_refresh.refresh_database(force=True)
+        assert queries.get_match_summary().shape[0] == 3
+
+        with source.get_connection() as conn:
+            conn.execute("DELETE FROM match_winners WHERE match_id = 3")
+        source.export_parquet(dataset, "season1")
+        assert data_refresh.refresh_database(force=True)
+        assert queries.generation == 2
+        with served.get_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM match_winners").fetchone() == (2,)
+        served.close()
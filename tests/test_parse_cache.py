@@ -0,0 +1,158 @@
+"""Tests for the parsed-record cache.
+
+Test Strategy:
+- Cached sections round-trip to exactly what parse_tournament_file returns
+- A warm cache does not parse the save file again
+- Bumping one section's version re-parses only that section
+- The ETL pipeline loads the same data with and without the cache
+"""
+
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from tournament_visualizer.data import parse_cache as parse_cache_module
+from tournament_visualizer.data.database import TournamentDatabase
+from tournament_visualizer.data.etl import TournamentETL
+from tournament_visualizer.data.parse_cache import ParsedRecordCache
+from tournament_visualizer.data.parser import (
+    PARSED_SECTION_VERSIONS,
+    parse_tournament_file,
+)
+
+FIXTURE = Path(__file__).parent / "fixtures" / "sample_save.xml"
+
+
+@pytest.fixture
+def save_file(tmp_path: Path) -> Path:
+    """Zip the sample save fixture the way the game does."""
+    zip_path = tmp_path / "match_1_alice-bob.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.write(FIXTURE, "match_1_alice-bob.xml")
+    return zip_path
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ParsedRecordCache:
+    return ParsedRecordCache(str(tmp_path / "parsed_cache"))
+
+
+class TestRoundTrip:
+    """Cached records match freshly parsed records."""
+
+    def test_sections_round_trip(
+        self, cache: ParsedRecordCache, save_file: Path
+    ) -> None:
+        cache.get_parsed_data(str(save_file), "abc")
+        cached = cache.get_parsed_data(str(save_file), "abc")
+
+        assert cached == parse_tournament_file(
+            str(save_file), sections=PARSED_SECTION_VERSIONS
+        )
+
+    def test_mixed_and_nested_values(self, cache: ParsedRecordCache) -> None:
+        records = [
+            {"turn_number": 1, "event_data": {"tech": "TECH_IRONWORKING"}},
+            {"turn_number": 2, "event_data": "plain text"},
+            {"turn_number": 3, "event_data": None, "amount": 1.5},
+            {"turn_number": 4, "event_data": [1, 2], "amount": 2},
+        ]
+        metadata = {"save_date": datetime(2025, 1, 2), "team_id": None}
+        cache.store("abc", {"events": records, "match_metadata": metadata})
+
+        loaded, missing = cache.load("abc", ["events", "match_metadata"])
+
+        assert missing == []
+        assert loaded["events"][0]["event_data"] == {"tech": "TECH_IRONWORKING"}
+        assert loaded["events"][1]["event_data"] == "plain text"
+        assert loaded["events"][3]["event_data"] == [1, 2]
+        assert [r["amount"] for r in loaded["events"]] == [None, None, 1.5, 2.0]
+        assert loaded["match_metadata"] == metadata
+
+    def test_empty_sections_cached(self, cache: ParsedRecordCache) -> None:
+        cache.store("abc", {"rulers": []})
+
+        loaded, missing = cache.load("abc", ["rulers", "cities"])
+
+        assert loaded == {"rulers": []}
+        assert missing == ["cities"]
+
+
+class TestInvalidation:
+    """Cache hits and parser version bumps."""
+
+    def test_warm_cache_skips_parsing(
+        self, cache: ParsedRecordCache, save_file: Path
+    ) -> None:
+        cache.get_parsed_data(str(save_file), "abc")
+
+        with patch.object(parse_cache_module, "parse_tournament_file") as parse:
+            cache.get_parsed_data(str(save_file), "abc")
+
+        parse.assert_not_called()
+
+    def test_version_bump_reparses_only_that_section(
+        self, cache: ParsedRecordCache, save_file: Path
+    ) -> None:
+        cache.get_parsed_data(str(save_file), "abc")
+        bumped = dict(PARSED_SECTION_VERSIONS, events=2)
+
+        with (
+            patch.dict(PARSED_SECTION_VERSIONS, bumped),
+            patch.object(
+                parse_cache_module,
+                "parse_tournament_file",
+                wraps=parse_tournament_file,
+            ) as parse,
+        ):
+            cache.get_parsed_data(str(save_file), "abc")
+
+        parse.assert_called_once_with(str(save_file), sections=["events"])
+        files = {p.name for p in (cache.cache_dir / "abc").iterdir()}
+        assert "events.v2.parquet" in files
+        assert "events.v1.parquet" not in files
+
+    def test_file_name_follows_current_path(
+        self, cache: ParsedRecordCache, save_file: Path, tmp_path: Path
+    ) -> None:
+        cache.get_parsed_data(str(save_file), "abc")
+        renamed = save_file.rename(tmp_path / "match_1_renamed.zip")
+
+        parsed = cache.get_parsed_data(str(renamed), "abc")
+
+        assert parsed["match_metadata"]["file_name"] == "match_1_renamed.zip"
+
+
+class TestETLWithCache:
+    """TournamentETL reuses cached records."""
+
+    def _load(self, db_path: Path, save_file: Path, cache=None) -> list:
+        db = TournamentDatabase(db_path=str(db_path), read_only=False)
+        db.create_schema()
+        try:
+            etl = TournamentETL(database=db, parse_cache=cache)
+            assert etl.process_tournament_file(str(save_file))
+            return [
+                db.fetch_all(f"SELECT * EXCLUDE ({id_column}) FROM {table} ORDER BY ALL")
+                for table, id_column in [
+                    ("events", "event_id"),
+                    ("player_yield_history", "resource_id"),
+                    ("family_opinion_history", "family_opinion_id"),
+                    ("territories", "territory_id"),
+                ]
+            ]
+        finally:
+            db.close()
+
+    def test_same_rows_with_and_without_cache(
+        self, cache: ParsedRecordCache, save_file: Path, tmp_path: Path
+    ) -> None:
+        uncached = self._load(tmp_path / "a.duckdb", save_file)
+        cold = self._load(tmp_path / "b.duckdb", save_file, cache)
+        warm = self._load(tmp_path / "c.duckdb", save_file, cache)
+
+        assert cold == uncached
+        assert warm == uncached
@@ -0,0 +1,298 @@
+"""Tests for precomputed default-state dashboard results.
+
+Test Strategy:
+- Callbacks are run with the initial values of the page layout, trying each
+  tab for tab-gated callbacks
+- Results round-trip through the precomputed_figures table
+- Results are ignored once the data fingerprint changes
+- Pinned results are served to live calls with the same inputs
+- Building the overview artifact in a booted app registers nothing twice
+"""
+
+import functools
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import dash
+import dash_bootstrap_components as dbc
+import pytest
+from dash import dcc, html
+from plotly import graph_objects as go
+
+from tournament_visualizer.components import figure_cache as figure_cache_module
+from tournament_visualizer.components.figure_cache import (
+    FigureCache,
+    cached_figures,
+    layout_defaults,
+    pin_precomputed_figures,
+    precompute_default_figures,
+)
+from tournament_visualizer.data.database import TournamentDatabase
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Runs in a fresh interpreter, since importing the app registers its pages and
+# callbacks for the rest of the process
+BUILD_OVERVIEW_ARTIFACT = """\
+import json
+
+import dash
+
+from tournament_visualizer import precompute
+from tournament_visualizer.app import app
+from tournament_visualizer.components.figure_cache import (
+    figure_cache,
+    make_figure_cache_key,
+)
+from tournament_visualizer.data.database import get_database
+from tournament_visualizer.data.queries import get_queries
+
+before = (
+    len(dash.page_registry),
+    len(dash._callback.GLOBAL_CALLBACK_MAP),
+    len(dash._callback.GLOBAL_CALLBACK_LIST),
+)
+built = precompute.build_overview_artifact()
+after = (
+    len(dash.page_registry),
+    len(dash._callback.GLOBAL_CALLBACK_MAP),
+    len(dash._callback.GLOBAL_CALLBACK_LIST),
+)
+
+figure_cache.clear()
+stored = get_database().get_precomputed_figures()
+pinned = precompute.pin_overview_artifact()
+generation = get_queries().generation
+served = [
+    figure_cache.get(make_figure_cache_key(e["name"], generation, e["inputs"]))
+    == (e["tuple"], e["outputs"])
+    for e in stored
+]
+print(json.dumps({
+    "before": before,
+    "after": after,
+    "built": built,
+    "stored": len(stored),
+    "pinned": pinned,
+    "served": served,
+}))
+"""
+
+
+@pytest.fixture
+def state(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Fresh figure cache, fixed generation and an empty callback registry."""
+    state = SimpleNamespace(cache=FigureCache(max_entries=8, ttl=60.0), calls=0)
+    monkeypatch.setattr(figure_cache_module, "figure_cache", state.cache)
+    monkeypatch.setattr(
+        figure_cache_module, "get_queries", lambda: SimpleNamespace(generation=3)
+    )
+    state.registry = {}
+    monkeypatch.setattr(dash._callback, "GLOBAL_CALLBACK_MAP", state.registry)
+    return state
+
+
+def _register(registry: dict, func, inputs: list) -> None:
+    """Mimic Dash's registration, which wraps the callback once more."""
+
+    @functools.wraps(func)
+    def dash_wrapper(*args, **kwargs):
+        raise AssertionError("precompute must call the cached wrapper directly")
+
+    registry[func.__name__] = {
+        "callback": dash_wrapper,
+        "inputs": [{"id": i, "property": p} for i, p in inputs],
+        "state": [],
+    }
+
+
+PAGE_LAYOUT = html.Div(
+    [
+        dcc.Dropdown(id="page-nations-dropdown", value=None),
+        dcc.Slider(id="page-turn-slider", min=0, max=200, value=200),
+        dbc.Tabs(
+            [dbc.Tab(tab_id="summary-tab"), dbc.Tab(tab_id="nations-tab")],
+            id="page-tabs",
+            active_tab="summary-tab",
+        ),
+    ]
+)
+
+
+class TestPrecomputeDefaultFigures:
+    """Running page callbacks with layout defaults."""
+
+    def test_layout_defaults(self) -> None:
+        defaults = layout_defaults(PAGE_LAYOUT)
+
+        assert defaults[("page-turn-slider", "value")] == 200
+        assert defaults[("page-tabs", "active_tab")] == "summary-tab"
+
+    def test_precompute_and_serve(self, state: SimpleNamespace) -> None:
+        @cached_figures("page.turn_chart")
+        def turn_chart(nations, turn_length):
+            state.calls += 1
+            return go.Figure(go.Bar(y=[turn_length]))
+
+        _register(
+            state.registry,
+            turn_chart,
+            [("page-nations-dropdown", "value"), ("page-turn-slider", "value")],
+        )
+
+        entries = precompute_default_figures(PAGE_LAYOUT, "page.")
+        state.cache.clear()
+
+        assert [entry["name"] for entry in entries] == ["page.turn_chart"]
+        assert pin_precomputed_figures(entries) == 1
+
+        # A live call with the default inputs is served from the pin
+        served = turn_chart(None, 200)
+        assert state.calls == 1
+        assert served["data"][0]["y"] == [200]
+
+    def test_tab_gated_callback_tries_each_tab(self, state: SimpleNamespace) -> None:
+        @cached_figures("page.nations_tab")
+        def nations_tab(active_tab, turn_length):
+            if active_tab != "nations-tab":
+                raise dash.exceptions.PreventUpdate
+            return go.Figure(), go.Figure()
+
+        _register(
+            state.registry,
+            nations_tab,
+            [("page-tabs", "active_tab"), ("page-turn-slider", "value")],
+        )
+
+        entries = precompute_default_figures(PAGE_LAYOUT, "page.")
+
+        assert len(entries) == 1
+        assert entries[0]["inputs"] == {
+            "active_tab": "nations-tab",
+            "turn_length": 200,
+        }
+        assert entries[0]["tuple"] is True
+
+    def test_other_pages_and_failures_skipped(self, state: SimpleNamespace) -> None:
+        @cached_figures("other.chart")
+        def other_chart(turn_length):
+            return go.Figure()
+
+        @cached_figures("page.broken")
+        def broken(turn_length):
+            raise RuntimeError("query failed")
+
+        for func in (other_chart, broken):
+            _register(state.registry, func, [("page-turn-slider", "value")])
+
+        assert precompute_default_figures(PAGE_LAYOUT, "page.") == []
+
+    def test_clientside_callbacks_skipped(self, state: SimpleNamespace) -> None:
+        # Clientside callbacks are registered without a server function
+        state.registry["clientside"] = {
+            "inputs": [{"id": "page-turn-slider", "property": "value"}],
+            "state": [],
+        }
+
+        assert precompute_default_figures(PAGE_LAYOUT, "page.") == []
+
+
+class TestPrecomputedFiguresStorage:
+    """precomputed_figures table and data fingerprint."""
+
+    @pytest.fixture
+    def db(self, tmp_path: Path) -> TournamentDatabase:
+        db = TournamentDatabase(db_path=str(tmp_path / "pre.duckdb"), read_only=False)
+        db.create_schema()
+        db.execute_query(
+            "INSERT INTO matches (match_id, file_name, file_hash) "
+            "VALUES (1, 'a.zip', 'hash-a')"
+        )
+        yield db
+        db.close()
+
+    def _entries(self) -> list:
+        return [
+            {
+                "name": "overview.update_units_chart",
+                "inputs": {"round_num": None, "turn_length": 200},
+                "tuple": False,
+                "outputs": ['{"data": [], "layout": {}}'],
+            }
+        ]
+
+    def test_round_trip(self, db: TournamentDatabase) -> None:
+        db.replace_precomputed_figures(self._entries(), db.get_data_fingerprint())
+
+        assert db.get_precomputed_figures() == self._entries()
+
+    def test_replace_overwrites(self, db: TournamentDatabase) -> None:
+        fingerprint = db.get_data_fingerprint()
+        db.replace_precomputed_figures(self._entries() * 2, fingerprint)
+        db.replace_precomputed_figures(self._entries(), fingerprint)
+
+        assert len(db.get_precomputed_figures()) == 1
+
+    def test_fingerprint_ignores_precomputed_table(
+        self, db: TournamentDatabase
+    ) -> None:
+        before = db.get_data_fingerprint()
+        db.replace_precomputed_figures(self._entries(), before)
+
+        assert db.get_data_fingerprint() == before
+
+    def test_stale_results_ignored(self, db: TournamentDatabase) -> None:
+        db.replace_precomputed_figures(self._entries(), db.get_data_fingerprint())
+        db.execute_query("UPDATE matches SET file_name = 'renamed.zip'")
+
+        assert db.get_precomputed_figures() == []
+
+    def test_missing_table(self, tmp_path: Path) -> None:
+        db = TournamentDatabase(db_path=str(tmp_path / "empty.duckdb"), read_only=False)
+        try:
+            assert db.get_precomputed_figures() == []
+        finally:
+            db.close()
+
+
+class TestBuildOverviewArtifact:
+    """Building and pinning the overview artifact in a booted app."""
+
+    def test_build_and_pin(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "tournament.duckdb"
+        db = TournamentDatabase(db_path=str(db_path), read_only=False)
+        db.create_schema()
+        db.execute_query(
+            "INSERT INTO matches (match_id, file_name, file_hash, total_turns) "
+            "VALUES (1, 'a.zip', 'hash-a', 120)"
+        )
+        db.close()
+        (tmp_path / "saves").mkdir()
+        env = {
+            **os.environ,
+            "PYTHONPATH": str(REPO_ROOT),
+            "SAVES_DIRECTORY": str(tmp_path / "saves"),
+            "TOURNAMENT_DB_PATH": str(db_path),
+            "SNAPSHOT_DIRECTORY": "",
+        }
+
+        result = subprocess.run(
+            [sys.executable, "-c", BUILD_OVERVIEW_ARTIFACT],
+            capture_output=True,
+            text=True,
+            cwd=tmp_path,
+            env=env,
+            check=False,
+        )
+
+        assert result.returncode == 0, result.stderr[-2000:]
+        report = json.loads(result.stdout.strip().splitlines()[-1])
+        assert report["after"] == report["before"]
+        assert report["built"] > 0
+        assert report["stored"] == report["built"]
+        assert report["pinned"] == report["built"]
+        assert all(report["served"])
@@ -0,0 +1,141 @@
+"""Tests for the gunicorn preload hooks.
+
+Test Strategy:
+- The arbiter closes its database connection before forking
+- A forked worker drops the inherited connection and opens its own
+- Lookups warmed in the arbiter are cached per process
+"""
+
+import gc
+import multiprocessing
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from tournament_visualizer import preload
+from tournament_visualizer.components.tech_tree import get_tech_tree_layout
+from tournament_visualizer.data.database import TournamentDatabase
+from tournament_visualizer.data.queries import (
+    TournamentQueries,
+    load_player_name_aliases,
+)
+
+
+@pytest.fixture
+def db(tmp_path: Path) -> TournamentDatabase:
+    path = str(tmp_path / "preload.duckdb")
+    writer = TournamentDatabase(db_path=path, read_only=False)
+    writer.create_schema()
+    writer.close()
+    database = TournamentDatabase(db_path=path, read_only=True)
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def unfreeze():
+    yield
+    gc.unfreeze()
+
+
+def _count_matches(db: TournamentDatabase, queue) -> None:
+    preload.reset_after_fork()
+    with db.get_connection() as conn:
+        queue.put(conn.execute("SELECT COUNT(*) FROM matches").fetchone()[0])
+    db.close()
+
+
+class TestResetAfterFork:
+    """Connection state inherited by forked workers."""
+
+    def test_drops_connection_and_reconnects(self, db: TournamentDatabase) -> None:
+        inherited = db.connect()
+
+        db.reset_after_fork()
+
+        assert db.connection is None
+        with db.get_connection() as conn:
+            assert conn is not inherited
+            assert conn.execute("SELECT COUNT(*) FROM matches").fetchone() == (0,)
+        inherited.close()
+
+    def test_forked_worker_opens_own_connection(
+        self, db: TournamentDatabase, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(preload, "get_database", lambda: db)
+        db.connect()
+        preload.release_before_fork()
+        assert db.connection is None
+
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+        worker = context.Process(target=_count_matches, args=(db, queue))
+        worker.start()
+        worker.join(timeout=60)
+
+        assert worker.exitcode == 0
+        assert queue.get(timeout=5) == 0
+
+
+class TestWarmSharedState:
+    """Warming lookups in the arbiter."""
+
+    def test_warms_lookups_and_closes_database(
+        self,
+        db: TournamentDatabase,
+        monkeypatch: pytest.MonkeyPatch,
+        unfreeze: None,
+    ) -> None:
+        monkeypatch.setattr(preload, "get_database", lambda: db)
+        db.connect()
+
+        stats = preload.warm_shared_state()
+
+        assert db.connection is None
+        assert stats["tech_tree_nodes"] == len(get_tech_tree_layout()[0])
+        assert stats["player_name_aliases"] == len(load_player_name_aliases())
+        assert stats["overview_results"] == 0
+        assert gc.get_freeze_count() > 0
+
+    def test_pins_stored_overview_results(
+        self,
+        db: TournamentDatabase,
+        monkeypatch: pytest.MonkeyPatch,
+        unfreeze: None,
+    ) -> None:
+        monkeypatch.setattr(preload, "get_database", lambda: db)
+        monkeypatch.setattr(preload, "pin_overview_artifact", lambda: 24)
+
+        stats = preload.warm_shared_state(warm_overview=True)
+
+        assert stats["overview_results"] == 24
+
+    def test_overview_failure_does_not_block_boot(
+        self,
+        db: TournamentDatabase,
+        monkeypatch: pytest.MonkeyPatch,
+        unfreeze: None,
+    ) -> None:
+        def broken() -> int:
+            raise RuntimeError("database missing")
+
+        monkeypatch.setattr(preload, "get_database", lambda: db)
+        monkeypatch.setattr(preload, "pin_overview_artifact", broken)
+
+        stats = preload.warm_shared_state(warm_overview=True)
+
+        assert stats["overview_results"] == 0
+
+
+class TestPlayerNameAliases:
+    """Alias file is read once per process."""
+
+    def test_cached(self) -> None:
+        assert load_player_name_aliases() is load_player_name_aliases()
+        assert load_player_name_aliases.cache_info().currsize == 1
+
+    def test_queries_use_cached_aliases(self) -> None:
+        queries = TournamentQueries(database=SimpleNamespace())
+
+        assert queries._load_player_name_aliases() is load_player_name_aliases()
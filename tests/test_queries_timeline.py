@@ -316,6 +316,20 @@ class TestMatchTimelineEvents:
         wonder_completes = df[(df["event_type"] == "wonder_complete") & (df["turn"] == 30)]
         assert len(wonder_completes) == 1
 
+    def test_cached_result_not_shared_with_caller(
+        self, timeline_test_db: TournamentDatabase
+    ) -> None:
+        """Modifying a returned DataFrame does not change later cache hits."""
+        queries = TournamentQueries(timeline_test_db)
+        first = queries.get_match_timeline_events(match_id=1)
+        expected = first.copy()
+
+        first["title"] = "changed"
+
+        pd.testing.assert_frame_equal(
+            queries.get_match_timeline_events(match_id=1), expected
+        )
+
 
 class TestTimelineEdgeCases:
     """Test edge cases for timeline query."""
@@ -0,0 +1,213 @@
+"""Tests for single-flight de-duplication in the query cache.
+
+Test Strategy:
+- Concurrent misses on one key run the computation once; the other callers
+  wait and get copies of its result
+- Different keys are computed in parallel
+- A computation that raises or returns without caching releases its waiters
+- Results computed before invalidate_caches() are not stored
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, List
+
+import pandas as pd
+import pytest
+
+from tournament_visualizer.data.queries import TournamentQueries, single_flight
+
+WAIT = 5.0
+
+
+class GatedQueries(TournamentQueries):
+    """Queries with one cached method whose computation can be held open."""
+
+    def __init__(self) -> None:
+        super().__init__(database=object())
+        self._cache_ttl = 60.0
+        self.calls = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.outcome = "store"
+
+    @single_flight
+    def compute(self, key: str) -> Any:
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        self.calls += 1
+        self.started.set()
+        assert self.release.wait(WAIT)
+        if self.outcome == "raise":
+            raise RuntimeError("query failed")
+        if self.outcome == "skip":
+            return pd.DataFrame()
+
+        result = pd.DataFrame({"key": [key], "call": [self.calls]})
+        self._cache_set(key, result)
+        return result.copy()
+
+
+def _run(queries: GatedQueries, keys: List[str]) -> tuple:
+    """Start compute(key) in a thread per key; returns (threads, results, errors)."""
+    results: List[Any] = []
+    errors: List[Exception] = []
+
+    def worker(key: str) -> None:
+        try:
+            results.append(queries.compute(key))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(key,)) for key in keys]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def _join(threads: List[threading.Thread]) -> None:
+    for thread in threads:
+        thread.join(WAIT)
+        assert not thread.is_alive()
+
+
+def _wait_for_waiters(queries: GatedQueries, key: str) -> None:
+    """Give the follower threads time to find the flight and start waiting."""
+    assert queries.started.wait(WAIT)
+    assert key in queries._flights
+    time.sleep(0.1)
+
+
+class TestSingleFlight:
+    """Concurrent misses on the same and on different keys."""
+
+    def test_concurrent_misses_compute_once(self) -> None:
+        queries = GatedQueries()
+
+        threads, results, errors = _run(queries, ["summary"] * 5)
+        _wait_for_waiters(queries, "summary")
+        queries.release.set()
+        _join(threads)
+
+        assert errors == []
+        assert queries.calls == 1
+        assert len(results) == 5
+        assert all(result["call"].tolist() == [1] for result in results)
+        # Each caller gets its own copy
+        assert len({id(result) for result in results}) == 5
+        assert queries._flights == {}
+
+    def test_different_keys_run_in_parallel(self) -> None:
+        queries = GatedQueries()
+        both_started = threading.Barrier(2, timeout=WAIT)
+        compute = GatedQueries.compute.__wrapped__
+
+        def gated(self: GatedQueries, key: str) -> Any:
+            both_started.wait()
+            return compute(self, key)
+
+        queries.compute = single_flight(gated).__get__(queries)
+        queries.release.set()
+
+        threads, results, errors = _run(queries, ["nations", "players"])
+        _join(threads)
+
+        assert errors == []
+        assert queries.calls == 2
+
+    def test_cached_result_served_without_flight(self) -> None:
+        queries = GatedQueries()
+        queries.release.set()
+        queries.compute("summary")
+
+        queries.compute("summary")
+
+        assert queries.calls == 1
+        assert queries._flights == {}
+
+
+class TestFailedFlights:
+    """Computations that do not store a result."""
+
+    @pytest.mark.parametrize("outcome", ["raise", "skip"])
+    def test_waiters_released(self, outcome: str) -> None:
+        queries = GatedQueries()
+        queries.outcome = outcome
+
+        threads, results, errors = _run(queries, ["summary"] * 3)
+        _wait_for_waiters(queries, "summary")
+        queries.release.set()
+        _join(threads)
+
+        # Nothing was cached, so every caller ends up computing
+        assert queries.calls == 3
+        assert len(errors) == (3 if outcome == "raise" else 0)
+        assert queries._flights == {}
+
+    def test_waiter_gives_up_after_timeout(self) -> None:
+        queries = GatedQueries()
+        queries._flight_timeout = 0.05
+        queries._flights["summary"] = threading.Event()  # Never finishes
+
+        assert queries._cache_get("summary") is None
+
+
+class TestInvalidation:
+    """invalidate_caches() while a computation is running."""
+
+    def test_stale_result_not_stored(self) -> None:
+        queries = GatedQueries()
+
+        threads, results, errors = _run(queries, ["summary"])
+        assert queries.started.wait(WAIT)
+        queries.invalidate_caches()
+        queries.release.set()
+        _join(threads)
+
+        assert errors == []
+        assert len(results) == 1
+        assert queries._cache == {}
+        assert queries._flights == {}
+
+
+class TestQueryMethods:
+    """Decorated query methods share concurrent misses."""
+
+    def test_available_nations_queries_once(self) -> None:
+        executed = []
+        release = threading.Event()
+
+        class Connection:
+            def execute(self, query: str) -> "Connection":
+                executed.append(query)
+                assert release.wait(WAIT)
+                return self
+
+            def df(self) -> pd.DataFrame:
+                return pd.DataFrame({"civilization": ["Egypt", "Rome"]})
+
+        class Database:
+            @contextmanager
+            def get_connection(self):
+                yield Connection()
+
+        queries = TournamentQueries(database=Database())
+        queries._cache_ttl = 60.0
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(queries.get_available_nations())
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.2)
+        release.set()
+        _join(threads)
+
+        assert len(executed) == 1
+        assert results == [["Egypt", "Rome"]] * 4
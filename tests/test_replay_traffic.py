@@ -0,0 +1,396 @@
+"""Tests for the access log replay load test (scripts/replay_traffic.py).
+
+Test Strategy:
+- Replayable log lines (page loads, map API, map viewer) group into sessions
+  per client, split after 30 idle minutes; everything else is dropped
+- Time compression divides session start offsets by --speedup
+- Page loads send the callbacks a browser would: inputs from the rendered
+  layout, Location components filled with the URL, no clientside,
+  prevent_initial_call or pattern-matching callbacks
+- Callbacks wait for pending callbacks that produce their inputs, and
+  changed outputs trigger the callbacks that read them
+- A replay against a fake Dash server records every request by group and
+  counts 5xx responses as errors
+- Memory sampling follows the whole server process tree
+"""
+
+import threading
+from datetime import datetime
+from typing import Iterator
+
+import pytest
+from flask import Flask, jsonify, request
+from werkzeug.serving import make_server
+
+import manage
+from scripts.replay_traffic import (
+    Replayer,
+    Result,
+    build_sessions,
+    collect_props,
+    fire_page_callbacks,
+    initial_callbacks,
+    process_tree,
+    schedule,
+    summarize,
+)
+
+
+def _line(path: str, time: str = "19:24:26", ip: str = "1.1.1.1", **kw) -> str:
+    method = kw.get("method", "GET")
+    status = kw.get("status", 200)
+    return (
+        f"{ip}, 66.241.125.158 - - [19/Feb/2026:{time} +0000] "
+        f'"{method} {path} HTTP/1.1" {status} 1234 "-" "Mozilla/5.0" 250000\n'
+    )
+
+
+def _component(type_: str, **props) -> dict:
+    return {"type": type_, "namespace": "dash_core_components", "props": props}
+
+
+SHELL_LAYOUT = _component(
+    "Div",
+    children=[
+        _component("Location", id="_pages_location"),
+        _component("Div", id="_pages_content"),
+        _component("Store", id="_pages_store"),
+    ],
+)
+
+PAGE_LAYOUT = _component(
+    "Div",
+    children=[
+        _component("Location", id="match-url", refresh=False),
+        _component("Dropdown", id="match-selector", value=3),
+        _component("Graph", id="match-chart"),
+        _component(
+            "Tabs", id="match-tabs", children=[_component("Tab", id="tab-a", value="a")]
+        ),
+    ],
+)
+
+DEPENDENCIES = [
+    {
+        "output": ".._pages_content.children..._pages_store.data..",
+        "inputs": [
+            {"id": "_pages_location", "property": "pathname"},
+            {"id": "_pages_location", "property": "search"},
+        ],
+        "state": [],
+        "prevent_initial_call": True,
+    },
+    {
+        "output": "match-selector.value",
+        "inputs": [{"id": "match-url", "property": "search"}],
+        "state": [],
+    },
+    {
+        "output": "..match-chart.figure...tab-a.label@1a2b..",
+        "inputs": [{"id": "match-selector", "property": "value"}],
+        "state": [{"id": "match-tabs", "property": "active_tab"}],
+    },
+    {
+        "output": "match-chart.style",
+        "inputs": [{"id": "match-selector", "property": "value"}],
+        "state": [],
+        "clientside_function": {"namespace": "ns", "function_name": "f"},
+    },
+    {
+        "output": "match-chart.config",
+        "inputs": [{"id": '{"index":["ALL"],"type":"x"}', "property": "value"}],
+        "state": [],
+    },
+    {
+        "output": "other-page-chart.figure",
+        "inputs": [{"id": "other-page-selector", "property": "value"}],
+        "state": [],
+    },
+]
+
+
+class TestBuildSessions:
+    """build_sessions() and schedule()"""
+
+    def test_groups_by_client_and_gap(self) -> None:
+        lines = [
+            _line("/", "10:00:00"),
+            _line("/matches?match_id=3", "10:00:30"),
+            _line("/api/map/territories/3/10", "10:00:31"),
+            _line("/players", "10:00:05", ip="2.2.2.2"),
+            _line("/maps", "11:00:00"),  # After 30 idle minutes
+        ]
+
+        sessions = build_sessions(lines)
+
+        assert [(s.client, len(s.steps)) for s in sessions] == [
+            ("1.1.1.1", 3),
+            ("2.2.2.2", 1),
+            ("1.1.1.1", 1),
+        ]
+        assert [(s.offset, s.kind) for s in sessions[0].steps] == [
+            (0.0, "page"),
+            (30.0, "page"),
+            (31.0, "api"),
+        ]
+        assert sessions[2].start == datetime(2026, 2, 19, 11, 0, 0)
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            _line("/_dash-update-component", method="POST"),
+            _line("/assets/style.css"),
+            _line("/matches", status=404),
+            _line("/health"),
+        ],
+    )
+    def test_not_replayed(self, line: str) -> None:
+        assert build_sessions([line]) == []
+
+    def test_map_viewer_replayed(self) -> None:
+        (session,) = build_sessions([_line("/map/viewer/3")])
+
+        assert session.steps[0].kind == "viewer"
+
+    def test_schedule_compresses_time(self) -> None:
+        sessions = build_sessions(
+            [_line("/", "10:00:00"), _line("/", "10:10:00", ip="2.2.2.2")]
+        )
+
+        assert schedule(sessions, speedup=60) == [0.0, 10.0]
+        assert schedule(sessions, speedup=0) == [0.0, 0.0]
+
+
+class TestInitialCallbacks:
+    """Callbacks a browser sends when a page loads."""
+
+    @pytest.fixture
+    def bodies(self) -> list:
+        url = "http://localhost:8050/matches?match_id=3"
+        props = collect_props(SHELL_LAYOUT, url)
+        collect_props(PAGE_LAYOUT, url, props)
+        return initial_callbacks(DEPENDENCIES, props)
+
+    def test_only_page_load_callbacks(self, bodies: list) -> None:
+        assert [body["output"] for body in bodies] == [
+            "match-selector.value",
+            "..match-chart.figure...tab-a.label@1a2b..",
+        ]
+
+    def test_location_filled_with_url(self, bodies: list) -> None:
+        assert bodies[0]["inputs"] == [
+            {"id": "match-url", "property": "search", "value": "?match_id=3"}
+        ]
+        assert bodies[0]["outputs"] == {"id": "match-selector", "property": "value"}
+
+    def test_multi_output_and_missing_values(self, bodies: list) -> None:
+        body = bodies[1]
+
+        assert body["outputs"] == [
+            {"id": "match-chart", "property": "figure"},
+            {"id": "tab-a", "property": "label"},
+        ]
+        assert body["inputs"] == [
+            {"id": "match-selector", "property": "value", "value": 3}
+        ]
+        # active_tab is not set in the layout, so no value is sent
+        assert body["state"] == [{"id": "match-tabs", "property": "active_tab"}]
+
+
+class TestFirePageCallbacks:
+    """Callbacks sent in dependency order, including chained ones."""
+
+    URL = "http://localhost:8050/matches?match_id=3"
+
+    def _fire(self, dependencies: list, responses: dict) -> tuple[list, dict]:
+        props = collect_props(SHELL_LAYOUT, self.URL)
+        collect_props(PAGE_LAYOUT, self.URL, props)
+        sent = []
+
+        def send(body: dict) -> dict | None:
+            sent.append(body)
+            return {"response": responses.get(body["output"], {})}
+
+        assert fire_page_callbacks(send, dependencies, props, self.URL) == len(sent)
+        return sent, props
+
+    def test_waits_for_inputs_of_pending_callbacks(self) -> None:
+        sent, props = self._fire(
+            DEPENDENCIES, {"match-selector.value": {"match-selector": {"value": 4}}}
+        )
+
+        assert [body["output"] for body in sent] == [
+            "match-selector.value",
+            "..match-chart.figure...tab-a.label@1a2b..",
+        ]
+        # The chart runs once, with the value the selector returned
+        assert sent[1]["inputs"][0]["value"] == 4
+        assert props["match-selector"]["value"] == 4
+
+    def test_changed_output_triggers_callback(self) -> None:
+        dependencies = DEPENDENCIES + [
+            {
+                "output": "match-tabs.active_tab",
+                "inputs": [{"id": "match-chart", "property": "figure"}],
+                "state": [],
+                "prevent_initial_call": True,
+            }
+        ]
+        chart = "..match-chart.figure...tab-a.label@1a2b.."
+
+        sent, _ = self._fire(
+            dependencies, {chart: {"match-chart": {"figure": {"data": []}}}}
+        )
+
+        assert [(body["output"], body["changedPropIds"]) for body in sent] == [
+            ("match-selector.value", []),
+            (chart, []),
+            ("match-tabs.active_tab", ["match-chart.figure"]),
+        ]
+
+    def test_update_loops_stop(self) -> None:
+        dependencies = [
+            {
+                "output": "match-selector.value",
+                "inputs": [{"id": "match-chart", "property": "figure"}],
+                "state": [],
+            },
+            {
+                "output": "match-chart.figure",
+                "inputs": [{"id": "match-selector", "property": "value"}],
+                "state": [],
+                "prevent_initial_call": True,
+            },
+        ]
+        counter = iter(range(100))
+        props = collect_props(PAGE_LAYOUT, self.URL)
+
+        def send(body: dict) -> dict:
+            component_id, prop = body["output"].split(".")
+            return {"response": {component_id: {prop: next(counter)}}}
+
+        assert fire_page_callbacks(send, dependencies, props, self.URL) == 6
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    """Fake Dash server on a free port that fails one callback."""
+    app = Flask(__name__)
+    app.add_url_rule("/_dash-dependencies", "deps", lambda: jsonify(DEPENDENCIES))
+    app.add_url_rule("/_dash-layout", "layout", lambda: jsonify(SHELL_LAYOUT))
+    app.add_url_rule("/matches", "matches", lambda: "<html></html>")
+    app.add_url_rule(
+        "/api/map/turn-range/<int:match_id>",
+        "turn_range",
+        lambda match_id: jsonify({"max_turn": 10}),
+    )
+
+    @app.route("/_dash-update-component", methods=["POST"])
+    def update_component():
+        body = request.get_json()
+        if body["output"].startswith(".._pages_content"):
+            return jsonify({"response": {"_pages_content": {"children": PAGE_LAYOUT}}})
+        if body["output"] == "match-selector.value":
+            return "failed", 500
+        return jsonify({"response": {}})
+
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    thread.join()
+
+
+class TestReplay:
+    """Replaying sessions against a server."""
+
+    def test_page_load_and_api(self, server_url: str) -> None:
+        sessions = build_sessions(
+            [
+                _line("/matches?match_id=3", "10:00:00"),
+                _line("/api/map/turn-range/3", "10:00:01"),
+                _line("/matches?match_id=3", "10:00:00", ip="2.2.2.2"),
+            ]
+        )
+        replayer = Replayer(server_url)
+
+        wall_seconds = replayer.run(sessions, concurrency=2, speedup=0)
+
+        summary = summarize(replayer.results, wall_seconds)
+        groups = {name: s["requests"] for name, s in summary["groups"].items()}
+        assert groups == {
+            "Page HTML": 2,
+            "Page layout": 2,
+            "Callbacks": 4,
+            "Map API": 1,
+        }
+        assert summary["total"]["requests"] == 9
+        assert summary["total"]["errors"] == 2
+        assert summary["groups"]["Callbacks"]["errors"] == 2
+        assert summary["labels"]["Page HTML: Matches"]["requests"] == 2
+
+    def test_unreachable_server_counted_as_error(self) -> None:
+        replayer = Replayer("http://127.0.0.1:9", timeout=1)
+        sessions = build_sessions([_line("/api/map/turn-range/3")])
+
+        replayer._shell = (DEPENDENCIES, SHELL_LAYOUT)
+        replayer.run(sessions, concurrency=1, speedup=0)
+
+        assert [r.status for r in replayer.results] == [0]
+
+
+class TestReport:
+    """summarize() and the server process tree."""
+
+    def test_summary(self) -> None:
+        results = [
+            Result("Map API", "API territories", 200, float(ms)) for ms in range(1, 101)
+        ]
+        results.append(Result("Map API", "API territories", 404, 1.0))
+        results.append(Result("Map API", "API territories", 0, 0.0))
+
+        total = summarize(results, wall_seconds=2.0)["total"]
+
+        assert total["requests"] == 102
+        assert total["throughput_rps"] == 51.0
+        assert total["errors"] == 1
+        assert total["client_errors"] == 1
+        assert total["p95_ms"] == 95.0
+
+    def test_process_tree(self) -> None:
+        table = [
+            (1, 0, 100, "init"),
+            (10, 1, 2000, "uv"),
+            (11, 10, 30000, "gunicorn"),
+            (12, 11, 250000, "gunicorn"),
+            (13, 11, 260000, "gunicorn"),
+            (20, 1, 5000, "other"),
+        ]
+
+        assert process_tree(10, table) == {
+            10: (2000, "uv"),
+            11: (30000, "gunicorn"),
+            12: (250000, "gunicorn"),
+            13: (260000, "gunicorn"),
+        }
+
+
+class TestServerCommand:
+    """manage.py start --gunicorn"""
+
+    def test_dev_server(self) -> None:
+        command, _ = manage.server_command()
+
+        assert command[-1] == "tournament_visualizer/app.py"
+
+    def test_gunicorn(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("LOG_DIR", raising=False)
+
+        command, env = manage.server_command(workers=2, threads=4)
+
+        assert "tournament_visualizer.app:server" in command
+        assert env["PORT"] == str(manage.PORT)
+        assert env["WEB_CONCURRENCY"] == "2"
+        assert env["GUNICORN_THREADS"] == "4"
+        assert env["LOG_DIR"].startswith("logs")
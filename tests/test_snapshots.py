@@ -0,0 +1,257 @@
+"""Tests for versioned database snapshots and switching workers to them.
+
+Test Strategy:
+- Publishing copies or moves a closed database into a new generation file,
+  points CURRENT at it and prunes old generations, never the live one
+- Files that are open for writing or are not tournament databases are refused
+- TournamentDatabase.reopen() serves new reads from the new file while reads
+  in flight finish on the old connection, which closes once they are released
+- refresh_database() switches to a new snapshot and drops the caches, at most
+  once per poll interval
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from tournament_visualizer import data_refresh
+from tournament_visualizer.config import Config
+from tournament_visualizer.data.database import TournamentDatabase
+from tournament_visualizer.data.queries import TournamentQueries
+from tournament_visualizer.data.snapshots import (
+    POINTER_FILE,
+    current_snapshot,
+    list_snapshots,
+    publish_snapshot,
+)
+
+
+def _make_database(path: Path, generation: int) -> str:
+    writer = TournamentDatabase(db_path=str(path), read_only=False)
+    writer.create_schema()
+    with writer.get_connection() as conn:
+        conn.execute("CREATE TABLE generation AS SELECT ? AS n", [generation])
+    writer.close()
+    return str(path)
+
+
+def _generation(db: TournamentDatabase) -> int:
+    with db.get_connection() as conn:
+        return conn.execute("SELECT n FROM generation").fetchone()[0]
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path: Path) -> str:
+    return str(tmp_path / "snapshots")
+
+
+class TestPublishSnapshot:
+    """publish_snapshot() and the CURRENT pointer."""
+
+    def test_nothing_published(self, snapshot_dir: str) -> None:
+        assert current_snapshot(snapshot_dir) is None
+        assert list_snapshots(snapshot_dir) == []
+
+    def test_copies_and_points_at_new_generation(
+        self, tmp_path: Path, snapshot_dir: str
+    ) -> None:
+        source = _make_database(tmp_path / "work.duckdb", 1)
+
+        first = publish_snapshot(source, snapshot_dir)
+        second = publish_snapshot(source, snapshot_dir)
+
+        assert Path(source).exists()
+        assert second > first
+        assert current_snapshot(snapshot_dir) == second
+        assert (Path(snapshot_dir) / POINTER_FILE).read_text() == second.name + "\n"
+        assert not list(Path(snapshot_dir).glob("*.tmp"))
+
+    def test_move(self, tmp_path: Path, snapshot_dir: str) -> None:
+        source = _make_database(tmp_path / "upload.duckdb", 1)
+
+        snapshot = publish_snapshot(source, snapshot_dir, move=True)
+
+        assert not Path(source).exists()
+        assert current_snapshot(snapshot_dir) == snapshot
+
+    def test_prunes_old_generations(self, tmp_path: Path, snapshot_dir: str) -> None:
+        source = _make_database(tmp_path / "work.duckdb", 1)
+
+        published = [publish_snapshot(source, snapshot_dir, keep=2) for _ in range(4)]
+
+        assert list_snapshots(snapshot_dir) == published[-2:]
+
+    def test_keeps_live_snapshot(self, tmp_path: Path, snapshot_dir: str) -> None:
+        source = _make_database(tmp_path / "work.duckdb", 1)
+        published = [publish_snapshot(source, snapshot_dir) for _ in range(2)]
+        # Roll back to the older generation by hand
+        (Path(snapshot_dir) / POINTER_FILE).write_text(published[0].name)
+
+        latest = publish_snapshot(source, snapshot_dir, keep=1)
+
+        assert list_snapshots(snapshot_dir) == [latest]
+        publish_snapshot(source, snapshot_dir, keep=1)
+        assert published[0] not in list_snapshots(snapshot_dir)
+
+    def test_refuses_open_writer(self, tmp_path: Path, snapshot_dir: str) -> None:
+        source = _make_database(tmp_path / "work.duckdb", 1)
+        writer = duckdb.connect(source)
+        writer.execute("INSERT INTO generation VALUES (2)")
+        try:
+            with pytest.raises(ValueError):
+                publish_snapshot(source, snapshot_dir)
+        finally:
+            writer.close()
+
+        assert current_snapshot(snapshot_dir) is None
+
+    def test_refuses_non_tournament_database(
+        self, tmp_path: Path, snapshot_dir: str
+    ) -> None:
+        other = tmp_path / "other.duckdb"
+        duckdb.connect(str(other)).close()
+
+        with pytest.raises(ValueError, match="not a tournament database"):
+            publish_snapshot(str(other), snapshot_dir)
+
+
+class TestReopen:
+    """TournamentDatabase.reopen()"""
+
+    def test_new_reads_use_new_file(self, tmp_path: Path) -> None:
+        old_path = _make_database(tmp_path / "old.duckdb", 1)
+        new_path = _make_database(tmp_path / "new.duckdb", 2)
+        db = TournamentDatabase(db_path=old_path, read_pool_size=2)
+        assert _generation(db) == 1
+
+        db.reopen(new_path)
+
+        assert db.db_path == new_path
+        assert _generation(db) == 2
+        db.close()
+
+    def test_reads_in_flight_finish_on_old_file(self, tmp_path: Path) -> None:
+        old_path = _make_database(tmp_path / "old.duckdb", 1)
+        new_path = _make_database(tmp_path / "new.duckdb", 2)
+        db = TournamentDatabase(db_path=old_path, read_pool_size=2)
+
+        with db.get_connection() as in_flight:
+            old_connection = db.connection
+            db.reopen(new_path)
+            # Another thread's read gets a cursor of the new file
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                assert executor.submit(_generation, db).result() == 2
+            assert in_flight.execute("SELECT n FROM generation").fetchone() == (1,)
+            assert db._retired
+
+        assert not db._retired
+        with pytest.raises(duckdb.ConnectionException):
+            old_connection.execute("SELECT 1")
+        db.close()
+
+    def test_unopenable_file_keeps_current(self, tmp_path: Path) -> None:
+        old_path = _make_database(tmp_path / "old.duckdb", 1)
+        db = TournamentDatabase(db_path=old_path)
+        broken = tmp_path / "broken.duckdb"
+        broken.write_bytes(b"not a database")
+
+        with pytest.raises(duckdb.Error):
+            db.reopen(str(broken))
+
+        assert db.db_path == old_path
+        assert _generation(db) == 1
+        db.close()
+
+
+class TestRefreshDatabase:
+    """Switching the server to a newly published snapshot."""
+
+    @pytest.fixture
+    def served(
+        self, tmp_path: Path, snapshot_dir: str, monkeypatch: pytest.MonkeyPatch
+    ) -> tuple[TournamentDatabase, TournamentQueries]:
+        db = TournamentDatabase(
+            db_path=_make_database(tmp_path / "work.duckdb", 0), read_pool_size=2
+        )
+        queries = TournamentQueries(database=db)
+        pinned = []
+        monkeypatch.setattr(Config, "SNAPSHOT_DIRECTORY", snapshot_dir)
+        monkeypatch.setattr(Config, "SNAPSHOT_POLL_INTERVAL", 60.0)
+        monkeypatch.setattr(data_refresh, "get_database", lambda: db)
+        monkeypatch.setattr(data_refresh, "get_queries", lambda: queries)
+        monkeypatch.setattr(
+            data_refresh, "pin_overview_artifact", lambda: pinned.append(1)
+        )
+        yield db, queries
+        db.close()
+
+    def test_without_snapshot_serves_database_path(
+        self, served: tuple[TournamentDatabase, TournamentQueries]
+    ) -> None:
+        db, queries = served
+
+        assert not data_refresh.refresh_database(force=True)
+        assert _generation(db) == 0
+        assert queries.generation == 0
+
+    def test_empty_directory_disables_snapshots(
+        self,
+        served: tuple[TournamentDatabase, TournamentQueries],
+        tmp_path: Path,
+        snapshot_dir: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        db, _ = served
+        publish_snapshot(_make_database(tmp_path / "g1.duckdb", 1), snapshot_dir)
+        monkeypatch.setattr(Config, "SNAPSHOT_DIRECTORY", "")
+
+        assert not data_refresh.refresh_database(force=True)
+        assert _generation(db) == 0
+
+    def test_switches_to_new_snapshot(
+        self,
+        served: tuple[TournamentDatabase, TournamentQueries],
+        tmp_path: Path,
+        snapshot_dir: str,
+    ) -> None:
+        db, queries = served
+        publish_snapshot(_make_database(tmp_path / "g1.duckdb", 1), snapshot_dir)
+
+        assert data_refresh.refresh_database(force=True)
+        assert _generation(db) == 1
+        assert queries.generation == 1
+        # Nothing new to switch to
+        assert not data_refresh.refresh_database(force=True)
+        assert queries.generation == 1
+
+    def test_polls_at_most_once_per_interval(
+        self,
+        served: tuple[TournamentDatabase, TournamentQueries],
+        tmp_path: Path,
+        snapshot_dir: str,
+    ) -> None:
+        db, _ = served
+        data_refresh.refresh_database(force=True)
+        publish_snapshot(_make_database(tmp_path / "g1.duckdb", 1), snapshot_dir)
+
+        assert not data_refresh.refresh_database()
+        assert _generation(db) == 0
+
+    def test_init_opens_live_snapshot_before_requests(
+        self,
+        served: tuple[TournamentDatabase, TournamentQueries],
+        tmp_path: Path,
+        snapshot_dir: str,
+    ) -> None:
+        from flask import Flask
+
+        db, _ = served
+        publish_snapshot(_make_database(tmp_path / "g1.duckdb", 1), snapshot_dir)
+        server = Flask(__name__)
+
+        data_refresh.init_data_refresh(server)
+
+        assert _generation(db) == 1
+        assert server.before_request_funcs[None]
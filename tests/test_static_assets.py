@@ -0,0 +1,274 @@
+"""Tests for the fingerprinted static asset build.
+
+Test Strategy:
+- Build a small assets tree of generated PNGs into tmp_path
+- File names carry a content hash that changes only when the content does
+- Sprite atlas frames reproduce the original sprite pixels exactly
+- Icon atlas cells map to background-position percentages
+- Build outputs are served with immutable caching, precompressed JSON is
+  served with Content-Encoding, and the manifest itself is not served
+- Without a build, asset_url() and asset_icon() fall back to /assets/ paths
+"""
+
+import gzip
+import io
+import json
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from dash import html
+from flask import Flask
+from PIL import Image
+
+from tournament_visualizer import static_assets
+from tournament_visualizer.static_assets import (
+    asset_icon,
+    asset_url,
+    build_assets,
+    init_static_assets,
+    load_manifest,
+    pack_shelves,
+    sprite_atlas_urls,
+)
+
+COLORS = {
+    "TERRAIN_ARID": (200, 160, 80, 255),
+    "TERRAIN_LUSH": (40, 160, 60, 255),
+    "TERRAIN_WATER": (30, 80, 200, 255),
+}
+
+
+def _write_png(path: Path, size: tuple, color: tuple) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    image = Image.new("RGBA", size, color)
+    # A distinct corner pixel catches frames that are offset or flipped
+    image.putpixel((0, 0), (255, 0, 255, 255))
+    image.save(path)
+
+
+@pytest.fixture
+def assets_dir(tmp_path: Path) -> Path:
+    root = tmp_path / "assets"
+    for i, (name, color) in enumerate(COLORS.items()):
+        _write_png(
+            root / "sprites/terrains/masked" / f"{name}.png", (21 + i, 18), color
+        )
+    _write_png(
+        root / "sprites/resources/RESOURCE_IRON.png", (12, 12), (90, 90, 90, 255)
+    )
+    for i in range(5):
+        _write_png(root / f"icons/techs/TECH_{i}.png", (240, 240), (i * 40, 0, 0, 255))
+    _write_png(root / "icons/yields/YIELD_ORDERS.png", (40, 30), (0, 0, 255, 255))
+    return root
+
+
+@pytest.fixture
+def build_dir(assets_dir: Path, tmp_path: Path) -> Iterator[Path]:
+    output = tmp_path / "static_build"
+    build_assets(assets_dir, output)
+    load_manifest.cache_clear()
+    yield output
+    load_manifest.cache_clear()
+
+
+@pytest.fixture
+def use_build(build_dir: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the runtime helpers at the tmp build."""
+    monkeypatch.setattr(static_assets, "_default_build_directory", lambda: build_dir)
+    return build_dir
+
+
+class TestBuild:
+    """build_assets() outputs and manifest."""
+
+    def test_files_fingerprinted(self, build_dir: Path, assets_dir: Path) -> None:
+        manifest = json.loads((build_dir / "manifest.json").read_text())
+
+        built = manifest["files"]["icons/yields/YIELD_ORDERS.png"]
+        assert built.startswith("icons/yields/YIELD_ORDERS.")
+        assert built.endswith(".png")
+        assert (build_dir / built).read_bytes() == (
+            assets_dir / "icons/yields/YIELD_ORDERS.png"
+        ).read_bytes()
+        assert len(manifest["files"]) == 10
+
+    def test_hash_changes_only_with_content(
+        self, assets_dir: Path, tmp_path: Path
+    ) -> None:
+        key = "icons/yields/YIELD_ORDERS.png"
+        build_assets(assets_dir, tmp_path / "a")
+        first = json.loads((tmp_path / "a/manifest.json").read_text())
+        build_assets(assets_dir, tmp_path / "b")
+        second = json.loads((tmp_path / "b/manifest.json").read_text())
+        _write_png(assets_dir / key, (40, 30), (0, 255, 0, 255))
+        build_assets(assets_dir, tmp_path / "c")
+        third = json.loads((tmp_path / "c/manifest.json").read_text())
+
+        assert first["files"] == second["files"]
+        assert third["files"][key] != first["files"][key]
+        assert (
+            third["files"]["icons/techs/TECH_0.png"]
+            == first["files"]["icons/techs/TECH_0.png"]
+        )
+
+    def test_sprite_atlas_frames_match_sprites(
+        self, build_dir: Path, assets_dir: Path
+    ) -> None:
+        manifest = json.loads((build_dir / "manifest.json").read_text())
+        sheet_path = build_dir / manifest["sprite_atlases"]["terrains/masked"]
+        sheet = json.loads(sheet_path.read_text())
+        atlas = Image.open(sheet_path.parent / sheet["meta"]["image"])
+
+        assert set(sheet["frames"]) == set(COLORS)
+        for name in COLORS:
+            frame = sheet["frames"][name]["frame"]
+            box = (
+                frame["x"],
+                frame["y"],
+                frame["x"] + frame["w"],
+                frame["y"] + frame["h"],
+            )
+            original = Image.open(assets_dir / f"sprites/terrains/masked/{name}.png")
+            assert list(atlas.crop(box).getdata()) == list(original.getdata())
+
+    def test_sprite_atlas_json_precompressed(self, build_dir: Path) -> None:
+        manifest = json.loads((build_dir / "manifest.json").read_text())
+        sheet_path = build_dir / manifest["sprite_atlases"]["resources"]
+
+        compressed = sheet_path.with_name(sheet_path.name + ".gz").read_bytes()
+
+        assert gzip.decompress(compressed) == sheet_path.read_bytes()
+
+    def test_icon_atlas_cells(self, build_dir: Path) -> None:
+        manifest = json.loads((build_dir / "manifest.json").read_text())
+        cells = manifest["icon_atlases"]
+
+        tech = cells["icons/techs/TECH_4.png"]
+        assert (tech["cols"], tech["rows"]) == (3, 2)
+        assert (tech["col"], tech["row"]) == (1, 1)
+        atlas = Image.open(build_dir / tech["atlas"]).convert("RGBA")
+        assert atlas.size == (3 * 72, 2 * 72)
+        assert atlas.getpixel((72 + 36, 72 + 36)) == (160, 0, 0, 255)
+
+    def test_pack_shelves_within_width_without_overlap(self) -> None:
+        sizes = [(50, 40), (60, 30), (70, 40), (20, 10)]
+        positions, width, height = pack_shelves(sizes, max_width=130, padding=2)
+
+        boxes = [(x, y, x + w, y + h) for (x, y), (w, h) in zip(positions, sizes)]
+        assert width <= 130
+        assert all(box[2] <= width and box[3] <= height for box in boxes)
+        for i, a in enumerate(boxes):
+            for b in boxes[i + 1 :]:
+                assert a[2] <= b[0] or b[2] <= a[0] or a[3] <= b[1] or b[3] <= a[1]
+
+
+class TestRuntimeHelpers:
+    """asset_url(), asset_icon() and sprite_atlas_urls()."""
+
+    def test_asset_url_fingerprinted(self, use_build: Path) -> None:
+        url = asset_url("/assets/icons/yields/YIELD_ORDERS.png")
+
+        assert url.startswith("/static-assets/icons/yields/YIELD_ORDERS.")
+        assert asset_url("/assets/icons/missing.png") == "/assets/icons/missing.png"
+
+    def test_asset_icon_uses_atlas(self, use_build: Path) -> None:
+        icon = asset_icon(
+            "/assets/icons/techs/TECH_4.png",
+            {"width": "36px", "height": "36px"},
+            title="Forestry",
+            className="timeline-icon",
+        )
+
+        assert isinstance(icon, html.Span)
+        assert icon.title == "Forestry"
+        assert icon.className == "timeline-icon"
+        assert icon.style["width"] == "36px"
+        assert icon.style["backgroundSize"] == "300% 200%"
+        assert icon.style["backgroundPosition"] == "50% 100%"
+        assert icon.style["backgroundImage"].startswith(
+            "url(/static-assets/atlases/icons-techs."
+        )
+
+    def test_sprite_atlas_urls(self, use_build: Path) -> None:
+        urls = sprite_atlas_urls()
+
+        assert set(urls) == {"terrains/masked", "resources"}
+        assert urls["resources"].startswith("/static-assets/atlases/sprites-resources.")
+
+    def test_fallback_without_build(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(
+            static_assets, "_default_build_directory", lambda: tmp_path / "none"
+        )
+        load_manifest.cache_clear()
+        try:
+            path = "/assets/icons/techs/TECH_4.png"
+            icon = asset_icon(path, {"width": "22px"}, title="Forestry")
+
+            assert asset_url(path) == path
+            assert isinstance(icon, html.Img)
+            assert icon.src == path
+            assert sprite_atlas_urls() == {}
+        finally:
+            load_manifest.cache_clear()
+
+
+class TestServing:
+    """The /static-assets/ route."""
+
+    @pytest.fixture
+    def client(self, build_dir: Path):
+        app = Flask(__name__)
+        init_static_assets(app, str(build_dir))
+        return app.test_client()
+
+    def _manifest(self, build_dir: Path) -> dict:
+        return json.loads((build_dir / "manifest.json").read_text())
+
+    def test_png_immutable(self, client, build_dir: Path) -> None:
+        name = self._manifest(build_dir)["files"]["icons/yields/YIELD_ORDERS.png"]
+
+        response = client.get(f"/static-assets/{name}")
+
+        assert response.status_code == 200
+        assert response.mimetype == "image/png"
+        assert response.cache_control.max_age == 365 * 24 * 3600
+        assert response.cache_control.immutable
+        assert response.cache_control.public
+        assert Image.open(io.BytesIO(response.data)).size == (40, 30)
+
+    def test_json_served_precompressed(self, client, build_dir: Path) -> None:
+        name = self._manifest(build_dir)["sprite_atlases"]["resources"]
+
+        compressed = client.get(
+            f"/static-assets/{name}", headers={"Accept-Encoding": "gzip"}
+        )
+        plain = client.get(f"/static-assets/{name}")
+
+        assert compressed.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in compressed.headers["Vary"]
+        assert json.loads(gzip.decompress(compressed.data)) == json.loads(plain.data)
+        assert "Content-Encoding" not in plain.headers
+
+    @pytest.mark.parametrize(
+        "path",
+        ["manifest.json", "icons/missing.png", "../assets/icons/techs/TECH_0.png"],
+    )
+    def test_not_found(self, client, path: str) -> None:
+        assert client.get(f"/static-assets/{path}").status_code == 404
+
+    def test_versioned_dash_assets_immutable(self, tmp_path: Path) -> None:
+        (tmp_path / "style.css").write_text("body {}")
+        app = Flask(__name__, static_folder=str(tmp_path), static_url_path="/assets")
+        init_static_assets(app, str(tmp_path / "none"))
+        client = app.test_client()
+
+        versioned = client.get("/assets/style.css?m=1700000000")
+        plain = client.get("/assets/style.css")
+
+        assert versioned.cache_control.immutable
+        assert not versioned.cache_control.no_cache
+        assert versioned.cache_control.max_age == 365 * 24 * 3600
+        assert not plain.cache_control.immutable
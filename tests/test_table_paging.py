@@ -0,0 +1,206 @@
+"""Tests for server-side DataTable paging, sorting and filtering.
+
+Test Strategy:
+- DataTable filter queries parse into terms, ignoring unknown syntax
+- SQL clauses only reference whitelisted columns and bind values as params
+- DataFrame paging matches the SQL behaviour for Python-computed tables
+- Paged queries return one page, a stable order and a cached total count
+"""
+
+import pandas as pd
+import pytest
+
+from tournament_visualizer.data.database import TournamentDatabase
+from tournament_visualizer.data.queries import TournamentQueries
+from tournament_visualizer.data.table_paging import (
+    FilterTerm,
+    build_table_clauses,
+    page_count,
+    page_dataframe,
+    parse_filter_query,
+)
+
+
+class TestParseFilterQuery:
+    """Parsing DataTable filter_query strings."""
+
+    def test_terms_and_case_prefixes(self) -> None:
+        terms = parse_filter_query(
+            '{player_name} icontains "Bob" && {turn_number} >= 50 '
+            "&& {description} scontains Iron"
+        )
+
+        assert terms == [
+            FilterTerm("player_name", "contains", "Bob"),
+            FilterTerm("turn_number", "ge", 50.0),
+            FilterTerm("description", "contains", "Iron", case_sensitive=True),
+        ]
+
+    def test_quoted_values_stay_strings(self) -> None:
+        (term,) = parse_filter_query("{round_display} = '1'")
+
+        assert term == FilterTerm("round_display", "eq", "1")
+
+    def test_unknown_syntax_skipped(self) -> None:
+        assert parse_filter_query("") == []
+        assert parse_filter_query("{a} matches x && garbage") == []
+
+
+class TestBuildTableClauses:
+    """Translating sort_by and filter_query into SQL."""
+
+    COLUMNS = {"turn": "turn_number", "player": "player_name"}
+
+    def test_filters_bound_as_params(self) -> None:
+        where, params, order = build_table_clauses(
+            self.COLUMNS, filter_query='{player} icontains "x\'; DROP" && {turn} < 5'
+        )
+
+        assert "DROP" not in where
+        assert params == ["x'; DROP", 5.0]
+        assert order == ""
+
+    def test_unknown_columns_ignored(self) -> None:
+        where, params, order = build_table_clauses(
+            self.COLUMNS,
+            sort_by=[{"column_id": "secret", "direction": "asc"}],
+            filter_query="{secret} = 1",
+        )
+
+        assert (where, params, order) == ("TRUE", [], "")
+
+    def test_sort_order(self) -> None:
+        _, _, order = build_table_clauses(
+            self.COLUMNS,
+            sort_by=[
+                {"column_id": "turn", "direction": "desc"},
+                {"column_id": "player", "direction": "asc"},
+            ],
+        )
+
+        assert order == "turn_number DESC NULLS LAST, player_name ASC NULLS LAST"
+
+
+class TestPageDataFrame:
+    """Paging tables whose rows are computed in Python."""
+
+    @pytest.fixture
+    def df(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "player": ["alice", "Bob", "carol", "dave", None],
+                "score": [50.0, 72.5, 61.0, 72.5, 10.0],
+            }
+        )
+
+    def test_page_and_total(self, df: pd.DataFrame) -> None:
+        page, total = page_dataframe(df, 1, 2)
+
+        assert total == 5
+        assert page["player"].tolist() == ["carol", "dave"]
+
+    def test_filter_then_sort(self, df: pd.DataFrame) -> None:
+        page, total = page_dataframe(
+            df,
+            0,
+            10,
+            sort_by=[{"column_id": "player", "direction": "desc"}],
+            filter_query='{score} > 60 && {player} icontains "b"',
+        )
+
+        assert total == 1
+        assert page["player"].tolist() == ["Bob"]
+
+    def test_page_count(self) -> None:
+        assert page_count(0, 20) == 1
+        assert page_count(40, 20) == 2
+        assert page_count(41, 20) == 3
+
+
+class TestPagedQueries:
+    """LIMIT/OFFSET queries in TournamentQueries."""
+
+    @pytest.fixture
+    def queries(self, tmp_path) -> TournamentQueries:
+        db = TournamentDatabase(str(tmp_path / "paging.duckdb"), read_only=False)
+        db.create_schema()
+        with db.get_connection() as conn:
+            conn.execute(
+                "INSERT INTO matches (match_id, file_name, file_hash, game_name, "
+                "total_turns, tournament_round) VALUES "
+                "(1, 'a.zip', 'ha', 'Alpha', 80, 1), "
+                "(2, 'b.zip', 'hb', 'Beta', 60, -2), "
+                "(3, 'c.zip', 'hc', 'Gamma', 100, NULL)"
+            )
+            conn.execute(
+                "INSERT INTO players (player_id, match_id, player_name, "
+                "player_name_normalized) VALUES (1, 1, 'alice', 'alice'), "
+                "(2, 1, 'bob', 'bob')"
+            )
+            for i in range(25):
+                conn.execute(
+                    "INSERT INTO events (event_id, match_id, turn_number, "
+                    "event_type, player_id, description) VALUES (?, 1, ?, ?, ?, ?)",
+                    [
+                        i + 1,
+                        i,
+                        "TECH_DISCOVERED" if i % 2 else "CITY_FOUNDED",
+                        1 + i % 2,
+                        f"Event {i}",
+                    ],
+                )
+        yield TournamentQueries(db)
+        db.close()
+
+    def test_first_page_matches_full_timeline(self, queries: TournamentQueries) -> None:
+        full = queries.get_event_timeline(1)
+        page, total = queries.get_event_timeline_page(1, 0, 10)
+
+        assert total == len(full) == 25
+        assert page["description"].tolist() == full["description"].head(10).tolist()
+
+    def test_pages_do_not_overlap(self, queries: TournamentQueries) -> None:
+        seen = []
+        for page_current in range(3):
+            page, _ = queries.get_event_timeline_page(
+                1,
+                page_current,
+                10,
+                sort_by=[{"column_id": "player_name", "direction": "asc"}],
+            )
+            seen.extend(page["description"])
+
+        assert sorted(seen) == sorted(f"Event {i}" for i in range(25))
+
+    def test_filter_on_gameplay_category(self, queries: TournamentQueries) -> None:
+        page, total = queries.get_event_timeline_page(
+            1, 0, 10, filter_query='{event_category} icontains "technology"'
+        )
+
+        assert total == 12
+        assert set(page["event_category"]) == {"Technology & Laws"}
+
+    def test_total_count_cached(self, queries: TournamentQueries) -> None:
+        queries.get_event_timeline_page(1, 0, 10)
+        with queries.db.get_connection() as conn:
+            conn.execute("DELETE FROM events WHERE event_id = 1")
+
+        _, total = queries.get_event_timeline_page(1, 1, 10)
+        assert total == 25
+
+        queries.invalidate_caches()
+        _, total = queries.get_event_timeline_page(1, 1, 10)
+        assert total == 24
+
+    def test_matches_page_sorted_and_filtered(self, queries: TournamentQueries) -> None:
+        page, total = queries.get_matches_page(
+            0, 2, sort_by=[{"column_id": "total_turns", "direction": "desc"}]
+        )
+
+        assert total == 3
+        assert page["game_name"].tolist() == ["Gamma", "Alpha"]
+
+        page, total = queries.get_matches_page(
+            0, 10, filter_query='{round_display} icontains "losers"'
+        )
+        assert (total, page["game_name"].tolist()) == (1, ["Beta"])
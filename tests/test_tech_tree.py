@@ -0,0 +1,76 @@
+"""Tests for the tech tree Cytoscape component.
+
+Test Strategy:
+- Discovery turns use the earliest turn and ignore unknown techs
+- The static layout is built once per process and shared between calls
+- Element classes match the researched set
+"""
+
+import pandas as pd
+
+from tournament_visualizer.components.tech_tree import (
+    build_cytoscape_elements,
+    get_tech_discovery_turns,
+    get_tech_tree_layout,
+    get_techs_at_turn,
+)
+
+TIMELINE = pd.DataFrame(
+    {
+        "player_id": [1, 1, 1, 1, 2],
+        "turn_number": [5, 12, 3, 9, 7],
+        "tech_name": [
+            "TECH_IRONWORKING",
+            '"TECH_STONECUTTING"',
+            "TECH_NOT_A_TECH",
+            "TECH_IRONWORKING",
+            "TECH_TRAPPING",
+        ],
+    }
+)
+
+
+class TestGetTechDiscoveryTurns:
+    """Per-player discovery turns sent to the browser."""
+
+    def test_earliest_turn_of_known_techs(self) -> None:
+        turns = get_tech_discovery_turns(TIMELINE, 1)
+
+        assert turns == {"TECH_IRONWORKING": 5, "TECH_STONECUTTING": 12}
+
+    def test_matches_techs_at_turn(self) -> None:
+        turns = get_tech_discovery_turns(TIMELINE, 1)
+
+        for turn in (0, 5, 11, 12):
+            expected = get_techs_at_turn(TIMELINE, 1, turn)
+            assert {tech for tech, t in turns.items() if t <= turn} == expected
+
+    def test_empty_timeline(self) -> None:
+        assert get_tech_discovery_turns(TIMELINE.head(0), 1) == {}
+        assert get_tech_discovery_turns(None, 1) == {}
+
+
+class TestBuildCytoscapeElements:
+    """Elements built from the cached static layout."""
+
+    def test_layout_cached(self) -> None:
+        assert get_tech_tree_layout() is get_tech_tree_layout()
+
+    def test_classes_follow_researched_set(self) -> None:
+        elements = build_cytoscape_elements({"TECH_IRONWORKING"})
+        nodes = {e["data"]["id"]: e for e in elements if "id" in e["data"]}
+
+        assert nodes["TECH_IRONWORKING"]["classes"] == "researched"
+        assert nodes["TECH_STONECUTTING"]["classes"] == "locked"
+        assert all(
+            e["classes"] == "edge-locked" for e in elements if "source" in e["data"]
+        )
+
+    def test_calls_do_not_share_elements(self) -> None:
+        researched = build_cytoscape_elements({"TECH_IRONWORKING"})
+        locked = build_cytoscape_elements()
+
+        assert researched[0] is not locked[0]
+        assert len(researched) == len(locked)
+        nodes, edges = get_tech_tree_layout()
+        assert len(locked) == len(nodes) + len(edges)
@@ -0,0 +1,205 @@
+"""Tests for request latency telemetry.
+
+Test Strategy:
+- Requests are keyed by URL rule, and Dash callbacks by their output
+- Database time and cache lookups reported during a request land on its
+  sample; reports outside a request are ignored
+- /debug/perf serves rolling percentiles to loopback clients only
+- The JSONL sink writes one parseable line per request
+- Response sizes are measured after compression
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+from flask import Flask, jsonify
+
+from tournament_visualizer.compression import init_compression
+from tournament_visualizer.telemetry import (
+    PerfStats,
+    RequestSample,
+    init_telemetry,
+    percentile,
+    record_cache_lookup,
+    record_db_time,
+)
+
+
+def _make_app(**kwargs) -> tuple:
+    app = Flask(__name__)
+
+    @app.route("/api/map/turn-range/<int:match_id>")
+    def turn_range(match_id: int):
+        record_db_time(0.004)
+        record_db_time(0.002)
+        record_cache_lookup(hit=True)
+        record_cache_lookup(hit=False)
+        return jsonify({"match_id": match_id})
+
+    @app.route("/_dash-update-component", methods=["POST"])
+    def update_component():
+        return jsonify({"response": {"x": [1] * 1000}})
+
+    @app.route("/boom")
+    def boom():
+        raise RuntimeError("failed")
+
+    stats = init_telemetry(app, enabled=True, window=100, **kwargs)
+    return app, stats
+
+
+class TestRequestSamples:
+    """Keys and per-request measurements."""
+
+    def test_route_keyed_by_rule(self) -> None:
+        app, stats = _make_app()
+        client = app.test_client()
+
+        client.get("/api/map/turn-range/1")
+        client.get("/api/map/turn-range/2")
+
+        (row,) = stats.snapshot()
+        assert row["key"] == "GET /api/map/turn-range/<int:match_id>"
+        assert row["count"] == 2
+        assert row["db_queries_avg"] == 2
+        assert row["db_p50_ms"] == pytest.approx(6.0)
+        assert row["cache_hit_rate"] == 0.5
+        assert row["bytes_avg"] > 0
+
+    def test_callback_keyed_by_output(self) -> None:
+        app, stats = _make_app()
+
+        app.test_client().post(
+            "/_dash-update-component",
+            json={"output": "overview-nation-win-chart.figure", "inputs": []},
+        )
+
+        assert [row["key"] for row in stats.snapshot()] == [
+            "callback overview-nation-win-chart.figure"
+        ]
+
+    def test_errors_counted(self) -> None:
+        app, stats = _make_app()
+        app.testing = False
+
+        assert app.test_client().get("/boom").status_code == 500
+
+        (row,) = stats.snapshot()
+        assert row["key"] == "GET /boom"
+        assert row["errors"] == 1
+
+    def test_reports_outside_request_ignored(self) -> None:
+        record_db_time(1.0)
+        record_cache_lookup(hit=True)  # Must not raise
+
+    def test_bytes_after_compression(self) -> None:
+        app = Flask(__name__)
+        app.route("/big")(lambda: jsonify({"data": [1.5] * 5000}))
+        stats = init_telemetry(app, enabled=True, window=10)
+        init_compression(app, level=6, min_size=1024)
+
+        response = app.test_client().get("/big", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert stats.snapshot()[0]["bytes_avg"] == len(response.data)
+
+
+class TestPerfEndpoint:
+    """/debug/perf"""
+
+    def test_reports_percentiles(self) -> None:
+        app, _ = _make_app()
+        client = app.test_client()
+        for match_id in range(20):
+            client.get(f"/api/map/turn-range/{match_id}")
+
+        report = client.get("/debug/perf").get_json()
+
+        (row,) = report["routes"]
+        assert row["count"] == 20
+        assert 0 < row["p50_ms"] <= row["p95_ms"] <= row["p99_ms"] <= row["max_ms"]
+        assert report["window"] == 100
+
+    def test_hidden_from_remote_clients(self) -> None:
+        app, _ = _make_app()
+
+        response = app.test_client().get(
+            "/debug/perf", environ_base={"REMOTE_ADDR": "66.241.125.158"}
+        )
+
+        assert response.status_code == 404
+
+    def test_reset(self) -> None:
+        app, stats = _make_app()
+        client = app.test_client()
+        client.get("/api/map/turn-range/1")
+
+        client.get("/debug/perf?reset=1")
+
+        assert stats.snapshot() == []
+
+    def test_disabled(self) -> None:
+        app = Flask(__name__)
+
+        assert init_telemetry(app, enabled=False) is None
+        assert app.test_client().get("/debug/perf").status_code == 404
+
+
+class TestJsonlSink:
+    """PERF_LOG_PATH output."""
+
+    def test_one_line_per_request(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "logs" / "perf.jsonl"
+        app, _ = _make_app(log_path=str(log_path))
+        client = app.test_client()
+
+        client.get("/api/map/turn-range/7")
+        client.post("/_dash-update-component", json={"output": "a.children"})
+
+        records = [json.loads(line) for line in log_path.read_text().splitlines()]
+        assert [r["key"] for r in records] == [
+            "GET /api/map/turn-range/<int:match_id>",
+            "callback a.children",
+        ]
+        assert records[0]["path"] == "/api/map/turn-range/7"
+        assert records[0]["status"] == 200
+        assert records[0]["db_queries"] == 2
+        assert {"ts", "pid", "ms", "db_ms", "bytes"} <= set(records[0])
+
+
+class TestPerfStats:
+    """Rolling windows and percentiles."""
+
+    def test_percentile_nearest_rank(self) -> None:
+        values = [float(v) for v in range(1, 101)]
+
+        assert percentile(values, 50) == 50
+        assert percentile(values, 95) == 95
+        assert percentile(values, 99) == 99
+        assert percentile([7.0], 99) == 7
+        assert percentile([], 50) == 0
+
+    def test_window_keeps_latest(self) -> None:
+        stats = PerfStats(window=3)
+        for ms in [100.0, 1.0, 2.0, 3.0]:
+            stats.add(RequestSample(key="GET /", path="/", ms=ms, status=200))
+
+        (row,) = stats.snapshot()
+        assert row["count"] == 4
+        assert row["window"] == 3
+        assert row["max_ms"] == 3.0
+
+    def test_window_aggregates_only_kept_samples(self) -> None:
+        stats = PerfStats(window=2)
+        for status, size in [(500, 9000), (200, 100), (502, 300)]:
+            stats.add(
+                RequestSample(
+                    key="GET /", path="/", status=status, bytes=size, db_queries=2
+                )
+            )
+
+        (row,) = stats.snapshot()
+        assert row["errors"] == 1
+        assert row["bytes_avg"] == 200
+        assert row["db_queries_avg"] == 2
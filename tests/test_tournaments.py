@@ -0,0 +1,171 @@
+"""Tests for per-tournament database partitions.
+
+Test Strategy:
+- Each database records the tournament it holds; initialize_database() stamps
+  the live one with TOURNAMENT and refuses a database of another tournament
+- Archiving publishes a marked copy of a closed database as the tournament's
+  partition; mismatched or invalid tournament identifiers are refused
+- Scoped queries open only their tournament's partition, lazily, and switch
+  to a re-archived generation (dropping cached results)
+- Unscoped and live-tournament queries keep using the global instance
+"""
+
+from pathlib import Path
+
+import pytest
+
+from scripts.bench_queries import generate_database
+from tournament_visualizer.config import Config
+from tournament_visualizer.data import etl, tournaments
+from tournament_visualizer.data.database import TournamentDatabase
+from tournament_visualizer.data.queries import (
+    TournamentQueries,
+    get_queries,
+    queries as global_queries,
+)
+from tournament_visualizer.data.tournaments import (
+    archive_tournament,
+    get_tournament_database,
+    list_tournaments,
+    partition_path,
+    validate_tournament_id,
+)
+
+
+def _match_count(queries: TournamentQueries) -> int:
+    with queries.db.get_connection() as conn:
+        return conn.execute("SELECT COUNT(*) FROM matches").fetchone()[0]
+
+
+@pytest.fixture
+def tournaments_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    directory = tmp_path / "tournaments"
+    monkeypatch.setattr(Config, "TOURNAMENT", "season3")
+    monkeypatch.setattr(Config, "TOURNAMENTS_DIRECTORY", str(directory))
+    monkeypatch.setattr(tournaments, "_partitions", {})
+    monkeypatch.setattr(tournaments, "_scoped_queries", {})
+    yield directory
+    tournaments.close_tournament_databases()
+
+
+@pytest.fixture
+def archived(tmp_path: Path, tournaments_dir: Path) -> dict[str, int]:
+    """Archive season1 with 2 matches and season2 with 3."""
+    sizes = {"season1": 2, "season2": 3}
+    for tournament, matches in sizes.items():
+        source = tmp_path / f"{tournament}-build.duckdb"
+        generate_database(source, matches=matches, seed=1, territory_matches=1)
+        archive_tournament(str(source), tournament)
+    return sizes
+
+
+class TestTournamentRecord:
+    """set_tournament() / get_tournament() and initialize_database()."""
+
+    def test_record_replaces_previous(self, tmp_path: Path) -> None:
+        db = TournamentDatabase(str(tmp_path / "t.duckdb"), read_only=False)
+        db.create_schema()
+        assert db.get_tournament() is None
+
+        db.set_tournament("season1")
+        db.set_tournament("season2", "Season Two", archived=True)
+
+        held = db.get_tournament()
+        assert held["tournament_id"] == "season2"
+        assert held["name"] == "Season Two"
+        assert held["archived_at"] is not None
+        db.close()
+
+    def test_initialize_stamps_and_checks_tournament(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(Config, "DATABASE_PATH", str(tmp_path / "live.duckdb"))
+        monkeypatch.setattr(Config, "TOURNAMENT", "season1")
+        db = etl.initialize_database()
+        assert db.get_tournament()["tournament_id"] == "season1"
+        db.close()
+
+        monkeypatch.setattr(Config, "TOURNAMENT", "season2")
+        with pytest.raises(ValueError, match="archive_tournament"):
+            etl.initialize_database()
+
+
+class TestArchive:
+    """archive_tournament() and the partition layout."""
+
+    def test_archives_and_lists(
+        self, archived: dict[str, int], tournaments_dir: Path
+    ) -> None:
+        assert list_tournaments() == ["season3", "season2", "season1"]
+        path = partition_path("season1")
+        assert path.parent == tournaments_dir / "season1"
+        assert partition_path("season3") is None
+        assert not list(tournaments_dir.glob("*/*.tmp"))
+
+        db = TournamentDatabase(str(path), read_only=True)
+        assert db.get_tournament()["archived_at"] is not None
+        db.close()
+
+    def test_refuses_other_tournament(
+        self, archived: dict[str, int], tournaments_dir: Path
+    ) -> None:
+        with pytest.raises(ValueError, match="holds tournament 'season1'"):
+            archive_tournament(str(partition_path("season1")), "season2")
+
+    @pytest.mark.parametrize("tournament", ["", "../live", "a/b", "-x", "s 1"])
+    def test_rejects_invalid_identifier(self, tournament: str) -> None:
+        with pytest.raises(ValueError, match="Invalid tournament identifier"):
+            validate_tournament_id(tournament)
+
+
+class TestScopedQueries:
+    """TournamentQueries scoped to a tournament."""
+
+    def test_live_tournament_uses_global_instance(
+        self, tournaments_dir: Path
+    ) -> None:
+        assert get_queries() is global_queries
+        assert get_queries("season3") is global_queries
+        assert global_queries.tournament == "season3"
+
+    def test_scoped_queries_touch_only_their_partition(
+        self, archived: dict[str, int]
+    ) -> None:
+        assert tournaments._partitions == {}
+
+        season1 = get_queries("season1")
+
+        assert set(tournaments._partitions) == {"season1"}
+        assert season1.tournament == "season1"
+        assert season1.db.read_only
+        assert _match_count(season1) == archived["season1"]
+        assert get_queries("season1") is season1
+        assert _match_count(get_queries("season2")) == archived["season2"]
+
+    def test_constructor_scope(self, archived: dict[str, int]) -> None:
+        queries = TournamentQueries(tournament="season2")
+
+        assert queries.db is get_tournament_database("season2")
+        assert _match_count(queries) == archived["season2"]
+
+    def test_unknown_tournament(self, tournaments_dir: Path) -> None:
+        with pytest.raises(ValueError, match="not archived"):
+            get_queries("season0")
+
+    def test_rearchived_partition_is_reopened(
+        self, archived: dict[str, int], tmp_path: Path
+    ) -> None:
+        season1 = get_queries("season1")
+        db = season1.db
+        assert _match_count(season1) == 2
+        generation = season1.generation
+
+        source = tmp_path / "season1-rebuild.duckdb"
+        generate_database(source, matches=4, seed=2, territory_matches=1)
+        archive_tournament(str(source), "season1")
+
+        assert get_queries("season1") is season1
+        assert season1.db is db
+        assert _match_count(season1) == 4
+        assert season1.generation == generation + 1
+        assert len(list(partition_path("season1").parent.glob("*.duckdb"))) == 1
@@ -17,6 +17,7 @@ from tournament_visualizer.api import map_api
 from tournament_visualizer.config import get_family_class
 from tournament_visualizer.data.queries import get_queries
 from tournament_visualizer.nation_colors import get_nation_map_color
+from tournament_visualizer.static_assets import sprite_atlas_urls
 
 logger = logging.getLogger(__name__)
 
@@ -86,6 +87,7 @@ def map_viewer(match_id: int) -> str:
         match_id=match_id,
         match_title=match_title,
         error=None,
+        sprite_atlases=sprite_atlas_urls(),
     )
 
 
@@ -20,6 +20,7 @@ from dash import Input, Output, callback, dcc, html
 
 from tournament_visualizer.config import get_config, validate_config
 from tournament_visualizer.data.database import get_database
+from tournament_visualizer.data.tournaments import close_tournament_databases
 
 
 def setup_logging() -> str:
@@ -343,6 +344,7 @@ def cleanup_resources() -> None:
     try:
         db = get_database()
         db.close()
+        close_tournament_databases()
         logger.info("Database connections cleaned up")
     except Exception as e:
         logger.error(f"Error during cleanup: {e}")
@@ -419,12 +421,42 @@ def create_production_server():
 # Export the server for WSGI deployment
 server = app.server
 
+# Time requests per route and per callback. Registered before compression so
+# its after_request hook runs last and sees the compressed size.
+from tournament_visualizer.telemetry import init_telemetry
+
+init_telemetry(server)
+
+# Compress callback, API and bundle responses
+from tournament_visualizer.compression import init_compression
+
+init_compression(server)
+
+# Serve fingerprinted icons, sprites and atlases with immutable caching
+from tournament_visualizer.static_assets import init_static_assets
+
+init_static_assets(server)
+
 # Register Flask blueprints for API routes
 from tournament_visualizer.api import map_api
 
 server.register_blueprint(map_api)
 logger.info("Registered map_api blueprint")
 
+# Serve the published snapshot, if any, and switch to newer ones between
+# requests
+from tournament_visualizer.data_refresh import init_data_refresh
+
+init_data_refresh(server)
+
+# Serve the default overview state from results precomputed at import time
+from tournament_visualizer.precompute import pin_overview_artifact
+
+try:
+    pin_overview_artifact()
+except Exception as e:
+    logger.warning(f"Precomputed overview results not loaded: {e}")
+
 
 # Health check endpoint for Fly.io and other platforms
 @server.route("/health")
@@ -0,0 +1,45 @@
+/*
+ * Incremental loading for the match Timeline tab.
+ *
+ * The game state table renders its first window of turns; the remaining
+ * turns are appended by the load_more_game_state_turns callback when the
+ * "Show more turns" button is clicked. This clicks the button as soon as it
+ * scrolls near the viewport, so further turns load while scrolling.
+ */
+(function () {
+    "use strict";
+
+    var BUTTON_ID = "game-state-load-more";
+    var observed = null;
+    var observedLabel = null;
+
+    var observer = new IntersectionObserver(
+        function (entries) {
+            entries.forEach(function (entry) {
+                if (entry.isIntersecting && entry.target.style.display !== "none") {
+                    entry.target.click();
+                }
+            });
+        },
+        { rootMargin: "400px 0px" }
+    );
+
+    // Dash renders the table asynchronously, so watch for the button to
+    // appear. Its label changes after every appended window; observing it
+    // again re-checks visibility in case the new rows did not fill the view.
+    new MutationObserver(function () {
+        var button = document.getElementById(BUTTON_ID);
+        var label = button ? button.textContent : null;
+        if (button === observed && label === observedLabel) {
+            return;
+        }
+        if (observed) {
+            observer.unobserve(observed);
+        }
+        if (button) {
+            observer.observe(button);
+        }
+        observed = button;
+        observedLabel = label;
+    }).observe(document.body, { childList: true, subtree: true, characterData: true });
+})();
@@ -0,0 +1,319 @@
+"""Cache of serialized Plotly figures for chart callbacks.
+
+Query results are already cached by TournamentQueries, but rebuilding the
+go.Figure objects and serializing them still dominates callback time for the
+overview tabs. This module caches the serialized figure JSON keyed by the
+callback name, its inputs and the query cache generation, so a repeat view of
+a filter state skips both the queries and Plotly.
+
+The generation is bumped by TournamentQueries.invalidate_caches(), which the
+ETL calls after every import, so figures never outlive the data they show.
+
+Results for a page's default filter state can also be precomputed after an
+import and stored in the database (see tournament_visualizer/precompute.py).
+The server pins those entries at startup so the landing page never waits on
+queries or Plotly.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import dash
+from dash.development.base_component import Component
+from plotly import graph_objects as go
+from plotly.io.json import to_json_plotly
+
+from ..config import Config
+from ..data.queries import get_queries
+from ..telemetry import record_cache_lookup
+
+logger = logging.getLogger(__name__)
+
+
+class FigureCache:
+    """Thread-safe LRU cache of serialized figures with a TTL.
+
+    Pinned entries (loaded from a precomputed artifact) never expire and are
+    not counted against max_entries.
+    """
+
+    def __init__(self, max_entries: int, ttl: float) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached callback results
+            ttl: Seconds before an entry expires (0 disables the cache)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # key -> (timestamp, returned a tuple, serialized figures)
+        self._entries: OrderedDict[str, Tuple[float, bool, List[str]]] = OrderedDict()
+        self._pinned: Dict[str, Tuple[bool, List[str]]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Tuple[bool, List[str]]]:
+        """Return (is_tuple, serialized figures) for a key, or None if expired."""
+        with self._lock:
+            pinned = self._pinned.get(key)
+            if pinned is not None:
+                self.hits += 1
+                record_cache_lookup(hit=True)
+                return pinned
+            if self.ttl == 0:
+                return None
+            entry = self._entries.get(key)
+            if entry is not None:
+                cached_time, is_tuple, figures = entry
+                if time.time() - cached_time < self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    record_cache_lookup(hit=True)
+                    return is_tuple, figures
+                del self._entries[key]
+            self.misses += 1
+        record_cache_lookup(hit=False)
+        return None
+
+    def set(self, key: str, is_tuple: bool, figures: List[str]) -> None:
+        """Store serialized figures, evicting the least recently used entry."""
+        if self.ttl == 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.time(), is_tuple, figures)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def pin(self, entries: Dict[str, Tuple[bool, List[str]]]) -> None:
+        """Replace the pinned entries."""
+        with self._lock:
+            self._pinned = dict(entries)
+
+    def clear(self) -> None:
+        """Remove all cached and pinned figures."""
+        with self._lock:
+            self._entries.clear()
+            self._pinned.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._pinned)
+
+
+# Global figure cache instance
+figure_cache = FigureCache(
+    max_entries=Config.FIGURE_CACHE_SIZE, ttl=float(Config.CACHE_TIMEOUT)
+)
+
+
+def make_figure_cache_key(name: str, generation: int, inputs: Dict[str, Any]) -> str:
+    """Build a deterministic key from chart name, inputs and data generation."""
+    raw = json.dumps(
+        {"n": name, "g": generation, "i": inputs}, sort_keys=True, default=str
+    )
+    return f"{name}:{hashlib.md5(raw.encode()).hexdigest()}"
+
+
+def _is_error_figure(figure: Any) -> bool:
+    """Whether a figure is an error placeholder that should not be cached."""
+    if not isinstance(figure, go.Figure):
+        return False
+    return any(
+        str(annotation.text or "").startswith("Error")
+        for annotation in figure.layout.annotations
+    )
+
+
+def _serialize(outputs: Tuple[Any, ...]) -> Optional[List[str]]:
+    """Serialize callback outputs, or return None if any is not cacheable.
+
+    Figures, non-empty table data (lists of rows) and integers (e.g. a
+    server-side paged table's page_count) are cacheable. Empty lists are
+    skipped because callbacks also return them on errors.
+    """
+    serialized = []
+    for output in outputs:
+        if isinstance(output, list):
+            if not output:
+                return None
+        elif isinstance(output, int) and not isinstance(output, bool):
+            pass
+        elif not isinstance(output, (go.Figure, dict)) or _is_error_figure(output):
+            return None
+        serialized.append(to_json_plotly(output))
+    return serialized
+
+
+def cached_figures(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Cache the figures returned by a chart callback or builder.
+
+    Works for functions returning a single figure or a tuple of figures (or
+    DataTable row lists). On a hit the figures are returned as plain dicts,
+    which Dash accepts for the ``figure`` property. Results containing error
+    placeholders or non-figure values (e.g. ``dash.no_update``) are not
+    cached, and exceptions such as PreventUpdate propagate untouched.
+
+    Args:
+        name: Unique name of the chart or callback, used in the cache key
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(func)
+
+        def bind_inputs(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+            # Bind so positional and keyword calls produce the same key
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return dict(bound.arguments)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = make_figure_cache_key(
+                name, get_queries().generation, bind_inputs(*args, **kwargs)
+            )
+            cached = figure_cache.get(key)
+            if cached is not None:
+                is_tuple, serialized = cached
+                figures = tuple(json.loads(figure) for figure in serialized)
+                return figures if is_tuple else figures[0]
+
+            result = func(*args, **kwargs)
+            is_tuple = isinstance(result, tuple)
+            serialized = _serialize(result if is_tuple else (result,))
+            if serialized is not None:
+                figure_cache.set(key, is_tuple, serialized)
+            return result
+
+        wrapper.figure_cache_name = name  # type: ignore[attr-defined]
+        wrapper.figure_cache_inputs = bind_inputs  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+def layout_defaults(layout: Component) -> Dict[Tuple[str, str], Any]:
+    """Collect the initial value of every property set on components with an id.
+
+    Args:
+        layout: Root component of a page layout
+
+    Returns:
+        Mapping of (component id, property) to its initial value
+    """
+    defaults: Dict[Tuple[str, str], Any] = {}
+    for component in [layout, *layout._traverse()]:
+        component_id = getattr(component, "id", None)
+        if not isinstance(component_id, str):
+            continue
+        for prop in component._prop_names:
+            if prop != "children" and hasattr(component, prop):
+                defaults[(component_id, prop)] = getattr(component, prop)
+    return defaults
+
+
+def _tab_ids(layout: Component, tabs_id: str) -> List[str]:
+    """Return the tab_id of every tab inside the Tabs component tabs_id."""
+    for component in layout._traverse():
+        if getattr(component, "id", None) == tabs_id:
+            return [
+                child.tab_id
+                for child in component._traverse()
+                if isinstance(getattr(child, "tab_id", None), str)
+            ]
+    return []
+
+
+def precompute_default_figures(layout: Component, prefix: str) -> List[Dict[str, Any]]:
+    """Run every cached callback of a page with the layout's initial inputs.
+
+    Callbacks gated on an ``active_tab`` input raise PreventUpdate for every
+    tab but their own, so each tab is tried until one produces output. Only
+    callbacks registered with a name starting with ``prefix`` are run.
+
+    Args:
+        layout: Page layout providing the initial input values
+        prefix: Cache name prefix of the page's callbacks (e.g. "overview.")
+
+    Returns:
+        Artifact entries with the callback name, bound inputs and outputs
+    """
+    from dash._callback import GLOBAL_CALLBACK_MAP
+
+    defaults = layout_defaults(layout)
+    entries: List[Dict[str, Any]] = []
+
+    for registered in GLOBAL_CALLBACK_MAP.values():
+        # Clientside callbacks have no server function
+        name = getattr(registered.get("callback"), "figure_cache_name", "")
+        if not name.startswith(prefix):
+            continue
+        func = registered["callback"].__wrapped__
+
+        inputs = registered["inputs"] + registered["state"]
+        args = [defaults.get((item["id"], item["property"])) for item in inputs]
+        tab_positions = [
+            i for i, item in enumerate(inputs) if item["property"] == "active_tab"
+        ]
+        candidates: List[List[Any]] = [args]
+        for position in tab_positions:
+            for tab_id in _tab_ids(layout, inputs[position]["id"]):
+                candidates.append([*args[:position], tab_id, *args[position + 1 :]])
+
+        for candidate in candidates:
+            try:
+                result = func(*candidate)
+            except dash.exceptions.PreventUpdate:
+                continue
+            except Exception as e:
+                logger.warning(f"Could not precompute {name}: {e}")
+                break
+
+            is_tuple = isinstance(result, tuple)
+            serialized = _serialize(result if is_tuple else (result,))
+            if serialized is not None:
+                entries.append(
+                    {
+                        "name": name,
+                        "inputs": func.figure_cache_inputs(*candidate),
+                        "tuple": is_tuple,
+                        "outputs": serialized,
+                    }
+                )
+            break
+
+    return entries
+
+
+def pin_precomputed_figures(
+    entries: List[Dict[str, Any]], cache: Optional[FigureCache] = None
+) -> int:
+    """Pin precomputed callback results so they are served without recomputing.
+
+    Keys embed the live generation, so pins stop matching as soon as
+    invalidate_caches() is called.
+
+    Args:
+        entries: Entries from precompute_default_figures
+        cache: Cache to pin into (defaults to the global figure cache)
+
+    Returns:
+        Number of pinned entries
+    """
+    generation = get_queries().generation
+    pinned = {
+        make_figure_cache_key(entry["name"], generation, entry["inputs"]): (
+            entry["tuple"],
+            entry["outputs"],
+        )
+        for entry in entries
+    }
+    (cache or figure_cache).pin(pinned)
+    return len(pinned)
@@ -5,11 +5,11 @@ between two players, including events, orders, and winner indicators.
 """
 
 import re
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 import dash_bootstrap_components as dbc
-from dash import html
+from dash import dcc, html
 
 from tournament_visualizer.components.layouts import create_empty_state
 from tournament_visualizer.data.game_constants import (
@@ -22,6 +22,7 @@ from tournament_visualizer.data.game_constants import (
     FAMILY_TO_ARCHETYPE,
     EVENT_FILTER_CATEGORIES,
 )
+from tournament_visualizer.static_assets import asset_icon, asset_url
 
 
 # Yield icon paths
@@ -54,6 +55,48 @@ THEOLOGY_ICONS = {
 }
 
 
+# Ids of the windowed Timeline table. Only the first window of turns is
+# rendered with the table; further turns are appended to the rows container
+# when the load-more button scrolls into view (assets/timeline_scroll.js).
+GAME_STATE_ROWS_ID = "game-state-rows"
+GAME_STATE_WINDOW_ID = "game-state-window"
+GAME_STATE_MORE_ID = "game-state-load-more"
+
+# Table styles - base row style (alternating colors applied per row)
+_ROW_STYLE = {
+    "display": "flex",
+    "flexDirection": "row",
+    "borderBottom": "1px solid var(--bs-border-color)",
+    "minHeight": "32px",
+    "width": "100%",
+    "alignItems": "center",
+}
+_ROW_COLOR_EVEN = "#0e1b2e"
+_ROW_COLOR_ODD = "#132337"
+
+# Column styles - 7 columns (Turn, P1 Events, 4x Comparisons, P2 Events)
+_TURN_COL_STYLE = {
+    "flex": "0 0 50px",
+    "width": "50px",
+    "textAlign": "center",
+    "fontWeight": "bold",
+    "padding": "6px 4px",
+    "color": "#edf1f6",
+}
+
+_EVENTS_COL_STYLE = {
+    "flex": "1 1 22%",
+    "padding": "6px 8px",
+    "color": "#edf2f7",
+}
+
+_COMPARISON_COL_STYLE = {
+    "flex": "0 0 44px",
+    "width": "44px",
+    "padding": "4px 2px",
+}
+
+
 def _create_styled_tooltip(text: str) -> html.Div:
     """Create a styled tooltip element.
 
@@ -91,8 +134,8 @@ def _create_colored_crest(
             "width": size,
             "height": size,
             "backgroundColor": color,
-            "maskImage": f"url({crest_path})",
-            "WebkitMaskImage": f"url({crest_path})",
+            "maskImage": f"url({asset_url(crest_path)})",
+            "WebkitMaskImage": f"url({asset_url(crest_path)})",
             "maskSize": "contain",
             "WebkitMaskSize": "contain",
             "maskRepeat": "no-repeat",
@@ -322,6 +365,7 @@ def create_game_state_component(
     show_text: bool = False,
     show_metrics: bool = True,
     enabled_categories: Optional[list[str]] = None,
+    turn_window: Optional[int] = None,
 ) -> html.Div:
     """Create game state comparison table.
 
@@ -343,6 +387,10 @@ def create_game_state_component(
         player2_civilization: Civilization name for player 2 (for crest icon)
         show_text: Whether to show text labels next to event icons (default False)
         show_metrics: Whether to show the center comparison columns (default True)
+        enabled_categories: Event filter categories to show (default all)
+        turn_window: Number of turns to render initially; the remaining turns
+            are loaded by create_game_state_rows() as the user scrolls. None
+            renders every turn.
 
     Returns:
         Dash HTML component with comparison table
@@ -354,58 +402,24 @@ def create_game_state_component(
             icon="bi-bar-chart",
         )
 
-    # Filter events by enabled categories
-    if enabled_categories is not None and not events_df.empty:
-        # Build list of enabled event types from categories
-        enabled_event_types = set()
-        for category in enabled_categories:
-            if category in EVENT_FILTER_CATEGORIES:
-                enabled_event_types.update(EVENT_FILTER_CATEGORIES[category])
-
-        # Filter events to only include enabled event types
-        events_df = events_df[events_df["event_type"].isin(enabled_event_types)]
-
-    # Get nation crest paths for winner indicators
-    p1_crest = get_nation_crest_icon_path(player1_civilization)
-    p2_crest = get_nation_crest_icon_path(player2_civilization)
-
-    # Common styles - base row style (alternating colors applied in loop)
-    row_style_base = {
-        "display": "flex",
-        "flexDirection": "row",
-        "borderBottom": "1px solid var(--bs-border-color)",
-        "minHeight": "32px",
-        "width": "100%",
-        "alignItems": "center",
-    }
-    row_color_even = "#0e1b2e"
-    row_color_odd = "#132337"
-
-    # Column styles - 7 columns (Turn, P1 Events, 4x Comparisons, P2 Events)
-    turn_col_style = {
-        "flex": "0 0 50px",
-        "width": "50px",
-        "textAlign": "center",
-        "fontWeight": "bold",
-        "padding": "6px 4px",
-        "color": "#edf1f6",
-    }
-
-    events_col_style = {
-        "flex": "1 1 22%",
-        "padding": "6px 8px",
-        "color": "#edf2f7",
-    }
-
-    comparison_col_style = {
-        "flex": "0 0 44px",
-        "width": "44px",
-        "padding": "4px 2px",
+    # Row arguments, kept with the table so later windows render identically
+    row_args = {
+        "player1_name": player1_name,
+        "player2_name": player2_name,
+        "player1_id": int(player1_id),
+        "player2_id": int(player2_id),
+        "player1_color": player1_color,
+        "player2_color": player2_color,
+        "player1_civilization": player1_civilization,
+        "player2_civilization": player2_civilization,
+        "show_text": show_text,
+        "show_metrics": show_metrics,
+        "enabled_categories": enabled_categories,
     }
 
     # Header comparison column style (shared)
     header_comparison_style = {
-        **comparison_col_style,
+        **_COMPARISON_COL_STYLE,
         "fontSize": "0.7rem",
         "fontWeight": "bold",
         "textAlign": "center",
@@ -422,13 +436,13 @@ def create_game_state_component(
 
     if show_metrics:
         # Turn on left when metrics enabled
-        header_children.append(html.Div("Turn", style=turn_col_style))
+        header_children.append(html.Div("Turn", style=_TURN_COL_STYLE))
 
     header_children.append(
         html.Div(
             player1_name,
             style={
-                **events_col_style,
+                **_EVENTS_COL_STYLE,
                 "textAlign": "right",
                 "fontWeight": "bold",
             },
@@ -443,8 +457,8 @@ def create_game_state_component(
                     [
                         html.Span(
                             [
-                                html.Img(
-                                    src=YIELD_ORDERS_ICON,
+                                asset_icon(
+                                    YIELD_ORDERS_ICON,
                                     style={
                                         "width": "14px",
                                         "height": "14px",
@@ -463,8 +477,8 @@ def create_game_state_component(
                     [
                         html.Span(
                             [
-                                html.Img(
-                                    src=YIELD_TRAINING_ICON,
+                                asset_icon(
+                                    YIELD_TRAINING_ICON,
                                     style={
                                         "width": "14px",
                                         "height": "14px",
@@ -483,8 +497,8 @@ def create_game_state_component(
                     [
                         html.Span(
                             [
-                                html.Img(
-                                    src=YIELD_SCIENCE_ICON,
+                                asset_icon(
+                                    YIELD_SCIENCE_ICON,
                                     style={
                                         "width": "14px",
                                         "height": "14px",
@@ -503,8 +517,8 @@ def create_game_state_component(
                     [
                         html.Span(
                             [
-                                html.Img(
-                                    src=YIELD_VP_ICON,
+                                asset_icon(
+                                    YIELD_VP_ICON,
                                     style={
                                         "width": "14px",
                                         "height": "14px",
@@ -523,13 +537,13 @@ def create_game_state_component(
         )
     else:
         # Turn in center when metrics disabled
-        header_children.append(html.Div("Turn", style=turn_col_style))
+        header_children.append(html.Div("Turn", style=_TURN_COL_STYLE))
 
     header_children.append(
         html.Div(
             player2_name,
             style={
-                **events_col_style,
+                **_EVENTS_COL_STYLE,
                 "textAlign": "left",
                 "fontWeight": "bold",
             },
@@ -600,8 +614,129 @@ def create_game_state_component(
         className="game-state-header",
     )
 
-    # Build data rows - include all turns from both comparison and events
-    data_rows = [header_row]
+    data_rows, total_turns = create_game_state_rows(
+        comparison_df, events_df, count=turn_window, **row_args
+    )
+    children = [header_row, html.Div(data_rows, id=GAME_STATE_ROWS_ID)]
+
+    if len(data_rows) < total_turns:
+        children.extend(
+            [
+                dcc.Store(
+                    id=GAME_STATE_WINDOW_ID,
+                    data={"rendered": len(data_rows), "row_args": row_args},
+                ),
+                html.Button(
+                    load_more_label(len(data_rows), total_turns),
+                    id=GAME_STATE_MORE_ID,
+                    className="btn btn-outline-secondary btn-sm w-100 my-2",
+                ),
+            ]
+        )
+
+    return html.Div(
+        children,
+        className="game-state-container",
+    )
+
+
+def load_more_label(rendered: int, total_turns: int) -> str:
+    """Label of the load-more button below a partially rendered table."""
+    return f"Show more turns ({rendered} of {total_turns})"
+
+
+def _filter_events_by_category(
+    events_df: pd.DataFrame, enabled_categories: Optional[list[str]]
+) -> pd.DataFrame:
+    """Keep only events whose type belongs to an enabled filter category."""
+    if enabled_categories is None or events_df.empty:
+        return events_df
+
+    enabled_event_types = set()
+    for category in enabled_categories:
+        if category in EVENT_FILTER_CATEGORIES:
+            enabled_event_types.update(EVENT_FILTER_CATEGORIES[category])
+
+    return events_df[events_df["event_type"].isin(enabled_event_types)]
+
+
+def _event_records_by_turn(
+    events_df: pd.DataFrame, player_ids: Tuple[int, int]
+) -> Dict[Tuple[int, int], List[Dict[str, Any]]]:
+    """Group event records by (turn, player_id) with running city counts.
+
+    City and capital events get the player's running city count and the
+    running count for the founding family. The counts are taken over the
+    whole match, so a turn window shows the same numbers as a full render.
+
+    Args:
+        events_df: DataFrame from get_match_timeline_events()
+        player_ids: Database player IDs of the two table columns
+
+    Returns:
+        Dict mapping (turn, player_id) to event records in display order
+    """
+    if events_df.empty:
+        return {}
+
+    events = events_df[events_df["player_id"].isin(player_ids)].sort_values(
+        "turn", kind="stable"
+    )
+    # NULL DB values come back as NaN, not ""
+    events = events.assign(
+        title=events["title"].fillna(""), details=events["details"].fillna("")
+    )
+
+    cities = events[
+        events["event_type"].isin(["city", "capital"]) & (events["details"] != "")
+    ]
+    family_counts = cities.groupby(["player_id", "details"]).cumcount() + 1
+    total_counts = cities.groupby("player_id").cumcount() + 1
+
+    grouped: Dict[Tuple[int, int], List[Dict[str, Any]]] = {}
+    for index, record in zip(events.index, events.to_dict("records")):
+        record["family_count"] = (
+            int(family_counts[index]) if index in family_counts.index else None
+        )
+        record["total_count"] = (
+            int(total_counts[index]) if index in total_counts.index else None
+        )
+        grouped.setdefault((record["turn"], record["player_id"]), []).append(record)
+    return grouped
+
+
+def create_game_state_rows(
+    comparison_df: pd.DataFrame,
+    events_df: pd.DataFrame,
+    player1_name: str,
+    player2_name: str,
+    player1_id: int,
+    player2_id: int,
+    player1_color: str = "#4dabf7",
+    player2_color: str = "#ff6b6b",
+    player1_civilization: str = "",
+    player2_civilization: str = "",
+    show_text: bool = False,
+    show_metrics: bool = True,
+    enabled_categories: Optional[list[str]] = None,
+    start: int = 0,
+    count: Optional[int] = None,
+) -> Tuple[list, int]:
+    """Create the data rows of the game state table for a window of turns.
+
+    Rows include every turn that has comparison data or events.
+
+    Args:
+        comparison_df: DataFrame from get_match_turn_comparisons()
+        events_df: DataFrame from get_match_timeline_events()
+        player1_name .. enabled_categories: As for create_game_state_component()
+        start: Index of the first turn to render
+        count: Number of turns to render (None for all remaining turns)
+
+    Returns:
+        Tuple of (row components, total number of turns in the table)
+    """
+    events_df = _filter_events_by_category(events_df, enabled_categories)
 
     # Get all unique turns from comparison and events
     comparison_turns = (
@@ -609,47 +744,27 @@ def create_game_state_component(
     )
     event_turns = set(events_df["turn"].tolist()) if not events_df.empty else set()
     all_turns = sorted(comparison_turns | event_turns)
+    window = all_turns[start:] if count is None else all_turns[start : start + count]
 
     # Create lookup for comparison data
-    comparison_by_turn = (
-        {int(row["turn_number"]): row for _, row in comparison_df.iterrows()}
-        if not comparison_df.empty
-        else {}
-    )
+    comparison_by_turn = {
+        int(row["turn_number"]): row for row in comparison_df.to_dict("records")
+    }
+    events_by_turn = _event_records_by_turn(events_df, (player1_id, player2_id))
 
-    # Track city counts: family counts and total counts per player
-    family_city_counts: Dict[
-        Tuple[int, str], int
-    ] = {}  # (player_id, family_name) -> count
-    player_city_counts: Dict[int, int] = {}  # player_id -> total count
-
-    for row_idx, turn in enumerate(all_turns):
-        # Get events for this turn
-        turn_events = (
-            events_df[events_df["turn"] == turn]
-            if not events_df.empty
-            else pd.DataFrame()
-        )
-        p1_events = (
-            turn_events[turn_events["player_id"] == player1_id]
-            if not turn_events.empty
-            else pd.DataFrame()
-        )
-        p2_events = (
-            turn_events[turn_events["player_id"] == player2_id]
-            if not turn_events.empty
-            else pd.DataFrame()
-        )
+    # Get nation crest paths for winner indicators
+    p1_crest = get_nation_crest_icon_path(player1_civilization)
+    p2_crest = get_nation_crest_icon_path(player2_civilization)
 
-        # Build event icons (with city count tracking)
+    data_rows = []
+    for row_idx, turn in enumerate(window, start=start):
         p1_icons = _build_event_icons(
-            p1_events, player1_id, family_city_counts, player_city_counts, show_text
+            events_by_turn.get((turn, player1_id), []), show_text
         )
         p2_icons = _build_event_icons(
-            p2_events, player2_id, family_city_counts, player_city_counts, show_text
+            events_by_turn.get((turn, player2_id), []), show_text
         )
 
-        # Get comparison data if available
         comp_row = comparison_by_turn.get(turn)
 
         if comp_row is not None:
@@ -745,12 +860,12 @@ def create_game_state_component(
 
         if show_metrics:
             # Turn on left when metrics enabled
-            row_children.append(html.Div(str(turn), style=turn_col_style))
+            row_children.append(html.Div(str(turn), style=_TURN_COL_STYLE))
 
         row_children.append(
             html.Div(
                 p1_icons,
-                style={**events_col_style, "textAlign": "right"},
+                style={**_EVENTS_COL_STYLE, "textAlign": "right"},
             ),
         )
 
@@ -758,26 +873,26 @@ def create_game_state_component(
             # All 4 metrics
             row_children.extend(
                 [
-                    html.Div(ord_indicator, style=comparison_col_style),
-                    html.Div(mil_indicator, style=comparison_col_style),
-                    html.Div(sci_indicator, style=comparison_col_style),
-                    html.Div(vp_indicator, style=comparison_col_style),
+                    html.Div(ord_indicator, style=_COMPARISON_COL_STYLE),
+                    html.Div(mil_indicator, style=_COMPARISON_COL_STYLE),
+                    html.Div(sci_indicator, style=_COMPARISON_COL_STYLE),
+                    html.Div(vp_indicator, style=_COMPARISON_COL_STYLE),
                 ]
             )
         else:
             # Turn in center when metrics disabled
-            row_children.append(html.Div(str(turn), style=turn_col_style))
+            row_children.append(html.Div(str(turn), style=_TURN_COL_STYLE))
 
         row_children.append(
             html.Div(
                 p2_icons,
-                style={**events_col_style, "textAlign": "left"},
+                style={**_EVENTS_COL_STYLE, "textAlign": "left"},
             ),
         )
 
         # Apply alternating row colors
-        row_bg = row_color_even if row_idx % 2 == 0 else row_color_odd
-        row_style = {**row_style_base, "backgroundColor": row_bg}
+        row_bg = _ROW_COLOR_EVEN if row_idx % 2 == 0 else _ROW_COLOR_ODD
+        row_style = {**_ROW_STYLE, "backgroundColor": row_bg}
 
         data_row = html.Div(
             row_children,
@@ -786,66 +901,35 @@ def create_game_state_component(
         )
         data_rows.append(data_row)
 
-    return html.Div(
-        data_rows,
-        className="game-state-container",
-    )
+    return data_rows, len(all_turns)
 
 
 def _build_event_icons(
-    events_df: pd.DataFrame,
-    player_id: int,
-    family_city_counts: Dict[Tuple[int, str], int],
-    player_city_counts: Dict[int, int],
+    events: List[Dict[str, Any]],
     show_text: bool = False,
 ) -> list:
-    """Build compact icon list from events DataFrame.
+    """Build compact icon list from event records.
 
     Args:
-        events_df: DataFrame with event data for one player on one turn
-        player_id: Database player ID for tracking cities
-        family_city_counts: Dict tracking (player_id, family_name) -> count
-            This is mutated to track running counts across turns.
-        player_city_counts: Dict tracking player_id -> total city count
-            This is mutated to track running counts across turns.
+        events: Event records for one player on one turn, as produced by
+            _event_records_by_turn() (with family_count and total_count)
         show_text: Whether to show text labels next to icons
 
     Returns:
         List of HTML elements (icons with tooltips)
     """
-    if events_df.empty:
-        return []
-
-    icons = []
-    for _, event in events_df.iterrows():
-        event_type = event.get("event_type", "")
-        title = event.get("title", "")
-        details = event.get("details", "")
-        icon_emoji = event.get("icon", "")
-
-        # Guard against NaN from pandas (NULL DB values return NaN, not "")
-        if pd.isna(title):
-            title = ""
-        if pd.isna(details):
-            details = ""
-
-        # Track city counts for city/capital events
-        family_count = None
-        total_count = None
-        if event_type in ("city", "capital") and details:
-            family_name = details  # details contains family_name
-            key = (player_id, family_name)
-            family_city_counts[key] = family_city_counts.get(key, 0) + 1
-            family_count = family_city_counts[key]
-            player_city_counts[player_id] = player_city_counts.get(player_id, 0) + 1
-            total_count = player_city_counts[player_id]
-
-        icon_element = _create_event_icon(
-            event_type, title, icon_emoji, details, family_count, total_count, show_text
+    return [
+        _create_event_icon(
+            event.get("event_type", ""),
+            event["title"],
+            event.get("icon", ""),
+            event["details"],
+            event["family_count"],
+            event["total_count"],
+            show_text,
         )
-        icons.append(icon_element)
-
-    return icons
+        for event in events
+    ]
 
 
 def _create_city_event_icons(
@@ -936,7 +1020,7 @@ def _create_city_event_icons(
     children = []
 
     # City founded icon with total count badge
-    city_img = html.Img(src=CITY_FOUNDED_ICON, style=icon_style)
+    city_img = asset_icon(CITY_FOUNDED_ICON, icon_style)
     city_badge = None
     if total_count is not None:
         city_badge = html.Span(
@@ -951,7 +1035,7 @@ def _create_city_event_icons(
 
     # Family crest icon with family count badge
     if family_icon_path:
-        family_img = html.Img(src=family_icon_path, style=icon_style)
+        family_img = asset_icon(family_icon_path, icon_style)
         family_badge = None
         if family_count is not None:
             family_badge = html.Span(
@@ -1156,11 +1240,11 @@ def _create_event_icon(
     }
 
     if icon_path:
-        img_element = html.Img(
-            src=icon_path,
-            className="game-state-icon",
+        img_element = asset_icon(
+            icon_path,
+            icon_style,
             title=tooltip,
-            style=icon_style,
+            className="game-state-icon",
         )
 
         # Add corner badge if specified
@@ -198,6 +198,7 @@ def create_data_table_card(
     table_id: str,
     columns: List[Dict[str, str]],
     export_button: bool = True,
+    server_side: bool = False,
 ) -> dbc.Card:
     """Create a card containing a data table.
 
@@ -206,12 +207,22 @@ def create_data_table_card(
         table_id: ID for the table component
         columns: Table column definitions
         export_button: Whether to include export button
+        server_side: Page, sort and filter in callbacks instead of the browser.
+            The table's callback must also set page_count (see
+            tournament_visualizer/data/table_paging.py).
 
     Returns:
         Card component with data table
     """
     from dash import dash_table
 
+    action = "custom" if server_side else "native"
+    server_side_props: Dict[str, Any] = (
+        {"page_current": 0, "page_count": 1, "sort_by": [], "filter_query": ""}
+        if server_side
+        else {}
+    )
+
     # Build header section with title and/or export button
     header_section = []
     if title or export_button:
@@ -245,11 +256,12 @@ def create_data_table_card(
                         id=table_id,
                         columns=columns,
                         data=[],
-                        sort_action="native",
-                        filter_action="native",
+                        sort_action=action,
+                        filter_action=action,
                         filter_options={"case": "insensitive"},
-                        page_action="native",
+                        page_action=action,
                         page_size=LAYOUT_CONSTANTS["TABLE_PAGE_SIZE"],
+                        **server_side_props,
                         style_table={
                             "backgroundColor": DARK_THEME["bg_dark"],
                         },
@@ -14,6 +14,7 @@ from dash import dcc, html
 
 from tournament_visualizer.components.layouts import create_empty_state
 from tournament_visualizer.data.game_constants import get_nation_crest_icon_path
+from tournament_visualizer.static_assets import asset_url
 
 logger = logging.getLogger(__name__)
 
@@ -619,8 +620,8 @@ def _create_colored_crest(
             "width": size,
             "height": size,
             "backgroundColor": color,
-            "maskImage": f"url({crest_path})",
-            "WebkitMaskImage": f"url({crest_path})",
+            "maskImage": f"url({asset_url(crest_path)})",
+            "WebkitMaskImage": f"url({asset_url(crest_path)})",
             "maskSize": "contain",
             "WebkitMaskSize": "contain",
             "maskRepeat": "no-repeat",
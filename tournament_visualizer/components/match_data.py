@@ -0,0 +1,228 @@
+"""Shared per-match datasets for the matches page.
+
+Selecting a match used to fire dozens of callbacks that each queried the
+database on their own, many of them repeating the same event, tech, yield
+and city queries. The matches-page callbacks now read the selected match
+from a key store (match-data-store, or the key store of their tab) and take
+these datasets from one MatchData per match and query cache generation.
+
+Each dataset is queried the first time a callback needs it, so a worker
+serving only the breadcrumb does not load the tab charts' data. Concurrent
+callbacks asking for the same dataset wait for one query instead of each
+running it. The store only holds a small key, so the callbacks reading it do
+not upload the datasets back to the server.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+from tournament_visualizer.data.queries import TournamentQueries, get_queries
+
+logger = logging.getLogger(__name__)
+
+# Matches whose datasets are kept per process
+MATCH_DATA_CACHE_SIZE = 32
+
+# Datasets read by more than one matches-page callback, by name
+MATCH_DATASETS: Dict[str, Callable[[TournamentQueries, int], pd.DataFrame]] = {
+    "events": lambda queries, match_id: queries.get_event_timeline(match_id, None),
+    "timeline_events": lambda queries, match_id: queries.get_match_timeline_events(
+        match_id
+    ),
+    "tech_timeline": lambda queries, match_id: queries.get_tech_timeline(match_id),
+    "tech_count_by_turn": lambda queries, match_id: queries.get_tech_count_by_turn(
+        match_id
+    ),
+    "law_count_by_turn": lambda queries, match_id: (
+        queries.get_cumulative_law_count_by_turn(match_id)
+    ),
+    "yield_history": lambda queries, match_id: queries.get_yield_history_by_match(
+        match_id
+    ),
+    # Empty for matches imported before yield totals were recorded
+    "yield_total_history": lambda queries, match_id: (
+        queries.get_yield_total_history_by_match(match_id)
+        if queries.has_yield_total_history(match_id)
+        else pd.DataFrame()
+    ),
+    "science_infrastructure_timeline": lambda queries, match_id: (
+        queries.get_science_infrastructure_timeline(match_id)
+    ),
+    "science_projects": lambda queries, match_id: queries.get_science_projects_summary(
+        match_id
+    ),
+    "science_bonuses": lambda queries, match_id: queries.get_science_bonuses_summary(
+        match_id
+    ),
+    "territory_control": lambda queries, match_id: (
+        queries.get_territory_control_summary(match_id)
+    ),
+    "city_founding": lambda queries, match_id: queries.get_city_founding_timeline(
+        match_id
+    ),
+    "family_city_counts": lambda queries, match_id: queries.get_family_city_counts(
+        match_id
+    ),
+    "units_produced": lambda queries, match_id: queries.get_match_units_produced(
+        match_id
+    ),
+}
+
+
+class MatchData:
+    """Shared datasets of one match, each loaded on first use.
+
+    Threads asking for a value another thread is loading wait for it rather
+    than running the same query. A failed load is not kept, so the next
+    caller tries again.
+    """
+
+    def __init__(
+        self,
+        match_id: int,
+        load_player_colors: Callable[["MatchData"], Dict[str, str]],
+    ) -> None:
+        """Initialize without loading anything.
+
+        Args:
+            match_id: The match ID
+            load_player_colors: Returns the player colors of a match
+        """
+        self.match_id = match_id
+        self._load_player_colors = load_player_colors
+        self._values: Dict[str, Any] = {}
+        self._loading: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, name: str, load: Callable[[], Any]) -> Any:
+        """Return a value of this match, loading it once."""
+        with self._lock:
+            if name in self._values:
+                return self._values[name]
+            loading = self._loading.setdefault(name, threading.Lock())
+        with loading:
+            with self._lock:
+                if name in self._values:
+                    return self._values[name]
+            value = load()
+            with self._lock:
+                self._values[name] = value
+            return value
+
+    def frame(self, name: str) -> pd.DataFrame:
+        """Return a copy of a dataset, loading it on first use.
+
+        Args:
+            name: Dataset name from MATCH_DATASETS
+
+        Returns:
+            The DataFrame, safe to modify
+
+        Raises:
+            Exception: Whatever the dataset's query raised
+        """
+        load = MATCH_DATASETS[name]
+        return self._get(name, lambda: load(get_queries(), self.match_id)).copy()
+
+    def turn_comparisons(self, player1_id: int, player2_id: int) -> pd.DataFrame:
+        """Return a copy of the turn-by-turn comparison of two players.
+
+        Args:
+            player1_id: First player's ID
+            player2_id: Second player's ID
+
+        Returns:
+            The DataFrame from TournamentQueries.get_match_turn_comparisons
+        """
+        return self._get(
+            f"turn_comparisons:{player1_id}:{player2_id}",
+            lambda: get_queries().get_match_turn_comparisons(
+                self.match_id, player1_id, player2_id
+            ),
+        ).copy()
+
+    @property
+    def summary(self) -> Optional[Dict[str, Any]]:
+        """The match's row of the match summary, or None if unavailable."""
+        try:
+            return self._get("summary", self._load_summary)
+        except Exception as e:
+            logger.error(f"Error loading match summary for match {self.match_id}: {e}")
+            return None
+
+    def _load_summary(self) -> Optional[Dict[str, Any]]:
+        match_df = get_queries().get_match_summary()
+        match_info = match_df[match_df["match_id"] == self.match_id]
+        if match_info.empty:
+            return None
+        return match_info.iloc[0].to_dict()
+
+    @property
+    def total_turns(self) -> Optional[int]:
+        """The match's total turns, if known."""
+        total_turns = (self.summary or {}).get("total_turns")
+        return None if total_turns is None or pd.isna(total_turns) else int(total_turns)
+
+    @property
+    def player_colors(self) -> Dict[str, str]:
+        """Player name to hex color mapping for the match ({} if unavailable)."""
+        try:
+            return self._get("player_colors", lambda: self._load_player_colors(self))
+        except Exception as e:
+            logger.error(f"Error loading player colors for match {self.match_id}: {e}")
+            return {}
+
+
+_cache: OrderedDict[Tuple[int, int], MatchData] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def make_match_data_key(match_id: int) -> Dict[str, int]:
+    """Build the match-data-store contents for a match.
+
+    Args:
+        match_id: The selected match ID
+
+    Returns:
+        JSON-serializable key of the match and the current query generation
+    """
+    return {"match_id": match_id, "generation": get_queries().generation}
+
+
+def get_match_data(
+    key: Dict[str, int], load_player_colors: Callable[[MatchData], Dict[str, str]]
+) -> MatchData:
+    """Return the shared datasets for a match-data-store key.
+
+    Looks up the datasets under this process's current query generation, so
+    a worker that has switched to newer data since the key was issued does
+    not serve stale frames. Nothing is queried here; see MatchData.
+
+    Args:
+        key: Contents of match-data-store from make_match_data_key
+        load_player_colors: Returns the player colors of a match
+
+    Returns:
+        The match's MatchData, shared by all callbacks of this process
+    """
+    match_id = key["match_id"]
+    cache_key = (match_id, get_queries().generation)
+    with _cache_lock:
+        data = _cache.get(cache_key)
+        if data is None:
+            data = _cache[cache_key] = MatchData(match_id, load_player_colors)
+            while len(_cache) > MATCH_DATA_CACHE_SIZE:
+                _cache.popitem(last=False)
+        else:
+            _cache.move_to_end(cache_key)
+        return data
+
+
+def clear_match_data_cache() -> None:
+    """Drop all cached match datasets."""
+    with _cache_lock:
+        _cache.clear()
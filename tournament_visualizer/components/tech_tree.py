@@ -1,5 +1,6 @@
 """Tech tree visualization component using Cytoscape."""
 
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 import dash_cytoscape as cyto
@@ -54,21 +55,48 @@ def get_techs_at_turn(tech_timeline_df, player_id: int, turn: int) -> Set[str]:
     return tech_names
 
 
-def build_cytoscape_elements(researched: Optional[Set[str]] = None) -> List[Dict]:
-    """Build Cytoscape elements from tech tree data.
+def get_tech_discovery_turns(tech_timeline_df, player_id: int) -> Dict[str, int]:
+    """Get the turn on which a player discovered each tech.
 
     Args:
-        researched: Set of tech IDs that have been researched
+        tech_timeline_df: DataFrame with columns player_id, turn_number, tech_name
+        player_id: Player ID to filter for
 
     Returns:
-        List of Cytoscape elements (nodes and edges)
+        Dict mapping tech IDs (only techs in our TECHS dict) to discovery turn
     """
-    if researched is None:
-        researched = set()
+    if tech_timeline_df is None or tech_timeline_df.empty:
+        return {}
+
+    player_techs = tech_timeline_df[tech_timeline_df["player_id"] == player_id]
 
-    elements = []
+    turns: Dict[str, int] = {}
+    for tech, turn in zip(player_techs["tech_name"], player_techs["turn_number"]):
+        # Strip quotes if present (from json_extract)
+        clean_tech = tech.strip('"') if isinstance(tech, str) else tech
+        if clean_tech in TECHS and (
+            clean_tech not in turns or turn < turns[clean_tech]
+        ):
+            turns[clean_tech] = int(turn)
+
+    return turns
+
+
+@lru_cache(maxsize=1)
+def get_tech_tree_layout() -> Tuple[
+    Tuple[Tuple[str, str, int, int], ...], Tuple[Tuple[str, str], ...]
+]:
+    """Get the static node positions and edges of the displayed tech tree.
 
-    # Create nodes - skip bonus/resource techs for cleaner display
+    Built once per process; only the researched/locked classes vary by player
+    and turn.
+
+    Returns:
+        Tuple of (nodes as (tech_id, label, x, y), edges as (prereq, unlocks))
+    """
+    nodes = []
+
+    # Skip bonus/resource techs for cleaner display
     for tech_id, (name, col, row) in TECHS.items():
         # Skip techs without positions (event bonuses)
         if col is None or row is None:
@@ -78,52 +106,56 @@ def build_cytoscape_elements(researched: Optional[Set[str]] = None) -> List[Dict
         if "BONUS" in tech_id or "RESOURCE" in tech_id:
             continue
 
-        is_researched = tech_id in researched
-
-        # Calculate position
         pos_x = col * COL_SPACING + NODE_WIDTH // 2
         pos_y = row * ROW_SPACING + NODE_HEIGHT // 2
+        nodes.append((tech_id, name, pos_x, pos_y))
+
+    # Only edges between displayed techs
+    valid_tech_ids = {tech_id for tech_id, _, _, _ in nodes}
+    edges = [
+        (prereq, unlocks)
+        for prereq, unlocks in PREREQUISITES
+        if prereq in valid_tech_ids and unlocks in valid_tech_ids
+    ]
 
-        elements.append(
-            {
-                "data": {
-                    "id": tech_id,
-                    "label": name,
-                },
-                "position": {
-                    "x": pos_x,
-                    "y": pos_y,
-                },
-                "classes": "researched" if is_researched else "locked",
-            }
-        )
-
-    # Create edges - only for main techs (not bonus)
-    valid_tech_ids = {
-        tech_id
-        for tech_id, (_, col, row) in TECHS.items()
-        if col is not None
-        and row is not None
-        and "BONUS" not in tech_id
-        and "RESOURCE" not in tech_id
-    }
-
-    for prereq, unlocks in PREREQUISITES:
-        # Skip edges involving bonus techs
-        if prereq not in valid_tech_ids or unlocks not in valid_tech_ids:
-            continue
+    return tuple(nodes), tuple(edges)
+
+
+def build_cytoscape_elements(researched: Optional[Set[str]] = None) -> List[Dict]:
+    """Build Cytoscape elements from tech tree data.
+
+    Args:
+        researched: Set of tech IDs that have been researched
+
+    Returns:
+        List of Cytoscape elements (nodes and edges)
+    """
+    if researched is None:
+        researched = set()
 
-        # Only mark edge as researched if both techs are researched
-        both_researched = prereq in researched and unlocks in researched
-        elements.append(
-            {
-                "data": {
-                    "source": prereq,
-                    "target": unlocks,
-                },
-                "classes": "edge-researched" if both_researched else "edge-locked",
-            }
-        )
+    nodes, edges = get_tech_tree_layout()
+
+    elements: List[Dict] = [
+        {
+            "data": {"id": tech_id, "label": label},
+            "position": {"x": pos_x, "y": pos_y},
+            "classes": "researched" if tech_id in researched else "locked",
+        }
+        for tech_id, label, pos_x, pos_y in nodes
+    ]
+
+    # Only mark edge as researched if both techs are researched
+    elements.extend(
+        {
+            "data": {"source": prereq, "target": unlocks},
+            "classes": (
+                "edge-researched"
+                if prereq in researched and unlocks in researched
+                else "edge-locked"
+            ),
+        }
+        for prereq, unlocks in edges
+    )
 
     return elements
 
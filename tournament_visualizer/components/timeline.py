@@ -4,7 +4,7 @@ This module provides a two-column timeline display showing key game events
 for both players side-by-side, organized by turn number.
 """
 
-from typing import Optional
+from typing import Any, Dict, List
 
 import pandas as pd
 import dash_bootstrap_components as dbc
@@ -16,6 +16,7 @@ from tournament_visualizer.data.game_constants import (
     get_law_icon_path,
     ARCHETYPE_ICONS,
 )
+from tournament_visualizer.static_assets import asset_icon
 
 
 def create_timeline_component(
@@ -52,8 +53,12 @@ def create_timeline_component(
             icon="bi-calendar-x",
         )
 
-    # Get unique turns and sort
-    turns = sorted(events_df["turn"].unique())
+    # Group event records by turn and player in one pass
+    events_by_turn: Dict[Any, Dict[Any, List[Dict[str, Any]]]] = {}
+    for record in events_df.to_dict("records"):
+        events_by_turn.setdefault(record["turn"], {}).setdefault(
+            record["player_id"], []
+        ).append(record)
 
     # Build timeline rows
     timeline_rows = []
@@ -138,12 +143,10 @@ def create_timeline_component(
     timeline_rows.append(header_row)
 
     # Event rows by turn
-    for turn in turns:
-        turn_events = events_df[events_df["turn"] == turn]
-
+    for turn in sorted(events_by_turn):
         # Split events by player
-        p1_events = turn_events[turn_events["player_id"] == player1_id]
-        p2_events = turn_events[turn_events["player_id"] == player2_id]
+        p1_events = events_by_turn[turn].get(player1_id, [])
+        p2_events = events_by_turn[turn].get(player2_id, [])
 
         # Build event lists for each player
         p1_content = _build_event_list(p1_events)
@@ -180,43 +183,43 @@ def create_timeline_component(
     )
 
 
-def _build_event_list(events_df: pd.DataFrame) -> list:
-    """Build a list of event components from DataFrame rows.
+def _build_event_list(events: List[Dict[str, Any]]) -> list:
+    """Build a list of event components from event records.
 
     Consolidates multiple events of the same type into a single line.
     Pairs death events with their corresponding ruler crowning events.
 
     Args:
-        events_df: DataFrame with event data
+        events: Event records (rows of get_match_timeline_events())
 
     Returns:
         List of HTML components for events
     """
-    if events_df.empty:
+    if not events:
         return []
 
-    # Separate death, crowned, starting ruler, and other events
-    death_events = events_df[events_df["event_type"] == "death"]
-    ruler_events = events_df[events_df["event_type"] == "ruler"]
-    crowned_events = ruler_events[ruler_events["title"].str.startswith("Crowned ")]
-    starting_events = ruler_events[
-        ruler_events["title"].str.startswith("Starting Ruler:")
+    # Separate death, crowned, starting ruler, and other events; records
+    # are already in succession order from the query
+    death_list = [e for e in events if e["event_type"] == "death"]
+    ruler_events = [e for e in events if e["event_type"] == "ruler"]
+    crowned_list = [e for e in ruler_events if str(e["title"]).startswith("Crowned ")]
+    starting_events = [
+        e for e in ruler_events if str(e["title"]).startswith("Starting Ruler:")
     ]
-    other_events = events_df[~events_df["event_type"].isin(["death", "ruler"])]
+    other_events: Dict[str, List[Dict[str, Any]]] = {}
+    for event in events:
+        if event["event_type"] not in ("death", "ruler"):
+            other_events.setdefault(event["event_type"], []).append(event)
 
     event_items = []
 
-    # Convert to lists - they should already be in succession order from the query
-    death_list = list(death_events.iterrows())
-    crowned_list = list(crowned_events.iterrows())
-
     # Pair deaths with crownings by position (1:1 in succession order)
     # Same-name successions are valid (parent → child with same name)
-    for i, (_, death_row) in enumerate(death_list):
+    for i, death_row in enumerate(death_list):
         dead_name = death_row.get("title", "").replace(" Died", "")
 
         if i < len(crowned_list):
-            _, ruler_row = crowned_list[i]
+            ruler_row = crowned_list[i]
             new_ruler_name = ruler_row.get("title", "").replace("Crowned ", "")
             details = ruler_row.get("details", "")
 
@@ -239,7 +242,7 @@ def _build_event_list(events_df: pd.DataFrame) -> list:
             event_items.append(_format_event_item(death_row))
 
     # Add starting ruler events (not paired with deaths)
-    for _, ruler_row in starting_events.iterrows():
+    for ruler_row in starting_events:
         event_items.append(_format_event_item(ruler_row))
 
     # Event types that can be consolidated with their prefix to strip
@@ -251,30 +254,29 @@ def _build_event_list(events_df: pd.DataFrame) -> list:
     }
 
     # Process other events
-    grouped = other_events.groupby("event_type")
-
-    for event_type, group in grouped:
+    for event_type in sorted(other_events):
+        group = other_events[event_type]
         if event_type in consolidatable and len(group) > 1:
             # Consolidate multiple events of same type
             prefix = consolidatable[event_type]
             items = []
-            for _, row in group.iterrows():
+            for row in group:
                 title = row.get("title", "")
                 if title.startswith(prefix):
                     items.append(title[len(prefix) :])
                 else:
                     items.append(title)
 
-            fallback_icon = group.iloc[0].get("icon", "")
+            fallback_icon = group[0].get("icon", "")
             consolidated_title = f"{prefix}{', '.join(items)}"
             css_class = f"timeline-event timeline-event-{event_type}"
 
             if event_type == "tech":
                 icons = [
-                    html.Img(
-                        src=get_tech_icon_path(name),
-                        className="timeline-icon",
+                    asset_icon(
+                        get_tech_icon_path(name),
                         title=name,
+                        className="timeline-icon",
                         style={
                             "width": "36px",
                             "height": "36px",
@@ -289,10 +291,10 @@ def _build_event_list(events_df: pd.DataFrame) -> list:
                 )
             elif event_type == "law":
                 icons = [
-                    html.Img(
-                        src=get_law_icon_path(name),
-                        className="timeline-icon",
+                    asset_icon(
+                        get_law_icon_path(name),
                         title=f"Adopted: {name}",
+                        className="timeline-icon",
                         style={
                             "width": "36px",
                             "height": "36px",
@@ -318,7 +320,7 @@ def _build_event_list(events_df: pd.DataFrame) -> list:
                     )
                 )
         else:
-            for _, row in group.iterrows():
+            for row in group:
                 event_items.append(_format_event_item(row))
 
     return event_items
@@ -355,21 +357,21 @@ def _create_icon_element(
         tooltip = f"{title} ({details})"
 
     if icon_path:
-        return html.Img(
-            src=icon_path,
-            className="timeline-icon",
+        return asset_icon(
+            icon_path,
+            {"width": "36px", "height": "36px", "verticalAlign": "middle"},
             title=tooltip,
-            style={"width": "36px", "height": "36px", "verticalAlign": "middle"},
+            className="timeline-icon",
         )
     else:
         return html.Span(fallback_emoji)
 
 
-def _format_event_item(row: pd.Series) -> html.Div:
+def _format_event_item(row: Dict[str, Any]) -> html.Div:
     """Format a single event for display.
 
     Args:
-        row: DataFrame row with event data
+        row: Event record
 
     Returns:
         HTML div element with formatted event
@@ -0,0 +1,143 @@
+"""Response compression for the Flask server.
+
+Dash callback responses carry whole Plotly figures and the map API returns
+per-tile JSON; both are large and very repetitive, so they shrink 5-20x when
+compressed. init_compression() registers an after_request hook that
+compresses responses when:
+
+- the client accepts br (if the optional brotli package is installed) or gzip
+- the mimetype is in Config.COMPRESSION_MIMETYPES
+- the body is at least Config.COMPRESSION_MIN_SIZE bytes
+- the response is not streamed (send_file) and not already encoded
+
+Dash's component bundles (plotly.min.js alone is several MB) are the same on
+every request, so their compressed bodies are kept in memory.
+"""
+
+import gzip
+import logging
+import threading
+from collections import OrderedDict
+from typing import Iterable, Optional, Tuple
+
+from flask import Flask, Response, request
+
+from .config import Config
+
+try:  # Optional: brotli compresses JSON ~15% smaller than gzip
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Compressed Dash component bundles, keyed by (path, encoding)
+STATIC_PREFIX = "/_dash-component-suites/"
+_STATIC_CACHE_SIZE = 32
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick the best supported encoding from an Accept-Encoding header.
+
+    Args:
+        accept_encoding: Raw header value, e.g. "gzip, deflate, br"
+
+    Returns:
+        "br", "gzip" or None if the client accepts neither
+    """
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.partition(";")
+        params = params.replace(" ", "")
+        try:
+            quality = float(params[2:]) if params.startswith("q=") else 1.0
+        except ValueError:
+            quality = 0.0
+        if quality > 0:
+            accepted.add(name.strip())
+
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return None
+
+
+def compress_body(data: bytes, encoding: str, level: int) -> bytes:
+    """Compress a response body.
+
+    Args:
+        data: Uncompressed body
+        encoding: "br" or "gzip"
+        level: 1-9 (gzip level; brotli quality uses the same number)
+
+    Returns:
+        Compressed body
+    """
+    if encoding == "br":
+        return brotli.compress(data, quality=level)
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def init_compression(
+    server: Flask,
+    level: int = Config.COMPRESSION_LEVEL,
+    min_size: int = Config.COMPRESSION_MIN_SIZE,
+    mimetypes: Iterable[str] = Config.COMPRESSION_MIMETYPES,
+) -> None:
+    """Compress eligible responses of a Flask server.
+
+    Args:
+        server: Flask app (the Dash app's server)
+        level: Compression level 1-9; 0 disables compression
+        min_size: Smallest body in bytes worth compressing
+        mimetypes: Mimetypes to compress
+    """
+    if level <= 0:
+        logger.info("Response compression disabled")
+        return
+
+    allowed = frozenset(mimetypes)
+    static_cache: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+    static_lock = threading.Lock()
+
+    @server.after_request
+    def compress_response(response: Response) -> Response:
+        if (
+            response.direct_passthrough
+            or response.is_streamed
+            or response.status_code != 200
+            or "Content-Encoding" in response.headers
+            or response.mimetype not in allowed
+        ):
+            return response
+        encoding = choose_encoding(request.headers.get("Accept-Encoding", ""))
+        if encoding is None:
+            return response
+
+        # Whether or not this one is compressed, caches must keep them apart
+        response.vary.add("Accept-Encoding")
+        data = response.get_data()
+        if len(data) < min_size:
+            return response
+
+        static_key = (request.path, encoding)
+        is_static = request.path.startswith(STATIC_PREFIX)
+        with static_lock:
+            compressed = static_cache.get(static_key) if is_static else None
+        if compressed is None:
+            compressed = compress_body(data, encoding, level)
+            if is_static:
+                with static_lock:
+                    static_cache[static_key] = compressed
+                    while len(static_cache) > _STATIC_CACHE_SIZE:
+                        static_cache.popitem(last=False)
+
+        response.set_data(compressed)
+        response.headers["Content-Encoding"] = encoding
+        return response
+
+    backends = "br, gzip" if brotli is not None else "gzip"
+    logger.info(
+        f"Response compression enabled ({backends}, level {level}, >= {min_size} bytes)"
+    )
@@ -19,6 +19,26 @@ class Config:
 
     # Database settings
     DATABASE_PATH = os.getenv("TOURNAMENT_DB_PATH", "data/tournament_data.duckdb")
+    # Concurrent read cursors per process; match the gunicorn thread count
+    DATABASE_READ_POOL_SIZE = int(os.getenv("DB_READ_POOL_SIZE", "8"))
+    # Published read-only snapshots (see data/snapshots.py). While this holds
+    # a CURRENT pointer the server reads the snapshot it names instead of
+    # DATABASE_PATH, and checks for a newer one at most every poll interval.
+    # Unset (the default) disables snapshots; fly.toml sets it in production.
+    SNAPSHOT_DIRECTORY = os.getenv("SNAPSHOT_DIRECTORY", "")
+    SNAPSHOT_POLL_INTERVAL = float(os.getenv("SNAPSHOT_POLL_INTERVAL", "5"))  # s
+    # Tournament the live database holds (Challonge URL identifier). Earlier
+    # tournaments are archived as one database file each in
+    # TOURNAMENTS_DIRECTORY and opened on demand (see data/tournaments.py).
+    TOURNAMENT = os.getenv("TOURNAMENT", "owduels2025")
+    TOURNAMENTS_DIRECTORY = os.getenv("TOURNAMENTS_DIRECTORY", "data/tournaments")
+    # When set, the server reads TOURNAMENT from this Parquet dataset (see
+    # data/parquet_dataset.py) instead of DuckDB files, through view catalogs
+    # built in PARQUET_CATALOG_DIRECTORY. Takes precedence over snapshots.
+    PARQUET_DATASET = os.getenv("PARQUET_DATASET", "")
+    PARQUET_CATALOG_DIRECTORY = os.getenv(
+        "PARQUET_CATALOG_DIRECTORY", "data/parquet_catalogs"
+    )
 
     # Application settings
     APP_TITLE = "Old World Tournament Visualizer"
@@ -28,8 +48,15 @@ class Config:
 
     # Data directories
     SAVES_DIRECTORY = os.getenv("SAVES_DIRECTORY", "saves")
+    # XML backend for save file parsing: "lxml" (fast) or "etree" (stdlib)
+    XML_PARSER_BACKEND = os.getenv("XML_PARSER_BACKEND", "lxml")
+    # Parsed save records reused by --force rebuilds (see data/parse_cache.py)
+    PARSED_CACHE_DIRECTORY = os.getenv("PARSED_CACHE_DIRECTORY", "data/parsed_cache")
     # Relative to app.py location (tournament_visualizer/)
     ASSETS_DIRECTORY = "assets"
+    # Fingerprinted icons, sprites and atlases (see static_assets.py), also
+    # relative to tournament_visualizer/; built by scripts/build_assets.py
+    STATIC_BUILD_DIRECTORY = "static_build"
 
     # Override files
     PARTICIPANT_NAME_OVERRIDES_PATH = os.getenv(
@@ -99,6 +126,22 @@ class Config:
 
     # Performance settings
     CACHE_TIMEOUT = 300  # 5 minutes
+    FIGURE_CACHE_SIZE = int(os.getenv("FIGURE_CACHE_SIZE", "512"))  # entries
+    # Response compression (see compression.py); level 0 disables it
+    COMPRESSION_LEVEL = int(os.getenv("COMPRESSION_LEVEL", "6"))
+    COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))  # bytes
+    COMPRESSION_MIMETYPES = (
+        "application/json",
+        "text/html",
+        "text/css",
+        "text/javascript",
+        "application/javascript",
+        "image/svg+xml",
+    )
+    # Request latency telemetry (see telemetry.py), served at /debug/perf
+    PERF_TELEMETRY = os.getenv("PERF_TELEMETRY", "true").lower() == "true"
+    PERF_WINDOW_SIZE = int(os.getenv("PERF_WINDOW_SIZE", "200"))  # samples per key
+    PERF_LOG_PATH = os.getenv("PERF_LOG_PATH", "")  # JSONL sink; empty disables
     LAZY_LOADING = True
     PAGINATION_SIZE = 50
 
@@ -548,6 +591,7 @@ LAYOUT_CONSTANTS = {
     "FILTER_HEIGHT": "auto",
     "CHART_MIN_HEIGHT": "300px",
     "TABLE_PAGE_SIZE": 20,
+    "TIMELINE_TURN_WINDOW": 40,  # Turns rendered per Timeline tab window
 }
 
 
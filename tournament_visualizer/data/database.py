@@ -4,32 +4,133 @@ This module handles DuckDB connection, schema creation, and database operations
 for the tournament visualization application.
 """
 
+import hashlib
+import json
 import logging
+import os
 import threading
+import time
 from contextlib import contextmanager
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import duckdb
 
+from ..telemetry import record_db_time
+from .game_constants import HEIGHT_TYPES, TERRAIN_TYPES, YIELD_TYPES
+
 logger = logging.getLogger(__name__)
 
+# Tables excluded from get_data_fingerprint(): derived data and bookkeeping
+FINGERPRINT_EXCLUDED_TABLES = (
+    "precomputed_figures",
+    "schema_migrations",
+    "tournaments",
+)
+# Comment on the views that stand in for tables in a Parquet dataset catalog
+# (see parquet_dataset.py). _get_table_names() treats them as tables.
+PARQUET_VIEW_COMMENT = "parquet dataset table"
+# Tables up to this many rows are hashed row by row. Larger tables are the
+# append-only per-turn history tables, where the row count is enough.
+FINGERPRINT_HASH_ROW_LIMIT = 100_000
+
+# Low-cardinality string columns stored as DuckDB ENUM types. Each enum type
+# maps to the (table, column) pairs that share its dictionary. Only tables that
+# no foreign key points at are listed, because DuckDB cannot retype those.
+# Every domain here is seeded from the game constants, so an import almost
+# never meets a new value; one that does rewrites the tables using the type.
+# Open-ended names (event, improvement, specialist and resource types, family
+# and religion names) stay VARCHAR, which DuckDB dictionary-compresses itself.
+CATEGORICAL_COLUMNS: Dict[str, List[Tuple[str, str]]] = {
+    "terrain_type_enum": [("territories", "terrain_type")],
+    "height_type_enum": [("territories", "height_type")],
+    "yield_type_enum": [
+        ("player_yield_history", "resource_type"),
+        ("player_yield_total_history", "resource_type"),
+    ],
+}
+
+# Known values used to seed enum types before any save file is imported.
+# Values discovered in save files are added on insert.
+CATEGORICAL_SEED_VALUES: Dict[str, List[str]] = {
+    "terrain_type_enum": TERRAIN_TYPES,
+    "height_type_enum": HEIGHT_TYPES,
+    "yield_type_enum": YIELD_TYPES,
+}
+
+# Large per-turn tables that optimize_storage() rewrites in (match_id,
+# turn_number) order. Clustered rows let DuckDB zone maps skip whole row
+# groups for other matches, which is what the per-match pages query.
+CLUSTERED_TABLES: List[str] = [
+    "territories",
+    "events",
+    "player_yield_history",
+    "player_yield_total_history",
+    "player_points_history",
+    "player_military_history",
+    "player_legitimacy_history",
+    "family_opinion_history",
+    "religion_opinion_history",
+]
+
+# Secondary indexes created by earlier schema versions on the clustered tables.
+# Each one repeats a prefix of a UNIQUE constraint or is served by zone maps
+# once rows are clustered, so it only slows down inserts.
+REDUNDANT_INDEXES: List[str] = [
+    "idx_territories_spatial",
+    "idx_territories_spatial_temporal",
+    "idx_territories_city",
+    "idx_events_type",
+    "idx_events_location",
+    "idx_events_type_player",
+    "idx_yield_history_match_player",
+    "idx_yield_history_turn",
+    "idx_yield_history_type",
+    "idx_yield_history_match_turn_type",
+    "idx_yield_total_history_match_player",
+    "idx_yield_total_history_turn",
+    "idx_yield_total_history_type",
+    "idx_yield_total_history_match_turn_type",
+    "idx_points_history_match_player",
+    "idx_points_history_turn",
+    "idx_military_history_match_player",
+    "idx_military_history_turn",
+    "idx_legitimacy_history_match_player",
+    "idx_legitimacy_history_turn",
+    "idx_family_opinion_match_player",
+    "idx_family_opinion_family",
+    "idx_religion_opinion_match_player",
+    "idx_religion_opinion_religion",
+]
+
 
 class TournamentDatabase:
     """Manages database connection and schema for tournament data."""
 
+    # Depth of nested transaction() blocks on the shared connection
+    _transaction_depth = 0
+
     def __init__(
-        self, db_path: str = "tournament_data.duckdb", read_only: bool = True
+        self,
+        db_path: str = "tournament_data.duckdb",
+        read_only: bool = True,
+        read_pool_size: int = 8,
     ) -> None:
         """Initialize database connection.
 
         Args:
             db_path: Path to the DuckDB database file
             read_only: Whether to open in read-only mode (default True for safety)
+            read_pool_size: Maximum concurrent read cursors (read-only mode)
         """
         self.db_path = db_path
         self.read_only = read_only
+        self.read_pool_size = max(1, read_pool_size)
         self.connection: Optional[duckdb.DuckDBPyConnection] = None
         self._lock = threading.RLock()  # Use reentrant lock to avoid deadlocks
+        self._pool_cond = threading.Condition()
+        # Per thread: the read cursor it has borrowed, if any
+        self._local = threading.local()
+        self._reset_read_pool()
 
         # Run migrations if not in read-only mode
         if not read_only:
@@ -37,20 +138,162 @@ class TournamentDatabase:
             self.migrate_to_participant_tracking()
             self.migrate_to_pick_order_tracking()
             self.migrate_to_player_narratives()
+            self.migrate_to_categorical_columns()
 
     @contextmanager
     def get_connection(self):
         """Context manager for database connections with proper locking.
 
-        Uses the shared connection to prevent multiple connections.
+        In read-only mode each block borrows a cursor from the read pool, so
+        threads (gthread workers) run queries in parallel. Cursors are extra
+        connections to the one open database and share its buffer cache, so
+        they add little memory. Writers use the shared connection under the
+        lock, which keeps transactions serialized.
+
+        A block nested in another one on the same thread reuses the outer
+        block's cursor, like the writer's reentrant lock. Borrowing a second
+        cursor would deadlock once the thread's own blocks fill the pool,
+        e.g. with DB_READ_POOL_SIZE=1. Fetch the outer result before running
+        a nested query, as the cursor holds one pending result at a time.
 
         Yields:
             DuckDB connection object
         """
-        with self._lock:
-            # Ensure the shared connection is established
-            conn = self.connect()
-            yield conn
+        # Includes waiting for a cursor or the lock; see telemetry.py
+        started = time.perf_counter()
+        try:
+            if self.read_only:
+                local = self._local
+                cursor = getattr(local, "cursor", None)
+                if cursor is not None:
+                    yield cursor
+                    return
+                cursor = self._acquire_cursor()
+                local.cursor = cursor
+                try:
+                    yield cursor
+                finally:
+                    local.cursor = None
+                    self._release_cursor(cursor)
+                return
+
+            with self._lock:
+                # Ensure the shared connection is established
+                conn = self.connect()
+                yield conn
+        finally:
+            record_db_time(time.perf_counter() - started)
+
+    def _reset_read_pool(self) -> None:
+        """Forget all read cursors (open ones are closed on release)."""
+        self._idle_cursors: List[duckdb.DuckDBPyConnection] = []
+        # ids of the cursors opened since the last reset. Cursors of a closed
+        # connection are not in it, so they are not handed out again.
+        self._pool_cursor_ids: set[int] = set()
+        # Connections replaced by reopen(), each with the ids of its cursors
+        # still in use. Closed once the last of them is released.
+        self._retired: List[Tuple[duckdb.DuckDBPyConnection, set[int]]] = []
+
+    def _acquire_cursor(self) -> duckdb.DuckDBPyConnection:
+        """Take an idle read cursor, opening one if the pool is not full."""
+        while True:
+            parent = self.connect()
+            with self._pool_cond:
+                while True:
+                    if self._idle_cursors:
+                        return self._idle_cursors.pop()
+                    if len(self._pool_cursor_ids) < self.read_pool_size:
+                        if parent is not self.connection:
+                            break  # Closed while waiting, reconnect
+                        cursor = parent.cursor()
+                        self._pool_cursor_ids.add(id(cursor))
+                        return cursor
+                    self._pool_cond.wait()
+
+    def _release_cursor(self, cursor: duckdb.DuckDBPyConnection) -> None:
+        """Return a read cursor to the pool."""
+        with self._pool_cond:
+            if id(cursor) in self._pool_cursor_ids:
+                self._idle_cursors.append(cursor)
+                self._pool_cond.notify()
+                return
+            cursor.close()
+            for retired in list(self._retired):
+                connection, in_use = retired
+                in_use.discard(id(cursor))
+                if not in_use:
+                    self._retired.remove(retired)
+                    connection.close()
+
+    @contextmanager
+    def transaction(self):
+        """Context manager that runs a block in a single explicit transaction.
+
+        Holds the connection lock for the whole block so other threads cannot
+        interleave statements. Commits when the block finishes and rolls back if
+        it raises, so a failed load leaves nothing behind. Nested calls join the
+        outer transaction.
+
+        Yields:
+            DuckDB connection object
+        """
+        with self.get_connection() as conn:
+            if self._transaction_depth:
+                self._transaction_depth += 1
+                try:
+                    yield conn
+                finally:
+                    self._transaction_depth -= 1
+                return
+
+            conn.execute("BEGIN TRANSACTION")
+            self._transaction_depth = 1
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except Exception:
+                try:
+                    conn.execute("ROLLBACK")
+                except duckdb.Error:
+                    # A failed COMMIT has already ended the transaction
+                    pass
+                raise
+            finally:
+                self._transaction_depth = 0
+
+    @contextmanager
+    def bulk_load(self):
+        """Context manager that defers secondary index maintenance.
+
+        Drops every CREATE INDEX index for the duration of the block and
+        rebuilds them once at the end, which is much cheaper than updating them
+        on each insert. Indexes backing PRIMARY KEY and UNIQUE constraints are
+        kept, so duplicate checks still apply. Meant for full rebuilds; queries
+        run during the block do not get index lookups.
+
+        Yields:
+            DuckDB connection object
+        """
+        with self.get_connection() as conn:
+            indexes = conn.execute(
+                """
+                SELECT index_name, sql
+                FROM duckdb_indexes()
+                WHERE schema_name = 'main' AND sql IS NOT NULL
+            """
+            ).fetchall()
+            for index_name, _ in indexes:
+                conn.execute(f"DROP INDEX IF EXISTS {index_name}")
+            logger.info(f"Bulk load: deferred {len(indexes)} indexes")
+
+            try:
+                yield conn
+            finally:
+                for index_name, sql in indexes:
+                    # Table rewrites during the block may have recreated some
+                    conn.execute(f"DROP INDEX IF EXISTS {index_name}")
+                    conn.execute(sql)
+                logger.info(f"Bulk load: rebuilt {len(indexes)} indexes")
 
     def connect(self) -> duckdb.DuckDBPyConnection:
         """Establish database connection.
@@ -75,14 +318,78 @@ class TournamentDatabase:
                     )
         return self.connection
 
+    def reopen(self, db_path: str) -> None:
+        """Switch to another database file without interrupting running reads.
+
+        The new file is opened before anything is replaced, so a file that
+        cannot be opened leaves the current one in use. Queries that start
+        afterwards use the new connection; the old one stays open until the
+        cursors borrowed from it are released.
+
+        Args:
+            db_path: Path to the DuckDB database file to use from now on
+
+        Raises:
+            duckdb.Error: If the new file cannot be opened
+        """
+        connection = duckdb.connect(db_path, read_only=self.read_only)
+        with self._lock:
+            with self._pool_cond:
+                old = self.connection
+                idle = {id(cursor) for cursor in self._idle_cursors}
+                in_use = self._pool_cursor_ids - idle
+                retired = self._retired
+                for cursor in self._idle_cursors:
+                    cursor.close()
+                self._reset_read_pool()
+                self._retired = retired
+                if old is not None:
+                    if in_use:
+                        self._retired.append((old, in_use))
+                    else:
+                        old.close()
+                self.connection = connection
+                self.db_path = db_path
+                self._pool_cond.notify_all()
+        mode = "read-only" if self.read_only else "read-write"
+        logger.info(f"Reopened database: {db_path} ({mode} mode)")
+
     def close(self) -> None:
-        """Close database connection."""
+        """Close database connection.
+
+        Also closes the pooled read cursors, so reads still running on other
+        threads fail. Only close while no requests are being served.
+        """
         with self._lock:
+            if self.read_only:
+                with self._pool_cond:
+                    for cursor in self._idle_cursors:
+                        cursor.close()
+                    for connection, _ in self._retired:
+                        connection.close()
+                    # Cursors still in use are closed when they are released
+                    self._reset_read_pool()
+                    self._pool_cond.notify_all()
             if self.connection:
                 self.connection.close()
                 self.connection = None
                 logger.info("Shared database connection closed")
 
+    def reset_after_fork(self) -> None:
+        """Drop connection state inherited from a parent process.
+
+        A DuckDB connection must not be used from two processes, so a forked
+        child forgets the parent's handle (without closing it, which would act
+        on the parent's database state) and lazily opens its own on first use.
+        The locks are replaced too, as a fork can copy them in a held state.
+        """
+        self._lock = threading.RLock()
+        self._pool_cond = threading.Condition()
+        self._local = threading.local()
+        self._reset_read_pool()
+        self.connection = None
+        self._transaction_depth = 0
+
     def execute_query(
         self, query: str, parameters: Optional[Dict[str, Any]] = None
     ) -> None:
@@ -133,6 +440,7 @@ class TournamentDatabase:
 
         # Create sequences for auto-increment
         self._create_sequences()
+        self._create_categorical_types()
 
         # Create tables in dependency order
         self._create_matches_table()
@@ -160,6 +468,8 @@ class TournamentDatabase:
         self._create_city_unit_production_table()
         self._create_city_projects_table()
         self._create_schema_migrations_table()
+        self._create_precomputed_figures_table()
+        self._create_tournaments_table()
         self._create_views()
 
         # Mark initial schema version
@@ -167,6 +477,8 @@ class TournamentDatabase:
             "1.0.0",
             "Initial database schema with comprehensive constraints and indexes",
         )
+        # Tables are created with enum columns, so the conversion is not needed
+        self._mark_schema_version("7", "Store categorical columns as ENUM types")
 
         logger.info("Database schema created successfully")
 
@@ -196,6 +508,41 @@ class TournamentDatabase:
             for seq_query in sequences:
                 conn.execute(seq_query)
 
+    def _create_categorical_types(self) -> None:
+        """Create the ENUM types that have known values from game constants.
+
+        Existing types are left alone. Other types are created on first insert.
+        """
+        with self.get_connection() as conn:
+            existing = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT type_name FROM duckdb_types() WHERE schema_name = 'main'"
+                ).fetchall()
+            }
+            for type_name, values in CATEGORICAL_SEED_VALUES.items():
+                if type_name in existing:
+                    continue
+                conn.execute(
+                    f"CREATE TYPE {type_name} AS ENUM ({_enum_literals(values)})"
+                )
+
+    def _categorical_column_type(self, type_name: str) -> str:
+        """Return the SQL type for a categorical column.
+
+        DuckDB does not allow empty ENUMs, so columns whose type has no values
+        yet are created as VARCHAR and converted on first insert.
+
+        Args:
+            type_name: Name of the ENUM type
+
+        Returns:
+            The ENUM type name, or VARCHAR if the type does not exist
+        """
+        if self._get_categorical_values(type_name) is None:
+            return "VARCHAR"
+        return type_name
+
     def _create_matches_table(self) -> None:
         """Create the matches table."""
         query = """
@@ -357,15 +704,17 @@ class TournamentDatabase:
 
     def _create_territories_table(self) -> None:
         """Create the territories table."""
-        query = """
+        terrain_type = self._categorical_column_type("terrain_type_enum")
+        height_type = self._categorical_column_type("height_type_enum")
+        query = f"""
         CREATE TABLE IF NOT EXISTS territories (
             territory_id BIGINT PRIMARY KEY,
             match_id BIGINT NOT NULL REFERENCES matches(match_id),
             x_coordinate INTEGER NOT NULL,
             y_coordinate INTEGER NOT NULL,
             turn_number INTEGER NOT NULL,
-            terrain_type VARCHAR(50),
-            height_type VARCHAR(50),
+            terrain_type {terrain_type},
+            height_type {height_type},
             improvement_type VARCHAR(50),
             specialist_type VARCHAR(50),
             resource_type VARCHAR(50),
@@ -379,11 +728,8 @@ class TournamentDatabase:
             CONSTRAINT unique_territory_turn UNIQUE(match_id, x_coordinate, y_coordinate, turn_number)
         );
 
-        CREATE INDEX IF NOT EXISTS idx_territories_spatial ON territories(match_id, x_coordinate, y_coordinate);
         CREATE INDEX IF NOT EXISTS idx_territories_temporal ON territories(match_id, turn_number);
         CREATE INDEX IF NOT EXISTS idx_territories_owner ON territories(owner_player_id);
-        CREATE INDEX IF NOT EXISTS idx_territories_spatial_temporal ON territories(match_id, turn_number, x_coordinate, y_coordinate);
-        CREATE INDEX IF NOT EXISTS idx_territories_city ON territories(match_id, city_id);
         """
         with self.get_connection() as conn:
             conn.execute(query)
@@ -408,33 +754,26 @@ class TournamentDatabase:
         );
         
         CREATE INDEX IF NOT EXISTS idx_events_match_turn ON events(match_id, turn_number);
-        CREATE INDEX IF NOT EXISTS idx_events_type ON events(event_type);
         CREATE INDEX IF NOT EXISTS idx_events_player ON events(player_id);
-        CREATE INDEX IF NOT EXISTS idx_events_location ON events(x_coordinate, y_coordinate);
-        CREATE INDEX IF NOT EXISTS idx_events_type_player ON events(event_type, player_id, turn_number);
         """
         with self.get_connection() as conn:
             conn.execute(query)
 
     def _create_resources_table(self) -> None:
         """Create the player_yield_history table (formerly resources)."""
-        query = """
+        yield_type = self._categorical_column_type("yield_type_enum")
+        query = f"""
         CREATE TABLE IF NOT EXISTS player_yield_history (
             resource_id BIGINT PRIMARY KEY,
             match_id BIGINT NOT NULL REFERENCES matches(match_id),
             player_id BIGINT NOT NULL REFERENCES players(player_id),
             turn_number INTEGER NOT NULL,
-            resource_type VARCHAR(50) NOT NULL,
+            resource_type {yield_type} NOT NULL,
             amount INTEGER NOT NULL,
 
             CONSTRAINT check_turn_number CHECK(turn_number >= 0),
             CONSTRAINT unique_yield_turn UNIQUE(match_id, player_id, turn_number, resource_type)
         );
-
-        CREATE INDEX IF NOT EXISTS idx_yield_history_match_player ON player_yield_history(match_id, player_id);
-        CREATE INDEX IF NOT EXISTS idx_yield_history_turn ON player_yield_history(turn_number);
-        CREATE INDEX IF NOT EXISTS idx_yield_history_type ON player_yield_history(resource_type);
-        CREATE INDEX IF NOT EXISTS idx_yield_history_match_turn_type ON player_yield_history(match_id, turn_number, resource_type);
         """
         with self.get_connection() as conn:
             conn.execute(query)
@@ -446,23 +785,19 @@ class TournamentDatabase:
         accurate cumulative totals that cannot be derived from rate history alone
         (due to yields from events, bonuses, specialists, trade, etc.).
         """
-        query = """
+        yield_type = self._categorical_column_type("yield_type_enum")
+        query = f"""
         CREATE TABLE IF NOT EXISTS player_yield_total_history (
             total_id BIGINT PRIMARY KEY,
             match_id BIGINT NOT NULL REFERENCES matches(match_id),
             player_id BIGINT NOT NULL REFERENCES players(player_id),
             turn_number INTEGER NOT NULL,
-            resource_type VARCHAR(50) NOT NULL,
+            resource_type {yield_type} NOT NULL,
             amount INTEGER NOT NULL,
 
             CONSTRAINT check_total_turn_number CHECK(turn_number >= 0),
             CONSTRAINT unique_yield_total_turn UNIQUE(match_id, player_id, turn_number, resource_type)
         );
-
-        CREATE INDEX IF NOT EXISTS idx_yield_total_history_match_player ON player_yield_total_history(match_id, player_id);
-        CREATE INDEX IF NOT EXISTS idx_yield_total_history_turn ON player_yield_total_history(turn_number);
-        CREATE INDEX IF NOT EXISTS idx_yield_total_history_type ON player_yield_total_history(resource_type);
-        CREATE INDEX IF NOT EXISTS idx_yield_total_history_match_turn_type ON player_yield_total_history(match_id, turn_number, resource_type);
         """
         with self.get_connection() as conn:
             conn.execute(query)
@@ -785,12 +1120,6 @@ class TournamentDatabase:
             CONSTRAINT check_points CHECK(points >= 0),
             CONSTRAINT unique_points_turn UNIQUE(match_id, player_id, turn_number)
         );
-
-        CREATE INDEX IF NOT EXISTS idx_points_history_match_player
-        ON player_points_history(match_id, player_id);
-
-        CREATE INDEX IF NOT EXISTS idx_points_history_turn
-        ON player_points_history(turn_number);
         """
         with self.get_connection() as conn:
             conn.execute(query)
@@ -809,12 +1138,6 @@ class TournamentDatabase:
             CONSTRAINT check_military_power CHECK(military_power >= 0),
             CONSTRAINT unique_military_turn UNIQUE(match_id, player_id, turn_number)
         );
-
-        CREATE INDEX IF NOT EXISTS idx_military_history_match_player
-        ON player_military_history(match_id, player_id);
-
-        CREATE INDEX IF NOT EXISTS idx_military_history_turn
-        ON player_military_history(turn_number);
         """
         with self.get_connection() as conn:
             conn.execute(query)
@@ -833,12 +1156,6 @@ class TournamentDatabase:
             CONSTRAINT check_legitimacy CHECK(legitimacy >= 0),
             CONSTRAINT unique_legitimacy_turn UNIQUE(match_id, player_id, turn_number)
         );
-
-        CREATE INDEX IF NOT EXISTS idx_legitimacy_history_match_player
-        ON player_legitimacy_history(match_id, player_id);
-
-        CREATE INDEX IF NOT EXISTS idx_legitimacy_history_turn
-        ON player_legitimacy_history(turn_number);
         """
         with self.get_connection() as conn:
             conn.execute(query)
@@ -857,12 +1174,6 @@ class TournamentDatabase:
             CONSTRAINT check_turn_number CHECK(turn_number >= 0),
             CONSTRAINT unique_family_opinion_turn UNIQUE(match_id, player_id, turn_number, family_name)
         );
-
-        CREATE INDEX IF NOT EXISTS idx_family_opinion_match_player
-        ON family_opinion_history(match_id, player_id);
-
-        CREATE INDEX IF NOT EXISTS idx_family_opinion_family
-        ON family_opinion_history(family_name);
         """
         with self.get_connection() as conn:
             conn.execute(query)
@@ -881,12 +1192,6 @@ class TournamentDatabase:
             CONSTRAINT check_turn_number CHECK(turn_number >= 0),
             CONSTRAINT unique_religion_opinion_turn UNIQUE(match_id, player_id, turn_number, religion_name)
         );
-
-        CREATE INDEX IF NOT EXISTS idx_religion_opinion_match_player
-        ON religion_opinion_history(match_id, player_id);
-
-        CREATE INDEX IF NOT EXISTS idx_religion_opinion_religion
-        ON religion_opinion_history(religion_name);
         """
         with self.get_connection() as conn:
             conn.execute(query)
@@ -1028,6 +1333,34 @@ class TournamentDatabase:
         with self.get_connection() as conn:
             conn.execute(query)
 
+    def _create_precomputed_figures_table(self) -> None:
+        """Create the table of precomputed dashboard callback results."""
+        query = """
+        CREATE TABLE IF NOT EXISTS precomputed_figures (
+            name VARCHAR NOT NULL,
+            inputs_json TEXT NOT NULL,
+            is_tuple BOOLEAN NOT NULL,
+            outputs_json TEXT NOT NULL,
+            data_fingerprint VARCHAR NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        """
+        with self.get_connection() as conn:
+            conn.execute(query)
+
+    def _create_tournaments_table(self) -> None:
+        """Create the tournament dimension: which tournament this file holds."""
+        query = """
+        CREATE TABLE IF NOT EXISTS tournaments (
+            tournament_id VARCHAR PRIMARY KEY,
+            name VARCHAR,
+            archived_at TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        """
+        with self.get_connection() as conn:
+            conn.execute(query)
+
     def _create_views(self) -> None:
         """Create performance optimization views."""
         # Player performance summary view
@@ -1405,6 +1738,482 @@ class TournamentDatabase:
             logger.error(f"Error during player narratives migration: {e}")
             raise
 
+    def migrate_to_categorical_columns(self) -> None:
+        """Migrate categorical VARCHAR columns to DuckDB ENUM types.
+
+        Converts the columns listed in CATEGORICAL_COLUMNS. Each enum is built
+        from the game constants plus every value already stored in the
+        database. This cuts storage and makes scans and GROUP BYs on these
+        columns cheaper.
+
+        This migration is idempotent - safe to run multiple times.
+        """
+        logger.info("Checking for categorical columns migration...")
+
+        try:
+            with self.get_connection() as conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS schema_migrations (
+                        version VARCHAR(20) PRIMARY KEY,
+                        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        description TEXT
+                    )
+                """
+                )
+
+                result = conn.execute(
+                    """
+                    SELECT COUNT(*)
+                    FROM schema_migrations
+                    WHERE version = '7'
+                """
+                ).fetchone()
+
+                if result[0] > 0:
+                    logger.info("Categorical columns migration already applied")
+                    return
+
+                existing_tables = self._get_table_names(conn)
+                if "territories" not in existing_tables:
+                    logger.info(
+                        "Territories table does not exist yet - skipping categorical "
+                        "columns migration (tables are created with ENUM columns)"
+                    )
+                    return
+
+                logger.info("Applying categorical columns migration...")
+                logger.info(
+                    "IMPORTANT: Consider backing up your database before applying schema changes"
+                )
+
+                domain_values: Dict[str, set] = {}
+                for type_name, columns in CATEGORICAL_COLUMNS.items():
+                    values = set(CATEGORICAL_SEED_VALUES.get(type_name, []))
+                    for table, column in columns:
+                        if table not in existing_tables:
+                            continue
+                        rows = conn.execute(
+                            f"SELECT DISTINCT {column}::VARCHAR FROM {table} "
+                            f"WHERE {column} IS NOT NULL"
+                        ).fetchall()
+                        values.update(row[0] for row in rows)
+                    domain_values[type_name] = values
+
+            self._rebuild_categorical_tables(domain_values)
+
+            with self.get_connection() as conn:
+                conn.execute(
+                    """
+                    INSERT INTO schema_migrations (version, description, applied_at)
+                    VALUES ('7', 'Store categorical columns as ENUM types', CURRENT_TIMESTAMP)
+                """
+                )
+
+                logger.info("Categorical columns migration completed successfully")
+
+        except Exception as e:
+            logger.error(f"Error during categorical columns migration: {e}")
+            raise
+
+    def _get_table_names(self, conn: duckdb.DuckDBPyConnection) -> set:
+        """Return the names of all tables in the main schema.
+
+        Includes the views over a Parquet dataset that stand in for tables.
+        """
+        rows = conn.execute(
+            """
+            SELECT table_name
+            FROM information_schema.tables
+            WHERE table_schema = 'main'
+              AND (table_type = 'BASE TABLE' OR table_comment = ?)
+        """,
+            [PARQUET_VIEW_COMMENT],
+        ).fetchall()
+        return {row[0] for row in rows}
+
+    def _get_categorical_values(self, type_name: str) -> Optional[set]:
+        """Get the values of an enum type, or None if the type does not exist.
+
+        Args:
+            type_name: Name of the ENUM type
+
+        Returns:
+            Set of enum values, or None if the type does not exist
+        """
+        with self.get_connection() as conn:
+            exists = conn.execute(
+                """
+                SELECT COUNT(*)
+                FROM duckdb_types()
+                WHERE schema_name = 'main' AND type_name = ?
+            """,
+                [type_name],
+            ).fetchone()[0]
+            if not exists:
+                return None
+            values = conn.execute(f"SELECT enum_range(NULL::{type_name})").fetchone()
+            return set(values[0])
+
+    def _ensure_categorical_values(
+        self, table: str, records: List[Dict[str, Any]]
+    ) -> None:
+        """Extend enum types with any new values found in records for a table.
+
+        DuckDB rejects values missing from an ENUM, so this must run before
+        inserting. New values are rare once a few matches are loaded, and the
+        first ones arrive while tables are still small.
+
+        Args:
+            table: Table the records will be inserted into
+            records: Record dictionaries keyed by column name
+        """
+        missing: Dict[str, set] = {}
+        for type_name, columns in CATEGORICAL_COLUMNS.items():
+            for column_table, column in columns:
+                if column_table != table:
+                    continue
+                known = self._get_categorical_values(type_name) or set()
+                new_values = {r.get(column) for r in records} - known - {None}
+                if new_values:
+                    missing.setdefault(type_name, set(known)).update(new_values)
+
+        if missing:
+            for type_name, values in missing.items():
+                logger.info(
+                    f"Extending {type_name} to {len(values)} values for {table}"
+                )
+            self._rebuild_categorical_tables(missing)
+
+    def _rebuild_categorical_tables(self, domain_values: Dict[str, set]) -> None:
+        """Recreate ENUM types and rewrite every table that uses them.
+
+        DuckDB cannot add values to an existing ENUM, or change the type of a
+        column covered by an index or UNIQUE constraint. Each affected table is
+        copied to a temporary table, dropped, recreated with the new types and
+        reloaded, all in one transaction.
+
+        Args:
+            domain_values: Enum type name -> complete set of values
+        """
+        tables = sorted(
+            {table for name in domain_values for table, _ in CATEGORICAL_COLUMNS[name]}
+        )
+        categorical = {
+            pair for columns in CATEGORICAL_COLUMNS.values() for pair in columns
+        }
+        creators = self._table_creators()
+
+        with self.transaction() as conn:
+            existing_tables = self._get_table_names(conn)
+            staged: List[Tuple[str, List[str]]] = []
+            for table in tables:
+                if table not in existing_tables:
+                    continue
+                cast_columns = {c for t, c in categorical if t == table}
+                columns = self._stage_table(conn, table, cast_columns)
+                staged.append((table, columns))
+
+            for type_name, values in domain_values.items():
+                conn.execute(f"DROP TYPE IF EXISTS {type_name}")
+                if values:
+                    conn.execute(
+                        f"CREATE TYPE {type_name} AS ENUM ({_enum_literals(values)})"
+                    )
+
+            for table in tables:
+                creators[table]()
+
+            for table, columns in staged:
+                self._reload_table(conn, table, columns)
+
+    def _table_creators(self) -> Dict[str, Callable[[], None]]:
+        """Map each table that can be rewritten in place to its create method."""
+        return {
+            "territories": self._create_territories_table,
+            "events": self._create_events_table,
+            "player_yield_history": self._create_resources_table,
+            "player_yield_total_history": self._create_yield_total_history_table,
+            "player_points_history": self._create_player_points_history_table,
+            "player_military_history": self._create_player_military_history_table,
+            "player_legitimacy_history": self._create_player_legitimacy_history_table,
+            "family_opinion_history": self._create_family_opinion_history_table,
+            "religion_opinion_history": self._create_religion_opinion_history_table,
+        }
+
+    def _stage_table(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        table: str,
+        cast_columns: Optional[set] = None,
+    ) -> List[str]:
+        """Copy a table to a temporary {table}_staged table and drop it.
+
+        Must run inside a transaction so a failed rewrite leaves the table intact.
+
+        Args:
+            conn: Connection with an open transaction
+            table: Table to stage
+            cast_columns: Columns to copy as VARCHAR (for ENUM rebuilds)
+
+        Returns:
+            Column names of the staged table, in table order
+        """
+        cast_columns = cast_columns or set()
+        columns = [
+            row[0]
+            for row in conn.execute(
+                """
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_schema = 'main' AND table_name = ?
+                ORDER BY ordinal_position
+            """,
+                [table],
+            ).fetchall()
+        ]
+        select_list = ", ".join(
+            f"{c}::VARCHAR AS {c}" if c in cast_columns else c for c in columns
+        )
+        conn.execute(
+            f"CREATE TEMP TABLE {table}_staged AS SELECT {select_list} FROM {table}"
+        )
+        conn.execute(f"DROP TABLE {table}")
+        return columns
+
+    def _reload_table(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        table: str,
+        columns: List[str],
+        order_by: Optional[str] = None,
+    ) -> None:
+        """Reload a recreated table from its staged copy and drop the copy.
+
+        Args:
+            conn: Connection with an open transaction
+            table: Table to reload
+            columns: Column names returned by _stage_table
+            order_by: Optional ORDER BY clause controlling physical row order
+        """
+        column_list = ", ".join(columns)
+        order_clause = f" ORDER BY {order_by}" if order_by else ""
+        conn.execute(
+            f"INSERT INTO {table} ({column_list}) "
+            f"SELECT {column_list} FROM {table}_staged{order_clause}"
+        )
+        conn.execute(f"DROP TABLE {table}_staged")
+
+    def get_storage_stats(self) -> Dict[str, int]:
+        """Get database file size and the bytes actually used by data blocks.
+
+        DuckDB reuses freed blocks but does not shrink the file, so used_bytes is
+        the better measure of what a rewrite saved.
+
+        Returns:
+            Dictionary with file_bytes, used_bytes and wal_bytes
+        """
+        with self.get_connection() as conn:
+            row = conn.execute(
+                "SELECT block_size, used_blocks FROM pragma_database_size() "
+                "WHERE database_name = current_database()"
+            ).fetchone()
+
+        wal_path = f"{self.db_path}.wal"
+        return {
+            "file_bytes": (
+                os.path.getsize(self.db_path) if os.path.exists(self.db_path) else 0
+            ),
+            "used_bytes": row[0] * row[1] if row else 0,
+            "wal_bytes": os.path.getsize(wal_path) if os.path.exists(wal_path) else 0,
+        }
+
+    def optimize_storage(self) -> Dict[str, int]:
+        """Cluster the large tables by match and turn, then checkpoint.
+
+        Rows arrive in many small appends, one save file at a time. Rewriting
+        each table in CLUSTERED_TABLES sorted by (match_id, turn_number) lets
+        zone maps prune row groups, which makes the indexes in REDUNDANT_INDEXES
+        unnecessary, so they are dropped. Run after an import finishes; later
+        imports append unsorted rows until the next run.
+
+        Returns:
+            Table name -> number of rows rewritten
+        """
+        creators = self._table_creators()
+        rewritten: Dict[str, int] = {}
+
+        with self.transaction() as conn:
+            for index_name in REDUNDANT_INDEXES:
+                conn.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+            existing_tables = self._get_table_names(conn)
+            for table in CLUSTERED_TABLES:
+                if table not in existing_tables:
+                    continue
+                columns = self._stage_table(conn, table)
+                creators[table]()
+                self._reload_table(
+                    conn, table, columns, order_by="match_id, turn_number"
+                )
+                rewritten[table] = conn.execute(
+                    f"SELECT COUNT(*) FROM {table}"
+                ).fetchone()[0]
+
+        with self.get_connection() as conn:
+            conn.execute("CHECKPOINT")
+
+        logger.info(f"Optimized storage for {len(rewritten)} tables")
+        return rewritten
+
+    def get_data_fingerprint(self) -> str:
+        """Get a fingerprint of the database contents.
+
+        Changes whenever a match is imported or any small table (participants,
+        overrides, pick order, ...) is edited. Used to detect precomputed
+        results that no longer match the data.
+
+        Returns:
+            Hex digest of per-table row counts and row hashes
+        """
+        parts = []
+        with self.get_connection() as conn:
+            for table in sorted(self._get_table_names(conn)):
+                if table in FINGERPRINT_EXCLUDED_TABLES:
+                    continue
+                count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                digest = None
+                if count <= FINGERPRINT_HASH_ROW_LIMIT:
+                    digest = conn.execute(
+                        f"SELECT bit_xor(hash(t)) FROM {table} t"
+                    ).fetchone()[0]
+                parts.append(f"{table}:{count}:{digest}")
+
+        return hashlib.md5("|".join(parts).encode()).hexdigest()
+
+    def replace_precomputed_figures(
+        self, entries: List[Dict[str, Any]], data_fingerprint: str
+    ) -> None:
+        """Replace all precomputed callback results.
+
+        Args:
+            entries: Dicts with name, inputs, tuple and outputs keys
+            data_fingerprint: Fingerprint of the data the entries were built from
+        """
+        self._create_precomputed_figures_table()
+        rows = [
+            (
+                entry["name"],
+                json.dumps(entry["inputs"], sort_keys=True),
+                entry["tuple"],
+                json.dumps(entry["outputs"]),
+                data_fingerprint,
+            )
+            for entry in entries
+        ]
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM precomputed_figures")
+            if rows:
+                conn.executemany(
+                    "INSERT INTO precomputed_figures "
+                    "(name, inputs_json, is_tuple, outputs_json, data_fingerprint) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+
+    def set_tournament(
+        self, tournament_id: str, name: Optional[str] = None, archived: bool = False
+    ) -> None:
+        """Record the tournament this database holds, replacing any previous one.
+
+        Each database file holds one tournament (see data/tournaments.py).
+
+        Args:
+            tournament_id: Challonge tournament URL identifier, e.g. owduels2025
+            name: Display name (defaults to the identifier)
+            archived: Mark the tournament as archived now
+        """
+        self._create_tournaments_table()
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM tournaments")
+            conn.execute(
+                "INSERT INTO tournaments (tournament_id, name, archived_at) "
+                "VALUES (?, ?, CASE WHEN ? THEN CURRENT_TIMESTAMP END)",
+                [tournament_id, name or tournament_id, archived],
+            )
+
+    def get_tournament(self) -> Optional[Dict[str, Any]]:
+        """Get the tournament this database holds.
+
+        Returns:
+            Dict with tournament_id, name and archived_at, or None if not
+            recorded (databases built before the tournament dimension)
+        """
+        with self.get_connection() as conn:
+            if "tournaments" not in self._get_table_names(conn):
+                return None
+            row = conn.execute(
+                "SELECT tournament_id, name, archived_at FROM tournaments"
+            ).fetchone()
+        if row is None:
+            return None
+        return {"tournament_id": row[0], "name": row[1], "archived_at": row[2]}
+
+    def export_parquet(
+        self, dataset_dir: str, tournament: Optional[str] = None, full: bool = False
+    ) -> Dict[str, int]:
+        """Export all tables as a tournament's part of a Parquet dataset.
+
+        Only partitions that are new or changed since the last export are
+        written. See parquet_dataset.py for the layout.
+
+        Args:
+            dataset_dir: Dataset root directory (created if missing)
+            tournament: Tournament to export as (default: the one recorded in
+                the database, else Config.TOURNAMENT)
+            full: Rewrite every file
+
+        Returns:
+            Table name -> number of files written
+        """
+        from .parquet_dataset import export_dataset
+
+        if tournament is None:
+            held = self.get_tournament()
+            tournament = held["tournament_id"] if held else Config.TOURNAMENT
+        return export_dataset(self, dataset_dir, tournament, full=full)
+
+    def get_precomputed_figures(self) -> List[Dict[str, Any]]:
+        """Get precomputed callback results that still match the data.
+
+        Returns:
+            Entries in the shape accepted by replace_precomputed_figures, or an
+            empty list if none exist or they were built from different data
+        """
+        with self.get_connection() as conn:
+            if "precomputed_figures" not in self._get_table_names(conn):
+                return []
+            rows = conn.execute(
+                "SELECT name, inputs_json, is_tuple, outputs_json, data_fingerprint "
+                "FROM precomputed_figures"
+            ).fetchall()
+
+        if not rows:
+            return []
+        if rows[0][4] != self.get_data_fingerprint():
+            logger.info("Ignoring precomputed figures built from different data")
+            return []
+
+        return [
+            {
+                "name": name,
+                "inputs": json.loads(inputs_json),
+                "tuple": is_tuple,
+                "outputs": json.loads(outputs_json),
+            }
+            for name, inputs_json, is_tuple, outputs_json, _ in rows
+        ]
+
     def get_processed_files(self) -> List[Tuple[str, str]]:
         """Get list of already processed files with their hashes.
 
@@ -1665,6 +2474,8 @@ class TournamentDatabase:
         if not territories_data:
             return
 
+        self._ensure_categorical_values("territories", territories_data)
+
         with self.get_connection() as conn:
             query = """
             INSERT INTO territories (
@@ -1708,6 +2519,8 @@ class TournamentDatabase:
         if not yield_data:
             return
 
+        self._ensure_categorical_values("player_yield_history", yield_data)
+
         with self.get_connection() as conn:
             query = """
             INSERT INTO player_yield_history (
@@ -1749,6 +2562,8 @@ class TournamentDatabase:
         if not yield_total_data:
             return
 
+        self._ensure_categorical_values("player_yield_total_history", yield_total_data)
+
         with self.get_connection() as conn:
             query = """
             INSERT INTO player_yield_total_history (
@@ -2338,11 +3153,21 @@ class TournamentDatabase:
             return result[0] if result else None
 
 
+def _enum_literals(values: Any) -> str:
+    """Format values as a sorted, quoted SQL list for CREATE TYPE ... AS ENUM.
+
+    Sorting keeps ORDER BY on enum columns identical to VARCHAR ordering.
+    """
+    return ", ".join("'" + str(v).replace("'", "''") + "'" for v in sorted(values))
+
+
 # Import Config for database path
 from ..config import Config
 
 # Global database instance
-db = TournamentDatabase(db_path=Config.DATABASE_PATH)
+db = TournamentDatabase(
+    db_path=Config.DATABASE_PATH, read_pool_size=Config.DATABASE_READ_POOL_SIZE
+)
 
 
 def get_database() -> TournamentDatabase:
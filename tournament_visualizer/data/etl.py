@@ -7,7 +7,9 @@ transformation into the appropriate format, and loading into the DuckDB database
 import hashlib
 import logging
 import os
+import time
 import traceback
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -15,17 +17,19 @@ from chyllonge.api import ChallongeApi
 from dotenv import load_dotenv
 
 from .database import TournamentDatabase, get_database
+from .parse_cache import ParsedRecordCache
 from .parser import OldWorldSaveParser, parse_tournament_file
 from .queries import get_queries
 
 logger = logging.getLogger(__name__)
 
 
-def fetch_tournament_rounds(tournament_url: str = "owduels2025") -> Dict[int, int]:
+def fetch_tournament_rounds(tournament_url: Optional[str] = None) -> Dict[int, int]:
     """Fetch tournament round numbers from Challonge API.
 
     Args:
-        tournament_url: Challonge tournament URL identifier
+        tournament_url: Challonge tournament URL identifier (default:
+            Config.TOURNAMENT)
 
     Returns:
         Dictionary mapping challonge_match_id to round number.
@@ -36,7 +40,10 @@ def fetch_tournament_rounds(tournament_url: str = "owduels2025") -> Dict[int, in
         - Positive (1, 2, 3, ...) = Winners Bracket
         - Negative (-1, -2, -3, ...) = Losers Bracket
     """
+    from ..config import Config
+
     load_dotenv()
+    tournament_url = tournament_url or Config.TOURNAMENT
 
     # Check for API credentials
     if not os.getenv("CHALLONGE_KEY"):
@@ -70,15 +77,20 @@ class TournamentETL:
         self,
         database: Optional[TournamentDatabase] = None,
         round_cache: Optional[Dict[int, int]] = None,
+        parse_cache: Optional[ParsedRecordCache] = None,
     ) -> None:
         """Initialize ETL pipeline.
 
         Args:
             database: Database instance to use (defaults to global instance)
             round_cache: Optional cache of challonge_match_id -> round_number
+            parse_cache: Optional cache of parsed records keyed by file hash.
+                When set, saves are only parsed if their cached records are
+                missing or were produced by an older parser version.
         """
         self.db = database or get_database()
         self.round_cache = round_cache or {}
+        self.parse_cache = parse_cache
 
     def calculate_file_hash(self, file_path: str) -> str:
         """Calculate SHA256 hash of a file.
@@ -135,8 +147,11 @@ class TournamentETL:
             # Calculate file hash
             file_hash = self.calculate_file_hash(file_path)
 
-            # Parse the file
-            parsed_data = parse_tournament_file(file_path)
+            # Parse the file (or reuse records parsed by an earlier import)
+            if self.parse_cache is not None:
+                parsed_data = self.parse_cache.get_parsed_data(file_path, file_hash)
+            else:
+                parsed_data = parse_tournament_file(file_path)
 
             # Add file tracking information
             match_metadata = parsed_data["match_metadata"]
@@ -153,8 +168,10 @@ class TournamentETL:
                         f"No round data found for challonge_match_id {challonge_match_id}"
                     )
 
-            # Transform and load data
-            self._load_tournament_data(parsed_data, file_path)
+            # Transform and load data in one transaction so a failure part way
+            # through does not leave a partial match behind
+            with self.db.transaction():
+                self._load_tournament_data(parsed_data, file_path)
 
             logger.info(f"Successfully processed: {file_path}")
             return True
@@ -279,13 +296,24 @@ class TournamentETL:
 
         # Only extract territories if we have turn data
         if final_turn > 0:
-            parser = OldWorldSaveParser(file_path)
-            parser.extract_and_parse()
-            territories = parser.extract_territories(
-                match_id=match_id,
-                final_turn=final_turn,
-                player_id_mapping=player_id_mapping,
-            )
+            if "territories" in parsed_data:
+                # Pre-extracted by the parse cache with slot player IDs
+                territories = parsed_data["territories"]
+                for territory in territories:
+                    territory["match_id"] = match_id
+                    owner = territory["owner_player_id"]
+                    if owner is not None:
+                        territory["owner_player_id"] = player_id_mapping.get(
+                            owner, owner
+                        )
+            else:
+                parser = OldWorldSaveParser(file_path)
+                parser.extract_and_parse()
+                territories = parser.extract_territories(
+                    match_id=match_id,
+                    final_turn=final_turn,
+                    player_id_mapping=player_id_mapping,
+                )
 
             if territories:
                 self.db.bulk_insert_territories(territories)
@@ -726,7 +754,11 @@ class TournamentETL:
         return None
 
     def process_directory(
-        self, directory_path: str, file_pattern: str = "*.zip", deduplicate: bool = True
+        self,
+        directory_path: str,
+        file_pattern: str = "*.zip",
+        deduplicate: bool = True,
+        bulk_load: bool = False,
     ) -> Tuple[int, int, List[Dict[str, Any]]]:
         """Process all tournament files in a directory.
 
@@ -734,6 +766,8 @@ class TournamentETL:
             directory_path: Path to directory containing tournament files
             file_pattern: File pattern to match (default: "*.zip")
             deduplicate: If True, automatically skip duplicate files (default: True)
+            bulk_load: If True, defer index maintenance until all files are
+                loaded (see TournamentDatabase.bulk_load). Use for full rebuilds.
 
         Returns:
             Tuple of (successful_count, total_count, skipped_duplicates)
@@ -762,20 +796,21 @@ class TournamentETL:
         successful_count = 0
         total_files = len(files_to_process)
 
-        for i, file_path in enumerate(files_to_process):
-            logger.info(
-                f"Processing file {i + 1}/{total_files}: {Path(file_path).name}"
-            )
+        with self.db.bulk_load() if bulk_load else nullcontext():
+            for i, file_path in enumerate(files_to_process):
+                logger.info(
+                    f"Processing file {i + 1}/{total_files}: {Path(file_path).name}"
+                )
 
-            # Extract challonge_match_id from filename
-            challonge_match_id = self.extract_challonge_match_id(file_path)
-            if challonge_match_id:
-                logger.info(f"Extracted Challonge match ID: {challonge_match_id}")
+                # Extract challonge_match_id from filename
+                challonge_match_id = self.extract_challonge_match_id(file_path)
+                if challonge_match_id:
+                    logger.info(f"Extracted Challonge match ID: {challonge_match_id}")
 
-            if self.process_tournament_file(file_path, challonge_match_id):
-                successful_count += 1
-            else:
-                logger.error(f"Failed to process: {file_path}")
+                if self.process_tournament_file(file_path, challonge_match_id):
+                    successful_count += 1
+                else:
+                    logger.error(f"Failed to process: {file_path}")
 
         logger.info(
             f"Processing complete: {successful_count}/{total_files} files successful"
@@ -937,14 +972,134 @@ def initialize_database() -> TournamentDatabase:
     # Create a new database instance with write access for schema creation
     db = TournamentDatabase(db_path=Config.DATABASE_PATH, read_only=False)
     db.create_schema()
+
+    # Each database holds one tournament; see data/tournaments.py
+    held = db.get_tournament()
+    if held is None:
+        db.set_tournament(Config.TOURNAMENT)
+    elif held["tournament_id"] != Config.TOURNAMENT:
+        db.close()
+        raise ValueError(
+            f"{Config.DATABASE_PATH} holds tournament {held['tournament_id']!r}, "
+            f"not TOURNAMENT={Config.TOURNAMENT!r}. Archive it with "
+            "scripts/archive_tournament.py, then rebuild with --force."
+        )
     logger.info("Database initialized successfully")
     return db
 
 
+# Representative per-match and cross-match reads used to report the effect of
+# optimize_database(). Per-match queries run against the most recent match.
+OPTIMIZE_BENCHMARK_QUERIES: Dict[str, str] = {
+    "territory_snapshot": """
+        SELECT x_coordinate, y_coordinate, terrain_type, owner_player_id
+        FROM territories
+        WHERE match_id = $match_id
+          AND turn_number = (
+              SELECT MAX(turn_number) FROM territories WHERE match_id = $match_id
+          )
+    """,
+    "territory_control": """
+        SELECT turn_number, owner_player_id, COUNT(*) AS tiles
+        FROM territories
+        WHERE match_id = $match_id AND owner_player_id IS NOT NULL
+        GROUP BY turn_number, owner_player_id
+    """,
+    "match_events": """
+        SELECT turn_number, event_type, player_id, description
+        FROM events
+        WHERE match_id = $match_id
+        ORDER BY turn_number
+    """,
+    "yield_history": """
+        SELECT player_id, turn_number, amount
+        FROM player_yield_history
+        WHERE match_id = $match_id AND resource_type = 'YIELD_SCIENCE'
+        ORDER BY turn_number
+    """,
+    "event_type_counts": """
+        SELECT event_type, COUNT(*) AS event_count
+        FROM events
+        GROUP BY event_type
+    """,
+}
+
+
+def _time_benchmark_queries(
+    db: TournamentDatabase, repeats: int = 3
+) -> Dict[str, float]:
+    """Run OPTIMIZE_BENCHMARK_QUERIES and return the best latency of each in ms.
+
+    Args:
+        db: Database to query
+        repeats: Number of runs per query; the fastest is reported
+
+    Returns:
+        Query name -> best latency in milliseconds (empty if no matches exist)
+    """
+    row = db.fetch_one("SELECT MAX(match_id) FROM matches")
+    if not row or row[0] is None:
+        return {}
+
+    latencies: Dict[str, float] = {}
+    for name, query in OPTIMIZE_BENCHMARK_QUERIES.items():
+        params = {"match_id": row[0]} if "$match_id" in query else None
+        best = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            db.fetch_all(query, params)
+            best = min(best, time.perf_counter() - start)
+        latencies[name] = best * 1000
+    return latencies
+
+
+def optimize_database(db: TournamentDatabase) -> Dict[str, Any]:
+    """Run the post-import storage optimization and measure its effect.
+
+    See TournamentDatabase.optimize_storage() for what is rewritten.
+
+    Args:
+        db: Database opened read-write
+
+    Returns:
+        Dictionary with before/after storage stats, before/after benchmark
+        latencies and the row count of each rewritten table
+    """
+    logger.info("Optimizing database storage...")
+    with db.get_connection() as conn:
+        conn.execute("CHECKPOINT")
+
+    before_storage = db.get_storage_stats()
+    before_latency = _time_benchmark_queries(db)
+
+    start = time.perf_counter()
+    tables = db.optimize_storage()
+    duration = time.perf_counter() - start
+
+    after_storage = db.get_storage_stats()
+    after_latency = _time_benchmark_queries(db)
+
+    get_queries().invalidate_caches()
+
+    logger.info(
+        f"Storage optimized in {duration:.1f}s: "
+        f"{before_storage['used_bytes']} -> {after_storage['used_bytes']} bytes used"
+    )
+
+    return {
+        "tables": tables,
+        "duration_seconds": duration,
+        "storage": {"before": before_storage, "after": after_storage},
+        "latency_ms": {"before": before_latency, "after": after_latency},
+    }
+
+
 def process_tournament_directory(
     directory_path: str,
     challonge_match_mapping: Optional[Dict[str, int]] = None,
     deduplicate: bool = True,
+    bulk_load: bool = False,
+    parse_cache: Optional[ParsedRecordCache] = None,
 ) -> Dict[str, Any]:
     """Process all tournament files in a directory.
 
@@ -952,6 +1107,8 @@ def process_tournament_directory(
         directory_path: Path to directory containing tournament save files
         challonge_match_mapping: Optional mapping of filename to Challonge match ID
         deduplicate: If True, automatically skip duplicate files (default: True)
+        bulk_load: If True, defer index maintenance until all files are loaded
+        parse_cache: Optional cache of parsed records to reuse across rebuilds
 
     Returns:
         Dictionary with processing results
@@ -964,11 +1121,11 @@ def process_tournament_directory(
     round_cache = fetch_tournament_rounds()
 
     # Create ETL instance
-    etl = TournamentETL(db, round_cache=round_cache)
+    etl = TournamentETL(db, round_cache=round_cache, parse_cache=parse_cache)
 
     # Process all files
     successful_count, total_count, skipped_duplicates = etl.process_directory(
-        directory_path, deduplicate=deduplicate
+        directory_path, deduplicate=deduplicate, bulk_load=bulk_load
     )
 
     # Cleanup and validate
@@ -82,6 +82,48 @@ LAW_TO_CLASS: dict[str, str] = {
     law: class_name for class_name, laws in LAW_CLASSES.items() for law in laws
 }
 
+# Yield types tracked in YieldRateHistory / YieldTotalHistory
+YIELD_TYPES: list[str] = [
+    "YIELD_CIVICS",
+    "YIELD_CULTURE",
+    "YIELD_DISCONTENT",
+    "YIELD_FOOD",
+    "YIELD_GROWTH",
+    "YIELD_HAPPINESS",
+    "YIELD_IRON",
+    "YIELD_LEGITIMACY",
+    "YIELD_MAINTENANCE",
+    "YIELD_MONEY",
+    "YIELD_ORDERS",
+    "YIELD_SCIENCE",
+    "YIELD_STONE",
+    "YIELD_TRAINING",
+    "YIELD_WOOD",
+]
+
+# Tile terrain and height constants (map sprites exist for each)
+TERRAIN_TYPES: list[str] = [
+    "TERRAIN_ARID",
+    "TERRAIN_FROST",
+    "TERRAIN_LUSH",
+    "TERRAIN_MARSH",
+    "TERRAIN_SAND",
+    "TERRAIN_TEMPERATE",
+    "TERRAIN_TUNDRA",
+    "TERRAIN_URBAN",
+    "TERRAIN_WATER",
+]
+
+HEIGHT_TYPES: list[str] = [
+    "HEIGHT_COAST",
+    "HEIGHT_FLAT",
+    "HEIGHT_HILL",
+    "HEIGHT_LAKE",
+    "HEIGHT_MOUNTAIN",
+    "HEIGHT_OCEAN",
+    "HEIGHT_VOLCANO",
+]
+
 # Timeline icons for event display
 TIMELINE_ICONS: dict[str, str] = {
     "tech": "🔬",
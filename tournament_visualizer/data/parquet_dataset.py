@@ -0,0 +1,322 @@
+"""Partitioned Parquet export of a tournament database, and serving from it.
+
+TournamentDatabase.export_parquet() writes every table of a database as a
+Parquet dataset. Tables with a match_id column are partitioned by match,
+the others are written whole:
+
+    {dataset}/{table}/tournament={t}/match_id={id}/part-{digest}.parquet
+    {dataset}/{table}/tournament={t}/part-{digest}.parquet
+    {dataset}/_manifest/tournament={t}.json
+
+The digest is the row count and a hash of the partition's rows, so a
+partition whose data did not change keeps its file and is not written again.
+Publishing after an import therefore only writes the new match partitions,
+plus any partitions that were edited (participant links, overrides) and the
+small unpartitioned tables that changed. Files are never modified in place.
+The manifest lists the files of the current generation and is replaced
+atomically after they are written. Files dropped from it are deleted on the
+next publish, so readers still on the previous generation keep working.
+
+The dataset needs no DuckDB file lock, so any number of processes and
+machines can read it, e.g. from a shared volume. open_dataset_catalog() builds
+a small local DuckDB file of views over one manifest generation. The views
+cast columns back to the source types and replay the source database's
+views, so TournamentDatabase and TournamentQueries run against it unchanged.
+With Config.PARQUET_DATASET set, the server serves the dataset this way and
+switches to each new generation between requests (see data_refresh.py).
+"""
+
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import duckdb
+
+from .database import PARQUET_VIEW_COMMENT
+from .tournaments import validate_tournament_id
+
+if TYPE_CHECKING:
+    from .database import TournamentDatabase
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_DIR = "_manifest"
+MANIFEST_FORMAT = 1
+CATALOG_SUFFIX = ".duckdb"
+
+# Row order within each file. Territory pages read one turn of one match, so
+# territories are sorted by turn and split into row groups of a few turns
+# each, which lets the Parquet reader skip the other turns using row group
+# statistics. Yield charts read one yield type per player. Other tables keep
+# their id order, which follows the import order.
+PARQUET_SORT_KEYS: Dict[str, str] = {
+    "territories": "turn_number, y_coordinate, x_coordinate",
+    "player_yield_history": "resource_type, player_id, turn_number",
+    "player_yield_total_history": "resource_type, player_id, turn_number",
+}
+# Rows per row group. About ten turns of territories on a large map; the
+# other per-match partitions fit in a single row group.
+PARQUET_ROW_GROUP_SIZES: Dict[str, int] = {"territories": 20_480}
+PARQUET_DEFAULT_ROW_GROUP_SIZE = 122_880
+
+
+def manifest_path(dataset_dir: str, tournament: str) -> Path:
+    """Path of a tournament's manifest in a dataset."""
+    return (
+        Path(dataset_dir)
+        / MANIFEST_DIR
+        / f"tournament={validate_tournament_id(tournament)}.json"
+    )
+
+
+def load_manifest(dataset_dir: str, tournament: str) -> Optional[Dict[str, Any]]:
+    """Read a tournament's manifest.
+
+    Args:
+        dataset_dir: Dataset root directory
+        tournament: Tournament identifier
+
+    Returns:
+        The manifest, or None if the tournament has not been exported
+    """
+    try:
+        with open(manifest_path(dataset_dir, tournament)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staging = path.with_name(path.name + ".tmp")
+    with open(staging, "w") as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(staging, path)
+
+
+def _table_columns(conn: duckdb.DuckDBPyConnection, table: str) -> List[List[str]]:
+    return [
+        [name, data_type]
+        for name, data_type in conn.execute(
+            """
+            SELECT column_name, data_type
+            FROM duckdb_columns()
+            WHERE schema_name = 'main' AND table_name = ?
+            ORDER BY column_index
+        """,
+            [table],
+        ).fetchall()
+    ]
+
+
+def _write_partition(
+    conn: duckdb.DuckDBPyConnection,
+    table: str,
+    columns: List[str],
+    where: str,
+    path: Path,
+) -> None:
+    order_by = PARQUET_SORT_KEYS.get(table, columns[0])
+    row_group_size = PARQUET_ROW_GROUP_SIZES.get(table, PARQUET_DEFAULT_ROW_GROUP_SIZE)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staging = path.with_name(path.name + ".tmp")
+    conn.execute(
+        f"COPY (SELECT {', '.join(columns)} FROM {table}{where} "
+        f"ORDER BY {order_by}) TO '{staging}' "
+        f"(FORMAT parquet, COMPRESSION zstd, ROW_GROUP_SIZE {row_group_size})"
+    )
+    os.replace(staging, path)
+
+
+def export_dataset(
+    db: "TournamentDatabase",
+    dataset_dir: str,
+    tournament: str,
+    full: bool = False,
+) -> Dict[str, int]:
+    """Export a database as a tournament's part of a Parquet dataset.
+
+    Use TournamentDatabase.export_parquet(), which picks the tournament.
+
+    Args:
+        db: Database to export
+        dataset_dir: Dataset root directory (created if missing)
+        tournament: Tournament the database holds
+        full: Rewrite every file, not just new and changed partitions
+
+    Returns:
+        Table name -> number of files written
+    """
+    root = Path(dataset_dir)
+    previous = load_manifest(dataset_dir, tournament) or {}
+    previous_files = {
+        (table, key): rel
+        for table, spec in previous.get("tables", {}).items()
+        for key, rel in spec["files"].items()
+    }
+    tables: Dict[str, Dict[str, Any]] = {}
+    written: Dict[str, int] = {}
+
+    with db.get_connection() as conn:
+        for table in sorted(db._get_table_names(conn)):
+            columns = _table_columns(conn, table)
+            names = [name for name, _ in columns]
+            partitioned = "match_id" in names
+            base = f"{table}/tournament={tournament}"
+            if partitioned:
+                digests = conn.execute(
+                    f"SELECT match_id, COUNT(*), bit_xor(hash(t)) "
+                    f"FROM {table} t GROUP BY match_id"
+                ).fetchall()
+                # The match_id is in the path
+                file_columns = [name for name in names if name != "match_id"]
+            else:
+                digests = [
+                    (None,)
+                    + conn.execute(
+                        f"SELECT COUNT(*), bit_xor(hash(t)) FROM {table} t"
+                    ).fetchone()
+                ]
+                file_columns = names
+
+            files: Dict[str, str] = {}
+            written[table] = 0
+            for match_id, count, row_hash in digests:
+                key = "" if match_id is None else str(match_id)
+                directory = f"{base}/match_id={match_id}" if partitioned else base
+                rel = f"{directory}/part-{count}-{row_hash or 0:016x}.parquet"
+                files[key] = rel
+                unchanged = previous_files.get((table, key)) == rel
+                if unchanged and not full and (root / rel).exists():
+                    continue
+                where = f" WHERE match_id = {int(match_id)}" if partitioned else ""
+                _write_partition(conn, table, file_columns, where, root / rel)
+                written[table] += 1
+
+            tables[table] = {
+                "columns": columns,
+                "partitioned": partitioned,
+                "files": files,
+            }
+
+        views = {
+            name: sql
+            for name, sql in conn.execute(
+                "SELECT view_name, sql FROM duckdb_views() "
+                "WHERE schema_name = 'main' AND NOT internal"
+            ).fetchall()
+        }
+
+    if not full and tables == previous.get("tables") and views == previous.get("views"):
+        logger.info(
+            f"{tournament} is unchanged since generation {previous['generation']}"
+        )
+        return written
+
+    current = {rel for spec in tables.values() for rel in spec["files"].values()}
+    manifest = {
+        "format": MANIFEST_FORMAT,
+        "tournament": tournament,
+        "generation": previous.get("generation", 0) + 1,
+        "published_at": datetime.now(timezone.utc).isoformat(),
+        "tables": tables,
+        "views": views,
+        "retired": sorted(set(previous_files.values()) - current),
+    }
+    _write_json(manifest_path(dataset_dir, tournament), manifest)
+
+    # Files the previous generation stopped using; readers have moved on
+    for rel in previous.get("retired", []):
+        if rel not in current:
+            (root / rel).unlink(missing_ok=True)
+
+    logger.info(
+        f"Exported {tournament} generation {manifest['generation']} to "
+        f"{dataset_dir}: {sum(written.values())} of {len(current)} files written"
+    )
+    return written
+
+
+def _sql_list(values: List[str]) -> str:
+    return "[" + ", ".join("'" + v.replace("'", "''") + "'" for v in values) + "]"
+
+
+def build_catalog(manifest: Dict[str, Any], dataset_dir: str, path: Path) -> None:
+    """Create a DuckDB file of views over one manifest generation.
+
+    Args:
+        manifest: Manifest from load_manifest()
+        dataset_dir: Dataset root directory the manifest paths are relative to
+        path: Catalog file to create
+    """
+    root = Path(dataset_dir).resolve()
+    path.unlink(missing_ok=True)
+    conn = duckdb.connect(str(path))
+    try:
+        for table, spec in manifest["tables"].items():
+            columns = spec["columns"]
+            files = [str(root / rel) for rel in spec["files"].values()]
+            if not files:
+                select = ", ".join(f"CAST(NULL AS {t}) AS {c}" for c, t in columns)
+                source = "(SELECT 1) WHERE false"
+            else:
+                select = ", ".join(f"CAST({c} AS {t}) AS {c}" for c, t in columns)
+                if spec["partitioned"]:
+                    match_type = dict(columns)["match_id"]
+                    source = (
+                        f"read_parquet({_sql_list(files)}, hive_partitioning = true, "
+                        f"hive_types = {{'match_id': {match_type}}})"
+                    )
+                else:
+                    source = (
+                        f"read_parquet({_sql_list(files)}, hive_partitioning = false)"
+                    )
+            conn.execute(f"CREATE VIEW {table} AS SELECT {select} FROM {source}")
+            conn.execute(f"COMMENT ON VIEW {table} IS '{PARQUET_VIEW_COMMENT}'")
+        for sql in manifest["views"].values():
+            conn.execute(sql)
+    finally:
+        conn.close()
+
+
+def open_dataset_catalog(
+    dataset_dir: str, tournament: str, catalog_dir: str
+) -> Optional[Path]:
+    """Get the catalog of a tournament's current dataset generation.
+
+    Built on first request for each generation. Each worker may build it; the
+    file is renamed into place, so they never see a partial one. Catalogs of
+    generations before the previous one are deleted.
+
+    Args:
+        dataset_dir: Dataset root directory
+        tournament: Tournament identifier
+        catalog_dir: Local directory for catalog files
+
+    Returns:
+        Path of the catalog, or None if the tournament has not been exported
+    """
+    manifest = load_manifest(dataset_dir, tournament)
+    if manifest is None:
+        return None
+    directory = Path(catalog_dir)
+    path = directory / f"{tournament}-{manifest['generation']}{CATALOG_SUFFIX}"
+    if path.exists():
+        return path
+
+    directory.mkdir(parents=True, exist_ok=True)
+    staging = path.with_name(f"{path.stem}.{os.getpid()}.tmp")
+    build_catalog(manifest, dataset_dir, staging)
+    os.replace(staging, path)
+    logger.info(f"Built catalog for {tournament} generation {manifest['generation']}")
+
+    for stale in directory.glob(f"{tournament}-*{CATALOG_SUFFIX}"):
+        generation = stale.stem.rsplit("-", 1)[-1]
+        if generation.isdigit() and int(generation) < manifest["generation"] - 1:
+            stale.unlink(missing_ok=True)
+    return path
@@ -0,0 +1,232 @@
+"""Persistent cache of parsed save file records.
+
+Parsing a save file means unzipping it and walking a large XML tree, which
+dominates the time of a full rebuild. This module stores each section returned
+by parse_tournament_file as a Parquet file, keyed by the save file's SHA-256
+hash and the section's version in PARSED_SECTION_VERSIONS. A rebuild with an
+unchanged parser then reloads records without touching the XML.
+
+Layout:
+    {cache_dir}/{file_hash}/manifest.json
+    {cache_dir}/{file_hash}/{section}.v{version}.parquet
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import duckdb
+import pandas as pd
+
+from .parser import PARSED_SECTION_VERSIONS, parse_tournament_file
+
+logger = logging.getLogger(__name__)
+
+
+class ParsedRecordCache:
+    """Stores parse_tournament_file output as per-section Parquet artifacts."""
+
+    def __init__(self, cache_dir: str) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding one subdirectory per save file hash
+        """
+        self.cache_dir = Path(cache_dir)
+
+    def get_parsed_data(
+        self,
+        file_path: str,
+        file_hash: str,
+        sections: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Any]:
+        """Get parsed data for a save file, parsing only what is not cached.
+
+        Sections whose cached version matches PARSED_SECTION_VERSIONS are read
+        from Parquet. Missing or outdated sections are parsed from the save
+        file and written back to the cache.
+
+        Args:
+            file_path: Path to the tournament save zip file
+            file_hash: SHA-256 hash of the file
+            sections: Sections to return (default: all, including territories)
+
+        Returns:
+            Dictionary in the same shape as parse_tournament_file output
+        """
+        wanted = (
+            list(sections) if sections is not None else list(PARSED_SECTION_VERSIONS)
+        )
+        parsed_data, missing = self.load(file_hash, wanted)
+
+        if missing:
+            logger.info(
+                f"Parse cache miss for {Path(file_path).name}: "
+                f"parsing {len(missing)}/{len(wanted)} sections"
+            )
+            fresh = parse_tournament_file(file_path, sections=missing)
+            self.store(file_hash, fresh)
+            parsed_data.update(fresh)
+        else:
+            logger.info(f"Parse cache hit for {Path(file_path).name}")
+
+        # The same save may be imported under a different file name
+        if "match_metadata" in parsed_data:
+            parsed_data["match_metadata"]["file_name"] = Path(file_path).name
+
+        return parsed_data
+
+    def load(
+        self, file_hash: str, sections: Iterable[str]
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """Load cached sections for a file hash.
+
+        Args:
+            file_hash: SHA-256 hash of the save file
+            sections: Sections to load
+
+        Returns:
+            Tuple of (sections loaded from cache, sections missing or outdated)
+        """
+        manifest = self._read_manifest(file_hash)
+        loaded: Dict[str, Any] = {}
+        missing: List[str] = []
+
+        for section in sections:
+            entry = manifest.get(section)
+            if entry is None or entry["version"] != PARSED_SECTION_VERSIONS[section]:
+                missing.append(section)
+                continue
+
+            try:
+                records = self._read_records(file_hash, entry)
+            except (OSError, duckdb.Error) as e:
+                logger.warning(f"Unreadable parse cache entry for {section}: {e}")
+                missing.append(section)
+                continue
+
+            loaded[section] = records[0] if entry["kind"] == "record" else records
+
+        return loaded, missing
+
+    def store(self, file_hash: str, parsed_data: Dict[str, Any]) -> None:
+        """Write parsed sections to the cache, replacing older versions.
+
+        Args:
+            file_hash: SHA-256 hash of the save file
+            parsed_data: Sections returned by parse_tournament_file
+        """
+        file_dir = self.cache_dir / file_hash
+        file_dir.mkdir(parents=True, exist_ok=True)
+        manifest = self._read_manifest(file_hash)
+
+        for section, value in parsed_data.items():
+            version = PARSED_SECTION_VERSIONS[section]
+            kind = "record" if isinstance(value, dict) else "records"
+            records = [value] if kind == "record" else value
+
+            old_entry = manifest.get(section)
+            if old_entry and old_entry.get("file"):
+                (file_dir / old_entry["file"]).unlink(missing_ok=True)
+
+            entry: Dict[str, Any] = {
+                "version": version,
+                "kind": kind,
+                "rows": len(records),
+                "file": None,
+                "json_columns": [],
+            }
+            if records:
+                frame, json_columns = _records_to_frame(records)
+                file_name = f"{section}.v{version}.parquet"
+                _write_parquet(frame, file_dir / file_name)
+                entry["file"] = file_name
+                entry["json_columns"] = json_columns
+
+            manifest[section] = entry
+
+        manifest_path = file_dir / "manifest.json"
+        tmp_path = file_dir / "manifest.json.tmp"
+        tmp_path.write_text(json.dumps(manifest, indent=2))
+        os.replace(tmp_path, manifest_path)
+
+    def _read_manifest(self, file_hash: str) -> Dict[str, Any]:
+        """Read the manifest for a file hash, or an empty one if absent."""
+        manifest_path = self.cache_dir / file_hash / "manifest.json"
+        if not manifest_path.exists():
+            return {}
+        try:
+            return json.loads(manifest_path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable parse cache manifest: {e}")
+            return {}
+
+    def _read_records(
+        self, file_hash: str, entry: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Read the records of one manifest entry back into dictionaries."""
+        if not entry["file"]:
+            return []
+
+        path = self.cache_dir / file_hash / entry["file"]
+        with duckdb.connect() as conn:
+            result = conn.execute("SELECT * FROM read_parquet(?)", [str(path)])
+            columns = [column[0] for column in result.description]
+            rows = result.fetchall()
+
+        records = [dict(zip(columns, row)) for row in rows]
+        for column in entry["json_columns"]:
+            for record in records:
+                if record[column] is not None:
+                    record[column] = json.loads(record[column])
+        return records
+
+
+def _records_to_frame(
+    records: List[Dict[str, Any]],
+) -> Tuple[pd.DataFrame, List[str]]:
+    """Build a typed DataFrame from record dictionaries.
+
+    Columns with a single scalar type keep it (nullable where needed). Nested
+    values and columns mixing types are stored as JSON text.
+
+    Returns:
+        Tuple of (DataFrame, names of JSON-encoded columns)
+    """
+    columns: Dict[str, None] = {}
+    for record in records:
+        columns.update(dict.fromkeys(record))
+
+    data: Dict[str, pd.Series] = {}
+    json_columns: List[str] = []
+    for column in columns:
+        values = [record.get(column) for record in records]
+        kinds = {type(value) for value in values if value is not None}
+
+        if not kinds or kinds == {int}:
+            data[column] = pd.Series(values, dtype="Int64")
+        elif kinds == {bool}:
+            data[column] = pd.Series(values, dtype="boolean")
+        elif kinds <= {int, float}:
+            data[column] = pd.Series(values, dtype="Float64")
+        elif kinds == {str}:
+            data[column] = pd.Series(values, dtype=object)
+        elif kinds == {datetime}:
+            data[column] = pd.Series(values, dtype="datetime64[us]")
+        else:
+            json_columns.append(column)
+            data[column] = pd.Series(
+                [None if value is None else json.dumps(value) for value in values],
+                dtype=object,
+            )
+
+    return pd.DataFrame(data), json_columns
+
+
+def _write_parquet(frame: pd.DataFrame, path: Path) -> None:
+    """Write a DataFrame to Parquet through DuckDB."""
+    with duckdb.connect() as conn:
+        conn.from_df(frame).write_parquet(str(path))
@@ -10,10 +10,74 @@ import xml.etree.ElementTree as ET
 import zipfile
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from lxml import etree as lxml_etree
+
+from ..config import Config
 
 logger = logging.getLogger(__name__)
 
+# Supported XML backends (selected with Config.XML_PARSER_BACKEND)
+XML_PARSER_BACKENDS = ("lxml", "etree")
+
+XmlElement = Union[ET.Element, lxml_etree._Element]
+
+# Compiled XPath expressions for lxml trees, keyed by expression
+_COMPILED_XPATHS: Dict[str, lxml_etree.XPath] = {}
+
+# Child elements of <Tile> read by extract_territories
+_TILE_FIELDS = (
+    "Terrain",
+    "Height",
+    "Improvement",
+    "Specialist",
+    "Resource",
+    "Road",
+    "CityTerritory",
+    "OwnerHistory",
+)
+
+# Child elements of <MemoryData> read by extract_events
+_MEMORY_FIELDS = (
+    "Turn",
+    "Type",
+    "Player",
+    "Religion",
+    "Tribe",
+    "Family",
+    "Nation",
+    "CharacterID",
+    "CityID",
+)
+
+# Output version of each section returned by parse_tournament_file. Bump a
+# section's version whenever its extractor output changes, so cached parse
+# artifacts for that section (and only that section) are rebuilt.
+PARSED_SECTION_VERSIONS: Dict[str, int] = {
+    "match_metadata": 1,
+    "players": 1,
+    "game_states": 1,
+    "events": 1,
+    "resources": 1,
+    "technology_progress": 1,
+    "player_statistics": 1,
+    "units_produced": 1,
+    "detailed_metadata": 1,
+    "yield_history": 1,
+    "yield_total_history": 1,
+    "points_history": 1,
+    "military_history": 1,
+    "legitimacy_history": 1,
+    "family_opinion_history": 1,
+    "religion_opinion_history": 1,
+    "rulers": 1,
+    "cities": 1,
+    "city_unit_production": 1,
+    "city_projects": 1,
+    "territories": 1,
+}
+
 
 class TerrainType:
     """Old World terrain type constants from XML."""
@@ -30,15 +94,23 @@ class TerrainType:
 class OldWorldSaveParser:
     """Parser for Old World game save XML files."""
 
-    def __init__(self, zip_file_path: str) -> None:
+    def __init__(self, zip_file_path: str, backend: Optional[str] = None) -> None:
         """Initialize parser with a zip file path.
 
         Args:
             zip_file_path: Path to the tournament save zip file
+            backend: XML backend, one of XML_PARSER_BACKENDS
+                (default: Config.XML_PARSER_BACKEND)
         """
         self.zip_file_path = Path(zip_file_path)
+        self.backend = backend or Config.XML_PARSER_BACKEND
+        if self.backend not in XML_PARSER_BACKENDS:
+            raise ValueError(
+                f"Unknown XML parser backend '{self.backend}', "
+                f"expected one of {XML_PARSER_BACKENDS}"
+            )
         self.xml_content: Optional[str] = None
-        self.root: Optional[ET.Element] = None
+        self.root: Optional[XmlElement] = None
 
     def parse_xml_file(self, xml_file_path: str) -> None:
         """Parse XML directly from a file (for testing purposes).
@@ -48,16 +120,18 @@ class OldWorldSaveParser:
         """
         xml_path = Path(xml_file_path)
         try:
-            with open(xml_path, encoding="utf-8") as f:
-                self.xml_content = f.read()
+            with open(xml_path, "rb") as f:
+                raw_xml = f.read()
+        except FileNotFoundError:
+            raise ValueError(f"XML file not found: {xml_path}")
 
-            self.root = ET.fromstring(self.xml_content)
+        self.xml_content = raw_xml.decode("utf-8")
+        try:
+            self._parse_xml(raw_xml)
             logger.info(
                 f"Successfully parsed XML from {xml_path} with root element: {self.root.tag}"
             )
-        except FileNotFoundError:
-            raise ValueError(f"XML file not found: {xml_path}")
-        except ET.ParseError as e:
+        except (ET.ParseError, lxml_etree.XMLSyntaxError) as e:
             raise ValueError(f"Error parsing XML from {xml_path}: {e}")
 
     def extract_and_parse(self) -> None:
@@ -74,7 +148,8 @@ class OldWorldSaveParser:
 
                 # Read the XML content
                 with zip_file.open(xml_file) as xml_content:
-                    self.xml_content = xml_content.read().decode("utf-8")
+                    raw_xml = xml_content.read()
+                    self.xml_content = raw_xml.decode("utf-8")
 
         except zipfile.BadZipFile:
             raise ValueError(f"Invalid zip file: {self.zip_file_path}")
@@ -83,11 +158,89 @@ class OldWorldSaveParser:
 
         # Parse the XML
         try:
-            self.root = ET.fromstring(self.xml_content)
+            self._parse_xml(raw_xml)
             logger.info(f"Successfully parsed XML with root element: {self.root.tag}")
-        except ET.ParseError as e:
+        except (ET.ParseError, lxml_etree.XMLSyntaxError) as e:
             raise ValueError(f"Error parsing XML from {self.zip_file_path}: {e}")
 
+    def _parse_xml(self, raw_xml: bytes) -> None:
+        """Parse raw XML bytes into self.root using the configured backend.
+
+        The lxml backend drops comments and processing instructions so that
+        iterating an element yields only child elements, as with ElementTree.
+        """
+        if self.backend == "lxml":
+            parser = lxml_etree.XMLParser(
+                huge_tree=True,
+                remove_comments=True,
+                remove_pis=True,
+                resolve_entities=False,
+            )
+            self.root = lxml_etree.fromstring(raw_xml, parser)
+        else:
+            self.root = ET.fromstring(raw_xml)
+
+    def _findall(self, path: str) -> List[XmlElement]:
+        """Find all elements matching an ElementPath expression from the root.
+
+        On lxml trees the expression is compiled once as XPath and evaluated in
+        C, instead of walking the whole tree in Python for every call.
+
+        Args:
+            path: ElementPath expression that is also valid XPath
+
+        Returns:
+            Matching elements in document order
+        """
+        if not isinstance(self.root, lxml_etree._Element):
+            return self.root.findall(path)
+
+        xpath = _COMPILED_XPATHS.get(path)
+        if xpath is None:
+            xpath = _COMPILED_XPATHS[path] = lxml_etree.XPath(path)
+        return xpath(self.root)
+
+    def _find(self, path: str) -> Optional[XmlElement]:
+        """Find the first element matching an ElementPath expression from the root.
+
+        Args:
+            path: ElementPath expression that is also valid XPath
+
+        Returns:
+            First matching element, or None
+        """
+        if not isinstance(self.root, lxml_etree._Element):
+            return self.root.find(path)
+
+        matches = self._findall(f"({path})[1]")
+        return matches[0] if matches else None
+
+    @staticmethod
+    def _first_children(
+        elem: XmlElement, tags: Tuple[str, ...]
+    ) -> Dict[str, XmlElement]:
+        """Get the first child element for each of several tags in one pass.
+
+        Replaces a chain of elem.find(tag) calls, each of which rescans the
+        children. lxml filters tags in C via iterchildren.
+
+        Args:
+            elem: Parent element
+            tags: Child tags to look for
+
+        Returns:
+            Tag -> first child with that tag (tags without a child are absent)
+        """
+        if isinstance(elem, lxml_etree._Element):
+            children = elem.iterchildren(*tags)
+        else:
+            children = (child for child in elem if child.tag in tags)
+
+        found: Dict[str, XmlElement] = {}
+        for child in children:
+            found.setdefault(child.tag, child)
+        return found
+
     def extract_basic_metadata(self) -> Dict[str, Any]:
         """Extract basic match metadata from the save file.
 
@@ -187,7 +340,7 @@ class OldWorldSaveParser:
             metadata["map_size"] = f"{map_width}x{map_width}"
 
         # Extract victory conditions from VictoryEnabled section
-        victory_enabled = self.root.find(".//VictoryEnabled")
+        victory_enabled = self._find(".//VictoryEnabled")
         if victory_enabled is not None:
             conditions = []
             for victory_elem in victory_enabled:
@@ -201,7 +354,7 @@ class OldWorldSaveParser:
             )
 
         # Get total turns from Game/Turn element
-        game_elem = self.root.find(".//Game")
+        game_elem = self._find(".//Game")
         if game_elem is not None:
             # Get the turn number from the Game/Turn element
             turn_elem = game_elem.find("Turn")
@@ -240,7 +393,7 @@ class OldWorldSaveParser:
         players = []
 
         # Find all player elements that have OnlineID (human players)
-        player_elements = self.root.findall(".//Player")
+        player_elements = self._findall(".//Player")
 
         for i, player_elem in enumerate(player_elements):
             # Only process players with OnlineID (human players)
@@ -295,7 +448,7 @@ class OldWorldSaveParser:
         game_states = []
 
         # Find all turn elements
-        turn_elements = self.root.findall(".//Turn")
+        turn_elements = self._findall(".//Turn")
 
         for turn_elem in turn_elements:
             turn_number = self._safe_int(turn_elem.get("number"), 0)
@@ -345,7 +498,7 @@ class OldWorldSaveParser:
         city_lookup = self._build_city_lookup()
 
         # Iterate through Player elements to preserve ownership context
-        for player_element in self.root.findall(".//Player[@ID]"):
+        for player_element in self._findall(".//Player[@ID]"):
             # Get the player ID who OWNS this MemoryList (0-based in XML)
             owner_xml_id = self._safe_int(player_element.get("ID"))
             if owner_xml_id is None:
@@ -361,9 +514,12 @@ class OldWorldSaveParser:
 
             # Process all MemoryData elements within this player's list
             for mem in memory_list.findall("MemoryData"):
+                # Collect all needed child elements in one pass over the memory
+                fields = self._first_children(mem, _MEMORY_FIELDS)
+
                 # Extract basic memory event data
-                turn_elem = mem.find("Turn")
-                type_elem = mem.find("Type")
+                turn_elem = fields.get("Turn")
+                type_elem = fields.get("Type")
 
                 if turn_elem is None or type_elem is None:
                     continue
@@ -374,7 +530,7 @@ class OldWorldSaveParser:
                 # Determine player_id based on event type:
                 # - MEMORYPLAYER_*: Use the <Player> child (subject/opponent)
                 # - MEMORYTRIBE/FAMILY/RELIGION_*: Use the owner player (viewer)
-                player_elem = mem.find("Player")
+                player_elem = fields.get("Player")
 
                 if player_elem is not None:
                     # MEMORYPLAYER_* events: <Player> child is the subject (0-based)
@@ -392,7 +548,7 @@ class OldWorldSaveParser:
                 # Fields that are directly available as text
                 text_fields = ["Religion", "Tribe", "Family", "Nation"]
                 for field in text_fields:
-                    elem = mem.find(field)
+                    elem = fields.get(field)
                     if elem is not None and elem.text:
                         # Format the value to be more readable
                         context_data[field.lower()] = self._format_context_value(
@@ -400,7 +556,7 @@ class OldWorldSaveParser:
                         )
 
                 # Fields that are IDs and need lookup
-                character_id_elem = mem.find("CharacterID")
+                character_id_elem = fields.get("CharacterID")
                 if character_id_elem is not None and character_id_elem.text:
                     char_id = self._safe_int(character_id_elem.text)
                     if char_id and char_id in character_lookup:
@@ -408,7 +564,7 @@ class OldWorldSaveParser:
                     else:
                         context_data["character_id"] = char_id
 
-                city_id_elem = mem.find("CityID")
+                city_id_elem = fields.get("CityID")
                 if city_id_elem is not None and city_id_elem.text:
                     city_id = self._safe_int(city_id_elem.text)
                     if city_id and city_id in city_lookup:
@@ -461,7 +617,7 @@ class OldWorldSaveParser:
         events = []
         seen = set()  # Track (player_id, religion, turn) to avoid duplicates
 
-        for player_element in self.root.findall(".//Player[@ID]"):
+        for player_element in self._findall(".//Player[@ID]"):
             player_xml_id = self._safe_int(player_element.get("ID"))
             if player_xml_id is None:
                 continue
@@ -559,7 +715,7 @@ class OldWorldSaveParser:
         events = []
 
         # Find all Player elements with OnlineID (human players)
-        player_elements = self.root.findall(".//Player[@OnlineID]")
+        player_elements = self._findall(".//Player[@OnlineID]")
 
         for player_elem in player_elements:
             # Get player's XML ID (0-based in XML)
@@ -864,7 +1020,7 @@ class OldWorldSaveParser:
         map_width = int(map_width)
 
         # Get all tiles from XML
-        tiles = self.root.findall(".//Tile[@ID]")
+        tiles = self._findall(".//Tile[@ID]")
 
         if not tiles:
             return []
@@ -879,35 +1035,38 @@ class OldWorldSaveParser:
             x_coord = tile_id % map_width
             y_coord = tile_id // map_width
 
+            # Collect all needed child elements in one pass over the tile
+            fields = self._first_children(tile_elem, _TILE_FIELDS)
+
             # Extract terrain (required)
-            terrain_elem = tile_elem.find("Terrain")
+            terrain_elem = fields.get("Terrain")
             terrain = terrain_elem.text if terrain_elem is not None else None
 
             # Extract height/elevation
-            height_elem = tile_elem.find("Height")
+            height_elem = fields.get("Height")
             height = height_elem.text if height_elem is not None else None
 
             # Extract improvement
-            improvement_elem = tile_elem.find("Improvement")
+            improvement_elem = fields.get("Improvement")
             improvement = (
                 improvement_elem.text if improvement_elem is not None else None
             )
 
             # Extract specialist
-            specialist_elem = tile_elem.find("Specialist")
+            specialist_elem = fields.get("Specialist")
             specialist = specialist_elem.text if specialist_elem is not None else None
 
             # Extract resource
-            resource_elem = tile_elem.find("Resource")
+            resource_elem = fields.get("Resource")
             resource = resource_elem.text if resource_elem is not None else None
 
             # Extract road
             # Road is an empty element <Road /> so check for existence
-            has_road = tile_elem.find("Road") is not None
+            has_road = "Road" in fields
 
             # Extract city territory (which city controls this tile)
             # Example: <CityTerritory>11</CityTerritory>
-            city_territory_elem = tile_elem.find("CityTerritory")
+            city_territory_elem = fields.get("CityTerritory")
             city_id = (
                 int(city_territory_elem.text)
                 if city_territory_elem is not None and city_territory_elem.text
@@ -918,7 +1077,7 @@ class OldWorldSaveParser:
             # OwnerHistory contains turn-by-turn ownership changes
             # Example: <OwnerHistory><T45>1</T45><T64>-1</T64></OwnerHistory>
             ownership_by_turn = {}
-            owner_hist_elem = tile_elem.find("OwnerHistory")
+            owner_hist_elem = fields.get("OwnerHistory")
             if owner_hist_elem is not None:
                 for turn_elem in owner_hist_elem:
                     # Tag format: "T45" -> turn 45
@@ -1012,7 +1171,7 @@ class OldWorldSaveParser:
         tech_progress = []
 
         # Find all player elements with OnlineID (human players)
-        player_elements = self.root.findall(".//Player")
+        player_elements = self._findall(".//Player")
         player_index = 0  # Track actual player index for human players
 
         for player_elem in player_elements:
@@ -1053,7 +1212,7 @@ class OldWorldSaveParser:
         statistics = []
 
         # Find all player elements with OnlineID (human players)
-        player_elements = self.root.findall(".//Player")
+        player_elements = self._findall(".//Player")
         player_index = 0
 
         for player_elem in player_elements:
@@ -1128,7 +1287,7 @@ class OldWorldSaveParser:
         units_data = []
 
         # Find all player elements with OnlineID (human players)
-        player_elements = self.root.findall(".//Player")
+        player_elements = self._findall(".//Player")
         player_index = 0
 
         for player_elem in player_elements:
@@ -1169,7 +1328,7 @@ class OldWorldSaveParser:
         metadata = {}
 
         # Extract difficulty (from first human player)
-        player_elements = self.root.findall(".//Player")
+        player_elements = self._findall(".//Player")
         for player_elem in player_elements:
             if player_elem.get("OnlineID"):
                 difficulty = player_elem.get("Difficulty")
@@ -1242,7 +1401,7 @@ class OldWorldSaveParser:
             )
 
         # Extract victory information
-        team_victories = self.root.find(".//TeamVictoriesCompleted")
+        team_victories = self._find(".//TeamVictoriesCompleted")
         if team_victories is not None:
             team_elem = team_victories.find(".//Team")
             if team_elem is not None:
@@ -1264,7 +1423,7 @@ class OldWorldSaveParser:
 
         # Extract various game option elements
         # Game options are self-closing tags - presence means enabled
-        option_elements = self.root.findall(".//GameOptions/*")
+        option_elements = self._findall(".//GameOptions/*")
         for opt in option_elements:
             # Self-closing tags have no text, so presence = enabled (True)
             # Tags with text content store that value
@@ -1275,7 +1434,7 @@ class OldWorldSaveParser:
 
         # Extract DLC content from GameContent element
         dlc_content = {}
-        dlc_elements = self.root.findall(".//GameContent/*")
+        dlc_elements = self._findall(".//GameContent/*")
         for dlc in dlc_elements:
             # DLC entries are self-closing tags - presence means enabled
             dlc_content[dlc.tag] = dlc.text if dlc.text else True
@@ -1308,7 +1467,7 @@ class OldWorldSaveParser:
             return None
 
         # Look for team victories (most reliable method)
-        team_victories = self.root.find(".//TeamVictoriesCompleted")
+        team_victories = self._find(".//TeamVictoriesCompleted")
         if team_victories is not None:
             # Get the first team that achieved victory
             team_elem = team_victories.find(".//Team")
@@ -1317,7 +1476,7 @@ class OldWorldSaveParser:
                 if winning_team_id is not None:
                     # Find which player is on the winning team
                     # PlayerTeam elements are indexed by player ID
-                    player_teams = self.root.findall(".//Team/PlayerTeam")
+                    player_teams = self._findall(".//Team/PlayerTeam")
                     for player_idx, team_elem in enumerate(player_teams):
                         team_id = self._safe_int(team_elem.text)
                         if team_id == winning_team_id:
@@ -1325,7 +1484,7 @@ class OldWorldSaveParser:
                             return player_idx + 1
 
         # Look for explicit victory markers in the XML (fallback)
-        victory_elem = self.root.find(".//Victory")
+        victory_elem = self._find(".//Victory")
         if victory_elem is not None:
             winner_id = self._safe_int(victory_elem.get("winner"))
             if winner_id is not None:
@@ -1409,7 +1568,7 @@ class OldWorldSaveParser:
         last_turn = None
 
         # Look through all turns for player activity
-        turn_elements = self.root.findall(".//Turn")
+        turn_elements = self._findall(".//Turn")
 
         for turn_elem in turn_elements:
             turn_number = self._safe_int(turn_elem.get("number"))
@@ -1434,7 +1593,7 @@ class OldWorldSaveParser:
         character_lookup = {}
 
         # Find all Character elements with ID and FirstName attributes
-        for char_elem in self.root.findall(".//Character"):
+        for char_elem in self._findall(".//Character"):
             char_id = self._safe_int(char_elem.get("ID"))
             char_first_name = char_elem.get("FirstName")
 
@@ -1468,7 +1627,7 @@ class OldWorldSaveParser:
         city_lookup = {}
 
         # Find all City elements with ID and NameType child element
-        for city_elem in self.root.findall(".//City"):
+        for city_elem in self._findall(".//City"):
             city_id = self._safe_int(city_elem.get("ID"))
             name_type_elem = city_elem.find("NameType")
 
@@ -1562,7 +1721,7 @@ class OldWorldSaveParser:
         points_data = []
 
         # Find all player elements with OnlineID (human players only)
-        player_elements = self.root.findall(".//Player[@OnlineID]")
+        player_elements = self._findall(".//Player[@OnlineID]")
 
         for player_elem in player_elements:
             # Get player's XML ID (0-based)
@@ -1634,7 +1793,7 @@ class OldWorldSaveParser:
         yield_data = []
 
         # Find all player elements with OnlineID (human players)
-        player_elements = self.root.findall(".//Player[@OnlineID]")
+        player_elements = self._findall(".//Player[@OnlineID]")
 
         for player_elem in player_elements:
             # Get player's XML ID (0-based)
@@ -1708,7 +1867,7 @@ class OldWorldSaveParser:
         yield_total_data = []
 
         # Find all player elements with OnlineID (human players)
-        player_elements = self.root.findall(".//Player[@OnlineID]")
+        player_elements = self._findall(".//Player[@OnlineID]")
 
         for player_elem in player_elements:
             # Get player's XML ID (0-based)
@@ -1767,7 +1926,7 @@ class OldWorldSaveParser:
 
         military_data = []
 
-        player_elements = self.root.findall(".//Player[@OnlineID]")
+        player_elements = self._findall(".//Player[@OnlineID]")
 
         for player_elem in player_elements:
             player_xml_id = player_elem.get("ID")
@@ -1815,7 +1974,7 @@ class OldWorldSaveParser:
 
         legitimacy_data = []
 
-        player_elements = self.root.findall(".//Player[@OnlineID]")
+        player_elements = self._findall(".//Player[@OnlineID]")
 
         for player_elem in player_elements:
             player_xml_id = player_elem.get("ID")
@@ -1877,7 +2036,7 @@ class OldWorldSaveParser:
         family_opinions = []
         religion_opinions = []
 
-        player_elements = self.root.findall(".//Player[@OnlineID]")
+        player_elements = self._findall(".//Player[@OnlineID]")
 
         for player_elem in player_elements:
             player_xml_id = player_elem.get("ID")
@@ -1981,7 +2140,7 @@ class OldWorldSaveParser:
         rulers = []
 
         # Find all player elements with OnlineID (human players only)
-        player_elements = self.root.findall(".//Player[@OnlineID]")
+        player_elements = self._findall(".//Player[@OnlineID]")
 
         for player_elem in player_elements:
             # Get player's XML ID (0-based)
@@ -2139,7 +2298,7 @@ class OldWorldSaveParser:
         cities = []
 
         # Find all City elements (direct children of root)
-        for city_elem in self.root.findall("City"):
+        for city_elem in self._findall("City"):
             try:
                 city_data = self._parse_city_element(city_elem)
                 cities.append(city_data)
@@ -2267,7 +2426,7 @@ class OldWorldSaveParser:
         logger.info("Extracting city unit production")
         production_records = []
 
-        for city_elem in self.root.findall("City"):
+        for city_elem in self._findall("City"):
             try:
                 city_id = self._safe_int(city_elem.get("ID"))
 
@@ -2305,7 +2464,7 @@ class OldWorldSaveParser:
         logger.info("Extracting city projects")
         project_records = []
 
-        for city_elem in self.root.findall("City"):
+        for city_elem in self._findall("City"):
             try:
                 city_id = self._safe_int(city_elem.get("ID"))
 
@@ -2375,94 +2534,106 @@ class OldWorldSaveParser:
         return None
 
 
-def parse_tournament_file(zip_file_path: str) -> Dict[str, Any]:
+def parse_tournament_file(
+    zip_file_path: str,
+    sections: Optional[Iterable[str]] = None,
+    parser: Optional[OldWorldSaveParser] = None,
+) -> Dict[str, Any]:
     """Parse a tournament save file and extract all data.
 
     Args:
         zip_file_path: Path to the tournament save zip file
+        sections: Sections to extract (keys of PARSED_SECTION_VERSIONS). Defaults
+            to every section except territories, which the ETL pipeline
+            normally extracts itself once match_id is known.
+        parser: Parser that already holds this file's XML, to extract more
+            sections without reading the file again
 
     Returns:
         Dictionary containing all extracted data
     """
-    parser = OldWorldSaveParser(zip_file_path)
-    parser.extract_and_parse()
-
-    # Extract all data components
-    match_metadata = parser.extract_basic_metadata()
-    players = parser.extract_players()
-    game_states = parser.extract_game_states()
-
-    # Extract both MemoryData and LogData events
-    memory_events = (
-        parser.extract_events()
-    )  # MemoryData: MEMORY* event types (limited historical data)
-    logdata_events = (
-        parser.extract_logdata_events()
-    )  # LogData: LAW_ADOPTED, TECH_DISCOVERED, etc. (comprehensive logs)
-    religion_adoptions = (
-        parser.extract_religion_adoptions()
-    )  # Religion adoption events with specific religion names
-
-    # Merge all event sources
-    # No deduplication needed - each source has separate event type namespaces:
-    #   - MemoryData: MEMORYPLAYER_*, MEMORYFAMILY_*, etc.
-    #   - LogData: LAW_ADOPTED, TECH_DISCOVERED, GOAL_STARTED, etc.
-    #   - Religion: RELIGION_ADOPTED (with specific religion in description)
-    # They capture different types of historical information and can be safely concatenated.
-    events = memory_events + logdata_events + religion_adoptions
-
-    # Note: territories are now extracted in ETL pipeline after match_id is known
-    # territories = parser.extract_territories()
-    resources = parser.extract_resources()
-
-    # Extract new statistics data
-    technology_progress = parser.extract_technology_progress()
-    player_statistics = parser.extract_player_statistics()
-    units_produced = parser.extract_units_produced()
-    detailed_metadata = parser.extract_match_metadata()
-
-    # Extract turn-by-turn history data
-    yield_history = parser.extract_yield_history()
-    yield_total_history = parser.extract_yield_total_history()  # v1.0.81366+ only
-    points_history = parser.extract_points_history()
-    military_history = parser.extract_military_history()
-    legitimacy_history = parser.extract_legitimacy_history()
-    opinion_histories = parser.extract_opinion_histories()
-
-    # Extract ruler succession data
-    rulers = parser.extract_rulers()
-
-    # Extract city data
-    cities = parser.extract_cities()
-    city_unit_production = parser.extract_city_unit_production()
-    city_projects = parser.extract_city_projects()
-
-    # Determine winner
-    winner_player_id = parser.determine_winner(players)
-    match_metadata["winner_player_id"] = winner_player_id
+    wanted = (
+        set(sections)
+        if sections is not None
+        else set(PARSED_SECTION_VERSIONS) - {"territories"}
+    )
 
-    return {
-        "match_metadata": match_metadata,
-        "players": players,
-        "game_states": game_states,
-        "events": events,
-        # territories: now extracted in ETL pipeline after match_id is known
-        "resources": resources,
-        "technology_progress": technology_progress,
-        "player_statistics": player_statistics,
-        "units_produced": units_produced,
-        "detailed_metadata": detailed_metadata,
+    if parser is None:
+        parser = OldWorldSaveParser(zip_file_path)
+        parser.extract_and_parse()
+
+    players: List[Dict[str, Any]] = []
+    opinion_histories: Dict[str, List[Dict[str, Any]]] = {}
+
+    def extract_players() -> List[Dict[str, Any]]:
+        if not players:
+            players.extend(parser.extract_players())
+        return players
+
+    def extract_opinions(key: str) -> List[Dict[str, Any]]:
+        if not opinion_histories:
+            opinion_histories.update(parser.extract_opinion_histories())
+        return opinion_histories[key]
+
+    def extract_events() -> List[Dict[str, Any]]:
+        # Merge all event sources
+        # No deduplication needed - each source has separate event type namespaces:
+        #   - MemoryData: MEMORYPLAYER_*, MEMORYFAMILY_*, etc.
+        #   - LogData: LAW_ADOPTED, TECH_DISCOVERED, GOAL_STARTED, etc.
+        #   - Religion: RELIGION_ADOPTED (with specific religion in description)
+        # They capture different types of historical information and can be safely concatenated.
+        return (
+            parser.extract_events()  # MemoryData: MEMORY* event types
+            + parser.extract_logdata_events()  # LogData: comprehensive logs
+            + parser.extract_religion_adoptions()  # Adoptions with religion names
+        )
+
+    def extract_match_metadata() -> Dict[str, Any]:
+        match_metadata = parser.extract_basic_metadata()
+        # Determine winner
+        match_metadata["winner_player_id"] = parser.determine_winner(extract_players())
+        return match_metadata
+
+    def extract_territories() -> List[Dict[str, Any]]:
+        # Stored with slot player IDs and a placeholder match_id; the ETL
+        # pipeline maps both to database IDs when loading
+        final_turn = parser.extract_basic_metadata().get("total_turns", 0)
+        if not final_turn:
+            return []
+        return parser.extract_territories(
+            match_id=0, final_turn=final_turn, player_id_mapping={}
+        )
+
+    extractors: Dict[str, Callable[[], Any]] = {
+        "match_metadata": extract_match_metadata,
+        "players": extract_players,
+        "game_states": parser.extract_game_states,
+        "events": extract_events,
+        "resources": parser.extract_resources,
+        # Statistics data
+        "technology_progress": parser.extract_technology_progress,
+        "player_statistics": parser.extract_player_statistics,
+        "units_produced": parser.extract_units_produced,
+        "detailed_metadata": parser.extract_match_metadata,
         # Turn-by-turn history data
-        "yield_history": yield_history,
-        "yield_total_history": yield_total_history,  # v1.0.81366+ only
-        "points_history": points_history,
-        "military_history": military_history,
-        "legitimacy_history": legitimacy_history,
-        "family_opinion_history": opinion_histories["family_opinions"],
-        "religion_opinion_history": opinion_histories["religion_opinions"],
-        "rulers": rulers,
+        "yield_history": parser.extract_yield_history,
+        "yield_total_history": parser.extract_yield_total_history,  # v1.0.81366+
+        "points_history": parser.extract_points_history,
+        "military_history": parser.extract_military_history,
+        "legitimacy_history": parser.extract_legitimacy_history,
+        "family_opinion_history": lambda: extract_opinions("family_opinions"),
+        "religion_opinion_history": lambda: extract_opinions("religion_opinions"),
+        # Ruler succession data
+        "rulers": parser.extract_rulers,
         # City data
-        "cities": cities,
-        "city_unit_production": city_unit_production,
-        "city_projects": city_projects,
+        "cities": parser.extract_cities,
+        "city_unit_production": parser.extract_city_unit_production,
+        "city_projects": parser.extract_city_projects,
+        "territories": extract_territories,
+    }
+
+    return {
+        section: extractor()
+        for section, extractor in extractors.items()
+        if section in wanted
     }
@@ -5,17 +5,27 @@ in the tournament visualization application.
 """
 
 import copy
+import functools
 import hashlib
 import json
 import logging
 import threading
 import time
-from typing import Any, Dict, List, Literal, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
 
 import pandas as pd
 
 from ..config import FAMILY_CLASS_MAP, Config, get_family_class
+from ..telemetry import record_cache_lookup
+from ..utils.event_categories import get_event_category
 from .database import TournamentDatabase, get_database
+from .table_paging import build_table_clauses
+from .tournaments import (
+    get_tournament_database,
+    get_tournament_queries,
+    is_live_tournament,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -157,15 +167,156 @@ TRAIT_BONUSES: Dict[str, Dict[str, Any]] = {
 }
 
 
+# Events of one match (parameter: match_id) with display categories and
+# priorities; MEMORYPLAYER_* events are excluded as they lack useful context
+_EVENT_TIMELINE_SOURCE = """
+    SELECT
+        e.event_id,
+        e.turn_number,
+        e.event_type,
+        p.player_name,
+        e.description,
+        e.x_coordinate,
+        e.y_coordinate,
+        CASE
+            WHEN e.event_data IS NOT NULL AND json_extract(e.event_data, '$.family') IS NOT NULL
+                THEN json_extract(e.event_data, '$.family')
+            WHEN e.event_data IS NOT NULL AND json_extract(e.event_data, '$.religion') IS NOT NULL
+                THEN json_extract(e.event_data, '$.religion')
+            ELSE NULL
+        END as ambition,
+        CASE
+            WHEN e.event_type LIKE 'MEMORY%' THEN 'Memory'
+            ELSE 'Game Log'
+        END as event_category,
+        CASE
+            -- LogData events get higher priority for display
+            WHEN e.event_type = 'LAW_ADOPTED' THEN 1
+            WHEN e.event_type = 'TECH_DISCOVERED' THEN 2
+            WHEN e.event_type = 'GOAL_STARTED' THEN 3
+            WHEN e.event_type = 'GOAL_FINISHED' THEN 4
+            WHEN e.event_type = 'CITY_FOUNDED' THEN 5
+            WHEN e.event_type = 'WONDER_ACTIVITY' THEN 6
+            WHEN e.event_type = 'CHARACTER_BIRTH' THEN 7
+            WHEN e.event_type = 'CHARACTER_DEATH' THEN 8
+            WHEN e.event_type = 'RELIGION_FOUNDED' THEN 9
+            WHEN e.event_type = 'THEOLOGY_ESTABLISHED' THEN 10
+            WHEN e.event_type LIKE 'TEAM_%' THEN 11
+            WHEN e.event_type LIKE 'TRIBE_%' THEN 12
+            ELSE 99
+        END as display_priority
+    FROM events e
+    LEFT JOIN players p ON e.player_id = p.player_id AND e.match_id = p.match_id
+    WHERE e.match_id = ?
+        -- Exclude all MEMORYPLAYER_* events as they lack useful context
+        AND e.event_type NOT LIKE 'MEMORYPLAYER_%'
+"""
+
+# Matches with round, winner and map details (parameter: list of match_ids)
+_MATCH_LIST_SOURCE = """
+WITH ranked_players AS (
+    SELECT
+        match_id,
+        player_name,
+        civilization,
+        ROW_NUMBER() OVER (PARTITION BY match_id ORDER BY player_id) as player_rank
+    FROM players
+)
+SELECT
+    m.match_id,
+    COALESCE(m.game_name, 'Unknown Game') as game_name,
+    m.save_date,
+    m.tournament_round,
+    m.total_turns,
+    m.challonge_match_id,
+    CASE
+        WHEN m.tournament_round > 0 THEN 'Winners'
+        WHEN m.tournament_round < 0 THEN 'Losers'
+        ELSE 'Unknown'
+    END as bracket,
+    COALESCE(w.player_name, 'Unknown') as winner_name,
+    COALESCE(
+        m.map_size || ' ' || COALESCE(m.map_class, '') || ' ' || COALESCE(m.map_aspect_ratio, ''),
+        'Unknown'
+    ) as map_info
+FROM matches m
+LEFT JOIN ranked_players p1 ON m.match_id = p1.match_id AND p1.player_rank = 1
+LEFT JOIN ranked_players p2 ON m.match_id = p2.match_id AND p2.player_rank = 2
+LEFT JOIN match_winners mw ON m.match_id = mw.match_id
+LEFT JOIN players w ON mw.match_id = w.match_id AND mw.winner_player_id = w.player_id
+WHERE m.match_id = ANY(?)
+"""
+
+# Overview matches table column id -> sortable/filterable SQL expression
+MATCH_TABLE_COLUMNS: Dict[str, str] = {
+    "match_link": "game_name",
+    "save_date": "save_date",
+    "round_display": (
+        "CASE WHEN tournament_round > 0 THEN 'Winners Round ' || tournament_round "
+        "WHEN tournament_round < 0 THEN 'Losers Round ' || abs(tournament_round) "
+        "ELSE 'Unknown' END"
+    ),
+    "total_turns": "total_turns",
+    "winner_name": "winner_name",
+    "map_info": "trim(map_info)",
+}
+
+# Match events table column id -> sortable/filterable SQL expression
+EVENT_TABLE_COLUMNS: Dict[str, str] = {
+    "turn_number": "turn_number",
+    "event_category": "event_category",
+    "player_name": "player_name",
+    "description": "description",
+}
+
+
+def single_flight(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Share cache misses of a query method between concurrent callers.
+
+    Inside a decorated call, a _cache_get() miss registers the calling thread
+    as the one computing that key. Other threads missing the same key wait
+    for its _cache_set() instead of running the same SQL. Keys the call
+    registered but never stored (early return, exception) are released when
+    it returns, and the waiters then compute the result themselves.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: "TournamentQueries", *args: Any, **kwargs: Any) -> Any:
+        flights = getattr(self._local, "flights", None)
+        outermost = flights is None
+        if outermost:
+            flights = self._local.flights = []
+        depth = len(flights)
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            while len(flights) > depth:
+                self._end_flight(*flights.pop())
+            if outermost:
+                self._local.flights = None
+
+    return wrapper
+
+
 class TournamentQueries:
     """Collection of reusable queries for tournament data analysis."""
 
-    def __init__(self, database: Optional[TournamentDatabase] = None) -> None:
+    def __init__(
+        self,
+        database: Optional[TournamentDatabase] = None,
+        tournament: Optional[str] = None,
+    ) -> None:
         """Initialize with database connection.
 
         Args:
-            database: Database instance to use (defaults to global instance)
-        """
+            database: Database instance to use (defaults to global instance,
+                or the tournament's partition when scoped to an archived one)
+            tournament: Tournament to scope queries to (default: the live
+                tournament, Config.TOURNAMENT)
+        """
+        self._tournament = tournament
+        if database is None and not is_live_tournament(tournament):
+            database = get_tournament_database(tournament)
         self.db = database or get_database()
         # Generic query cache: key -> (timestamp, result)
         self._cache: dict[str, tuple[float, Any]] = {}
@@ -173,6 +324,14 @@ class TournamentQueries:
         self._cache_ttl: float = float(Config.CACHE_TIMEOUT)
         # Landing page data refreshes more frequently
         self._match_summary_ttl: float = 60.0
+        # Bumped on every invalidation so derived caches (figures) can key on it
+        self.generation: int = 0
+        # Keys being computed -> event set once the result is stored (see
+        # single_flight). Waiters give up after _flight_timeout seconds.
+        self._flights: dict[str, threading.Event] = {}
+        self._flight_timeout: float = 120.0
+        # Per thread: (key, event) of the flights the thread is computing
+        self._local = threading.local()
 
     def _make_cache_key(self, method_name: str, *args: Any, **kwargs: Any) -> str:
         """Build a deterministic cache key from method name and arguments."""
@@ -184,28 +343,69 @@ class TournamentQueries:
         return f"{method_name}:{hashlib.md5(raw.encode()).hexdigest()}"
 
     def _cache_get(self, key: str, ttl: Optional[float] = None) -> Any:
-        """Return a cached result copy if within TTL, else None."""
+        """Return a cached result copy if within TTL, else None.
+
+        If another thread is already computing the key, waits for its result
+        rather than returning None (see single_flight).
+        """
         if self._cache_ttl == 0:
             return None
         ttl = ttl if ttl is not None else self._cache_ttl
-        with self._cache_lock:
-            entry = self._cache.get(key)
-            if entry is not None:
-                cached_time, cached_value = entry
-                if time.time() - cached_time < ttl:
-                    # Deep copy to prevent callers from mutating cached data
-                    if isinstance(cached_value, pd.DataFrame):
-                        return cached_value.copy()
-                    return copy.deepcopy(cached_value)
-                del self._cache[key]
-        return None
+        flights = getattr(self._local, "flights", None)
+        while True:
+            with self._cache_lock:
+                entry = self._cache.get(key)
+                if entry is not None:
+                    cached_time, cached_value = entry
+                    if time.time() - cached_time < ttl:
+                        break
+                    del self._cache[key]
+                flight = self._flights.get(key)
+                if flight is None:
+                    if flights is not None:
+                        flight = self._flights[key] = threading.Event()
+                        flights.append((key, flight))
+                    record_cache_lookup(hit=False)
+                    return None
+                if any(led is flight for _, led in flights or ()):
+                    record_cache_lookup(hit=False)
+                    return None
+            if not flight.wait(self._flight_timeout):
+                logger.warning(f"Gave up waiting for concurrent query {key}")
+                record_cache_lookup(hit=False)
+                return None
+        record_cache_lookup(hit=True)
+        # Cached values are never modified in place, so the copy can be made
+        # without blocking other threads. It keeps callers from mutating them.
+        if isinstance(cached_value, pd.DataFrame):
+            return cached_value.copy()
+        return copy.deepcopy(cached_value)
 
     def _cache_set(self, key: str, value: Any) -> None:
-        """Store a result in the cache."""
+        """Store a result in the cache and wake threads waiting for it."""
         if self._cache_ttl == 0:
             return
+        flights = getattr(self._local, "flights", None) or []
+        flight = next((led for led_key, led in flights if led_key == key), None)
         with self._cache_lock:
-            self._cache[key] = (time.time(), value)
+            # A flight dropped by invalidate_caches() computed from old data
+            if flight is None or self._flights.get(key) is flight:
+                self._cache[key] = (time.time(), value)
+        if flight is not None:
+            flights.remove((key, flight))
+            self._end_flight(key, flight)
+
+    def _end_flight(self, key: str, flight: threading.Event) -> None:
+        """Finish a computation registered by _cache_get and wake waiters."""
+        with self._cache_lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+        flight.set()
+
+    @property
+    def tournament(self) -> str:
+        """Tournament these queries are scoped to."""
+        return self._tournament or Config.TOURNAMENT
 
     def invalidate_caches(self) -> None:
         """Clear all cached query results.
@@ -214,8 +414,84 @@ class TournamentQueries:
         """
         with self._cache_lock:
             self._cache.clear()
+            self.generation += 1
+            # Results still being computed are from the old data: drop them,
+            # so the next caller of each key recomputes it once
+            flights = list(self._flights.values())
+            self._flights.clear()
+        for flight in flights:
+            flight.set()
         logger.info("All query caches invalidated")
 
+    @single_flight
+    def _get_table_page(
+        self,
+        name: str,
+        source_query: str,
+        source_params: List[Any],
+        columns: Dict[str, str],
+        default_order: str,
+        page_current: Optional[int],
+        page_size: int,
+        sort_by: Optional[List[Dict[str, str]]] = None,
+        filter_query: Optional[str] = None,
+    ) -> Tuple[pd.DataFrame, int]:
+        """Fetch one page of a query for a server-side paged DataTable.
+
+        Sorting, filtering and paging run in SQL (ORDER BY/LIMIT/OFFSET), so
+        only page_size rows are materialized. Total row counts are cached per
+        filter state, making page turns a single LIMIT query.
+
+        Args:
+            name: Name of the calling method, used in cache keys
+            source_query: Query producing all rows of the table
+            source_params: Parameters of source_query
+            columns: Table column id -> SQL expression over source_query columns
+            default_order: ORDER BY expressions used when the table is unsorted
+            page_current: Zero-based page index
+            page_size: Rows per page
+            sort_by: DataTable sort_by property
+            filter_query: DataTable filter_query property
+
+        Returns:
+            Tuple of (page rows, total rows matching the filter)
+        """
+        where, where_params, order = build_table_clauses(columns, sort_by, filter_query)
+        params = [*source_params, *where_params]
+
+        count_key = self._make_cache_key(f"{name}:count", params, where)
+        total = self._cache_get(count_key)
+        if total is None:
+            count_query = f"""
+            SELECT COUNT(*) FROM ({source_query}) AS page_source WHERE {where}
+            """
+            with self.db.get_connection() as conn:
+                total = conn.execute(count_query, params).fetchone()[0]
+            self._cache_set(count_key, total)
+
+        offset = max(page_current or 0, 0) * page_size
+        page_key = self._make_cache_key(
+            f"{name}:page", params, where, order, offset, page_size
+        )
+        cached = self._cache_get(page_key)
+        if cached is not None:
+            return cached, total
+
+        # The default order breaks ties so pages never overlap
+        order = f"{order}, {default_order}" if order else default_order
+        page_query = f"""
+        SELECT * FROM ({source_query}) AS page_source
+        WHERE {where}
+        ORDER BY {order}
+        LIMIT ? OFFSET ?
+        """
+        with self.db.get_connection() as conn:
+            result = conn.execute(page_query, [*params, page_size, offset]).df()
+
+        self._cache_set(page_key, result)
+        return result.copy(), total
+
+    @single_flight
     def get_match_summary(self) -> pd.DataFrame:
         """Get comprehensive match summary data.
 
@@ -314,6 +590,7 @@ class TournamentQueries:
             "p2_narrative": result[2],
         }
 
+    @single_flight
     def get_player_performance(self) -> pd.DataFrame:
         """Get player performance statistics.
 
@@ -837,48 +1114,9 @@ class TournamentQueries:
         """
         # Build the main query to get all events
         # Excludes MEMORYPLAYER_* events as they lack useful context
-        base_query = """
+        base_query = f"""
         WITH categorized_events AS (
-            SELECT
-                e.event_id,
-                e.turn_number,
-                e.event_type,
-                p.player_name,
-                e.description,
-                e.x_coordinate,
-                e.y_coordinate,
-                CASE
-                    WHEN e.event_data IS NOT NULL AND json_extract(e.event_data, '$.family') IS NOT NULL
-                        THEN json_extract(e.event_data, '$.family')
-                    WHEN e.event_data IS NOT NULL AND json_extract(e.event_data, '$.religion') IS NOT NULL
-                        THEN json_extract(e.event_data, '$.religion')
-                    ELSE NULL
-                END as ambition,
-                CASE
-                    WHEN e.event_type LIKE 'MEMORY%' THEN 'Memory'
-                    ELSE 'Game Log'
-                END as event_category,
-                CASE
-                    -- LogData events get higher priority for display
-                    WHEN e.event_type = 'LAW_ADOPTED' THEN 1
-                    WHEN e.event_type = 'TECH_DISCOVERED' THEN 2
-                    WHEN e.event_type = 'GOAL_STARTED' THEN 3
-                    WHEN e.event_type = 'GOAL_FINISHED' THEN 4
-                    WHEN e.event_type = 'CITY_FOUNDED' THEN 5
-                    WHEN e.event_type = 'WONDER_ACTIVITY' THEN 6
-                    WHEN e.event_type = 'CHARACTER_BIRTH' THEN 7
-                    WHEN e.event_type = 'CHARACTER_DEATH' THEN 8
-                    WHEN e.event_type = 'RELIGION_FOUNDED' THEN 9
-                    WHEN e.event_type = 'THEOLOGY_ESTABLISHED' THEN 10
-                    WHEN e.event_type LIKE 'TEAM_%' THEN 11
-                    WHEN e.event_type LIKE 'TRIBE_%' THEN 12
-                    ELSE 99
-                END as display_priority
-            FROM events e
-            LEFT JOIN players p ON e.player_id = p.player_id AND e.match_id = p.match_id
-            WHERE e.match_id = ?
-                -- Exclude all MEMORYPLAYER_* events as they lack useful context
-                AND e.event_type NOT LIKE 'MEMORYPLAYER_%'
+{_EVENT_TIMELINE_SOURCE}
         )
         SELECT
             turn_number,
@@ -907,6 +1145,86 @@ class TournamentQueries:
         with self.db.get_connection() as conn:
             return conn.execute(base_query, params).df()
 
+    @single_flight
+    def _get_event_type_categories(self) -> Tuple[List[str], List[str]]:
+        """Get every stored event type with its gameplay category.
+
+        Returns:
+            Tuple of (event types, gameplay categories) in matching order
+        """
+        cache_key = self._make_cache_key("_get_event_type_categories")
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        query = "SELECT DISTINCT event_type FROM events WHERE event_type IS NOT NULL"
+        with self.db.get_connection() as conn:
+            event_types = [row[0] for row in conn.execute(query).fetchall()]
+
+        result = (event_types, [get_event_category(t) for t in event_types])
+        self._cache_set(cache_key, result)
+        return result
+
+    def get_event_timeline_page(
+        self,
+        match_id: int,
+        page_current: Optional[int],
+        page_size: int,
+        sort_by: Optional[List[Dict[str, str]]] = None,
+        filter_query: Optional[str] = None,
+    ) -> Tuple[pd.DataFrame, int]:
+        """Get one page of a match's event timeline for the events table.
+
+        Unlike get_event_timeline(), event_category holds the gameplay
+        category (see utils.event_categories) so it can be filtered in SQL.
+
+        Args:
+            match_id: ID of the match
+            page_current: Zero-based page index
+            page_size: Rows per page
+            sort_by: DataTable sort_by property (columns in EVENT_TABLE_COLUMNS)
+            filter_query: DataTable filter_query property
+
+        Returns:
+            Tuple of (page rows, total matching events)
+        """
+        event_types, categories = self._get_event_type_categories()
+
+        source_query = f"""
+        WITH categorized_events AS (
+{_EVENT_TIMELINE_SOURCE}
+        ),
+        gameplay_categories AS (
+            SELECT
+                unnest(?::VARCHAR[]) as event_type,
+                unnest(?::VARCHAR[]) as gameplay_category
+        )
+        SELECT
+            ce.turn_number,
+            ce.event_type,
+            ce.player_name,
+            ce.description,
+            ce.x_coordinate,
+            ce.y_coordinate,
+            ce.ambition,
+            COALESCE(gc.gameplay_category, 'Other') as event_category,
+            ce.display_priority
+        FROM categorized_events ce
+        LEFT JOIN gameplay_categories gc ON ce.event_type = gc.event_type
+        """
+
+        return self._get_table_page(
+            "get_event_timeline_page",
+            source_query,
+            [match_id, event_types, categories],
+            EVENT_TABLE_COLUMNS,
+            "turn_number DESC, display_priority, event_type, player_name",
+            page_current,
+            page_size,
+            sort_by,
+            filter_query,
+        )
+
     def get_territory_control_summary(self, match_id: int) -> pd.DataFrame:
         """Get territory control summary over time.
 
@@ -1014,6 +1332,7 @@ class TournamentQueries:
             with self.db.get_connection() as conn:
                 return conn.execute(query).df()
 
+    @single_flight
     def get_database_statistics(self) -> Dict[str, Any]:
         """Get comprehensive database statistics.
 
@@ -1452,6 +1771,7 @@ class TournamentQueries:
         with self.db.get_connection() as conn:
             return conn.execute(query).df()
 
+    @single_flight
     def get_nation_win_stats(
         self,
         tournament_round: Optional[list[int]] = None,
@@ -1542,6 +1862,7 @@ class TournamentQueries:
         self._cache_set(cache_key, result)
         return result.copy()
 
+    @single_flight
     def get_nation_loss_stats(
         self,
         tournament_round: Optional[list[int]] = None,
@@ -1630,6 +1951,7 @@ class TournamentQueries:
         self._cache_set(cache_key, result)
         return result.copy()
 
+    @single_flight
     def get_nation_popularity(
         self,
         tournament_round: Optional[list[int]] = None,
@@ -1712,6 +2034,7 @@ class TournamentQueries:
         self._cache_set(cache_key, result)
         return result.copy()
 
+    @single_flight
     def get_map_breakdown(
         self,
         tournament_round: Optional[list[int]] = None,
@@ -1797,6 +2120,7 @@ class TournamentQueries:
         self._cache_set(cache_key, result)
         return result.copy()
 
+    @single_flight
     def get_unit_popularity(
         self,
         tournament_round: Optional[list[int]] = None,
@@ -4175,6 +4499,7 @@ class TournamentQueries:
         with self.db.get_connection() as conn:
             return conn.execute(query, params).df()
 
+    @single_flight
     def get_nation_counter_pick_matrix(
         self,
         min_games: int = 1,
@@ -4307,6 +4632,7 @@ class TournamentQueries:
         self._cache_set(cache_key, result)
         return result.copy()
 
+    @single_flight
     def get_pick_order_win_rates(
         self,
         tournament_round: Optional[list[int]] = None,
@@ -7314,6 +7640,7 @@ class TournamentQueries:
         loser_pairs = all_pairs - winner_pairs
         return list(loser_pairs)
 
+    @single_flight
     def get_matches_by_round(
         self,
         tournament_round: Optional[list[int]] = None,
@@ -7393,47 +7720,84 @@ class TournamentQueries:
         match_ids = self._extract_match_ids(filtered, result_filter)
 
         # Get full match details for those IDs
-        query = """
-        WITH ranked_players AS (
-            SELECT
-                match_id,
-                player_name,
-                civilization,
-                ROW_NUMBER() OVER (PARTITION BY match_id ORDER BY player_id) as player_rank
-            FROM players
-        )
-        SELECT
-            m.match_id,
-            COALESCE(m.game_name, 'Unknown Game') as game_name,
-            m.save_date,
-            m.tournament_round,
-            m.total_turns,
-            m.challonge_match_id,
-            CASE
-                WHEN m.tournament_round > 0 THEN 'Winners'
-                WHEN m.tournament_round < 0 THEN 'Losers'
-                ELSE 'Unknown'
-            END as bracket,
-            COALESCE(w.player_name, 'Unknown') as winner_name,
-            COALESCE(
-                m.map_size || ' ' || COALESCE(m.map_class, '') || ' ' || COALESCE(m.map_aspect_ratio, ''),
-                'Unknown'
-            ) as map_info
-        FROM matches m
-        LEFT JOIN ranked_players p1 ON m.match_id = p1.match_id AND p1.player_rank = 1
-        LEFT JOIN ranked_players p2 ON m.match_id = p2.match_id AND p2.player_rank = 2
-        LEFT JOIN match_winners mw ON m.match_id = mw.match_id
-        LEFT JOIN players w ON mw.match_id = w.match_id AND mw.winner_player_id = w.player_id
-        WHERE m.match_id = ANY($match_ids)
+        query = f"""
+        {_MATCH_LIST_SOURCE}
         ORDER BY m.save_date DESC
         """
 
         with self.db.get_connection() as conn:
-            result = conn.execute(query, {"match_ids": match_ids}).df()
+            result = conn.execute(query, [match_ids]).df()
 
         self._cache_set(cache_key, result)
         return result.copy()
 
+    def get_matches_page(
+        self,
+        page_current: Optional[int],
+        page_size: int,
+        sort_by: Optional[List[Dict[str, str]]] = None,
+        filter_query: Optional[str] = None,
+        tournament_round: Optional[list[int]] = None,
+        min_turns: Optional[int] = None,
+        max_turns: Optional[int] = None,
+        map_size: Optional[list[str]] = None,
+        map_class: Optional[list[str]] = None,
+        map_aspect: Optional[list[str]] = None,
+        nations: Optional[list[str]] = None,
+        players: Optional[list[str]] = None,
+        result_filter: ResultFilter = None,
+    ) -> Tuple[pd.DataFrame, int]:
+        """Get one page of filtered matches for the overview matches table.
+
+        Args:
+            page_current: Zero-based page index
+            page_size: Rows per page
+            sort_by: DataTable sort_by property (columns in MATCH_TABLE_COLUMNS)
+            filter_query: DataTable filter_query property
+            tournament_round: Specific round numbers
+            min_turns: Minimum number of turns
+            max_turns: Maximum number of turns
+            map_size: Map size filter
+            map_class: Map class filter
+            map_aspect: Map aspect ratio filter
+            nations: List of civilization names to filter by
+            players: List of player names to filter by
+            result_filter: Filter by match result (winners/losers/all)
+
+        Returns:
+            Tuple of (page rows with the columns of get_matches_by_round(),
+            total matching matches)
+        """
+        filtered = self._get_filtered_match_ids(
+            tournament_round=tournament_round,
+            min_turns=min_turns,
+            max_turns=max_turns,
+            map_size=map_size,
+            map_class=map_class,
+            map_aspect=map_aspect,
+            nations=nations,
+            players=players,
+            result_filter=result_filter,
+        )
+
+        if not filtered:
+            return pd.DataFrame(), 0
+
+        match_ids = self._extract_match_ids(filtered, result_filter)
+
+        return self._get_table_page(
+            "get_matches_page",
+            _MATCH_LIST_SOURCE,
+            [match_ids],
+            MATCH_TABLE_COLUMNS,
+            "save_date DESC NULLS LAST, match_id DESC",
+            page_current,
+            page_size,
+            sort_by,
+            filter_query,
+        )
+
+    @single_flight
     def get_available_rounds(self) -> pd.DataFrame:
         """Get list of tournament rounds that have matches.
 
@@ -7468,6 +7832,7 @@ class TournamentQueries:
         self._cache_set(cache_key, result)
         return result.copy()
 
+    @single_flight
     def get_available_map_sizes(self) -> list[str]:
         """Get list of unique map sizes from matches.
 
@@ -7492,6 +7857,7 @@ class TournamentQueries:
         self._cache_set(cache_key, result)
         return result
 
+    @single_flight
     def get_available_map_classes(self) -> list[str]:
         """Get list of unique map classes from matches.
 
@@ -7516,6 +7882,7 @@ class TournamentQueries:
         self._cache_set(cache_key, result)
         return result
 
+    @single_flight
     def get_available_map_aspects(self) -> list[str]:
         """Get list of unique map aspect ratios from matches.
 
@@ -7540,6 +7907,7 @@ class TournamentQueries:
         self._cache_set(cache_key, result)
         return result
 
+    @single_flight
     def get_available_nations(self) -> list[str]:
         """Get list of unique civilizations from players.
 
@@ -7564,6 +7932,7 @@ class TournamentQueries:
         self._cache_set(cache_key, result)
         return result
 
+    @single_flight
     def get_available_players(self) -> list[str]:
         """Get list of unique player names.
 
@@ -7607,6 +7976,7 @@ class TournamentQueries:
                 return (0, 200)
             return (int(df["min_turns"].iloc[0]), int(df["max_turns"].iloc[0]))
 
+    @single_flight
     def get_science_win_correlation(
         self,
         tournament_round: Optional[list[int]] = None,
@@ -7743,6 +8113,7 @@ class TournamentQueries:
         self._cache_set(cache_key, result)
         return result.copy()
 
+    @single_flight
     def get_match_timeline_events(self, match_id: int) -> pd.DataFrame:
         """Get unified timeline of key game events for a match.
 
@@ -7763,6 +8134,11 @@ class TournamentQueries:
             - icon: str (emoji)
             - subtype: str | None (tech type, law class, etc.)
         """
+        cache_key = self._make_cache_key("get_match_timeline_events", match_id)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         from tournament_visualizer.data.game_constants import (
             EVENT_PRIORITY,
             IGNORED_LAWS,
@@ -8300,8 +8676,11 @@ class TournamentQueries:
         else:
             df["player_name"] = None
 
-        return df.reset_index(drop=True)
+        df = df.reset_index(drop=True)
+        self._cache_set(cache_key, df)
+        return df.copy()
 
+    @single_flight
     def get_match_turn_comparisons(
         self,
         match_id: int,
@@ -8328,6 +8707,13 @@ class TournamentQueries:
             - p1_vp, p2_vp: Victory points
             - mil_ratio, orders_ratio, science_ratio, vp_ratio: P1/P2 ratios
         """
+        cache_key = self._make_cache_key(
+            "get_match_turn_comparisons", match_id, player1_id, player2_id
+        )
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         query = """
         WITH
         -- Get all turns from ALL data sources (each may have different turn coverage)
@@ -8479,7 +8865,10 @@ class TournamentQueries:
         ]
 
         with self.db.get_connection() as conn:
-            return conn.execute(query, params).df()
+            df = conn.execute(query, params).df()
+
+        self._cache_set(cache_key, df)
+        return df.copy()
 
     def get_ruler_legitimacy_breakdown(self, match_id: int) -> pd.DataFrame:
         """Get rulers with cognomens for legitimacy breakdown calculation.
@@ -9685,6 +10074,7 @@ class TournamentQueries:
     # Player Skill Rating Methods
     # =========================================================================
 
+    @single_flight
     def get_player_skill_ratings(self, min_matches: int = 1) -> pd.DataFrame:
         """Calculate composite skill ratings for all players.
 
@@ -9973,23 +10363,7 @@ class TournamentQueries:
         Returns:
             Dict mapping normalized names to canonical names
         """
-        import json
-        from pathlib import Path
-
-        # Use path relative to this file's location (file is in tournament_visualizer/)
-        this_dir = Path(__file__).parent
-        package_dir = this_dir.parent
-        alias_file = package_dir / "player_name_aliases.json"
-        if not alias_file.exists():
-            return {}
-
-        try:
-            with open(alias_file) as f:
-                data = json.load(f)
-            return data.get("aliases", {})
-        except (json.JSONDecodeError, OSError) as e:
-            logger.warning(f"Failed to load player name aliases: {e}")
-            return {}
+        return load_player_name_aliases()
 
     def _apply_name_aliases(self, df: pd.DataFrame) -> pd.DataFrame:
         """Apply player name aliases to grouping_key column.
@@ -10244,14 +10618,48 @@ class TournamentQueries:
         ].sort_values("match_id")
 
 
+@lru_cache(maxsize=1)
+def load_player_name_aliases() -> dict[str, str]:
+    """Load player name aliases from config file.
+
+    The file ships with the code, so it is read once per process (or once in
+    the gunicorn arbiter before forking, see preload.py).
+
+    Returns:
+        Dict mapping normalized names to canonical names. Shared, do not mutate.
+    """
+    from pathlib import Path
+
+    # Use path relative to this file's location (file is in tournament_visualizer/)
+    alias_file = Path(__file__).parent.parent / "player_name_aliases.json"
+    if not alias_file.exists():
+        return {}
+
+    try:
+        with open(alias_file) as f:
+            data = json.load(f)
+        return data.get("aliases", {})
+    except (json.JSONDecodeError, OSError) as e:
+        logger.warning(f"Failed to load player name aliases: {e}")
+        return {}
+
+
 # Global queries instance
 queries = TournamentQueries()
 
 
-def get_queries() -> TournamentQueries:
-    """Get the global queries instance.
+def get_queries(tournament: Optional[str] = None) -> TournamentQueries:
+    """Get the global queries instance, or the one for an archived tournament.
+
+    Args:
+        tournament: Tournament identifier (default: the live tournament)
 
     Returns:
         TournamentQueries instance
+
+    Raises:
+        ValueError: If the tournament is not live and not archived
     """
-    return queries
+    if is_live_tournament(tournament):
+        return queries
+    return get_tournament_queries(tournament)
@@ -0,0 +1,179 @@
+"""Versioned read-only database snapshots for zero-downtime data refresh.
+
+Imports keep writing to the working database (Config.DATABASE_PATH).
+publish_snapshot() then copies it into the snapshot directory under a new
+generation name and atomically replaces the CURRENT pointer file with that
+name. Web workers open whatever CURRENT names and switch to a newer snapshot
+between requests (see tournament_visualizer/data_refresh.py), so a data
+refresh needs no restart and readers never wait on the writer.
+
+Layout:
+    {snapshot_dir}/CURRENT                            name of the live snapshot
+    {snapshot_dir}/snapshot-{YYYYmmddTHHMMSSffffff}.duckdb
+
+Snapshots are never modified after publishing. Older ones are pruned; on
+POSIX a worker still reading a pruned file keeps it until it switches.
+"""
+
+import logging
+import os
+import shutil
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional
+
+import duckdb
+
+logger = logging.getLogger(__name__)
+
+POINTER_FILE = "CURRENT"
+SNAPSHOT_PREFIX = "snapshot-"
+SNAPSHOT_SUFFIX = ".duckdb"
+
+
+def current_snapshot(snapshot_dir: str) -> Optional[Path]:
+    """Get the snapshot the CURRENT pointer names.
+
+    Args:
+        snapshot_dir: Snapshot directory
+
+    Returns:
+        Path of the live snapshot, or None if nothing has been published
+    """
+    pointer = Path(snapshot_dir) / POINTER_FILE
+    try:
+        name = pointer.read_text().strip()
+    except FileNotFoundError:
+        return None
+    if not name:
+        return None
+    return pointer.parent / name
+
+
+def list_snapshots(snapshot_dir: str) -> List[Path]:
+    """List published snapshot files, oldest first.
+
+    Args:
+        snapshot_dir: Snapshot directory
+
+    Returns:
+        Snapshot paths sorted by generation
+    """
+    directory = Path(snapshot_dir)
+    if not directory.is_dir():
+        return []
+    return sorted(directory.glob(f"{SNAPSHOT_PREFIX}*{SNAPSHOT_SUFFIX}"))
+
+
+def _fsync(path: Path) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def check_database(path: Path) -> None:
+    """Make sure a file is a closed, readable tournament database.
+
+    Opening read-only fails while a writer holds the file, which also means
+    it may not be checkpointed yet.
+
+    Raises:
+        ValueError: If the file is open for writing or not a tournament
+            database
+    """
+    if Path(f"{path}.wal").exists():
+        raise ValueError(
+            f"{path} has an unflushed write-ahead log; close its writer first"
+        )
+    try:
+        conn = duckdb.connect(str(path), read_only=True)
+    except duckdb.Error as e:
+        raise ValueError(f"Cannot open {path} read-only: {e}") from e
+    try:
+        conn.execute("SELECT COUNT(*) FROM matches").fetchone()
+    except duckdb.Error as e:
+        raise ValueError(f"{path} is not a tournament database: {e}") from e
+    finally:
+        conn.close()
+
+
+def _new_snapshot_path(directory: Path) -> Path:
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+    path = directory / f"{SNAPSHOT_PREFIX}{stamp}{SNAPSHOT_SUFFIX}"
+    # Generations must sort after every published one
+    latest = list_snapshots(str(directory))
+    if latest and path <= latest[-1]:
+        path = latest[-1].with_name(latest[-1].stem + "1" + SNAPSHOT_SUFFIX)
+    return path
+
+
+def publish_snapshot(
+    source_path: str, snapshot_dir: str, keep: int = 2, move: bool = False
+) -> Path:
+    """Publish a database file as the new live snapshot.
+
+    The file is written under a temporary name and renamed, then the pointer
+    is replaced the same way, so readers see either the old snapshot or the
+    complete new one.
+
+    Args:
+        source_path: Closed database file to publish
+        snapshot_dir: Snapshot directory (created if missing)
+        keep: Snapshots to keep, including the new one
+        move: Move the file instead of copying it (same filesystem only)
+
+    Returns:
+        Path of the published snapshot
+
+    Raises:
+        ValueError: If the source is open for writing or not a tournament
+            database
+    """
+    source = Path(source_path)
+    check_database(source)
+
+    directory = Path(snapshot_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    snapshot = _new_snapshot_path(directory)
+    staging = snapshot.with_name(snapshot.name + ".tmp")
+
+    if move:
+        os.replace(source, staging)
+    else:
+        shutil.copyfile(source, staging)
+    _fsync(staging)
+    os.replace(staging, snapshot)
+
+    pointer = directory / POINTER_FILE
+    staging = pointer.with_name(POINTER_FILE + ".tmp")
+    staging.write_text(snapshot.name + "\n")
+    _fsync(staging)
+    os.replace(staging, pointer)
+    _fsync(directory)
+    logger.info(f"Published snapshot {snapshot}")
+
+    prune_snapshots(snapshot_dir, keep)
+    return snapshot
+
+
+def prune_snapshots(snapshot_dir: str, keep: int) -> List[Path]:
+    """Delete all but the newest snapshots. The live one is always kept.
+
+    Args:
+        snapshot_dir: Snapshot directory
+        keep: Number of snapshots to keep
+
+    Returns:
+        Deleted snapshot paths
+    """
+    live = current_snapshot(snapshot_dir)
+    snapshots = list_snapshots(snapshot_dir)
+    stale = [
+        path for path in snapshots[: max(len(snapshots) - keep, 0)] if path != live
+    ]
+    for path in stale:
+        path.unlink(missing_ok=True)
+        logger.info(f"Pruned snapshot {path}")
+    return stale
@@ -0,0 +1,245 @@
+"""Server-side paging, sorting and filtering for Dash DataTables.
+
+Tables created with ``create_data_table_card(..., server_side=True)`` use
+``page_action``, ``sort_action`` and ``filter_action`` set to "custom", so the
+browser only ever receives one page of rows. Their callbacks receive the
+table's ``page_current``, ``page_size``, ``sort_by`` and ``filter_query`` and
+pass them here to build the matching SQL clauses (for query-backed tables) or
+to slice an already computed DataFrame.
+
+Only column ids listed in the caller's column mapping can be filtered or
+sorted; anything else in the filter query is ignored, and filter values are
+always bound as parameters.
+"""
+
+import math
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+# DataTable filter operators (word and symbol forms) -> canonical operator
+FILTER_OPERATORS: Dict[str, str] = {
+    "eq": "eq",
+    "=": "eq",
+    "ne": "ne",
+    "!=": "ne",
+    "lt": "lt",
+    "<": "lt",
+    "le": "le",
+    "<=": "le",
+    "gt": "gt",
+    ">": "gt",
+    "ge": "ge",
+    ">=": "ge",
+    "contains": "contains",
+    "datestartswith": "datestartswith",
+}
+
+_COMPARISONS: Dict[str, str] = {
+    "eq": "=",
+    "ne": "!=",
+    "lt": "<",
+    "le": "<=",
+    "gt": ">",
+    "ge": ">=",
+}
+
+# "{column} op value"; operators may carry DataTable's i/s case prefix
+_FILTER_TERM_RE = re.compile(
+    r"^\{(?P<column>[^}]+)\}\s+(?P<operator>[a-z]+|[<>=!]+)\s*(?P<value>.*)$"
+)
+
+
+@dataclass(frozen=True)
+class FilterTerm:
+    """One condition of a DataTable filter query."""
+
+    column: str
+    operator: str
+    value: Any
+    case_sensitive: bool = False
+
+
+def _parse_value(raw: str) -> Any:
+    """Parse a filter value: quoted strings stay strings, bare numbers are floats."""
+    raw = raw.strip()
+    if len(raw) >= 2 and raw[0] == raw[-1] and raw[0] in ("'", '"', "`"):
+        quote = raw[0]
+        return raw[1:-1].replace("\\" + quote, quote)
+    try:
+        return float(raw)
+    except ValueError:
+        return raw
+
+
+def _as_text(value: Any) -> str:
+    """Render a filter value for text matching (5.0 -> "5")."""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def parse_filter_query(filter_query: Optional[str]) -> List[FilterTerm]:
+    """Parse a DataTable filter query into filter terms.
+
+    Args:
+        filter_query: Value of the table's ``filter_query`` property, e.g.
+            ``{player_name} icontains "bob" && {turn_number} > 50``
+
+    Returns:
+        Parsed terms; unrecognized parts are skipped
+    """
+    if not filter_query:
+        return []
+
+    terms = []
+    for part in filter_query.split(" && "):
+        match = _FILTER_TERM_RE.match(part.strip())
+        if not match:
+            continue
+        operator = match.group("operator")
+        case_sensitive = False
+        if operator not in FILTER_OPERATORS and operator[:1] in ("i", "s"):
+            case_sensitive = operator[0] == "s"
+            operator = operator[1:]
+        if operator not in FILTER_OPERATORS:
+            continue
+        terms.append(
+            FilterTerm(
+                column=match.group("column"),
+                operator=FILTER_OPERATORS[operator],
+                value=_parse_value(match.group("value")),
+                case_sensitive=case_sensitive,
+            )
+        )
+    return terms
+
+
+def _term_sql(expression: str, term: FilterTerm) -> Tuple[str, Any]:
+    """Build the SQL condition and parameter for one filter term."""
+    text = f"CAST({expression} AS VARCHAR)"
+    value = term.value
+
+    if term.operator == "contains":
+        if term.case_sensitive:
+            return f"contains({text}, ?)", _as_text(value)
+        return f"contains(lower({text}), lower(?))", _as_text(value)
+    if term.operator == "datestartswith":
+        return f"starts_with({text}, ?)", _as_text(value)
+
+    comparison = _COMPARISONS[term.operator]
+    if isinstance(value, str) and not term.case_sensitive:
+        return f"lower({text}) {comparison} lower(?)", value
+    if isinstance(value, str):
+        return f"{text} {comparison} ?", value
+    return f"{expression} {comparison} ?", value
+
+
+def build_table_clauses(
+    columns: Dict[str, str],
+    sort_by: Optional[List[Dict[str, str]]] = None,
+    filter_query: Optional[str] = None,
+) -> Tuple[str, List[Any], str]:
+    """Translate DataTable sorting and filtering into SQL clauses.
+
+    Args:
+        columns: Table column id -> SQL expression that may be filtered/sorted
+        sort_by: Value of the table's ``sort_by`` property
+        filter_query: Value of the table's ``filter_query`` property
+
+    Returns:
+        Tuple of (WHERE condition, its parameters, ORDER BY expression list);
+        the condition is "TRUE" and the order list empty when not applicable
+    """
+    conditions = []
+    params: List[Any] = []
+    for term in parse_filter_query(filter_query):
+        if term.column not in columns:
+            continue
+        condition, param = _term_sql(columns[term.column], term)
+        conditions.append(condition)
+        params.append(param)
+
+    order = [
+        f"{columns[sort['column_id']]} "
+        f"{'DESC' if sort.get('direction') == 'desc' else 'ASC'} NULLS LAST"
+        for sort in sort_by or []
+        if sort.get("column_id") in columns
+    ]
+
+    return " AND ".join(conditions) or "TRUE", params, ", ".join(order)
+
+
+def _term_mask(series: pd.Series, term: FilterTerm) -> pd.Series:
+    """Evaluate one filter term against a DataFrame column."""
+    value = term.value
+
+    if term.operator in ("contains", "datestartswith") or isinstance(value, str):
+        text = series.astype("string").fillna("")
+        value = _as_text(value)
+        if not term.case_sensitive:
+            text = text.str.lower()
+            value = value.lower()
+        if term.operator == "contains":
+            return text.str.contains(value, regex=False)
+        if term.operator == "datestartswith":
+            return text.str.startswith(value)
+        series = text
+
+    numeric = (
+        pd.to_numeric(series, errors="coerce") if not isinstance(value, str) else series
+    )
+    comparisons = {
+        "eq": numeric == value,
+        "ne": numeric != value,
+        "lt": numeric < value,
+        "le": numeric <= value,
+        "gt": numeric > value,
+        "ge": numeric >= value,
+    }
+    return comparisons[term.operator].fillna(False).astype(bool)
+
+
+def page_dataframe(
+    df: pd.DataFrame,
+    page_current: Optional[int],
+    page_size: int,
+    sort_by: Optional[List[Dict[str, str]]] = None,
+    filter_query: Optional[str] = None,
+) -> Tuple[pd.DataFrame, int]:
+    """Apply DataTable filtering, sorting and paging to a DataFrame.
+
+    Used for tables whose rows are computed in Python rather than by a query.
+
+    Args:
+        df: Full table data
+        page_current: Zero-based page index
+        page_size: Rows per page
+        sort_by: Value of the table's ``sort_by`` property
+        filter_query: Value of the table's ``filter_query`` property
+
+    Returns:
+        Tuple of (rows of the requested page, total matching rows)
+    """
+    for term in parse_filter_query(filter_query):
+        if term.column in df.columns:
+            df = df[_term_mask(df[term.column], term)]
+
+    sorts = [s for s in sort_by or [] if s.get("column_id") in df.columns]
+    if sorts:
+        df = df.sort_values(
+            [s["column_id"] for s in sorts],
+            ascending=[s.get("direction") != "desc" for s in sorts],
+            na_position="last",
+            kind="stable",
+        )
+
+    start = (page_current or 0) * page_size
+    return df.iloc[start : start + page_size], len(df)
+
+
+def page_count(total_rows: int, page_size: int) -> int:
+    """Number of pages for a row count (at least 1, so the pager renders)."""
+    return max(1, math.ceil(total_rows / page_size))
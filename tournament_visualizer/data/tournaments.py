@@ -0,0 +1,239 @@
+"""Per-tournament database partitions.
+
+The live database (Config.DATABASE_PATH, or its published snapshot) holds the
+current tournament, Config.TOURNAMENT. Earlier tournaments are archived with
+archive_tournament() as one database file each, published like the live
+snapshots (see snapshots.py):
+
+    {tournaments_dir}/{tournament}/CURRENT
+    {tournaments_dir}/{tournament}/snapshot-{generation}.duckdb
+
+Each file records its tournament in the tournaments table. A partition is
+opened read-only the first time a query is scoped to its tournament
+(get_queries(tournament) or TournamentQueries(tournament=...)), so a season's
+queries only touch that season's file and seasons nobody views stay cold on
+disk. Re-archiving a tournament publishes a new generation, which is opened on
+next use with the query cache dropped. A new file name is needed for that:
+DuckDB shares one database instance per path within a process, so reopening a
+replaced file under the same path would still read the old one.
+"""
+
+import logging
+import re
+import shutil
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from ..config import Config
+from .database import TournamentDatabase
+from .snapshots import check_database, current_snapshot, publish_snapshot
+
+if TYPE_CHECKING:
+    from .queries import TournamentQueries
+
+logger = logging.getLogger(__name__)
+
+# Tournament identifiers become directory names
+_TOURNAMENT_ID = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_-]*$")
+
+_lock = threading.Lock()
+# tournament -> (database, generation file it has open)
+_partitions: Dict[str, Tuple[TournamentDatabase, Path]] = {}
+_scoped_queries: Dict[str, "TournamentQueries"] = {}
+
+
+def validate_tournament_id(tournament: str) -> str:
+    """Check a tournament identifier.
+
+    Args:
+        tournament: Challonge tournament URL identifier, e.g. owduels2025
+
+    Returns:
+        The identifier
+
+    Raises:
+        ValueError: If it is not letters, digits, dashes and underscores
+    """
+    if not _TOURNAMENT_ID.match(tournament or ""):
+        raise ValueError(f"Invalid tournament identifier: {tournament!r}")
+    return tournament
+
+
+def is_live_tournament(tournament: Optional[str]) -> bool:
+    """Whether queries for a tournament go to the live database."""
+    return tournament is None or tournament == Config.TOURNAMENT
+
+
+def partition_dir(tournament: str, tournaments_dir: Optional[str] = None) -> Path:
+    """Directory holding an archived tournament's database generations.
+
+    Args:
+        tournament: Tournament identifier
+        tournaments_dir: Partitions directory (default: TOURNAMENTS_DIRECTORY)
+    """
+    directory = Path(tournaments_dir or Config.TOURNAMENTS_DIRECTORY)
+    return directory / validate_tournament_id(tournament)
+
+
+def partition_path(
+    tournament: str, tournaments_dir: Optional[str] = None
+) -> Optional[Path]:
+    """Current database file of an archived tournament.
+
+    Args:
+        tournament: Tournament identifier
+        tournaments_dir: Partitions directory (default: TOURNAMENTS_DIRECTORY)
+
+    Returns:
+        Path of the live generation, or None if the tournament is not archived
+    """
+    return current_snapshot(str(partition_dir(tournament, tournaments_dir)))
+
+
+def list_tournaments(tournaments_dir: Optional[str] = None) -> List[str]:
+    """List the live tournament followed by the archived ones.
+
+    Args:
+        tournaments_dir: Partitions directory (default: TOURNAMENTS_DIRECTORY)
+
+    Returns:
+        Tournament identifiers, archived ones newest name first
+    """
+    directory = Path(tournaments_dir or Config.TOURNAMENTS_DIRECTORY)
+    archived = []
+    if directory.is_dir():
+        archived = sorted(
+            (
+                path.name
+                for path in directory.iterdir()
+                if _TOURNAMENT_ID.match(path.name) and current_snapshot(str(path))
+            ),
+            reverse=True,
+        )
+    return [Config.TOURNAMENT] + [t for t in archived if t != Config.TOURNAMENT]
+
+
+def archive_tournament(
+    source_path: str,
+    tournament: str,
+    name: Optional[str] = None,
+    tournaments_dir: Optional[str] = None,
+) -> Path:
+    """Store a closed database as a tournament's partition.
+
+    The copy is marked with the tournament and published as the partition's
+    new generation, replacing an earlier archive of the same tournament.
+    Servers switch to it on next use.
+
+    Args:
+        source_path: Closed database holding only this tournament
+        tournament: Tournament identifier
+        name: Display name (defaults to the identifier)
+        tournaments_dir: Partitions directory (default: TOURNAMENTS_DIRECTORY)
+
+    Returns:
+        Path of the published database file
+
+    Raises:
+        ValueError: If the source is open for writing, is not a tournament
+            database or records a different tournament
+    """
+    directory = partition_dir(tournament, tournaments_dir)
+    source = Path(source_path)
+    check_database(source)
+    recorded = TournamentDatabase(str(source), read_only=True)
+    try:
+        held = recorded.get_tournament()
+    finally:
+        recorded.close()
+    if held and held["tournament_id"] != tournament:
+        raise ValueError(
+            f"{source} holds tournament {held['tournament_id']!r}, not {tournament!r}"
+        )
+
+    directory.mkdir(parents=True, exist_ok=True)
+    staging = directory / "archive.duckdb.tmp"
+    shutil.copyfile(source, staging)
+    # Opening for writing runs the schema migrations on the copy
+    db = TournamentDatabase(str(staging), read_only=False)
+    try:
+        db.set_tournament(tournament, name or (held or {}).get("name"), archived=True)
+    finally:
+        db.close()
+    path = publish_snapshot(str(staging), str(directory), keep=1, move=True)
+    logger.info(f"Archived tournament {tournament} to {path}")
+    return path
+
+
+def get_tournament_database(tournament: str) -> TournamentDatabase:
+    """Get the read-only database of an archived tournament.
+
+    Opened on first use; switched to a newer generation if the tournament
+    was archived again since.
+
+    Args:
+        tournament: Tournament identifier
+
+    Returns:
+        TournamentDatabase of the partition
+
+    Raises:
+        ValueError: If the identifier is invalid or not archived
+    """
+    path = partition_path(tournament)
+    if path is None:
+        raise ValueError(f"Tournament {tournament!r} is not archived")
+    with _lock:
+        entry = _partitions.get(tournament)
+        if entry is None:
+            db = TournamentDatabase(
+                db_path=str(path), read_pool_size=Config.DATABASE_READ_POOL_SIZE
+            )
+            _partitions[tournament] = (db, path)
+            logger.info(f"Attached tournament {tournament} ({path})")
+            return db
+
+        db, opened = entry
+        if path != opened:
+            db.reopen(str(path))
+            _partitions[tournament] = (db, path)
+            if tournament in _scoped_queries:
+                _scoped_queries[tournament].invalidate_caches()
+        return db
+
+
+def get_tournament_queries(tournament: str) -> "TournamentQueries":
+    """Get the shared queries instance scoped to an archived tournament.
+
+    Args:
+        tournament: Tournament identifier
+
+    Returns:
+        TournamentQueries reading only that tournament's partition
+    """
+    from .queries import TournamentQueries
+
+    db = get_tournament_database(tournament)
+    with _lock:
+        queries = _scoped_queries.get(tournament)
+        if queries is None:
+            queries = TournamentQueries(database=db, tournament=tournament)
+            _scoped_queries[tournament] = queries
+        return queries
+
+
+def close_tournament_databases() -> None:
+    """Close every open partition. They reopen on next use."""
+    with _lock:
+        for db, _ in _partitions.values():
+            db.close()
+
+
+def reset_after_fork() -> None:
+    """Drop partition connections inherited from a parent process."""
+    global _lock
+
+    _lock = threading.Lock()
+    for db, _ in _partitions.values():
+        db.reset_after_fork()
@@ -0,0 +1,138 @@
+"""Switch the server to newly published database snapshots between requests.
+
+init_data_refresh() opens the live snapshot at startup, if one has been
+published (see data/snapshots.py), and registers a before_request hook that
+reads the CURRENT pointer at most every Config.SNAPSHOT_POLL_INTERVAL
+seconds. When it names a new snapshot the worker:
+
+- opens the new file; reads already running finish on the old connection,
+  which is closed when they release it
+- drops the query and figure caches, which hold results of the old data
+- pins the precomputed overview results stored in the new snapshot
+
+With Config.PARQUET_DATASET set, the live database is instead the view
+catalog of the dataset's current generation (see data/parquet_dataset.py),
+and a new generation is switched to the same way.
+
+Only one thread per worker checks at a time; the others skip the check.
+Without SNAPSHOT_DIRECTORY set (the default outside production), or before
+a snapshot has been published, the server keeps serving Config.DATABASE_PATH.
+"""
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from flask import Flask
+
+from .components.figure_cache import figure_cache
+from .config import Config
+from .data.database import get_database
+from .data.parquet_dataset import open_dataset_catalog
+from .data.queries import get_queries
+from .data.snapshots import current_snapshot
+from .precompute import pin_overview_artifact
+
+logger = logging.getLogger(__name__)
+
+_check_lock = threading.Lock()
+_last_check = float("-inf")
+
+
+def switch_database(db_path: str) -> bool:
+    """Serve another database file and drop results computed from the old one.
+
+    Args:
+        db_path: Database file to read from now on
+
+    Returns:
+        False if the file could not be opened; the current one stays in use
+    """
+    try:
+        get_database().reopen(db_path)
+    except Exception as e:
+        logger.error(f"Could not open database {db_path}: {e}")
+        return False
+    get_queries().invalidate_caches()
+    figure_cache.clear()
+    return True
+
+
+def live_database_path() -> Optional[Path]:
+    """Get the database file the server should be reading.
+
+    Returns:
+        The Parquet dataset catalog or the live snapshot, or None to keep
+        serving Config.DATABASE_PATH
+    """
+    if Config.PARQUET_DATASET:
+        try:
+            return open_dataset_catalog(
+                Config.PARQUET_DATASET,
+                Config.TOURNAMENT,
+                Config.PARQUET_CATALOG_DIRECTORY,
+            )
+        except Exception as e:
+            logger.error(f"Could not open Parquet dataset catalog: {e}")
+            return None
+    if Config.SNAPSHOT_DIRECTORY:
+        return current_snapshot(Config.SNAPSHOT_DIRECTORY)
+    return None
+
+
+def refresh_database(force: bool = False) -> bool:
+    """Switch to the live snapshot if it changed since the last check.
+
+    Args:
+        force: Check even if the poll interval has not passed
+
+    Returns:
+        True if a new snapshot was opened
+    """
+    global _last_check
+
+    now = time.monotonic()
+    if not force and now - _last_check < Config.SNAPSHOT_POLL_INTERVAL:
+        return False
+    enabled = Config.PARQUET_DATASET or Config.SNAPSHOT_DIRECTORY
+    if not enabled or not _check_lock.acquire(blocking=False):
+        return False  # Disabled, or another thread is checking
+    try:
+        _last_check = now
+        snapshot = live_database_path()
+        if snapshot is None or str(snapshot) == get_database().db_path:
+            return False
+        if not switch_database(str(snapshot)):
+            return False
+
+        try:
+            pin_overview_artifact()
+        except Exception as e:
+            logger.warning(f"Precomputed overview results not loaded: {e}")
+        logger.info(f"Now serving snapshot {snapshot.name}")
+        return True
+    finally:
+        _check_lock.release()
+
+
+def init_data_refresh(server: Flask) -> None:
+    """Serve the live snapshot and follow new ones between requests.
+
+    Call before the overview results are pinned at startup, so they are
+    read from the snapshot.
+
+    Args:
+        server: Flask server of the Dash app
+    """
+    global _last_check
+
+    _last_check = time.monotonic()
+    snapshot = live_database_path()
+    if snapshot is not None and switch_database(str(snapshot)):
+        logger.info(f"Serving snapshot {snapshot.name}")
+
+    @server.before_request
+    def _refresh_database() -> None:
+        refresh_database()
@@ -13,7 +13,6 @@ from dash import ALL, Input, Output, State, callback, ctx, dash_table, dcc, html
 
 from tournament_visualizer.components.layouts import create_empty_state
 from tournament_visualizer.config import get_config
-from tournament_visualizer.data.evidence import generate_evidence
 from tournament_visualizer.theme import DARK_THEME
 
 logger = logging.getLogger(__name__)
@@ -133,6 +132,8 @@ def handle_chat_query(
     if not question or not question.strip():
         return html.Div()
 
+    # Imported on first use: the LLM client is only needed once someone chats
+    from tournament_visualizer.data.evidence import generate_evidence
     from tournament_visualizer.data.nl_query import get_nl_query_service
 
     service = get_nl_query_service()
@@ -11,7 +11,7 @@ import dash
 import dash_bootstrap_components as dbc
 import dash_cytoscape as cyto
 import pandas as pd
-from dash import Input, Output, State, callback, dcc, html
+from dash import Input, Output, Patch, State, callback, dcc, html
 from plotly import graph_objects as go
 
 from tournament_visualizer.components.charts import (
@@ -44,7 +44,14 @@ from tournament_visualizer.components.charts import (
     create_units_treemap_chart,
     create_units_waffle_chart,
 )
-from tournament_visualizer.components.game_state import create_game_state_component
+from tournament_visualizer.components.game_state import (
+    GAME_STATE_MORE_ID,
+    GAME_STATE_ROWS_ID,
+    GAME_STATE_WINDOW_ID,
+    create_game_state_component,
+    create_game_state_rows,
+    load_more_label,
+)
 from tournament_visualizer.components.layouts import (
     create_breadcrumb,
     create_chart_card,
@@ -59,14 +66,20 @@ from tournament_visualizer.components.match_card import (
     fetch_match_card_data,
 )
 from tournament_visualizer.components.match_card_layouts import create_match_card_layout
+from tournament_visualizer.components.match_data import (
+    MatchData,
+    get_match_data,
+    make_match_data_key,
+)
 from tournament_visualizer.components.tech_tree import (
     TECH_TREE_STYLESHEET,
     build_cytoscape_elements,
-    get_techs_at_turn,
+    get_tech_discovery_turns,
 )
 from tournament_visualizer.config import (
     COGNOMEN_DISPLAY_NAMES,
     COGNOMEN_LEGITIMACY,
+    LAYOUT_CONSTANTS,
     MODEBAR_CONFIG,
     PAGE_CONFIG,
     Config,
@@ -76,6 +89,7 @@ from tournament_visualizer.config import (
     get_family_class,
 )
 from tournament_visualizer.data.queries import get_queries
+from tournament_visualizer.data.table_paging import page_count
 from tournament_visualizer.nation_colors import get_match_player_colors
 from tournament_visualizer.tech_tree import TECHS
 from tournament_visualizer.utils.event_categories import (
@@ -115,24 +129,17 @@ def get_player_colors_from_df(df: pd.DataFrame) -> Dict[str, str]:
     return {players[0]: color1, players[1]: color2}
 
 
-def get_player_colors_for_match(match_id: int) -> Dict[str, str]:
-    """Get player colors for a match by fetching player civilization data.
+def get_player_colors_for_match(match_data: MatchData) -> Dict[str, str]:
+    """Get player colors for a match from its player civilization data.
 
     Args:
-        match_id: The match ID to get player colors for
+        match_data: Shared datasets of the match
 
     Returns:
         Dict mapping player names to hex color codes
     """
-    try:
-        queries = get_queries()
-        # Use yield history which has civilization data
-        df = queries.get_yield_history_by_match(match_id)
-        if not df.empty and "civilization" in df.columns:
-            return get_player_colors_from_df(df)
-    except Exception:
-        pass
-    return {}
+    # Yield history has civilization data, and the yield charts share it
+    return get_player_colors_from_df(match_data.frame("yield_history"))
 
 
 # All 14 yield types tracked in Old World
@@ -179,13 +186,11 @@ layout = html.Div(
                 "Wonders": True,
             },
         ),
-        # Track which tabs have been loaded for the current match
-        # This prevents re-fetching data when switching back to already-loaded tabs
-        dcc.Store(
-            id="match-tabs-loaded-store",
-            storage_type="memory",
-            data={"match_id": None, "loaded_tabs": []},
-        ),
+        # Key of the selected match's shared datasets, set with the details
+        dcc.Store(id="match-data-store", storage_type="memory", data=None),
+        # Tech discovery turns per player, used to restyle the tech trees in
+        # the browser when the turn slider moves
+        dcc.Store(id="match-tech-tree-store", storage_type="memory", data=None),
         # Page header
         create_page_header(
             title=PAGE_CONFIG["matches"]["title"],
@@ -235,51 +240,73 @@ layout = html.Div(
 
 
 # =============================================================================
-# Tab Loading State Management
+# Shared Match Data
 # =============================================================================
-# This callback manages which tabs have been loaded for the current match.
-# Tab callbacks use the store State to skip re-fetching data when returning
-# to an already-loaded tab. The store resets when the match changes.
+# update_match_details sets match-data-store in the same response that renders
+# the match. Datasets used by more than one callback are queried once per match
+# and worker, on first use (see components/match_data.py). The store only
+# holds a key; the datasets stay on the server.
+#
+# Each tab's callbacks read the key from the tab's own store, which is rendered
+# with the match details. The default tab's store starts with the key, so only
+# its callbacks run with the details; the others run the first time their tab
+# is shown. Picking a match renders fresh stores, so every tab loads again.
+
+# Tab IDs of the match details, in display order
+MATCH_DETAIL_TABS = [
+    "overview",
+    "timeline",
+    "events",
+    "laws",
+    "technology",
+    "yields",
+    "science",
+    "ambitions",
+    "cities",
+    "map",
+    "improvements",
+    "military",
+    "settings",
+]
+DEFAULT_MATCH_TAB = "overview"
 
 
-@callback(
-    Output("match-tabs-loaded-store", "data"),
+def _tab_store_id(tab: str) -> str:
+    """Return the ID of the store holding the match key of a details tab."""
+    return f"match-{tab}-tab-store"
+
+
+# Give the shown tab the match key in the browser, the first time it is shown
+# for the selected match. Tabs not shown yet send no requests.
+dash.clientside_callback(
+    """
+    function(activeTab, matchKey, ...tabKeys) {
+        const outputs = window.dash_clientside.callback_context.outputs_list;
+        return outputs.map((output, i) =>
+            matchKey && !tabKeys[i] && output.id === `match-${activeTab}-tab-store`
+                ? matchKey
+                : window.dash_clientside.no_update
+        );
+    }
+    """,
+    [Output(_tab_store_id(tab), "data") for tab in MATCH_DETAIL_TABS],
     Input("match-details-tabs", "active_tab"),
-    Input("match-selector", "value"),
-    State("match-tabs-loaded-store", "data"),
+    State("match-data-store", "data"),
+    *[State(_tab_store_id(tab), "data") for tab in MATCH_DETAIL_TABS],
     prevent_initial_call=True,
 )
-def update_tab_loaded_state(
-    active_tab: Optional[str],
-    match_id: Optional[int],
-    current_state: Optional[Dict[str, Any]],
-) -> Dict[str, Any]:
-    """Track which tabs have been loaded for the current match.
-
-    When a tab is visited, it's added to the loaded_tabs list.
-    When the match changes, the list is reset.
-
-    Args:
-        active_tab: Currently active tab ID
-        match_id: Currently selected match ID
-        current_state: Current state from the store
 
-    Returns:
-        Updated state dict with match_id and loaded_tabs list
-    """
-    if current_state is None:
-        current_state = {"match_id": None, "loaded_tabs": []}
 
-    # If match changed, reset loaded tabs
-    if current_state.get("match_id") != match_id:
-        return {"match_id": match_id, "loaded_tabs": [active_tab] if active_tab else []}
+def _shared_match_data(match_key: Optional[Dict[str, int]]) -> Optional[MatchData]:
+    """Return the shared datasets for a match key from one of the key stores."""
+    if not match_key:
+        return None
+    return get_match_data(match_key, get_player_colors_for_match)
 
-    # Add current tab to loaded list if not already there
-    loaded_tabs = current_state.get("loaded_tabs", [])
-    if active_tab and active_tab not in loaded_tabs:
-        loaded_tabs = loaded_tabs + [active_tab]
 
-    return {"match_id": match_id, "loaded_tabs": loaded_tabs}
+def _selected_match_id(match_key: Optional[Dict[str, int]]) -> Optional[int]:
+    """Return the match ID in a match key from one of the key stores, if any."""
+    return match_key["match_id"] if match_key else None
 
 
 @callback(
@@ -435,6 +462,7 @@ def update_match_options(pathname: str) -> List[Dict[str, Any]]:
         Output("match-details-section", "children"),
         Output("match-details-section", "style"),
         Output("match-empty-state", "style"),
+        Output("match-data-store", "data"),
     ],
     Input("match-selector", "value"),
     State("match-url", "search"),
@@ -442,26 +470,28 @@ def update_match_options(pathname: str) -> List[Dict[str, Any]]:
 def update_match_details(match_id: Optional[int], url_search: Optional[str]) -> tuple:
     """Update match details when a match is selected.
 
+    Sets match-data-store and the default tab's key store in the same
+    response, so the breadcrumb and the default tab's callbacks start without
+    another round trip.
+
     Args:
         match_id: Selected match ID
         url_search: URL query string (e.g., "?beta=true")
 
     Returns:
-        Tuple of (details_content, details_style, empty_state_style)
+        Tuple of (details_content, details_style, empty_state_style,
+        match key for match-data-store)
     """
     # Check if beta features should be shown
     show_beta = url_search and "beta=true" in url_search
     if not match_id:
-        return html.Div(), {"display": "none"}, {"display": "block"}
+        return html.Div(), {"display": "none"}, {"display": "block"}, None
 
     try:
-        queries = get_queries()
-
-        # Get match info
-        match_df = queries.get_match_summary()
-        match_info = match_df[match_df["match_id"] == match_id]
+        match_key = make_match_data_key(match_id)
+        summary = _shared_match_data(match_key).summary
 
-        if match_info.empty:
+        if summary is None:
             return (
                 create_empty_state(
                     title="Match Not Found",
@@ -470,26 +500,25 @@ def update_match_details(match_id: Optional[int], url_search: Optional[str]) ->
                 ),
                 {"display": "block"},
                 {"display": "none"},
+                None,
             )
 
-        match_data = match_info.iloc[0]
-
         # Format display values with nations
-        players_with_nations = match_data.get("players_with_nations", "")
+        players_with_nations = summary.get("players_with_nations", "")
         game_display = (
             players_with_nations
             if players_with_nations
-            else match_data.get("game_name", "Unknown")
+            else summary.get("game_name", "Unknown")
         )
 
-        winner_name = match_data.get("winner_name", "Unknown")
-        winner_civ = match_data.get("winner_civilization", "Unknown")
+        winner_name = summary.get("winner_name", "Unknown")
+        winner_civ = summary.get("winner_civilization", "Unknown")
         winner_display = (
             f"{winner_name} ({winner_civ})" if winner_civ != "Unknown" else winner_name
         )
 
         # Get first picker info
-        first_picker_name = match_data.get("first_picker_name", "Unknown")
+        first_picker_name = summary.get("first_picker_name", "Unknown")
         first_picker_display = (
             first_picker_name if first_picker_name != "Unknown" else "No data"
         )
@@ -527,7 +556,7 @@ def update_match_details(match_id: Optional[int], url_search: Optional[str]) ->
                                                                 className="bi bi-clock me-2 text-info"
                                                             ),
                                                             html.Span(
-                                                                f"{match_data.get('total_turns', 0)} ",
+                                                                f"{summary.get('total_turns', 0)} ",
                                                                 className="fw-bold",
                                                             ),
                                                             html.Span(
@@ -543,7 +572,7 @@ def update_match_details(match_id: Optional[int], url_search: Optional[str]) ->
                                                                 className="bi bi-people me-2 text-success"
                                                             ),
                                                             html.Span(
-                                                                f"{match_data.get('player_count', 0)} ",
+                                                                f"{summary.get('player_count', 0)} ",
                                                                 className="fw-bold",
                                                             ),
                                                             html.Span(
@@ -731,6 +760,7 @@ def update_match_details(match_id: Optional[int], url_search: Optional[str]) ->
                                             create_data_table_card(
                                                 title="Events",
                                                 table_id="match-turns-table",
+                                                server_side=True,
                                                 columns=[
                                                     {
                                                         "name": "Turn",
@@ -1388,12 +1418,20 @@ def update_match_details(match_id: Optional[int], url_search: Optional[str]) ->
                         ],
                     },
                 ],
-                active_tab="overview",
+                active_tab=DEFAULT_MATCH_TAB,
                 tabs_id="match-details-tabs",
             ),
+            # Match key for each tab's callbacks, given to a tab when first shown
+            *[
+                dcc.Store(
+                    id=_tab_store_id(tab),
+                    data=match_key if tab == DEFAULT_MATCH_TAB else None,
+                )
+                for tab in MATCH_DETAIL_TABS
+            ],
         ]
 
-        return details_content, {"display": "block"}, {"display": "none"}
+        return details_content, {"display": "block"}, {"display": "none"}, match_key
 
     except Exception as e:
         error_content = create_empty_state(
@@ -1401,7 +1439,7 @@ def update_match_details(match_id: Optional[int], url_search: Optional[str]) ->
             message=f"Unable to load match details: {str(e)}",
             icon="bi-exclamation-triangle",
         )
-        return error_content, {"display": "block"}, {"display": "none"}
+        return error_content, {"display": "block"}, {"display": "none"}, None
 
 
 @callback(
@@ -1477,46 +1515,37 @@ def sync_store_from_filter(selected_categories: list[str]) -> dict:
 
 @callback(
     Output("match-overview-table", "children"),
-    Input("match-details-tabs", "active_tab"),
-    Input("match-selector", "value"),
+    Input("match-timeline-tab-store", "data"),
     Input("show-event-text-toggle", "value"),
     Input("event-filter-checklist", "value"),
+    prevent_initial_call=True,
 )
 def update_overview_table(
-    active_tab: Optional[str],
-    match_id: Optional[int],
+    match_key: Optional[Dict[str, int]],
     show_text: bool,
     enabled_categories: Optional[list[str]],
 ) -> html.Div:
     """Update the overview comparison table.
 
     Args:
-        active_tab: Currently active tab ID
-        match_id: Selected match ID
+        match_key: Match key from match-timeline-tab-store
         show_text: Whether to show event text labels
         enabled_categories: List of enabled filter categories (includes "Metrics")
 
     Returns:
         Overview comparison component HTML
     """
+    match_data = _shared_match_data(match_key)
     # Extract Metrics toggle from the checklist
     show_metrics = "Metrics" in (enabled_categories or [])
-    # Lazy loading - only update when Timeline tab is active
-    if active_tab != "timeline":
+    # The toggles are restored before the Timeline tab is first shown
+    if not match_data:
         raise dash.exceptions.PreventUpdate
 
-    if not match_id:
-        return create_empty_state(
-            title="Select a Match",
-            message="Choose a match from the dropdown to view match overview.",
-            icon="bi-bar-chart",
-        )
-
     try:
-        queries = get_queries()
-
         # Get timeline events for the icons column
-        events_df = queries.get_match_timeline_events(match_id)
+        events_df = match_data.frame("timeline_events")
+        summary = match_data.summary
 
         # Get player IDs from events or match summary
         if not events_df.empty:
@@ -1526,11 +1555,9 @@ def update_overview_table(
                 player2_id = int(max(player_ids))
             else:
                 # Fall back to match summary
-                players_df = queries.get_match_summary()
-                match_info = players_df[players_df["match_id"] == match_id]
-                if not match_info.empty:
-                    player1_id = int(match_info.iloc[0]["player1_id"])
-                    player2_id = int(match_info.iloc[0]["player2_id"])
+                if summary is not None:
+                    player1_id = int(summary["player1_id"])
+                    player2_id = int(summary["player2_id"])
                 else:
                     return create_empty_state(
                         title="No Player Data",
@@ -1539,11 +1566,9 @@ def update_overview_table(
                     )
         else:
             # Get player IDs from match summary
-            players_df = queries.get_match_summary()
-            match_info = players_df[players_df["match_id"] == match_id]
-            if not match_info.empty:
-                player1_id = int(match_info.iloc[0]["player1_id"])
-                player2_id = int(match_info.iloc[0]["player2_id"])
+            if summary is not None:
+                player1_id = int(summary["player1_id"])
+                player2_id = int(summary["player2_id"])
             else:
                 return create_empty_state(
                     title="No Match Data",
@@ -1552,9 +1577,7 @@ def update_overview_table(
                 )
 
         # Get comparison data
-        comparison_df = queries.get_match_turn_comparisons(
-            match_id, player1_id, player2_id
-        )
+        comparison_df = match_data.turn_comparisons(player1_id, player2_id)
 
         if comparison_df.empty:
             return create_empty_state(
@@ -1588,9 +1611,9 @@ def update_overview_table(
         player1_civilization = ""
         player2_civilization = ""
         try:
-            yield_df = queries.get_yield_history_by_match(match_id)
+            yield_df = match_data.frame("yield_history")
             if not yield_df.empty and "civilization" in yield_df.columns:
-                colors = get_player_colors_from_df(yield_df)
+                colors = match_data.player_colors
                 player1_color = colors.get(player1_name, "#4dabf7")
                 player2_color = colors.get(player2_name, "#ff6b6b")
                 # Extract civilizations
@@ -1616,6 +1639,7 @@ def update_overview_table(
             show_text=show_text,
             show_metrics=show_metrics,
             enabled_categories=enabled_categories,
+            turn_window=LAYOUT_CONSTANTS["TIMELINE_TURN_WINDOW"],
         )
 
     except Exception as e:
@@ -1627,23 +1651,88 @@ def update_overview_table(
         )
 
 
-@callback(Output("match-progression-chart", "figure"), Input("match-selector", "value"))
-def update_progression_chart(match_id: Optional[int]):
+@callback(
+    Output(GAME_STATE_ROWS_ID, "children"),
+    Output(GAME_STATE_WINDOW_ID, "data"),
+    Output(GAME_STATE_MORE_ID, "children"),
+    Output(GAME_STATE_MORE_ID, "style"),
+    Input(GAME_STATE_MORE_ID, "n_clicks"),
+    State(GAME_STATE_WINDOW_ID, "data"),
+    State("match-data-store", "data"),
+    prevent_initial_call=True,
+)
+def load_more_game_state_turns(
+    n_clicks: Optional[int],
+    window: Optional[Dict[str, Any]],
+    match_key: Optional[Dict[str, int]],
+) -> tuple:
+    """Append the next window of turns to the game state table.
+
+    Triggered when the load-more button below the table is clicked or
+    scrolled into view. Only the new rows are sent to the browser.
+
+    Args:
+        n_clicks: Load-more button clicks
+        window: Rendered turn count and row arguments of the table
+        match_key: Match key from match-data-store
+
+    Returns:
+        Tuple of (rows patch, updated window, button label, button style)
+    """
+    match_data = _shared_match_data(match_key)
+    if not n_clicks or not window or not match_data:
+        raise dash.exceptions.PreventUpdate
+
+    row_args = window["row_args"]
+    events_df = match_data.frame("timeline_events")
+    comparison_df = match_data.turn_comparisons(
+        row_args["player1_id"], row_args["player2_id"]
+    )
+    if not events_df.empty:
+        comparison_df = comparison_df[
+            comparison_df["turn_number"].isin(events_df["turn"].unique())
+        ]
+
+    rows, total_turns = create_game_state_rows(
+        comparison_df,
+        events_df,
+        start=window["rendered"],
+        count=LAYOUT_CONSTANTS["TIMELINE_TURN_WINDOW"],
+        **row_args,
+    )
+    rendered = window["rendered"] + len(rows)
+
+    patch = Patch()
+    patch.extend(rows)
+    return (
+        patch,
+        {**window, "rendered": rendered},
+        load_more_label(rendered, total_turns),
+        {"display": "none"} if rendered >= total_turns else {},
+    )
+
+
+@callback(
+    Output("match-progression-chart", "figure"),
+    Input("match-events-tab-store", "data"),
+    prevent_initial_call=True,
+)
+def update_progression_chart(match_key: Optional[Dict[str, int]]):
     """Update the events timeline chart categorized by gameplay type.
 
     Args:
-        match_id: Selected match ID
+        match_key: Match key from match-events-tab-store
 
     Returns:
         Plotly figure for events timeline as stacked bar chart
     """
-    if not match_id:
+    match_data = _shared_match_data(match_key)
+    if not match_data:
         return create_empty_chart_placeholder("Select a match to view events")
 
     try:
-        queries = get_queries()
-        # Get event timeline (includes both MemoryData and LogData events)
-        df = queries.get_event_timeline(match_id, None)
+        # Event timeline (includes both MemoryData and LogData events)
+        df = match_data.frame("events")
 
         if df.empty:
             return create_empty_chart_placeholder("No event data available")
@@ -1702,75 +1791,92 @@ def update_progression_chart(match_id: Optional[int]):
         return create_empty_chart_placeholder(f"Error loading events: {str(e)}")
 
 
-@callback(Output("match-turns-table", "data"), Input("match-selector", "value"))
-def update_turns_table(match_id: Optional[int]) -> List[Dict[str, Any]]:
+@callback(
+    Output("match-turns-table", "page_current"),
+    Input("match-events-tab-store", "data"),
+    Input("match-turns-table", "filter_query"),
+    prevent_initial_call=True,
+)
+def reset_turns_table_page(
+    match_key: Optional[Dict[str, int]], filter_query: str
+) -> int:
+    """Return to the first page of the events table for a new match or filter."""
+    return 0
+
+
+@callback(
+    Output("match-turns-table", "data"),
+    Output("match-turns-table", "page_count"),
+    Input("match-events-tab-store", "data"),
+    Input("match-turns-table", "page_current"),
+    Input("match-turns-table", "page_size"),
+    Input("match-turns-table", "sort_by"),
+    Input("match-turns-table", "filter_query"),
+    prevent_initial_call=True,
+)
+def update_turns_table(
+    match_key: Optional[Dict[str, int]],
+    page_current: Optional[int],
+    page_size: int,
+    sort_by: Optional[List[Dict[str, str]]],
+    filter_query: Optional[str],
+) -> tuple:
     """Update the event details table with both MemoryData and LogData events.
 
+    Sorting, filtering and paging run in the database, so only the current
+    page of events is sent to the browser.
+
     Args:
-        match_id: Selected match ID
+        match_key: Match key from match-events-tab-store
+        page_current: Zero-based page index of the table
+        page_size: Rows per page
+        sort_by: Table sort columns
+        filter_query: Table column filters
 
     Returns:
-        List of event data for table
+        Tuple of (event rows for the current page, page count)
     """
+    match_id = _selected_match_id(match_key)
     if not match_id:
-        return []
+        return [], 1
 
     try:
         queries = get_queries()
-        # Get event timeline data (includes both MemoryData and LogData events)
-        df = queries.get_event_timeline(match_id, None)
-
-        if df.empty:
-            return []
-
-        # Add gameplay category to each event
-        df["gameplay_category"] = df["event_type"].apply(get_event_category)
-
-        # Replace the old event_category with the new gameplay_category
-        df["event_category"] = df["gameplay_category"]
+        # Categorized events (includes both MemoryData and LogData events)
+        df, total = queries.get_event_timeline_page(
+            match_id, page_current, page_size, sort_by, filter_query
+        )
 
-        # Limit to 500 most recent events for display (increased from 100 to show more LogData events)
-        return df.head(500).to_dict("records")
+        return df.to_dict("records"), page_count(total, page_size)
 
     except Exception as e:
         logger.error(f"Error updating events table: {e}")
-        return []
+        return [], 1
 
 
-@callback(Output("match-breadcrumb", "children"), Input("match-selector", "value"))
-def update_breadcrumb(match_id: Optional[int]) -> html.Div:
+@callback(Output("match-breadcrumb", "children"), Input("match-data-store", "data"))
+def update_breadcrumb(match_key: Optional[Dict[str, int]]) -> html.Div:
     """Update breadcrumb navigation.
 
     Args:
-        match_id: Selected match ID
+        match_key: Match key from match-data-store
 
     Returns:
         Breadcrumb component
     """
+    match_data = _shared_match_data(match_key)
     items = [{"label": "Home", "href": "/"}, {"label": "Matches", "href": "/matches"}]
 
-    if match_id:
-        # Get match name for breadcrumb
-        try:
-            queries = get_queries()
-            match_df = queries.get_match_summary()
-            match_info = match_df[match_df["match_id"] == match_id]
-
-            if not match_info.empty:
-                players_with_nations = match_info.iloc[0].get(
-                    "players_with_nations", ""
-                )
-                game_name = match_info.iloc[0].get("game_name", f"Match {match_id}")
-                # Use players with nations if available, otherwise use game name
-                display_name = (
-                    players_with_nations if players_with_nations else game_name
-                )
-                items.append({"label": display_name})
-            else:
-                items.append({"label": f"Match {match_id}"})
-        except Exception as e:
-            # Log the error but don't crash
-            logger.error(f"Error getting match name for breadcrumb: {e}")
+    if match_data:
+        match_id = match_data.match_id
+        summary = match_data.summary
+        if summary:
+            players_with_nations = summary.get("players_with_nations")
+            game_name = summary.get("game_name") or f"Match {match_id}"
+            # Use players with nations if available, otherwise use game name
+            display_name = players_with_nations if players_with_nations else game_name
+            items.append({"label": display_name})
+        else:
             items.append({"label": f"Match {match_id}"})
 
     return create_breadcrumb(items)
@@ -1778,41 +1884,25 @@ def update_breadcrumb(match_id: Optional[int]) -> html.Div:
 
 @callback(
     Output("match-technology-chart", "figure"),
-    Input("match-details-tabs", "active_tab"),
-    Input("match-selector", "value"),
-    State("match-tabs-loaded-store", "data"),
+    Input("match-technology-tab-store", "data"),
     prevent_initial_call=True,
 )
-def update_technology_chart(
-    active_tab: Optional[str],
-    match_id: Optional[int],
-    loaded_state: Optional[Dict[str, Any]],
-) -> go.Figure:
+def update_technology_chart(match_key: Optional[Dict[str, int]]) -> go.Figure:
     """Update cumulative technology count chart.
 
     Args:
-        active_tab: Currently active tab
-        match_id: Selected match ID
-        loaded_state: Tab loading state from store
+        match_key: Match key from match-technology-tab-store
 
     Returns:
         Plotly figure for cumulative technology count
     """
-    # Lazy loading: skip rendering if tab is not active
-    if active_tab != "technology":
-        raise dash.exceptions.PreventUpdate
-
-    # Skip re-fetching if tab was already loaded for this match
-    if loaded_state and loaded_state.get("match_id") == match_id:
-        if "technology" in loaded_state.get("loaded_tabs", []):
-            raise dash.exceptions.PreventUpdate
-
+    match_data = _shared_match_data(match_key)
+    match_id = match_data.match_id if match_data else None
     if not match_id:
         return create_empty_chart_placeholder("Select a match to view technology data")
 
     try:
-        queries = get_queries()
-        df = queries.get_tech_count_by_turn(match_id)
+        df = match_data.frame("tech_count_by_turn")
 
         if df.empty:
             return create_empty_chart_placeholder(
@@ -1820,14 +1910,10 @@ def update_technology_chart(
             )
 
         # Get total turns for the match to extend lines to the end
-        match_df = queries.get_match_summary()
-        match_info = match_df[match_df["match_id"] == match_id]
-        total_turns = (
-            match_info.iloc[0]["total_turns"] if not match_info.empty else None
-        )
+        total_turns = match_data.total_turns
 
         # Get player colors based on their civilizations
-        player_colors = get_player_colors_for_match(match_id)
+        player_colors = match_data.player_colors
 
         return create_cumulative_tech_count_chart(df, total_turns, player_colors)
 
@@ -1838,34 +1924,35 @@ def update_technology_chart(
         )
 
 
-@callback(Output("match-tech-timeline", "figure"), Input("match-selector", "value"))
-def update_tech_timeline(match_id: Optional[int]) -> go.Figure:
+@callback(
+    Output("match-tech-timeline", "figure"),
+    Input("match-technology-tab-store", "data"),
+    prevent_initial_call=True,
+)
+def update_tech_timeline(match_key: Optional[Dict[str, int]]) -> go.Figure:
     """Update technology completion timeline chart.
 
     Args:
-        match_id: Selected match ID
+        match_key: Match key from match-technology-tab-store
 
     Returns:
         Plotly figure showing when each player discovered each technology
     """
-    if not match_id:
+    match_data = _shared_match_data(match_key)
+    if not match_data:
         return create_empty_chart_placeholder(
             "Select a match to view technology timeline"
         )
 
     try:
-        queries = get_queries()
-        df = queries.get_tech_timeline(match_id)
+        df = match_data.frame("tech_timeline")
 
         if df.empty:
             return create_empty_chart_placeholder(
                 "No technology timeline data available for this match"
             )
 
-        # Get player colors based on their civilizations
-        player_colors = get_player_colors_for_match(match_id)
-
-        return create_tech_completion_timeline_chart(df, player_colors)
+        return create_tech_completion_timeline_chart(df, match_data.player_colors)
 
     except Exception as e:
         logger.error(f"Error loading tech completion timeline: {e}")
@@ -1876,43 +1963,20 @@ def update_tech_timeline(match_id: Optional[int]) -> go.Figure:
 
 @callback(
     Output("match-law-timeline", "figure"),
-    Input("match-details-tabs", "active_tab"),
-    Input("match-selector", "value"),
-    State("match-tabs-loaded-store", "data"),
+    Input("match-laws-tab-store", "data"),
     prevent_initial_call=True,
 )
-def update_law_timeline(
-    active_tab: Optional[str],
-    match_id: Optional[int],
-    loaded_state: Optional[Dict[str, Any]],
-) -> go.Figure:
+def update_law_timeline(match_key: Optional[Dict[str, int]]) -> go.Figure:
     """Update law adoption timeline chart.
 
     Args:
-        active_tab: Currently active tab
-        match_id: Selected match ID
-        loaded_state: Tab loading state from store
+        match_key: Match key from match-laws-tab-store
 
     Returns:
         Plotly figure showing when each player adopted each law
     """
-    # Lazy loading: skip rendering if tab is not active
-    if active_tab != "laws":
-        raise dash.exceptions.PreventUpdate
-    # Skip re-fetching if tab was already loaded for this match
-    if loaded_state and loaded_state.get("match_id") == match_id:
-        if "laws" in loaded_state.get("loaded_tabs", []):
-            raise dash.exceptions.PreventUpdate
-    # Skip re-fetching if tab was already loaded for this match
-    if loaded_state and loaded_state.get("match_id") == match_id:
-        if "laws" in loaded_state.get("loaded_tabs", []):
-            raise dash.exceptions.PreventUpdate
-
-    # Skip re-fetching if tab was already loaded for this match
-    if loaded_state and loaded_state.get("match_id") == match_id:
-        if "laws" in loaded_state.get("loaded_tabs", []):
-            raise dash.exceptions.PreventUpdate
-
+    match_data = _shared_match_data(match_key)
+    match_id = match_data.match_id if match_data else None
     if not match_id:
         return create_empty_chart_placeholder("Select a match to view law timeline")
 
@@ -1926,7 +1990,7 @@ def update_law_timeline(
             )
 
         # Get player colors based on their civilizations
-        player_colors = get_player_colors_for_match(match_id)
+        player_colors = match_data.player_colors
 
         return create_law_adoption_timeline_chart(df, player_colors)
 
@@ -1936,17 +2000,20 @@ def update_law_timeline(
 
 
 @callback(
-    Output("match-settings-content", "children"), Input("match-selector", "value")
+    Output("match-settings-content", "children"),
+    Input("match-settings-tab-store", "data"),
+    prevent_initial_call=True,
 )
-def update_settings_content(match_id: Optional[int]):
+def update_settings_content(match_key: Optional[Dict[str, int]]):
     """Update game settings display with comprehensive formatting.
 
     Args:
-        match_id: Selected match ID
+        match_key: Match key from match-settings-tab-store
 
     Returns:
         HTML content with game settings
     """
+    match_id = _selected_match_id(match_key)
     if not match_id:
         return create_empty_state(
             "Select a match to view game settings", icon="bi-gear"
@@ -2254,37 +2321,25 @@ def update_settings_content(match_id: Optional[int]):
 
 @callback(
     Output("match-final-laws-content", "children"),
-    Input("match-details-tabs", "active_tab"),
-    Input("match-selector", "value"),
-    State("match-tabs-loaded-store", "data"),
+    Input("match-laws-tab-store", "data"),
     prevent_initial_call=True,
 )
-def update_final_laws(
-    active_tab: Optional[str],
-    match_id: Optional[int],
-    loaded_state: Optional[Dict[str, Any]],
-) -> html.Div:
+def update_final_laws(match_key: Optional[Dict[str, int]]) -> html.Div:
     """Update final laws display by player.
 
     Args:
-        active_tab: Currently active tab
-        match_id: Selected match ID
+        match_key: Match key from match-laws-tab-store
 
     Returns:
         HTML content with player boxes containing laws
     """
-    # Lazy loading: skip rendering if tab is not active
-    if active_tab != "laws":
-        raise dash.exceptions.PreventUpdate
-
-    if not match_id:
+    match_data = _shared_match_data(match_key)
+    if not match_data:
         return html.Div("Select a match to view final laws", className="text-muted")
 
     try:
-        queries = get_queries()
-
         # Get laws data
-        laws_df = queries.get_cumulative_law_count_by_turn(match_id)
+        laws_df = match_data.frame("law_count_by_turn")
 
         if laws_df.empty:
             return html.Div("No law data available", className="text-muted")
@@ -2362,27 +2417,26 @@ def update_final_laws(
 
 @callback(
     Output("match-final-techs-content", "children"),
-    Input("match-selector", "value"),
+    Input("match-technology-tab-store", "data"),
+    prevent_initial_call=True,
 )
-def update_final_techs(match_id: Optional[int]) -> html.Div:
+def update_final_techs(match_key: Optional[Dict[str, int]]) -> html.Div:
     """Update final technologies display by player.
 
     Args:
-        match_id: Selected match ID
+        match_key: Match key from match-technology-tab-store
 
     Returns:
         HTML content with player boxes containing technologies
     """
-    if not match_id:
+    match_data = _shared_match_data(match_key)
+    if not match_data:
         return html.Div(
             "Select a match to view final technologies", className="text-muted"
         )
 
     try:
-        queries = get_queries()
-
-        # Get techs data
-        techs_df = queries.get_tech_count_by_turn(match_id)
+        techs_df = match_data.frame("tech_count_by_turn")
 
         if techs_df.empty:
             return html.Div("No technology data available", className="text-muted")
@@ -2460,48 +2514,34 @@ def update_final_techs(match_id: Optional[int]) -> html.Div:
 
 @callback(
     Output("match-law-cumulative", "figure"),
-    Input("match-details-tabs", "active_tab"),
-    Input("match-selector", "value"),
-    State("match-tabs-loaded-store", "data"),
+    Input("match-laws-tab-store", "data"),
     prevent_initial_call=True,
 )
-def update_law_cumulative(
-    active_tab: Optional[str],
-    match_id: Optional[int],
-    loaded_state: Optional[Dict[str, Any]],
-) -> go.Figure:
+def update_law_cumulative(match_key: Optional[Dict[str, int]]) -> go.Figure:
     """Update cumulative law count chart.
 
     Args:
-        active_tab: Currently active tab
-        match_id: Selected match ID
+        match_key: Match key from match-laws-tab-store
 
     Returns:
         Plotly figure with cumulative line chart
     """
-    # Lazy loading: skip rendering if tab is not active
-    if active_tab != "laws":
-        raise dash.exceptions.PreventUpdate
-
+    match_data = _shared_match_data(match_key)
+    match_id = match_data.match_id if match_data else None
     if not match_id:
         return create_empty_chart_placeholder("Select a match")
 
     try:
-        queries = get_queries()
-        df = queries.get_cumulative_law_count_by_turn(match_id)
+        df = match_data.frame("law_count_by_turn")
 
         if df.empty:
             return create_empty_chart_placeholder("No law data for this match")
 
         # Get total turns for the match to extend lines to the end
-        match_df = queries.get_match_summary()
-        match_info = match_df[match_df["match_id"] == match_id]
-        total_turns = (
-            match_info.iloc[0]["total_turns"] if not match_info.empty else None
-        )
+        total_turns = match_data.total_turns
 
         # Get player colors based on their civilizations
-        player_colors = get_player_colors_for_match(match_id)
+        player_colors = match_data.player_colors
 
         return create_cumulative_law_count_chart(df, total_turns, player_colors)
 
@@ -2516,38 +2556,23 @@ def update_law_cumulative(
         Output(f"match-{yield_type.lower().replace('_', '-')}-chart", "figure")
         for yield_type, _ in YIELD_TYPES
     ],
-    Input("match-details-tabs", "active_tab"),
-    Input("match-selector", "value"),
-    State("match-tabs-loaded-store", "data"),
+    Input("match-yields-tab-store", "data"),
     prevent_initial_call=True,
 )
-def update_all_yield_charts(
-    active_tab: Optional[str],
-    match_id: Optional[int],
-    loaded_state: Optional[Dict[str, Any]],
-) -> List[go.Figure]:
+def update_all_yield_charts(match_key: Optional[Dict[str, int]]) -> List[go.Figure]:
     """Update all yield charts when a match is selected.
 
     Fetches data for all 14 yield types in a single query and creates
     individual charts for each yield type.
 
     Args:
-        active_tab: Currently active tab
-        match_id: Selected match ID
-        loaded_state: Tab loading state from store
+        match_key: Match key from match-yields-tab-store
 
     Returns:
         List of 14 Plotly figures (one for each yield type)
     """
-    # Lazy loading: skip rendering if tab is not active
-    if active_tab != "yields":
-        raise dash.exceptions.PreventUpdate
-
-    # Skip re-fetching if tab was already loaded for this match
-    if loaded_state and loaded_state.get("match_id") == match_id:
-        if "yields" in loaded_state.get("loaded_tabs", []):
-            raise dash.exceptions.PreventUpdate
-
+    match_data = _shared_match_data(match_key)
+    match_id = match_data.match_id if match_data else None
     # If no match selected, return empty placeholders for all charts
     if not match_id:
         return [
@@ -2558,10 +2583,8 @@ def update_all_yield_charts(
         ]
 
     try:
-        queries = get_queries()
-
         # SINGLE query fetches ALL yield data for the match
-        all_yields_df = queries.get_yield_history_by_match(match_id)
+        all_yields_df = match_data.frame("yield_history")
 
         if all_yields_df.empty:
             return [
@@ -2573,16 +2596,12 @@ def update_all_yield_charts(
 
         # Check for actual cumulative totals (v1.0.81366+ saves)
         # These are ~30% more accurate because they include events, bonuses, etc.
-        yield_total_df = None
-        if queries.has_yield_total_history(match_id):
-            yield_total_df = queries.get_yield_total_history_by_match(match_id)
+        yield_total_df = match_data.frame("yield_total_history")
+        if yield_total_df.empty:
+            yield_total_df = None
 
         # Get total turns for the match to extend chart lines
-        match_df = queries.get_match_summary()
-        match_info = match_df[match_df["match_id"] == match_id]
-        total_turns = (
-            match_info.iloc[0]["total_turns"] if not match_info.empty else None
-        )
+        total_turns = match_data.total_turns
 
         # Get player colors based on their civilizations
         player_colors = get_player_colors_from_df(all_yields_df)
@@ -2746,33 +2765,20 @@ def _create_science_reference_panel() -> dbc.Accordion:
 
 @callback(
     Output("match-science-breakdown", "figure"),
-    Input("match-details-tabs", "active_tab"),
-    Input("match-selector", "value"),
-    State("match-tabs-loaded-store", "data"),
+    Input("match-science-tab-store", "data"),
     prevent_initial_call=True,
 )
-def update_science_breakdown_chart(
-    active_tab: Optional[str],
-    match_id: Optional[int],
-    loaded_state: Optional[Dict[str, Any]],
-) -> go.Figure:
+def update_science_breakdown_chart(match_key: Optional[Dict[str, int]]) -> go.Figure:
     """Update science breakdown chart showing all sources.
 
     Args:
-        active_tab: Currently active tab
-        match_id: Selected match ID
-        loaded_state: Tab loading state from store
+        match_key: Match key from match-science-tab-store
 
     Returns:
         Plotly figure with stacked horizontal bar chart
     """
-    if active_tab != "science":
-        raise dash.exceptions.PreventUpdate
-
-    if loaded_state and loaded_state.get("match_id") == match_id:
-        if "science" in loaded_state.get("loaded_tabs", []):
-            raise dash.exceptions.PreventUpdate
-
+    match_data = _shared_match_data(match_key)
+    match_id = match_data.match_id if match_data else None
     if not match_id:
         return create_empty_chart_placeholder(
             "Select a match to view science breakdown"
@@ -2785,7 +2791,7 @@ def update_science_breakdown_chart(
         if breakdown_df.empty:
             return create_empty_chart_placeholder("No science data available")
 
-        player_colors = get_player_colors_for_match(match_id)
+        player_colors = match_data.player_colors
         return create_science_breakdown_chart(breakdown_df, player_colors)
 
     except Exception as e:
@@ -2795,63 +2801,43 @@ def update_science_breakdown_chart(
 
 @callback(
     Output("match-science-rate-cumulative", "figure"),
-    Input("match-details-tabs", "active_tab"),
-    Input("match-selector", "value"),
-    State("match-tabs-loaded-store", "data"),
+    Input("match-science-tab-store", "data"),
     prevent_initial_call=True,
 )
 def update_science_rate_cumulative_chart(
-    active_tab: Optional[str],
-    match_id: Optional[int],
-    loaded_state: Optional[Dict[str, Any]],
+    match_key: Optional[Dict[str, int]],
 ) -> go.Figure:
     """Update science rate and cumulative chart with event spike annotations.
 
     Args:
-        active_tab: Currently active tab
-        match_id: Selected match ID
-        loaded_state: Tab loading state from store
+        match_key: Match key from match-science-tab-store
 
     Returns:
         Plotly figure with rate + cumulative subplots
     """
-    if active_tab != "science":
-        raise dash.exceptions.PreventUpdate
-
-    if loaded_state and loaded_state.get("match_id") == match_id:
-        if "science" in loaded_state.get("loaded_tabs", []):
-            raise dash.exceptions.PreventUpdate
-
+    match_data = _shared_match_data(match_key)
+    match_id = match_data.match_id if match_data else None
     if not match_id:
         return create_empty_chart_placeholder("Select a match to view science rate")
 
     try:
-        queries = get_queries()
-
         # Get science rate data
-        rate_df = queries.get_yield_history_by_match(
-            match_id, yield_types=["YIELD_SCIENCE"]
-        )
+        all_yields = match_data.frame("yield_history")
+        rate_df = all_yields[all_yields["resource_type"] == "YIELD_SCIENCE"]
+        rate_df = rate_df.reset_index(drop=True)
         if rate_df.empty:
             return create_empty_chart_placeholder("No science yield data available")
 
         # Get actual cumulative totals if available (v1.0.81366+ saves)
         cumulative_df = None
-        if queries.has_yield_total_history(match_id):
-            all_totals = queries.get_yield_total_history_by_match(match_id)
-            if all_totals is not None and not all_totals.empty:
-                cumulative_df = all_totals[
-                    all_totals["resource_type"] == "YIELD_SCIENCE"
-                ]
+        all_totals = match_data.frame("yield_total_history")
+        if not all_totals.empty:
+            cumulative_df = all_totals[all_totals["resource_type"] == "YIELD_SCIENCE"]
 
         # Get total turns for extending lines
-        match_df = queries.get_match_summary()
-        match_info = match_df[match_df["match_id"] == match_id]
-        total_turns = (
-            match_info.iloc[0]["total_turns"] if not match_info.empty else None
-        )
+        total_turns = match_data.total_turns
 
-        player_colors = get_player_colors_for_match(match_id)
+        player_colors = match_data.player_colors
         return create_science_rate_cumulative_chart(
             rate_df,
             total_turns=total_turns,
@@ -2866,46 +2852,34 @@ def update_science_rate_cumulative_chart(
 
 @callback(
     Output("match-science-sources-stacked", "figure"),
-    Input("match-details-tabs", "active_tab"),
-    Input("match-selector", "value"),
-    State("match-tabs-loaded-store", "data"),
+    Input("match-science-tab-store", "data"),
     prevent_initial_call=True,
 )
 def update_science_sources_stacked_chart(
-    active_tab: Optional[str],
-    match_id: Optional[int],
-    loaded_state: Optional[Dict[str, Any]],
+    match_key: Optional[Dict[str, int]],
 ) -> go.Figure:
     """Update per-player stacked area chart for science sources.
 
     Args:
-        active_tab: Currently active tab
-        match_id: Selected match ID
-        loaded_state: Tab loading state from store
+        match_key: Match key from match-science-tab-store
 
     Returns:
         Plotly figure with stacked area subplots per player
     """
-    if active_tab != "science":
-        raise dash.exceptions.PreventUpdate
-
-    if loaded_state and loaded_state.get("match_id") == match_id:
-        if "science" in loaded_state.get("loaded_tabs", []):
-            raise dash.exceptions.PreventUpdate
-
+    match_data = _shared_match_data(match_key)
+    match_id = match_data.match_id if match_data else None
     if not match_id:
         return create_empty_chart_placeholder("Select a match to view science sources")
 
     try:
-        queries = get_queries()
-        df = queries.get_science_infrastructure_timeline(match_id)
+        df = match_data.frame("science_infrastructure_timeline")
 
         if df.empty:
             return create_empty_chart_placeholder("No science infrastructure data")
 
-        projects_df = queries.get_science_projects_summary(match_id)
-        bonuses_df = queries.get_science_bonuses_summary(match_id)
-        player_colors = get_player_colors_for_match(match_id)
+        projects_df = match_data.frame("science_projects")
+        bonuses_df = match_data.frame("science_bonuses")
+        player_colors = match_data.player_colors
         return create_science_sources_stacked_chart(
             df, player_colors, projects_df=projects_df, bonuses_df=bonuses_df
         )
@@ -2917,46 +2891,32 @@ def update_science_sources_stacked_chart(
 
 @callback(
     Output("match-science-sources", "figure"),
-    Input("match-details-tabs", "active_tab"),
-    Input("match-selector", "value"),
-    State("match-tabs-loaded-store", "data"),
+    Input("match-science-tab-store", "data"),
     prevent_initial_call=True,
 )
-def update_science_sources_chart(
-    active_tab: Optional[str],
-    match_id: Optional[int],
-    loaded_state: Optional[Dict[str, Any]],
-) -> go.Figure:
+def update_science_sources_chart(match_key: Optional[Dict[str, int]]) -> go.Figure:
     """Update detailed science sources chart.
 
     Args:
-        active_tab: Currently active tab
-        match_id: Selected match ID
-        loaded_state: Tab loading state from store
+        match_key: Match key from match-science-tab-store
 
     Returns:
         Plotly figure with grouped bar chart
     """
-    if active_tab != "science":
-        raise dash.exceptions.PreventUpdate
-
-    if loaded_state and loaded_state.get("match_id") == match_id:
-        if "science" in loaded_state.get("loaded_tabs", []):
-            raise dash.exceptions.PreventUpdate
-
+    match_data = _shared_match_data(match_key)
+    match_id = match_data.match_id if match_data else None
     if not match_id:
         return create_empty_chart_placeholder("Select a match to view science sources")
 
     try:
-        queries = get_queries()
-        infra_df = queries.get_science_infrastructure_summary(match_id)
+        infra_df = get_queries().get_science_infrastructure_summary(match_id)
 
         if infra_df.empty:
             return create_empty_chart_placeholder("No science infrastructure data")
 
-        projects_df = queries.get_science_projects_summary(match_id)
-        bonuses_df = queries.get_science_bonuses_summary(match_id)
-        player_colors = get_player_colors_for_match(match_id)
+        projects_df = match_data.frame("science_projects")
+        bonuses_df = match_data.frame("science_bonuses")
+        player_colors = match_data.player_colors
         return create_science_sources_detail_chart(
             infra_df, player_colors, projects_df=projects_df, bonuses_df=bonuses_df
         )
@@ -2968,44 +2928,30 @@ def update_science_sources_chart(
 
 @callback(
     Output("match-science-timeline", "figure"),
-    Input("match-details-tabs", "active_tab"),
-    Input("match-selector", "value"),
-    State("match-tabs-loaded-store", "data"),
+    Input("match-science-tab-store", "data"),
     prevent_initial_call=True,
 )
-def update_science_timeline_chart(
-    active_tab: Optional[str],
-    match_id: Optional[int],
-    loaded_state: Optional[Dict[str, Any]],
-) -> go.Figure:
+def update_science_timeline_chart(match_key: Optional[Dict[str, int]]) -> go.Figure:
     """Update stacked area chart for science infrastructure timeline.
 
     Args:
-        active_tab: Currently active tab
-        match_id: Selected match ID
-        loaded_state: Tab loading state from store
+        match_key: Match key from match-science-tab-store
 
     Returns:
         Plotly figure with stacked area chart
     """
-    if active_tab != "science":
-        raise dash.exceptions.PreventUpdate
-
-    if loaded_state and loaded_state.get("match_id") == match_id:
-        if "science" in loaded_state.get("loaded_tabs", []):
-            raise dash.exceptions.PreventUpdate
-
+    match_data = _shared_match_data(match_key)
+    match_id = match_data.match_id if match_data else None
     if not match_id:
         return create_empty_chart_placeholder("Select a match to view science timeline")
 
     try:
-        queries = get_queries()
-        df = queries.get_science_infrastructure_timeline(match_id)
+        df = match_data.frame("science_infrastructure_timeline")
 
         if df.empty:
             return create_empty_chart_placeholder("No science timeline data")
 
-        player_colors = get_player_colors_for_match(match_id)
+        player_colors = match_data.player_colors
         return create_science_infrastructure_timeline(df, player_colors)
 
     except Exception as e:
@@ -3015,45 +2961,19 @@ def update_science_timeline_chart(
 
 @callback(
     Output("match-legitimacy-progression", "figure"),
-    Input("match-details-tabs", "active_tab"),
-    Input("match-selector", "value"),
-    State("match-tabs-loaded-store", "data"),
+    Input("match-ambitions-tab-store", "data"),
     prevent_initial_call=True,
 )
-def update_legitimacy_chart(
-    active_tab: Optional[str],
-    match_id: Optional[int],
-    loaded_state: Optional[Dict[str, Any]],
-) -> go.Figure:
+def update_legitimacy_chart(match_key: Optional[Dict[str, int]]) -> go.Figure:
     """Update legitimacy progression chart.
 
     Args:
-        active_tab: Currently active tab
-        match_id: Selected match ID
+        match_key: Match key from match-ambitions-tab-store
 
     Returns:
         Plotly figure with legitimacy progression
     """
-    # Lazy loading: skip rendering if tab is not active
-    if active_tab != "ambitions":
-        raise dash.exceptions.PreventUpdate
-    # Skip re-fetching if tab was already loaded for this match
-    if loaded_state and loaded_state.get("match_id") == match_id:
-        if "ambitions" in loaded_state.get("loaded_tabs", []):
-            raise dash.exceptions.PreventUpdate
-    # Skip re-fetching if tab was already loaded for this match
-    if loaded_state and loaded_state.get("match_id") == match_id:
-        if "ambitions" in loaded_state.get("loaded_tabs", []):
-            raise dash.exceptions.PreventUpdate
-    # Skip re-fetching if tab was already loaded for this match
-    if loaded_state and loaded_state.get("match_id") == match_id:
-        if "ambitions" in loaded_state.get("loaded_tabs", []):
-            raise dash.exceptions.PreventUpdate
-    # Skip re-fetching if tab was already loaded for this match
-    if loaded_state and loaded_state.get("match_id") == match_id:
-        if "ambitions" in loaded_state.get("loaded_tabs", []):
-            raise dash.exceptions.PreventUpdate
-
+    match_id = _selected_match_id(match_key)
     if not match_id:
         return create_empty_chart_placeholder("Select a match to view legitimacy")
 
@@ -3075,32 +2995,22 @@ def update_legitimacy_chart(
 
 @callback(
     Output("match-legitimacy-breakdown-container", "children"),
-    Input("match-details-tabs", "active_tab"),
-    Input("match-selector", "value"),
-    State("match-tabs-loaded-store", "data"),
+    Input("match-ambitions-tab-store", "data"),
     prevent_initial_call=True,
 )
-def update_legitimacy_breakdown(
-    active_tab: Optional[str],
-    match_id: Optional[int],
-    loaded_state: Optional[Dict[str, Any]],
-) -> html.Div:
+def update_legitimacy_breakdown(match_key: Optional[Dict[str, int]]) -> html.Div:
     """Update legitimacy breakdown showing cognomen contributions per ruler.
 
     Displays each player's legitimacy sources with events grouped under
     each ruler based on when they occurred during that ruler's reign.
 
     Args:
-        active_tab: Currently active tab
-        match_id: Selected match ID
+        match_key: Match key from match-ambitions-tab-store
 
     Returns:
         HTML Div containing breakdown cards for each player
     """
-    # Lazy loading: skip rendering if tab is not active
-    if active_tab != "ambitions":
-        raise dash.exceptions.PreventUpdate
-
+    match_id = _selected_match_id(match_key)
     if not match_id:
         return html.Div()
 
@@ -3337,29 +3247,19 @@ def update_legitimacy_breakdown(
 
 @callback(
     Output("match-ambition-timelines-container", "children"),
-    Input("match-details-tabs", "active_tab"),
-    Input("match-selector", "value"),
-    State("match-tabs-loaded-store", "data"),
+    Input("match-ambitions-tab-store", "data"),
     prevent_initial_call=True,
 )
-def update_ambition_timelines(
-    active_tab: Optional[str],
-    match_id: Optional[int],
-    loaded_state: Optional[Dict[str, Any]],
-):
+def update_ambition_timelines(match_key: Optional[Dict[str, int]]):
     """Update ambition timeline charts - one per player.
 
     Args:
-        active_tab: Currently active tab
-        match_id: Selected match ID
+        match_key: Match key from match-ambitions-tab-store
 
     Returns:
         HTML Div containing separate chart cards for each player
     """
-    # Lazy loading: skip rendering if tab is not active
-    if active_tab != "ambitions":
-        raise dash.exceptions.PreventUpdate
-
+    match_id = _selected_match_id(match_key)
     if not match_id:
         return html.Div(
             "Select a match to view ambition timelines", className="text-muted"
@@ -3419,29 +3319,19 @@ def update_ambition_timelines(
 
 @callback(
     Output("match-ambition-summary", "figure"),
-    Input("match-details-tabs", "active_tab"),
-    Input("match-selector", "value"),
-    State("match-tabs-loaded-store", "data"),
+    Input("match-ambitions-tab-store", "data"),
     prevent_initial_call=True,
 )
-def update_ambition_summary(
-    active_tab: Optional[str],
-    match_id: Optional[int],
-    loaded_state: Optional[Dict[str, Any]],
-) -> go.Figure:
+def update_ambition_summary(match_key: Optional[Dict[str, int]]) -> go.Figure:
     """Update ambition summary table.
 
     Args:
-        active_tab: Currently active tab
-        match_id: Selected match ID
+        match_key: Match key from match-ambitions-tab-store
 
     Returns:
         Plotly figure for ambition summary table
     """
-    # Lazy loading: skip rendering if tab is not active
-    if active_tab != "ambitions":
-        raise dash.exceptions.PreventUpdate
-
+    match_id = _selected_match_id(match_key)
     if not match_id:
         return create_empty_chart_placeholder("Select a match to view ambition summary")
 
@@ -3465,25 +3355,26 @@ def update_ambition_summary(
 
 @callback(
     Output("match-family-city-panels", "children"),
-    Input("match-selector", "value"),
+    Input("match-cities-tab-store", "data"),
+    prevent_initial_call=True,
 )
-def update_family_city_panels(match_id: Optional[int]) -> dbc.Row:
+def update_family_city_panels(match_key: Optional[Dict[str, int]]) -> dbc.Row:
     """Update family city distribution panels for each player.
 
     Shows which families each player has and how many cities per family.
 
     Args:
-        match_id: Selected match ID
+        match_key: Match key from match-cities-tab-store
 
     Returns:
         Row with player panels showing family city counts
     """
-    if not match_id:
+    match_data = _shared_match_data(match_key)
+    if not match_data:
         return html.Div()
 
     try:
-        queries = get_queries()
-        df = queries.get_family_city_counts(match_id)
+        df = match_data.frame("family_city_counts")
 
         if df.empty:
             return html.Div()
@@ -3553,43 +3444,37 @@ def update_family_city_panels(match_id: Optional[int]) -> dbc.Row:
 
 @callback(
     Output("match-cumulative-city-count", "figure"),
-    Input("match-selector", "value"),
+    Input("match-cities-tab-store", "data"),
+    prevent_initial_call=True,
 )
-def update_cumulative_city_count(match_id: Optional[int]) -> go.Figure:
+def update_cumulative_city_count(match_key: Optional[Dict[str, int]]) -> go.Figure:
     """Update cumulative city count chart.
 
     Args:
-        match_id: Selected match ID
+        match_key: Match key from match-cities-tab-store
 
     Returns:
         Plotly figure with cumulative city count
     """
-    if not match_id:
+    match_data = _shared_match_data(match_key)
+    if not match_data:
         return create_empty_chart_placeholder(
             "Select a match to view cumulative city count"
         )
 
     try:
-        queries = get_queries()
-        df = queries.get_city_founding_timeline(match_id)
+        df = match_data.frame("city_founding")
 
         if df.empty:
             return create_empty_chart_placeholder(
                 "No city founding data available for this match"
             )
 
-        # Get total turns for the match to extend lines to the end
-        match_df = queries.get_match_summary()
-        match_info = match_df[match_df["match_id"] == match_id]
-        total_turns = (
-            match_info.iloc[0]["total_turns"] if not match_info.empty else None
+        # Total turns extend the lines to the end of the match
+        return create_cumulative_city_count_chart(
+            df, match_data.total_turns, match_data.player_colors
         )
 
-        # Get player colors based on their civilizations
-        player_colors = get_player_colors_for_match(match_id)
-
-        return create_cumulative_city_count_chart(df, total_turns, player_colors)
-
     except Exception as e:
         logger.error(f"Error loading cumulative city count: {e}")
         return create_empty_chart_placeholder(
@@ -3599,35 +3484,33 @@ def update_cumulative_city_count(match_id: Optional[int]) -> go.Figure:
 
 @callback(
     Output("match-city-founding-scatter", "figure"),
-    Input("match-selector", "value"),
+    Input("match-cities-tab-store", "data"),
+    prevent_initial_call=True,
 )
-def update_city_founding_scatter(match_id: Optional[int]) -> go.Figure:
+def update_city_founding_scatter(match_key: Optional[Dict[str, int]]) -> go.Figure:
     """Update city founding scatter plot with jitter.
 
     Args:
-        match_id: Selected match ID
+        match_key: Match key from match-cities-tab-store
 
     Returns:
         Plotly figure with city founding scatter plot
     """
-    if not match_id:
+    match_data = _shared_match_data(match_key)
+    if not match_data:
         return create_empty_chart_placeholder(
             "Select a match to view city founding detail"
         )
 
     try:
-        queries = get_queries()
-        df = queries.get_city_founding_timeline(match_id)
+        df = match_data.frame("city_founding")
 
         if df.empty:
             return create_empty_chart_placeholder(
                 "No city founding data available for this match"
             )
 
-        # Get player colors based on their civilizations
-        player_colors = get_player_colors_for_match(match_id)
-
-        return create_city_founding_scatter_jitter_chart(df, player_colors)
+        return create_city_founding_scatter_jitter_chart(df, match_data.player_colors)
 
     except Exception as e:
         logger.error(f"Error loading city founding scatter: {e}")
@@ -3638,27 +3521,20 @@ def update_city_founding_scatter(match_id: Optional[int]) -> go.Figure:
 
 @callback(
     Output("match-pixi-map-iframe", "src"),
-    Input("match-details-tabs", "active_tab"),
-    Input("match-selector", "value"),
+    Input("match-map-tab-store", "data"),
     prevent_initial_call=True,
 )
-def update_pixi_map_iframe(
-    active_tab: Optional[str],
-    match_id: Optional[int],
-) -> str:
+def update_pixi_map_iframe(match_key: Optional[Dict[str, int]]) -> str:
     """Update Pixi.js map iframe src when Map tab is selected.
 
     Args:
-        active_tab: Currently active tab
-        match_id: Selected match ID
+        match_key: Match key from match-map-tab-store
 
     Returns:
         URL for the Pixi.js map viewer iframe
     """
+    match_id = _selected_match_id(match_key)
     # Only load when Map tab is active
-    if active_tab != "map":
-        raise dash.exceptions.PreventUpdate
-
     if not match_id:
         return ""
 
@@ -3668,37 +3544,27 @@ def update_pixi_map_iframe(
 
 @callback(
     Output("match-territory-timeline-chart", "figure"),
-    Input("match-details-tabs", "active_tab"),
-    Input("match-selector", "value"),
-    State("match-tabs-loaded-store", "data"),
+    Input("match-cities-tab-store", "data"),
     prevent_initial_call=True,
 )
-def update_match_territory_timeline_chart(
-    active_tab: Optional[str],
-    match_id: Optional[int],
-    loaded_state: Optional[Dict[str, Any]],
-):
+def update_match_territory_timeline_chart(match_key: Optional[Dict[str, int]]):
     """Update territory timeline chart.
 
     Args:
-        active_tab: Currently active tab
-        match_id: Selected match ID
+        match_key: Match key from match-cities-tab-store
 
     Returns:
         Plotly figure for territory timeline
     """
-    # Lazy loading: skip rendering if tab is not active
-    if active_tab != "cities":
-        raise dash.exceptions.PreventUpdate
-
+    match_data = _shared_match_data(match_key)
+    match_id = match_data.match_id if match_data else None
     if not match_id:
         return create_empty_chart_placeholder(
             "Select a match to view territory control"
         )
 
     try:
-        queries = get_queries()
-        df = queries.get_territory_control_summary(match_id)
+        df = match_data.frame("territory_control")
 
         if df.empty:
             return create_empty_chart_placeholder(
@@ -3706,7 +3572,7 @@ def update_match_territory_timeline_chart(
             )
 
         # Get player colors based on their civilizations
-        player_colors = get_player_colors_for_match(match_id)
+        player_colors = match_data.player_colors
 
         return create_territory_control_chart(df, player_colors)
 
@@ -3719,35 +3585,25 @@ def update_match_territory_timeline_chart(
 
 @callback(
     Output("match-territory-distribution-chart", "figure"),
-    Input("match-details-tabs", "active_tab"),
-    Input("match-selector", "value"),
-    State("match-tabs-loaded-store", "data"),
+    Input("match-cities-tab-store", "data"),
     prevent_initial_call=True,
 )
-def update_match_territory_distribution_chart(
-    active_tab: Optional[str],
-    match_id: Optional[int],
-    loaded_state: Optional[Dict[str, Any]],
-):
+def update_match_territory_distribution_chart(match_key: Optional[Dict[str, int]]):
     """Update territory distribution chart.
 
     Args:
-        active_tab: Currently active tab
-        match_id: Selected match ID
+        match_key: Match key from match-cities-tab-store
 
     Returns:
         Plotly figure for territory distribution
     """
-    # Lazy loading: skip rendering if tab is not active
-    if active_tab != "cities":
-        raise dash.exceptions.PreventUpdate
-
+    match_data = _shared_match_data(match_key)
+    match_id = match_data.match_id if match_data else None
     if not match_id:
         return create_empty_chart_placeholder("Select a match")
 
     try:
-        queries = get_queries()
-        df = queries.get_territory_control_summary(match_id)
+        df = match_data.frame("territory_control")
 
         if df.empty:
             return create_empty_chart_placeholder("No territory data available")
@@ -3757,7 +3613,7 @@ def update_match_territory_distribution_chart(
         final_data = df[(df["turn_number"] == final_turn) & (df["player_name"].notna())]
 
         # Get nation colors for players
-        player_colors = get_player_colors_for_match(match_id)
+        player_colors = match_data.player_colors
         colors = [
             player_colors.get(
                 name, Config.PRIMARY_COLORS[i % len(Config.PRIMARY_COLORS)]
@@ -3787,29 +3643,20 @@ def update_match_territory_distribution_chart(
 
 @callback(
     Output("match-improvements-section", "children"),
-    Input("match-details-tabs", "active_tab"),
-    Input("match-selector", "value"),
-    State("match-tabs-loaded-store", "data"),
+    Input("match-improvements-tab-store", "data"),
     prevent_initial_call=True,
 )
-def update_match_improvements_section(
-    active_tab: Optional[str],
-    match_id: Optional[int],
-    loaded_state: Optional[Dict[str, Any]],
-) -> html.Div:
+def update_match_improvements_section(match_key: Optional[Dict[str, int]]) -> html.Div:
     """Update improvements section showing improvement counts per player.
 
     Args:
-        active_tab: Currently active tab
-        match_id: Selected match ID
+        match_key: Match key from match-improvements-tab-store
 
     Returns:
         HTML div with butterfly chart comparing improvement counts
     """
-    # Lazy loading: skip rendering if tab is not active
-    if active_tab != "improvements":
-        raise dash.exceptions.PreventUpdate
-
+    match_data = _shared_match_data(match_key)
+    match_id = match_data.match_id if match_data else None
     if not match_id:
         return html.Div()
 
@@ -3818,7 +3665,7 @@ def update_match_improvements_section(
         df = queries.get_improvement_counts_by_player(match_id)
 
         # Get player colors for styling
-        player_colors = get_player_colors_for_match(match_id)
+        player_colors = match_data.player_colors
 
         # Create butterfly chart
         fig = create_improvement_butterfly_chart(df, player_colors)
@@ -3849,29 +3696,20 @@ def update_match_improvements_section(
 
 @callback(
     Output("match-specialists-section", "children"),
-    Input("match-details-tabs", "active_tab"),
-    Input("match-selector", "value"),
-    State("match-tabs-loaded-store", "data"),
+    Input("match-improvements-tab-store", "data"),
     prevent_initial_call=True,
 )
-def update_match_specialists_section(
-    active_tab: Optional[str],
-    match_id: Optional[int],
-    loaded_state: Optional[Dict[str, Any]],
-) -> html.Div:
+def update_match_specialists_section(match_key: Optional[Dict[str, int]]) -> html.Div:
     """Update specialists section showing specialist counts per player.
 
     Args:
-        active_tab: Currently active tab
-        match_id: Selected match ID
+        match_key: Match key from match-improvements-tab-store
 
     Returns:
         HTML div with butterfly chart comparing specialist counts
     """
-    # Lazy loading: skip rendering if tab is not active
-    if active_tab != "improvements":
-        raise dash.exceptions.PreventUpdate
-
+    match_data = _shared_match_data(match_key)
+    match_id = match_data.match_id if match_data else None
     if not match_id:
         return html.Div()
 
@@ -3880,7 +3718,7 @@ def update_match_specialists_section(
         df = queries.get_specialist_counts_by_player(match_id)
 
         # Get player colors for styling
-        player_colors = get_player_colors_for_match(match_id)
+        player_colors = match_data.player_colors
 
         # Create butterfly chart
         fig = create_specialist_butterfly_chart(df, player_colors)
@@ -3916,33 +3754,19 @@ def update_match_specialists_section(
 
 @callback(
     Output("match-military-power", "figure"),
-    Input("match-details-tabs", "active_tab"),
-    Input("match-selector", "value"),
-    State("match-tabs-loaded-store", "data"),
+    Input("match-military-tab-store", "data"),
     prevent_initial_call=True,
 )
-def update_military_power_chart(
-    active_tab: Optional[str],
-    match_id: Optional[int],
-    loaded_state: Optional[Dict[str, Any]],
-) -> go.Figure:
+def update_military_power_chart(match_key: Optional[Dict[str, int]]) -> go.Figure:
     """Update military power progression chart.
 
     Args:
-        active_tab: Currently active tab
-        match_id: Selected match ID
+        match_key: Match key from match-military-tab-store
 
     Returns:
         Plotly figure with military power line chart
     """
-    # Lazy loading: skip rendering if tab is not active
-    if active_tab != "military":
-        raise dash.exceptions.PreventUpdate
-    # Skip re-fetching if tab was already loaded for this match
-    if loaded_state and loaded_state.get("match_id") == match_id:
-        if "military" in loaded_state.get("loaded_tabs", []):
-            raise dash.exceptions.PreventUpdate
-
+    match_id = _selected_match_id(match_key)
     if not match_id:
         return create_empty_chart_placeholder("Select a match to view military power")
 
@@ -3972,37 +3796,22 @@ def update_military_power_chart(
         Output("match-units-portrait", "figure"),
         Output("match-units-marimekko", "figure"),
     ],
-    Input("match-details-tabs", "active_tab"),
-    Input("match-selector", "value"),
-    State("match-tabs-loaded-store", "data"),
+    Input("match-military-tab-store", "data"),
     prevent_initial_call=True,
 )
-def update_all_unit_charts(
-    active_tab: Optional[str],
-    match_id: Optional[int],
-    loaded_state: Optional[Dict[str, Any]],
-) -> List[go.Figure]:
+def update_all_unit_charts(match_key: Optional[Dict[str, int]]) -> List[go.Figure]:
     """Update all unit composition charts when a match is selected.
 
     Fetches unit data once and creates all 7 chart types.
 
     Args:
-        active_tab: Currently active tab
-        match_id: Selected match ID
-        loaded_state: Tab loading state from store
+        match_key: Match key from match-military-tab-store
 
     Returns:
         List of 7 Plotly figures for unit charts
     """
-    # Lazy loading: skip rendering if tab is not active
-    if active_tab != "military":
-        raise dash.exceptions.PreventUpdate
-
-    # Skip re-fetching if tab was already loaded for this match
-    if loaded_state and loaded_state.get("match_id") == match_id:
-        if "military" in loaded_state.get("loaded_tabs", []):
-            raise dash.exceptions.PreventUpdate
-
+    match_data = _shared_match_data(match_key)
+    match_id = match_data.match_id if match_data else None
     empty_placeholder = create_empty_chart_placeholder(
         "Select a match to view unit data"
     )
@@ -4011,8 +3820,7 @@ def update_all_unit_charts(
         return [empty_placeholder] * 7
 
     try:
-        queries = get_queries()
-        df = queries.get_match_units_produced(match_id)
+        df = match_data.frame("units_produced")
 
         if df.empty:
             no_data = create_empty_chart_placeholder(
@@ -4021,7 +3829,7 @@ def update_all_unit_charts(
             return [no_data] * 7
 
         # Get player colors for nation-based coloring
-        player_colors = get_player_colors_for_match(match_id)
+        player_colors = match_data.player_colors
 
         # Create all 7 charts from the same DataFrame
         return [
@@ -4042,23 +3850,24 @@ def update_all_unit_charts(
 
 @callback(
     Output("match-units-list-content", "children"),
-    Input("match-selector", "value"),
+    Input("match-military-tab-store", "data"),
+    prevent_initial_call=True,
 )
-def update_units_list(match_id: Optional[int]) -> html.Div:
+def update_units_list(match_key: Optional[Dict[str, int]]) -> html.Div:
     """Update unit listing by player, split into Military and Non-Military.
 
     Args:
-        match_id: Selected match ID
+        match_key: Match key from match-military-tab-store
 
     Returns:
         HTML content with player boxes containing unit lists
     """
-    if not match_id:
+    match_data = _shared_match_data(match_key)
+    if not match_data:
         return html.Div("Select a match to view unit details", className="text-muted")
 
     try:
-        queries = get_queries()
-        df = queries.get_match_units_produced(match_id)
+        df = match_data.frame("units_produced")
 
         if df.empty:
             return html.Div("No unit data available", className="text-muted")
@@ -4188,23 +3997,27 @@ def update_units_list(match_id: Optional[int]) -> html.Div:
         Output("match-tech-tree-turn-slider", "max"),
         Output("match-tech-tree-turn-slider", "value"),
         Output("match-tech-tree-turn-slider", "marks"),
+        Output("match-tech-tree-store", "data"),
     ],
-    Input("match-selector", "value"),
+    Input("match-technology-tab-store", "data"),
+    prevent_initial_call=True,
 )
-def update_tech_tree_controls(match_id: Optional[int]):
+def update_tech_tree_controls(match_key: Optional[Dict[str, int]]):
     """Initialize tech trees and configure turn slider for selected match.
 
     Args:
-        match_id: Selected match ID
+        match_key: Match key from match-technology-tab-store
 
     Returns:
         Tuple of (player1_elements, player2_elements, player1_header,
-                  player2_header, slider_max, slider_value, slider_marks)
+                  player2_header, slider_max, slider_value, slider_marks,
+                  tech_tree_data)
     """
+    match_data = _shared_match_data(match_key)
     empty_elements: List[Dict[str, Any]] = []
     default_marks = {i: str(i) for i in range(0, 101, 25)}
 
-    if not match_id:
+    if not match_data:
         return (
             empty_elements,
             empty_elements,
@@ -4213,13 +4026,11 @@ def update_tech_tree_controls(match_id: Optional[int]):
             100,
             100,
             default_marks,
+            None,
         )
 
     try:
-        queries = get_queries()
-
-        # Get tech timeline for this match
-        tech_df = queries.get_tech_timeline(match_id)
+        tech_df = match_data.frame("tech_timeline")
 
         if tech_df.empty:
             return (
@@ -4230,6 +4041,7 @@ def update_tech_tree_controls(match_id: Optional[int]):
                 100,
                 100,
                 default_marks,
+                None,
             )
 
         # Get player info
@@ -4249,13 +4061,22 @@ def update_tech_tree_controls(match_id: Optional[int]):
         max_turn = int(tech_df["turn_number"].max())
         min_turn = int(tech_df["turn_number"].min())
 
-        # Get techs at final turn for initial view
-        player1_techs = get_techs_at_turn(tech_df, player1_id, max_turn)
-        player2_techs = (
-            get_techs_at_turn(tech_df, player2_id, max_turn) if player2_id else set()
+        # Discovery turns drive the client-side restyling on slider changes
+        player1_turns = get_tech_discovery_turns(tech_df, player1_id)
+        player2_turns = (
+            get_tech_discovery_turns(tech_df, player2_id) if player2_id else {}
         )
+        tech_tree_data = {
+            "players": [
+                {"name": player1_name, "turns": player1_turns},
+                {"name": player2_name, "turns": player2_turns},
+            ],
+            "total_techs": len(TECHS),
+        }
 
-        # Build elements
+        # Initial view shows every tech discovered by the final turn
+        player1_techs = set(player1_turns)
+        player2_techs = set(player2_turns)
         player1_elements = build_cytoscape_elements(player1_techs)
         player2_elements = build_cytoscape_elements(player2_techs)
 
@@ -4278,6 +4099,7 @@ def update_tech_tree_controls(match_id: Optional[int]):
             max_turn,
             max_turn,
             marks,
+            tech_tree_data,
         )
 
     except Exception as e:
@@ -4290,81 +4112,54 @@ def update_tech_tree_controls(match_id: Optional[int]):
             100,
             100,
             default_marks,
+            None,
         )
 
 
-@callback(
+# Restyle both tech trees for the slider turn in the browser. Node positions
+# never change, so only the researched/locked classes and the header counts
+# are recomputed from the discovery turns in match-tech-tree-store.
+dash.clientside_callback(
+    """
+    function(turn, treeData, elements1, elements2) {
+        const noUpdate = window.dash_clientside.no_update;
+        if (!treeData || turn === null || turn === undefined) {
+            return [noUpdate, noUpdate, noUpdate, noUpdate];
+        }
+        const known = (turns, id) => turns[id] !== undefined && turns[id] <= turn;
+        const restyle = (elements, turns) => (elements || []).map((el) => {
+            if (el.data.source === undefined) {
+                const cls = known(turns, el.data.id) ? "researched" : "locked";
+                return {...el, classes: cls};
+            }
+            const both = known(turns, el.data.source) && known(turns, el.data.target);
+            return {...el, classes: both ? "edge-researched" : "edge-locked"};
+        });
+        const header = (player) => {
+            const count = Object.values(player.turns).filter((t) => t <= turn).length;
+            return `${player.name} (${count}/${treeData.total_techs} techs)`;
+        };
+        const [player1, player2] = treeData.players;
+        return [
+            restyle(elements1, player1.turns),
+            restyle(elements2, player2.turns),
+            header(player1),
+            header(player2),
+        ];
+    }
+    """,
     [
         Output("match-tech-tree-player1", "elements", allow_duplicate=True),
         Output("match-tech-tree-player2", "elements", allow_duplicate=True),
         Output("match-tech-tree-player1-header", "children", allow_duplicate=True),
         Output("match-tech-tree-player2-header", "children", allow_duplicate=True),
     ],
-    [
-        Input("match-selector", "value"),
-        Input("match-tech-tree-turn-slider", "value"),
-    ],
+    Input("match-tech-tree-turn-slider", "value"),
+    State("match-tech-tree-store", "data"),
+    State("match-tech-tree-player1", "elements"),
+    State("match-tech-tree-player2", "elements"),
     prevent_initial_call=True,
 )
-def update_tech_trees_for_turn(
-    match_id: Optional[int],
-    turn_number: int,
-) -> tuple:
-    """Update tech trees when turn slider changes.
-
-    Args:
-        match_id: Selected match ID
-        turn_number: Turn number from slider
-
-    Returns:
-        Tuple of (player1_elements, player2_elements, player1_header, player2_header)
-    """
-    empty_elements: List[Dict[str, Any]] = []
-
-    if not match_id or turn_number is None:
-        return empty_elements, empty_elements, "Player 1", "Player 2"
-
-    try:
-        queries = get_queries()
-
-        # Get tech timeline for this match
-        tech_df = queries.get_tech_timeline(match_id)
-
-        if tech_df.empty:
-            return empty_elements, empty_elements, "No data", "No data"
-
-        # Get player info
-        players = (
-            tech_df[["player_id", "player_name"]].drop_duplicates().values.tolist()
-        )
-        if len(players) < 2:
-            players.append((None, "Player 2"))
-
-        player1_id, player1_name = players[0]
-        player2_id, player2_name = (
-            players[1] if len(players) > 1 else (None, "Player 2")
-        )
-
-        # Get techs at specified turn
-        player1_techs = get_techs_at_turn(tech_df, player1_id, turn_number)
-        player2_techs = (
-            get_techs_at_turn(tech_df, player2_id, turn_number) if player2_id else set()
-        )
-
-        # Build elements
-        player1_elements = build_cytoscape_elements(player1_techs)
-        player2_elements = build_cytoscape_elements(player2_techs)
-
-        # Build headers with tech counts
-        total_techs = len(TECHS)
-        player1_header = f"{player1_name} ({len(player1_techs)}/{total_techs} techs)"
-        player2_header = f"{player2_name} ({len(player2_techs)}/{total_techs} techs)"
-
-        return player1_elements, player2_elements, player1_header, player2_header
-
-    except Exception as e:
-        logger.error(f"Error updating tech trees for turn: {e}")
-        return empty_elements, empty_elements, "Error", "Error"
 
 
 # =============================================================================
@@ -4374,29 +4169,23 @@ def update_tech_trees_for_turn(
 
 @callback(
     Output("match-overview-content", "children"),
-    Input("match-details-tabs", "active_tab"),
-    Input("match-selector", "value"),
+    Input("match-overview-tab-store", "data"),
     State("match-url", "search"),
 )
 def update_overview_beta(
-    active_tab: Optional[str],
-    match_id: Optional[int],
+    match_key: Optional[Dict[str, int]],
     url_search: Optional[str] = None,
 ) -> html.Div:
     """Update the Overview (Beta) Match Card content.
 
     Args:
-        active_tab: Currently active tab ID
-        match_id: Selected match ID
+        match_key: Match key from match-overview-tab-store
         url_search: URL query string (e.g., "?beta=true")
 
     Returns:
         Match Card layout component
     """
-    # Lazy loading - only update when Overview (Beta) tab is active
-    if active_tab != "overview":
-        raise dash.exceptions.PreventUpdate
-
+    match_id = _selected_match_id(match_key)
     if not match_id:
         return create_empty_state(
             title="Select a Match",
@@ -56,6 +56,7 @@ from tournament_visualizer.components.charts import (
     create_tournament_production_strategies_chart,
     create_unit_popularity_sunburst_chart,
 )
+from tournament_visualizer.components.figure_cache import cached_figures
 from tournament_visualizer.components.layouts import (
     create_chart_card,
     create_data_table_card,
@@ -65,6 +66,7 @@ from tournament_visualizer.components.layouts import (
 )
 from tournament_visualizer.config import MODEBAR_CONFIG, PAGE_CONFIG
 from tournament_visualizer.data.queries import get_queries
+from tournament_visualizer.data.table_paging import page_count
 
 logger = logging.getLogger(__name__)
 
@@ -401,6 +403,7 @@ layout = html.Div(
                                         create_data_table_card(
                                             title="Matches",
                                             table_id="overview-matches-table",
+                                            server_side=True,
                                             columns=[
                                                 {
                                                     "name": "Match",
@@ -1361,6 +1364,7 @@ def update_overview_metrics(pathname: str) -> html.Div:
     Input("overview-result-dropdown", "value"),
     prevent_initial_call=True,
 )
+@cached_figures("overview.update_nations_tab_charts")
 def update_nations_tab_charts(
     active_tab: Optional[str],
     round_num: Optional[list[int]],
@@ -1492,6 +1496,7 @@ def update_nations_tab_charts(
     Input("overview-players-dropdown", "value"),
     Input("overview-result-dropdown", "value"),
 )
+@cached_figures("overview.update_family_tab_charts")
 def update_family_tab_charts(
     active_tab: Optional[str],
     round_num: Optional[list[int]],
@@ -1698,6 +1703,7 @@ def update_family_tab_charts(
     Input("overview-players-dropdown", "value"),
     Input("overview-result-dropdown", "value"),
 )
+@cached_figures("overview.update_units_chart")
 def update_units_chart(
     round_num: Optional[list[int]],
     turn_length: Optional[int],
@@ -1760,6 +1766,7 @@ def update_units_chart(
     Input("overview-players-dropdown", "value"),
     Input("overview-result-dropdown", "value"),
 )
+@cached_figures("overview.update_map_chart")
 def update_map_chart(
     round_num: Optional[list[int]],
     turn_length: Optional[int],
@@ -1811,8 +1818,27 @@ def update_map_chart(
         return create_empty_chart_placeholder(f"Error loading map data: {str(e)}")
 
 
+@callback(
+    Output("overview-matches-table", "page_current"),
+    Input("overview-round-filter-dropdown", "value"),
+    Input("overview-turn-length-slider", "value"),
+    Input("overview-map-size-dropdown", "value"),
+    Input("overview-map-class-dropdown", "value"),
+    Input("overview-map-aspect-dropdown", "value"),
+    Input("overview-nations-dropdown", "value"),
+    Input("overview-players-dropdown", "value"),
+    Input("overview-result-dropdown", "value"),
+    Input("overview-matches-table", "filter_query"),
+    prevent_initial_call=True,
+)
+def reset_matches_table_page(*_filters: Any) -> int:
+    """Return to the first page of the matches table when filters change."""
+    return 0
+
+
 @callback(
     Output("overview-matches-table", "data"),
+    Output("overview-matches-table", "page_count"),
     Input("overview-round-filter-dropdown", "value"),
     Input("overview-turn-length-slider", "value"),
     Input("overview-map-size-dropdown", "value"),
@@ -1821,7 +1847,12 @@ def update_map_chart(
     Input("overview-nations-dropdown", "value"),
     Input("overview-players-dropdown", "value"),
     Input("overview-result-dropdown", "value"),
+    Input("overview-matches-table", "page_current"),
+    Input("overview-matches-table", "page_size"),
+    Input("overview-matches-table", "sort_by"),
+    Input("overview-matches-table", "filter_query"),
 )
+@cached_figures("overview.update_matches_table")
 def update_matches_table(
     round_num: Optional[list[int]],
     turn_length: Optional[int],
@@ -1831,8 +1862,15 @@ def update_matches_table(
     nations: Optional[List[str]],
     players: Optional[List[str]],
     result_filter: Optional[str],
-) -> List[Dict[str, Any]]:
-    """Update the matches table based on filters.
+    page_current: Optional[int],
+    page_size: int,
+    sort_by: Optional[List[Dict[str, str]]],
+    filter_query: Optional[str],
+) -> tuple:
+    """Update the current page of the matches table based on filters.
+
+    Sorting, table filtering and paging run in the database, so only one
+    page of rows is sent to the browser.
 
     Args:
         round_num: Selected round number
@@ -1843,9 +1881,13 @@ def update_matches_table(
         nations: List of selected nations
         players: List of selected players
         result_filter: Filter by match result (winners/losers/all)
+        page_current: Zero-based page index of the table
+        page_size: Rows per page
+        sort_by: Table sort columns
+        filter_query: Table column filters
 
     Returns:
-        List of dictionaries for table data
+        Tuple of (rows for the current page, page count)
     """
     from tournament_visualizer.components.layouts import format_round_display
 
@@ -1855,10 +1897,13 @@ def update_matches_table(
         # Parse turn length filter
         min_turns, max_turns = parse_turn_length(turn_length)
 
-        # Get filtered matches
-        df = queries.get_matches_by_round(
+        # Get the requested page of filtered matches
+        df, total = queries.get_matches_page(
+            page_current,
+            page_size,
+            sort_by=sort_by,
+            filter_query=filter_query,
             tournament_round=round_num,
-            bracket=None,
             min_turns=min_turns,
             max_turns=max_turns,
             map_size=map_size,
@@ -1870,7 +1915,7 @@ def update_matches_table(
         )
 
         if df.empty:
-            return []
+            return [], page_count(total, page_size)
 
         # Format data for table
         table_data = []
@@ -1893,11 +1938,11 @@ def update_matches_table(
                 }
             )
 
-        return table_data
+        return table_data, page_count(total, page_size)
 
     except Exception as e:
         logger.error(f"Error updating matches table: {e}")
-        return []
+        return [], 1
 
 
 @callback(
@@ -1982,6 +2027,7 @@ def check_data_status(pathname: str) -> html.Div:
     Input("overview-result-dropdown", "value"),
     prevent_initial_call=True,
 )
+@cached_figures("overview.update_law_distribution")
 def update_law_distribution(
     active_tab: Optional[str],
     round_num: Optional[list[int]],
@@ -2055,6 +2101,7 @@ def update_law_distribution(
     Input("overview-result-dropdown", "value"),
     prevent_initial_call=True,
 )
+@cached_figures("overview.update_law_efficiency")
 def update_law_efficiency(
     active_tab: Optional[str],
     round_num: Optional[list[int]],
@@ -2126,6 +2173,7 @@ def update_law_efficiency(
     Input("overview-players-dropdown", "value"),
     Input("overview-result-dropdown", "value"),
 )
+@cached_figures("overview.update_event_timeline")
 def update_event_timeline(
     round_num: Optional[list[int]],
     turn_length: Optional[int],
@@ -2194,6 +2242,7 @@ def update_event_timeline(
     Input("overview-result-dropdown", "value"),
     prevent_initial_call=True,
 )
+@cached_figures("overview.update_ruler_archetype_chart")
 def update_ruler_archetype_chart(
     active_tab: Optional[str],
     round_num: Optional[list[int]],
@@ -2265,6 +2314,7 @@ def update_ruler_archetype_chart(
     Input("overview-result-dropdown", "value"),
     prevent_initial_call=True,
 )
+@cached_figures("overview.update_ruler_trait_performance_chart")
 def update_ruler_trait_performance_chart(
     active_tab: Optional[str],
     round_num: Optional[list[int]],
@@ -2338,6 +2388,7 @@ def update_ruler_trait_performance_chart(
     Input("overview-result-dropdown", "value"),
     prevent_initial_call=True,
 )
+@cached_figures("overview.update_ruler_matchup_matrix_chart")
 def update_ruler_matchup_matrix_chart(
     active_tab: Optional[str],
     round_num: Optional[list[int]],
@@ -2410,6 +2461,7 @@ def update_ruler_matchup_matrix_chart(
     Input("overview-result-dropdown", "value"),
     prevent_initial_call=True,
 )
+@cached_figures("overview.update_ruler_combinations_chart")
 def update_ruler_combinations_chart(
     active_tab: Optional[str],
     round_num: Optional[list[int]],
@@ -2483,6 +2535,7 @@ def update_ruler_combinations_chart(
     Input("overview-reign-exclude-entire-toggle", "value"),
     prevent_initial_call=True,
 )
+@cached_figures("overview.update_ruler_reign_duration_chart")
 def update_ruler_reign_duration_chart(
     active_tab: Optional[str],
     round_num: Optional[list[int]],
@@ -2564,6 +2617,7 @@ def update_ruler_reign_duration_chart(
     Input("overview-succession-exclude-zero-toggle", "value"),
     prevent_initial_call=True,
 )
+@cached_figures("overview.update_ruler_succession_rate_chart")
 def update_ruler_succession_rate_chart(
     active_tab: Optional[str],
     round_num: Optional[list[int]],
@@ -2627,6 +2681,7 @@ def update_ruler_succession_rate_chart(
     Input("overview-players-dropdown", "value"),
     prevent_initial_call=True,
 )
+@cached_figures("overview.update_ruler_survival_chart")
 def update_ruler_survival_chart(
     active_tab: Optional[str],
     round_num: Optional[list[int]],
@@ -2762,6 +2817,7 @@ for yield_type, display_name, rate_color, cumulative_color in YIELD_CHARTS:
     Input("overview-science-scale-toggle", "value"),
     prevent_initial_call=True,
 )
+@cached_figures("overview.update_science_chart")
 def update_science_chart(
     active_tab: Optional[str],
     round_num: Optional[list[int]],
@@ -2827,6 +2883,7 @@ def update_science_chart(
     Input("overview-result-dropdown", "value"),
     prevent_initial_call=True,
 )
+@cached_figures("overview.update_military_progression")
 def update_military_progression(
     active_tab: Optional[str],
     round_num: Optional[list[int]],
@@ -2898,6 +2955,7 @@ def update_military_progression(
     Input("overview-result-dropdown", "value"),
     prevent_initial_call=True,
 )
+@cached_figures("overview.update_legitimacy_progression")
 def update_legitimacy_progression(
     active_tab: Optional[str],
     round_num: Optional[list[int]],
@@ -2972,6 +3030,7 @@ def update_legitimacy_progression(
     Input("overview-result-dropdown", "value"),
     prevent_initial_call=True,
 )
+@cached_figures("overview.update_expansion_timeline_chart")
 def update_expansion_timeline_chart(
     active_tab: Optional[str],
     round_num: Optional[list[int]],
@@ -3043,6 +3102,7 @@ def update_expansion_timeline_chart(
     Input("overview-result-dropdown", "value"),
     prevent_initial_call=True,
 )
+@cached_figures("overview.update_production_strategies_chart")
 def update_production_strategies_chart(
     active_tab: Optional[str],
     round_num: Optional[list[int]],
@@ -3112,6 +3172,7 @@ def update_production_strategies_chart(
     Input("overview-players-dropdown", "value"),
     Input("overview-result-dropdown", "value"),
 )
+@cached_figures("overview.update_science_correlation_chart")
 def update_science_correlation_chart(
     round_num: Optional[list[int]],
     turn_length: Optional[int],
@@ -3182,6 +3243,7 @@ def update_science_correlation_chart(
     Input("overview-result-dropdown", "value"),
     prevent_initial_call=True,
 )
+@cached_figures("overview.update_tech_popularity")
 def update_tech_popularity(
     active_tab: Optional[str],
     round_num: Optional[list[int]],
@@ -3237,6 +3299,7 @@ def update_tech_popularity(
     Input("overview-result-dropdown", "value"),
     prevent_initial_call=True,
 )
+@cached_figures("overview.update_tech_timing_heatmap")
 def update_tech_timing_heatmap(
     active_tab: Optional[str],
     round_num: Optional[list[int]],
@@ -3291,6 +3354,7 @@ def update_tech_timing_heatmap(
     Input("overview-players-dropdown", "value"),
     prevent_initial_call=True,
 )
+@cached_figures("overview.update_tech_winner_loser")
 def update_tech_winner_loser(
     active_tab: Optional[str],
     round_num: Optional[list[int]],
@@ -3344,6 +3408,7 @@ def update_tech_winner_loser(
     Input("overview-result-dropdown", "value"),
     prevent_initial_call=True,
 )
+@cached_figures("overview.update_tech_timing_distribution")
 def update_tech_timing_distribution(
     active_tab: Optional[str],
     round_num: Optional[list[int]],
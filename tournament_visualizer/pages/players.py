@@ -5,7 +5,7 @@ and performance comparisons.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Dict, List, Optional
 
 import dash
 import dash_bootstrap_components as dbc
@@ -24,6 +24,7 @@ from tournament_visualizer.components.layouts import (
 )
 from tournament_visualizer.config import PAGE_CONFIG
 from tournament_visualizer.data.queries import get_queries
+from tournament_visualizer.data.table_paging import page_count, page_dataframe
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +57,7 @@ layout = html.Div(
                                         create_data_table_card(
                                             title=None,
                                             table_id="skill-rankings-table",
+                                            server_side=True,
                                             columns=[
                                                 {
                                                     "name": "Rank",
@@ -378,25 +380,53 @@ def _format_civilizations_display(civs_played: str, favorite: str) -> str:
 
 
 # Skill Ratings tab callbacks
+@callback(
+    Output("skill-rankings-table", "page_current"),
+    Input("skill-rankings-table", "filter_query"),
+    prevent_initial_call=True,
+)
+def reset_skill_rankings_page(filter_query: str) -> int:
+    """Return to the first page of the skill rankings when filters change."""
+    return 0
+
+
 @callback(
     Output("skill-rankings-table", "data"),
+    Output("skill-rankings-table", "page_count"),
     Input("_pages_location", "pathname"),
+    Input("skill-rankings-table", "page_current"),
+    Input("skill-rankings-table", "page_size"),
+    Input("skill-rankings-table", "sort_by"),
+    Input("skill-rankings-table", "filter_query"),
 )
-def update_skill_rankings_table(pathname: str) -> List[Dict[str, Any]]:
-    """Update skill rankings table.
+def update_skill_rankings_table(
+    pathname: str,
+    page_current: Optional[int],
+    page_size: int,
+    sort_by: Optional[List[Dict[str, str]]],
+    filter_query: Optional[str],
+) -> tuple:
+    """Update the current page of the skill rankings table.
+
+    Ratings are computed in Python, so sorting, filtering and paging are
+    applied to the (cached) ratings before sending one page to the browser.
 
     Args:
         pathname: Current page path (triggers on page load)
+        page_current: Zero-based page index of the table
+        page_size: Rows per page
+        sort_by: Table sort columns
+        filter_query: Table column filters
 
     Returns:
-        List of skill ranking data with civilizations
+        Tuple of (skill ranking rows with civilizations, page count)
     """
     try:
         queries = get_queries()
         df = queries.get_player_skill_ratings()
 
         if df.empty:
-            return []
+            return [], 1
 
         # Get civilization data from player performance
         perf_df = queries.get_player_performance()
@@ -423,11 +453,12 @@ def update_skill_rankings_table(pathname: str) -> List[Dict[str, Any]]:
         # Use player name directly for display
         df["player_display"] = df["player_name"]
 
-        return df.to_dict("records")
+        page, total = page_dataframe(df, page_current, page_size, sort_by, filter_query)
+        return page.to_dict("records"), page_count(total, page_size)
 
     except Exception as e:
         logger.error(f"Error updating skill rankings table: {e}")
-        return []
+        return [], 1
 
 
 @callback(
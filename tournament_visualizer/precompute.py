@@ -0,0 +1,80 @@
+"""Precomputed dashboard results for the default filter state.
+
+Nearly every visitor lands on the overview page with default filters, which
+fires dozens of chart callbacks that recompute the same figures. After an
+import, build_overview_artifact() runs those callbacks once and stores their
+serialized outputs in the precomputed_figures table. At startup the server
+calls pin_overview_artifact(), so the landing page is served from memory and
+only non-default filter states are computed live.
+
+The stored data fingerprint ties the results to the data they were built
+from; they are ignored once any table changes.
+"""
+
+import logging
+from typing import Optional
+
+import dash
+
+from .components.figure_cache import pin_precomputed_figures, precompute_default_figures
+from .config import Config
+from .data.database import TournamentDatabase, get_database
+
+logger = logging.getLogger(__name__)
+
+OVERVIEW_CACHE_PREFIX = "overview."
+
+
+def build_overview_artifact() -> int:
+    """Precompute the default overview page and store it in the database.
+
+    Runs against the global database (Config.DATABASE_PATH), which must not be
+    open for writing elsewhere.
+
+    Returns:
+        Number of stored callback results
+    """
+    # Importing the app registers the pages and their callbacks
+    try:
+        from .app import app  # noqa: F401
+    except SystemExit as e:
+        raise RuntimeError("Dash app failed to initialize (see log)") from e
+    from .data_refresh import switch_database
+
+    reader = get_database()
+    # Importing the app opened the published snapshot, if there is one
+    if reader.db_path != Config.DATABASE_PATH:
+        if not switch_database(Config.DATABASE_PATH):
+            raise RuntimeError(f"Cannot open {Config.DATABASE_PATH}")
+    # Dash registered the page as "pages.overview"; importing it again under
+    # the package name would register the page and its callbacks twice
+    layout = dash.page_registry["pages.overview"]["layout"]
+    entries = precompute_default_figures(layout, OVERVIEW_CACHE_PREFIX)
+    fingerprint = reader.get_data_fingerprint()
+
+    # DuckDB cannot hold read-only and read-write handles to one file at once
+    reader.close()
+    writer = TournamentDatabase(db_path=reader.db_path, read_only=False)
+    try:
+        writer.replace_precomputed_figures(entries, fingerprint)
+    finally:
+        writer.close()
+
+    logger.info(f"Stored {len(entries)} precomputed overview results")
+    return len(entries)
+
+
+def pin_overview_artifact(db: Optional[TournamentDatabase] = None) -> int:
+    """Load precomputed overview results into the figure cache.
+
+    Args:
+        db: Database to read from (defaults to the global instance)
+
+    Returns:
+        Number of pinned results (0 if none exist or they are stale)
+    """
+    entries = (db or get_database()).get_precomputed_figures()
+    pinned = pin_precomputed_figures(entries)
+    if pinned:
+        logger.info(f"Pinned {pinned} precomputed overview results")
+    return pinned
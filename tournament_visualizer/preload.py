@@ -0,0 +1,87 @@
+"""Warm state shared by gunicorn workers when the app is preloaded.
+
+With GUNICORN_PRELOAD=1 the gunicorn arbiter imports the app once and forks
+the workers from it, instead of every worker importing it on its own (again
+after each max_requests recycle). Anything built in the arbiter before the
+fork is shared between the workers copy-on-write:
+
+- module-level lookups (game constants, nation colors) and the app layout,
+  built by the import itself
+- lazily cached lookups: the tech tree layout, player name aliases and the
+  static asset manifest
+- optionally, the default overview results, pinned in the figure cache
+
+The shared DuckDB connection is not fork-safe, so the arbiter closes it before
+forking and each worker opens its own on first use. See gunicorn.conf.py for
+the hooks that call these functions.
+"""
+
+import gc
+import logging
+from typing import Dict
+
+import dash
+
+from .components.figure_cache import pin_precomputed_figures, precompute_default_figures
+from .components.tech_tree import get_tech_tree_layout
+from .data.database import get_database
+from .data.queries import load_player_name_aliases
+from .data.tournaments import close_tournament_databases
+from .data.tournaments import reset_after_fork as reset_tournaments_after_fork
+from .precompute import OVERVIEW_CACHE_PREFIX, pin_overview_artifact
+from .static_assets import load_manifest
+
+logger = logging.getLogger(__name__)
+
+
+def warm_shared_state(warm_overview: bool = False) -> Dict[str, int]:
+    """Build the lookups shared by all workers. Call in the arbiter.
+
+    Args:
+        warm_overview: Also pin the default overview results. Uses the stored
+            artifact if it is current, otherwise computes them live.
+
+    Returns:
+        Sizes of the warmed lookups, for logging
+    """
+    nodes, edges = get_tech_tree_layout()
+    stats = {
+        "tech_tree_nodes": len(nodes),
+        "tech_tree_edges": len(edges),
+        "player_name_aliases": len(load_player_name_aliases()),
+        "static_assets": len(load_manifest()["files"]),
+        "overview_results": 0,
+    }
+
+    if warm_overview:
+        try:
+            stats["overview_results"] = pin_overview_artifact()
+            if not stats["overview_results"]:
+                # Dash registered the page as "pages.overview"; importing it
+                # again under the package name would register it twice
+                layout = dash.page_registry["pages.overview"]["layout"]
+                entries = precompute_default_figures(layout, OVERVIEW_CACHE_PREFIX)
+                stats["overview_results"] = pin_precomputed_figures(entries)
+        except Exception as e:
+            logger.warning(f"Overview results not warmed before fork: {e}")
+
+    release_before_fork()
+
+    # Move everything allocated so far out of the collector's reach. Collection
+    # passes write to object headers, which would copy the shared pages into
+    # every worker.
+    gc.collect()
+    gc.freeze()
+    return stats
+
+
+def release_before_fork() -> None:
+    """Close the arbiter's database connections so no worker inherits them."""
+    get_database().close()
+    close_tournament_databases()
+
+
+def reset_after_fork() -> None:
+    """Reset per-process state in a freshly forked worker."""
+    get_database().reset_after_fork()
+    reset_tournaments_after_fork()
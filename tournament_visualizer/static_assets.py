@@ -0,0 +1,459 @@
+"""Fingerprinted, precompressed icons and sprites.
+
+The icon and sprite trees under assets/ hold ~530 PNGs. Dash serves them one
+request each with no cache lifetime, so every page view revalidates every
+icon it shows. build_assets() (run by scripts/build_assets.py at image build
+time) writes a static build next to the package:
+
+- every icon and sprite, copied as name.<hash>.png
+- a PIXI spritesheet atlas per map sprite group (terrains, heights,
+  improvements, resources, specialists, crests), so the map viewer loads one
+  texture per group instead of one per sprite
+- an icon atlas per icons/ folder with every icon scaled into a 72 px cell,
+  so a match page loads a handful of images instead of dozens (the wonder
+  icons alone are 30 MB at full size)
+- .gz (and .br, if brotli is installed) copies of the atlas JSON; PNG data
+  is already deflated, so the images are stored as they are
+- manifest.json mapping original asset paths to their build outputs
+
+Build outputs are served from /static-assets/ with a one year immutable
+Cache-Control, so repeat visits make no asset requests at all. A changed file
+gets a new hash and therefore a new URL. Without a build, asset_url() and
+asset_icon() fall back to the plain /assets/ paths.
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import logging
+import math
+import mimetypes
+import os
+import shutil
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from dash import html
+from flask import Flask, Response, abort, request, send_file
+from PIL import Image
+from werkzeug.security import safe_join
+
+from .compression import choose_encoding
+from .config import Config
+
+try:  # Optional: brotli precompressed copies for clients that accept br
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+ASSET_URL_PREFIX = "/assets/"
+BUILD_URL_PREFIX = "/static-assets/"
+MANIFEST_NAME = "manifest.json"
+
+# Map sprite folders packed into PIXI spritesheets (relative to assets/)
+SPRITE_ATLAS_GROUPS = (
+    "sprites/terrains/masked",
+    "sprites/heights/masked",
+    "sprites/improvements",
+    "sprites/resources",
+    "sprites/specialists",
+    "sprites/crests",
+)
+# Each folder under icons/ becomes one grid atlas of square cells. Icons are
+# shown at 14-36 px, so 72 px cells stay sharp on 2x displays.
+ICON_ATLAS_ROOT = "icons"
+ICON_CELL_SIZE = 72
+ATLAS_MAX_WIDTH = 2048
+ATLAS_PADDING = 2  # Transparent pixels between sprites to stop filtering bleed
+FINGERPRINTED_DIRS = ("icons", "sprites")
+PRECOMPRESSED_SUFFIXES = (".json", ".css", ".js", ".svg")
+
+CACHE_MAX_AGE = 365 * 24 * 3600  # seconds
+
+
+def _fingerprint(data: bytes) -> str:
+    """Short content hash used in build file names."""
+    return hashlib.sha256(data).hexdigest()[:8]
+
+
+def _fingerprinted_name(rel_path: str, data: bytes) -> str:
+    """Insert the content hash before the extension: a/b.png -> a/b.1f2e3d4c.png"""
+    stem, ext = os.path.splitext(rel_path)
+    return f"{stem}.{_fingerprint(data)}{ext}"
+
+
+def _png_bytes(image: Image.Image) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG", optimize=True)
+    return buffer.getvalue()
+
+
+def _write_output(output_dir: Path, rel_path: str, data: bytes) -> str:
+    """Write a fingerprinted build file (and precompressed copies).
+
+    Args:
+        output_dir: Build directory
+        rel_path: Path relative to the build directory, without the hash
+        data: File contents
+
+    Returns:
+        Fingerprinted path relative to the build directory
+    """
+    name = _fingerprinted_name(rel_path, data)
+    target = output_dir / name
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_bytes(data)
+
+    if name.endswith(PRECOMPRESSED_SUFFIXES):
+        target.with_name(target.name + ".gz").write_bytes(
+            gzip.compress(data, compresslevel=9, mtime=0)
+        )
+        if brotli is not None:
+            target.with_name(target.name + ".br").write_bytes(
+                brotli.compress(data, quality=11)
+            )
+    return name
+
+
+def pack_shelves(
+    sizes: List[Tuple[int, int]],
+    max_width: int = ATLAS_MAX_WIDTH,
+    padding: int = ATLAS_PADDING,
+) -> Tuple[List[Tuple[int, int]], int, int]:
+    """Place rectangles on horizontal shelves, tallest first.
+
+    Args:
+        sizes: (width, height) of each rectangle
+        max_width: Widest the atlas may get
+        padding: Gap around each rectangle
+
+    Returns:
+        (positions in input order, atlas width, atlas height)
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    positions: List[Tuple[int, int]] = [(0, 0)] * len(sizes)
+    x = y = shelf_height = width = 0
+    for i in order:
+        w, h = sizes[i]
+        if x and x + w + padding > max_width:
+            y += shelf_height + padding
+            x = shelf_height = 0
+        positions[i] = (x, y)
+        x += w + padding
+        shelf_height = max(shelf_height, h)
+        width = max(width, x - padding)
+    return positions, width, y + shelf_height
+
+
+def build_sprite_atlas(files: List[Path]) -> Tuple[Image.Image, Dict[str, Any]]:
+    """Pack sprites into one image with PIXI spritesheet (JSON hash) frames.
+
+    Args:
+        files: Sprite PNGs; each frame is named after its file stem
+
+    Returns:
+        (atlas image, frames dict)
+    """
+    images = [Image.open(path).convert("RGBA") for path in files]
+    positions, width, height = pack_shelves([image.size for image in images])
+    atlas = Image.new("RGBA", (max(width, 1), max(height, 1)), (0, 0, 0, 0))
+
+    frames = {}
+    for path, image, (x, y) in zip(files, images, positions):
+        atlas.paste(image, (x, y))
+        w, h = image.size
+        frames[path.stem] = {
+            "frame": {"x": x, "y": y, "w": w, "h": h},
+            "rotated": False,
+            "trimmed": False,
+            "spriteSourceSize": {"x": 0, "y": 0, "w": w, "h": h},
+            "sourceSize": {"w": w, "h": h},
+        }
+        image.close()
+    return atlas, frames
+
+
+def build_icon_atlas(
+    files: List[Path], cell: int = ICON_CELL_SIZE
+) -> Tuple[Image.Image, int, int]:
+    """Scale icons into square cells of a grid, in file order.
+
+    Args:
+        files: Icon PNGs
+        cell: Cell size in pixels; icons are fitted and centered
+
+    Returns:
+        (atlas image, columns, rows)
+    """
+    cols = max(1, math.ceil(math.sqrt(len(files))))
+    rows = max(1, math.ceil(len(files) / cols))
+    atlas = Image.new("RGBA", (cols * cell, rows * cell), (0, 0, 0, 0))
+
+    for index, path in enumerate(files):
+        with Image.open(path) as source:
+            image = source.convert("RGBA")
+        image.thumbnail((cell, cell), Image.Resampling.LANCZOS)
+        col, row = index % cols, index // cols
+        atlas.paste(
+            image,
+            (
+                col * cell + (cell - image.width) // 2,
+                row * cell + (cell - image.height) // 2,
+            ),
+        )
+    return atlas, cols, rows
+
+
+def build_assets(source_dir: Path, output_dir: Path) -> Dict[str, int]:
+    """Write the static build for an assets directory.
+
+    Replaces output_dir entirely. manifest.json is written last, so a build
+    that fails part way leaves no manifest and the app keeps using /assets/.
+
+    Args:
+        source_dir: The Dash assets folder
+        output_dir: Build directory to (re)create
+
+    Returns:
+        Counts and byte totals, for reporting
+    """
+    source_dir = Path(source_dir)
+    output_dir = Path(output_dir)
+    if output_dir.exists():
+        shutil.rmtree(output_dir)
+    output_dir.mkdir(parents=True)
+
+    manifest: Dict[str, Dict[str, Any]] = {
+        "files": {},
+        "sprite_atlases": {},
+        "icon_atlases": {},
+    }
+    stats = {
+        "files": 0,
+        "file_bytes": 0,
+        "sprite_atlases": 0,
+        "icon_atlases": 0,
+        "atlas_bytes": 0,
+    }
+
+    for folder in FINGERPRINTED_DIRS:
+        for path in sorted((source_dir / folder).rglob("*")):
+            if not path.is_file():
+                continue
+            rel_path = path.relative_to(source_dir).as_posix()
+            data = path.read_bytes()
+            manifest["files"][rel_path] = _write_output(output_dir, rel_path, data)
+            stats["files"] += 1
+            stats["file_bytes"] += len(data)
+
+    for group in SPRITE_ATLAS_GROUPS:
+        files = sorted((source_dir / group).glob("*.png"))
+        if not files:
+            continue
+        atlas, frames = build_sprite_atlas(files)
+        slug = group.replace("/", "-")
+        image_data = _png_bytes(atlas)
+        image_name = _write_output(output_dir, f"atlases/{slug}.png", image_data)
+        sheet = {
+            "frames": frames,
+            "meta": {
+                # Resolved by PIXI relative to the JSON URL
+                "image": Path(image_name).name,
+                "format": "RGBA8888",
+                "size": {"w": atlas.width, "h": atlas.height},
+                "scale": "1",
+            },
+        }
+        sheet_data = json.dumps(sheet, sort_keys=True, separators=(",", ":")).encode()
+        group_key = group.split("/", 1)[1]  # Relative to sprites/, as in the viewer
+        manifest["sprite_atlases"][group_key] = _write_output(
+            output_dir, f"atlases/{slug}.json", sheet_data
+        )
+        stats["sprite_atlases"] += 1
+        stats["atlas_bytes"] += len(image_data) + len(sheet_data)
+
+    icon_root = source_dir / ICON_ATLAS_ROOT
+    folders = (
+        sorted(p for p in icon_root.iterdir() if p.is_dir())
+        if icon_root.is_dir()
+        else []
+    )
+    for folder in folders:
+        files = sorted(folder.glob("*.png"))
+        if not files:
+            continue
+        atlas, cols, rows = build_icon_atlas(files)
+        image_data = _png_bytes(atlas)
+        image_name = _write_output(
+            output_dir, f"atlases/icons-{folder.name}.png", image_data
+        )
+        for index, path in enumerate(files):
+            manifest["icon_atlases"][path.relative_to(source_dir).as_posix()] = {
+                "atlas": image_name,
+                "col": index % cols,
+                "row": index // cols,
+                "cols": cols,
+                "rows": rows,
+            }
+        stats["icon_atlases"] += 1
+        stats["atlas_bytes"] += len(image_data)
+
+    (output_dir / MANIFEST_NAME).write_text(
+        json.dumps(manifest, sort_keys=True, indent=1)
+    )
+    return stats
+
+
+def _default_build_directory() -> Path:
+    return Path(__file__).parent / Config.STATIC_BUILD_DIRECTORY
+
+
+@lru_cache(maxsize=None)
+def load_manifest(build_dir: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Read the build manifest, or empty tables when there is no build.
+
+    Args:
+        build_dir: Build directory; defaults to Config.STATIC_BUILD_DIRECTORY
+
+    Returns:
+        Dict with "files", "sprite_atlases" and "icon_atlases" tables
+    """
+    path = Path(build_dir) if build_dir else _default_build_directory()
+    try:
+        return json.loads((path / MANIFEST_NAME).read_text())
+    except FileNotFoundError:
+        return {"files": {}, "sprite_atlases": {}, "icon_atlases": {}}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable static asset manifest: {e}")
+        return {"files": {}, "sprite_atlases": {}, "icon_atlases": {}}
+
+
+def _asset_key(path: Optional[str]) -> Optional[str]:
+    if path and path.startswith(ASSET_URL_PREFIX):
+        return path[len(ASSET_URL_PREFIX) :]
+    return path
+
+
+def asset_url(path: str) -> str:
+    """Fingerprinted URL for an asset path, e.g. "/assets/icons/laws/LAW_X.png".
+
+    Returns the path unchanged when it is not part of the build.
+    """
+    built = load_manifest()["files"].get(_asset_key(path))
+    return f"{BUILD_URL_PREFIX}{built}" if built else path
+
+
+def sprite_atlas_urls() -> Dict[str, str]:
+    """Spritesheet JSON URLs for the map viewer, keyed by group under sprites/."""
+    return {
+        group: f"{BUILD_URL_PREFIX}{name}"
+        for group, name in load_manifest()["sprite_atlases"].items()
+    }
+
+
+def asset_icon(
+    path: str,
+    style: Dict[str, Any],
+    title: Optional[str] = None,
+    className: Optional[str] = None,
+) -> html.Img | html.Span:
+    """Icon element drawn from its icon atlas.
+
+    The style must give a square width and height (as all icon styles here
+    do); the atlas cell is scaled to fill it. Icons not in an atlas are
+    rendered as an html.Img of their fingerprinted file.
+
+    Args:
+        path: Asset path, e.g. "/assets/icons/techs/TECH_FORESTRY.png"
+        style: Inline style with width and height
+        title: Tooltip text
+        className: CSS class
+
+    Returns:
+        html.Span with the atlas as background, or html.Img
+    """
+    extra = {k: v for k, v in (("title", title), ("className", className)) if v}
+    cell = load_manifest()["icon_atlases"].get(_asset_key(path))
+    if cell is None:
+        return html.Img(src=asset_url(path), style=style, **extra)
+
+    cols, rows = cell["cols"], cell["rows"]
+    x = cell["col"] * 100 / (cols - 1) if cols > 1 else 0
+    y = cell["row"] * 100 / (rows - 1) if rows > 1 else 0
+    return html.Span(
+        role="img",
+        **{"aria-label": title or ""},
+        style={
+            "display": "inline-block",
+            **style,
+            "backgroundImage": f"url({BUILD_URL_PREFIX}{cell['atlas']})",
+            "backgroundSize": f"{cols * 100}% {rows * 100}%",
+            "backgroundPosition": f"{x:g}% {y:g}%",
+            "backgroundRepeat": "no-repeat",
+        },
+        **extra,
+    )
+
+
+def init_static_assets(server: Flask, build_dir: Optional[str] = None) -> None:
+    """Serve the static build with immutable caching.
+
+    Also marks Dash's own /assets/ stylesheets and scripts as immutable: Dash
+    links them with an ?m=<mtime> query string that changes with the file.
+
+    Args:
+        server: Flask app (the Dash app's server)
+        build_dir: Build directory; defaults to Config.STATIC_BUILD_DIRECTORY
+    """
+    root = str(Path(build_dir) if build_dir else _default_build_directory())
+
+    @server.route(f"{BUILD_URL_PREFIX}<path:filename>")
+    def serve_static_asset(filename: str) -> Response:
+        path = safe_join(root, filename)
+        if path is None or filename == MANIFEST_NAME or not os.path.isfile(path):
+            abort(404)
+
+        mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        encoding = None
+        if filename.endswith(PRECOMPRESSED_SUFFIXES):
+            encoding = choose_encoding(request.headers.get("Accept-Encoding", ""))
+            suffix = {"br": ".br", "gzip": ".gz"}.get(encoding or "")
+            if suffix and os.path.isfile(path + suffix):
+                path += suffix
+            else:
+                encoding = None
+
+        response = send_file(path, mimetype=mimetype, max_age=CACHE_MAX_AGE)
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+        if filename.endswith(PRECOMPRESSED_SUFFIXES):
+            response.vary.add("Accept-Encoding")
+        if encoding:
+            response.headers["Content-Encoding"] = encoding
+        return response
+
+    @server.after_request
+    def cache_versioned_dash_assets(response: Response) -> Response:
+        if (
+            response.status_code == 200
+            and request.path.startswith(ASSET_URL_PREFIX)
+            and "m" in request.args
+        ):
+            response.cache_control.no_cache = None
+            response.cache_control.public = True
+            response.cache_control.max_age = CACHE_MAX_AGE
+            response.cache_control.immutable = True
+        return response
+
+    manifest = load_manifest(build_dir)
+    if manifest["files"]:
+        logger.info(
+            f"Serving {len(manifest['files'])} fingerprinted assets and "
+            f"{len(manifest['sprite_atlases'])} sprite atlases from {root}"
+        )
+    else:
+        logger.info("No static asset build; icons and sprites served from /assets/")
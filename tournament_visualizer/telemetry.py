@@ -0,0 +1,315 @@
+"""Per-route and per-callback latency telemetry.
+
+gunicorn's access log only has one duration per request, and every Dash
+callback shows up as the same POST /_dash-update-component. init_telemetry()
+registers request hooks on the Flask server that time each request and key
+it by:
+
+- the URL rule for ordinary routes ("/api/map/territories/<int:match_id>/...")
+- "callback <output>" for Dash callbacks, using the output id and property
+  from the request body ("overview-nation-win-chart.figure")
+
+Each request also carries the time spent holding a database connection, the
+number of queries, query and figure cache hits/misses and the response size
+(after compression). The data layer reports those through record_db_time()
+and record_cache_lookup(), which do nothing outside a timed request.
+
+Every worker keeps the last Config.PERF_WINDOW_SIZE samples per key, packed
+as doubles (56 bytes each), and serves p50/p95/p99 at /debug/perf, to
+loopback clients only (use `fly ssh console` and curl localhost:8080). With
+PERF_LOG_PATH set, every sample is also appended to that file as one JSON
+line, for offline analysis.
+"""
+
+import ipaddress
+import json
+import logging
+import math
+import os
+import threading
+import time
+from array import array
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from flask import Flask, Response, abort, g, jsonify, request
+
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+PERF_ENDPOINT = "/debug/perf"
+CALLBACK_PATH = "/_dash-update-component"
+
+_current = threading.local()
+
+
+@dataclass(slots=True)
+class RequestSample:
+    """Measurements for one request."""
+
+    key: str
+    path: str
+    started: float = field(default_factory=time.perf_counter)
+    status: int = 0
+    ms: float = 0.0
+    db_ms: float = 0.0
+    db_queries: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    bytes: int = 0
+
+
+def record_db_time(seconds: float) -> None:
+    """Add one database connection use to the current request, if timed."""
+    sample = getattr(_current, "sample", None)
+    if sample is not None:
+        sample.db_ms += seconds * 1000
+        sample.db_queries += 1
+
+
+def record_cache_lookup(hit: bool) -> None:
+    """Count a query or figure cache lookup for the current request, if timed."""
+    sample = getattr(_current, "sample", None)
+    if sample is not None:
+        if hit:
+            sample.cache_hits += 1
+        else:
+            sample.cache_misses += 1
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list (0 for an empty list)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(len(sorted_values) * pct / 100))
+    return sorted_values[rank - 1]
+
+
+# RequestSample fields kept in the rolling windows, in storage order
+WINDOW_FIELDS = (
+    "ms",
+    "db_ms",
+    "db_queries",
+    "cache_hits",
+    "cache_misses",
+    "bytes",
+    "status",
+)
+
+
+class _Window:
+    """Ring buffer of the last samples of one key.
+
+    Samples are stored as consecutive runs of WINDOW_FIELDS in one array of
+    doubles, rather than as objects, to keep every key's window small.
+    """
+
+    __slots__ = ("values", "capacity", "next", "count")
+
+    def __init__(self, capacity: int) -> None:
+        self.values = array("d")
+        self.capacity = capacity
+        self.next = 0  # Slot the next sample overwrites once full
+        self.count = 0  # Samples added, including those dropped
+
+    def add(self, sample: RequestSample) -> None:
+        row = [float(getattr(sample, name)) for name in WINDOW_FIELDS]
+        self.count += 1
+        if len(self.values) < self.capacity * len(WINDOW_FIELDS):
+            self.values.extend(row)
+            return
+        start = self.next * len(WINDOW_FIELDS)
+        self.values[start : start + len(WINDOW_FIELDS)] = array("d", row)
+        self.next = (self.next + 1) % self.capacity
+
+    def columns(self) -> Dict[str, List[float]]:
+        """Kept values by field name, in no particular order."""
+        width = len(WINDOW_FIELDS)
+        return {
+            name: self.values[i::width].tolist() for i, name in enumerate(WINDOW_FIELDS)
+        }
+
+
+class PerfStats:
+    """Rolling per-key latency windows for one worker process."""
+
+    def __init__(self, window: int) -> None:
+        """Initialize the stats.
+
+        Args:
+            window: Samples kept per key
+        """
+        self.window = window
+        self._windows: Dict[str, _Window] = {}
+        self._lock = threading.Lock()
+        self.since = time.time()
+
+    def add(self, sample: RequestSample) -> None:
+        with self._lock:
+            window = self._windows.get(sample.key)
+            if window is None:
+                window = self._windows[sample.key] = _Window(self.window)
+            window.add(sample)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._windows.clear()
+            self.since = time.time()
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Summaries per key, slowest p95 first."""
+        with self._lock:
+            windows = {
+                key: (window.count, window.columns())
+                for key, window in self._windows.items()
+            }
+
+        rows = []
+        for key, (count, columns) in windows.items():
+            latencies = sorted(columns["ms"])
+            db_times = sorted(columns["db_ms"])
+            n = len(latencies)
+            hits = sum(columns["cache_hits"])
+            lookups = hits + sum(columns["cache_misses"])
+            rows.append(
+                {
+                    "key": key,
+                    "count": count,
+                    "window": n,
+                    "p50_ms": round(percentile(latencies, 50), 2),
+                    "p95_ms": round(percentile(latencies, 95), 2),
+                    "p99_ms": round(percentile(latencies, 99), 2),
+                    "max_ms": round(latencies[-1], 2),
+                    "db_p50_ms": round(percentile(db_times, 50), 2),
+                    "db_p95_ms": round(percentile(db_times, 95), 2),
+                    "db_queries_avg": round(sum(columns["db_queries"]) / n, 2),
+                    "cache_hit_rate": round(hits / lookups, 3) if lookups else None,
+                    "bytes_avg": int(sum(columns["bytes"]) / n),
+                    "errors": sum(1 for status in columns["status"] if status >= 500),
+                }
+            )
+        rows.sort(key=lambda row: row["p95_ms"], reverse=True)
+        return rows
+
+
+class JsonlSink:
+    """Append samples to a file, one JSON object per line."""
+
+    def __init__(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", buffering=1, encoding="utf-8")
+
+    def write(self, sample: RequestSample) -> None:
+        record = asdict(sample)
+        del record["started"]
+        record["ts"] = round(time.time(), 3)
+        record["pid"] = os.getpid()
+        record["ms"] = round(record["ms"], 2)
+        record["db_ms"] = round(record["db_ms"], 2)
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        # One write per line keeps lines from concurrent workers whole
+        with self._lock:
+            self._file.write(line)
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+def request_key() -> str:
+    """Telemetry key for the current request."""
+    if request.path == CALLBACK_PATH:
+        body = request.get_json(silent=True) or {}
+        output = body.get("output")
+        if isinstance(output, str) and output:
+            return f"callback {output}"
+    rule = request.url_rule.rule if request.url_rule is not None else "<unmatched>"
+    return f"{request.method} {rule}"
+
+
+def _is_loopback(address: Optional[str]) -> bool:
+    try:
+        return ipaddress.ip_address(address or "").is_loopback
+    except ValueError:
+        return False
+
+
+def init_telemetry(
+    server: Flask,
+    enabled: bool = Config.PERF_TELEMETRY,
+    window: int = Config.PERF_WINDOW_SIZE,
+    log_path: str = Config.PERF_LOG_PATH,
+) -> Optional[PerfStats]:
+    """Time every request of a Flask server.
+
+    Register this before other after_request hooks (compression): Flask runs
+    them in reverse order, so this one sees the final response size.
+
+    Args:
+        server: Flask app (the Dash app's server)
+        enabled: False registers nothing
+        window: Samples kept per key
+        log_path: JSONL file to append samples to; empty for none
+
+    Returns:
+        The worker's PerfStats, or None when disabled
+    """
+    if not enabled:
+        logger.info("Request telemetry disabled")
+        return None
+
+    stats = PerfStats(window)
+    sink = JsonlSink(log_path) if log_path else None
+
+    @server.before_request
+    def start_sample() -> None:
+        if request.path == PERF_ENDPOINT:
+            return
+        sample = RequestSample(key=request_key(), path=request.path)
+        g.perf_sample = sample
+        _current.sample = sample
+
+    @server.after_request
+    def finish_sample(response: Response) -> Response:
+        sample = g.pop("perf_sample", None)
+        _current.sample = None
+        if sample is None:
+            return response
+        sample.ms = (time.perf_counter() - sample.started) * 1000
+        sample.status = response.status_code
+        sample.bytes = response.content_length or 0
+        stats.add(sample)
+        if sink is not None:
+            try:
+                sink.write(sample)
+            except OSError as e:
+                logger.warning(f"Could not write telemetry sample: {e}")
+        return response
+
+    @server.teardown_request
+    def clear_sample(exc: Optional[BaseException]) -> None:
+        _current.sample = None
+
+    @server.route(PERF_ENDPOINT)
+    def perf_report() -> Response:
+        if not _is_loopback(request.remote_addr):
+            abort(404)
+        if request.args.get("reset"):
+            stats.reset()
+        return jsonify(
+            {
+                "pid": os.getpid(),
+                "since": stats.since,
+                "window": stats.window,
+                "routes": stats.snapshot(),
+            }
+        )
+
+    target = f", logging to {log_path}" if log_path else ""
+    logger.info(f"Request telemetry enabled (window {window}{target})")
+    return stats